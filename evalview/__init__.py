@@ -1,15 +1,49 @@
 """EvalView - Testing framework for multi-step AI agents."""
 
+from typing import Any
+
 __version__ = "0.7.0"
 
-# Public API — importable as ``from evalview import gate``
-from evalview.api import gate, gate_async, GateResult, DiffStatus  # noqa: F401
-
-# Model comparison API — importable as ``import evalview; evalview.run_eval(...)``
-from evalview.compare import (  # noqa: F401
-    run_eval,
-    score,
-    compare_models,
-    ModelResult,
-    print_comparison_table,
-)
+# Public API — importable as ``from evalview import gate`` and, for model
+# comparison, ``import evalview; evalview.run_eval(...)``. Resolved on first
+# access so that ``import evalview.cli`` (every CLI start) doesn't pull in
+# pydantic models and provider SDKs.
+_LAZY_EXPORTS = {
+    "gate": "evalview.api",
+    "gate_async": "evalview.api",
+    "GateResult": "evalview.api",
+    "DiffStatus": "evalview.api",
+    "run_eval": "evalview.compare",
+    "score": "evalview.compare",
+    "compare_models": "evalview.compare",
+    "ModelResult": "evalview.compare",
+    "print_comparison_table": "evalview.compare",
+}
+
+__all__ = [
+    "__version__",
+    "gate",
+    "gate_async",
+    "GateResult",
+    "DiffStatus",
+    "run_eval",
+    "score",
+    "compare_models",
+    "ModelResult",
+    "print_comparison_table",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
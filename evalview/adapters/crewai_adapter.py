@@ -18,6 +18,7 @@ from evalview.core.types import (
     TokenUsage,
 )
 from evalview.core.pricing import calculate_cost
+from evalview.core.http_pool import http_client_pool
 from evalview.core.tracing import Tracer
 
 logger = logging.getLogger(__name__)
@@ -82,7 +83,7 @@ class CrewAIAdapter(AgentAdapter):
 
         try:
             print("Creating httpx client...") if self.verbose else None
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_client_pool.client(self.endpoint, timeout=self.timeout) as client:
                 print("Making POST request...") if self.verbose else None
                 response = await client.post(
                     self.endpoint,
@@ -14,6 +14,7 @@ from evalview.core.types import (
     SpanKind,
 )
 from evalview.core.pricing import calculate_cost
+from evalview.core.http_pool import http_client_pool
 from evalview.core.tracing import Tracer
 
 logger = logging.getLogger(__name__)
@@ -22,9 +23,16 @@ logger = logging.getLogger(__name__)
 class AgentConnectionError(Exception):
     """Raised when connection to the agent endpoint fails."""
 
-    def __init__(self, message: str, endpoint: str, error_type: str = "connection"):
+    def __init__(
+        self,
+        message: str,
+        endpoint: str,
+        error_type: str = "connection",
+        status_code: Optional[int] = None,
+    ):
         self.endpoint = endpoint
         self.error_type = error_type
+        self.status_code = status_code
         super().__init__(message)
 
     def __str__(self) -> str:
@@ -86,7 +94,7 @@ class HTTPAdapter(AgentAdapter):
 
         try:
             async with tracer.start_span_async("HTTP Agent", SpanKind.AGENT):
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with http_client_pool.client(self.endpoint, timeout=self.timeout) as client:
                     api_start = datetime.now()
                     response = await client.post(
                         self.endpoint,
@@ -144,6 +152,7 @@ class HTTPAdapter(AgentAdapter):
                 f"HTTP {e.response.status_code}: {e.response.reason_phrase}",
                 endpoint=self.endpoint,
                 error_type="http",
+                status_code=e.response.status_code,
             ) from None
 
         # Record the API call as an LLM span if model info is available
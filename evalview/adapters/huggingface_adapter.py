@@ -27,6 +27,7 @@ from evalview.core.types import (
     ExecutionMetrics,
     SpanKind,
 )
+from evalview.core.http_pool import http_client_pool
 from evalview.core.tracing import Tracer
 
 logger = logging.getLogger(__name__)
@@ -245,7 +246,7 @@ class HuggingFaceAdapter(AgentAdapter):
         payload = {"data": [query, chat_history]}
 
         async with tracer.start_span_async("HuggingFace Space", SpanKind.AGENT):
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_client_pool.client(self.endpoint, timeout=self.timeout) as client:
                 # Step 1: Submit the request
                 submit_url = f"{self.endpoint}/gradio_api/call/{fn_name}"
 
@@ -17,6 +17,7 @@ from evalview.core.types import (
     StepMetrics,
     ExecutionMetrics,
 )
+from evalview.core.http_pool import http_client_pool
 from evalview.core.tracing import Tracer
 
 logger = logging.getLogger(__name__)
@@ -112,7 +113,7 @@ class LangGraphAdapter(AgentAdapter):
             logger.info(f"🚀 Executing LangGraph Cloud API: {query}...")
             logger.debug(f"Assistant ID: {assistant_id}")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_client_pool.client(base_url, timeout=self.timeout) as client:
             # Step 1: Create thread
             thread_response = await client.post(
                 f"{base_url}/threads",
@@ -401,7 +402,7 @@ class LangGraphAdapter(AgentAdapter):
             logger.info(f"🚀 Executing LangGraph request: {query}...")
             logger.debug(f"📤 Payload: {json.dumps(payload, indent=2)}")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_client_pool.client(self.endpoint, timeout=self.timeout) as client:
             response = await client.post(
                 self.endpoint,
                 json=payload,
@@ -456,7 +457,7 @@ class LangGraphAdapter(AgentAdapter):
         final_output = ""
         thread_id = None
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_client_pool.client(self.endpoint, timeout=self.timeout) as client:
             async with client.stream(
                 "POST",
                 self.endpoint,
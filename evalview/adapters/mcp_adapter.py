@@ -254,11 +254,11 @@ class MCPAdapter(AgentAdapter):
         self, query: str, context: Dict[str, Any], url: str, tracer: Tracer
     ) -> List[StepTrace]:
         """Execute via HTTP transport."""
-        import httpx
+        from evalview.core.http_pool import http_client_pool
 
         steps = []
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_client_pool.client(url, timeout=self.timeout) as client:
             # Get tool calls
             if query == "multi":
                 tool_calls = context.get("tool_calls", [])
@@ -500,9 +500,9 @@ class MCPAdapter(AgentAdapter):
 
     async def _discover_tools_http(self, url: str) -> List[Dict[str, Any]]:
         """Discover tools via HTTP transport."""
-        import httpx
+        from evalview.core.http_pool import http_client_pool
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_client_pool.client(url, timeout=self.timeout) as client:
             # Initialize session
             self._request_id += 1
             init_response = await client.post(
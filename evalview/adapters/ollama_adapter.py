@@ -21,6 +21,7 @@ from evalview.core.types import (
     TokenUsage,
     SpanKind,
 )
+from evalview.core.http_pool import http_client_pool
 from evalview.core.tracing import Tracer
 
 
@@ -83,7 +84,7 @@ class OllamaAdapter(AgentAdapter):
 
         # Start agent span
         async with tracer.start_span_async("Ollama Chat", SpanKind.AGENT):
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_client_pool.client(url, timeout=self.timeout) as client:
                 api_start = datetime.now()
                 response = await client.post(
                     url,
@@ -17,6 +17,7 @@ from evalview.core.types import (
     SpanKind,
 )
 from evalview.core.pricing import calculate_cost
+from evalview.core.http_pool import http_client_pool
 from evalview.core.tracing import Tracer
 
 # Set up logging
@@ -204,7 +205,7 @@ class TapeScopeAdapter(AgentAdapter):
             logger.debug(f"📤 Payload: {json.dumps(payload, indent=2)}")
 
         async with tracer.start_span_async("TapeScope Agent", SpanKind.AGENT):
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_client_pool.client(self.endpoint, timeout=self.timeout) as client:
                 async with client.stream(
                     "POST",
                     self.endpoint,
@@ -18,6 +18,9 @@ Async variant::
 
     result = await gate_async(test_dir="tests/")
 
+``gate_async`` runs on the caller's event loop, so many gates can run
+concurrently and share HTTP connection pools and judge rate limits.
+
 The gate functions bypass the CLI layer entirely — no Click context, no Rich
 console output, no ``sys.exit()``.  They call the same internal execution
 pipeline that powers ``evalview check``.
@@ -28,11 +31,14 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 # Re-export key types so callers only need ``from evalview.api import ...``
 from evalview.core.diff import DiffStatus, TraceDiff  # noqa: F401
 
+if TYPE_CHECKING:
+    from evalview.core.parallel import ConcurrencyLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -283,17 +289,33 @@ async def gate_async(
     semantic_diff: bool = False,
     timeout: float = 30.0,
     quick: bool = False,
+    limiter: Optional["ConcurrencyLimiter"] = None,
 ) -> GateResult:
     """Async variant of :func:`gate`.
 
     Use this when you're already inside an async event loop (e.g. inside an
-    agent framework or async test runner).
+    agent framework or async test runner). The checks run on that loop, not
+    in a helper thread, so concurrent gates share the judge rate limits and,
+    inside ``http_client_pool.session()``, pooled agent connections.
 
     Args:
-        Same as :func:`gate`.
+        Same as :func:`gate`, plus:
+        limiter: Caps agent calls across every gate that shares it. ``None``
+            = a per-gate limiter from the config's ``concurrency`` section.
 
     Returns:
         :class:`GateResult`.
+
+    Example::
+
+        from evalview.core.http_pool import http_client_pool
+        from evalview.core.parallel import ConcurrencyLimiter
+
+        limiter = ConcurrencyLimiter(16)
+        async with http_client_pool.session():
+            results = await asyncio.gather(
+                *[gate_async(test_dir=d, limiter=limiter) for d in suites]
+            )
     """
     if fail_on is None:
         fail_on = {DiffStatus.REGRESSION}
@@ -306,6 +328,7 @@ async def gate_async(
         semantic_diff=semantic_diff,
         timeout=timeout,
         quick=quick,
+        limiter=limiter,
     )
 
 
@@ -317,6 +340,7 @@ async def _gate_impl(
     semantic_diff: bool,
     timeout: float,
     quick: bool = False,
+    limiter: Optional["ConcurrencyLimiter"] = None,
 ) -> GateResult:
     """Shared async implementation for gate() and gate_async()."""
     from evalview.core.loader import TestCaseLoader
@@ -364,27 +388,17 @@ async def _gate_impl(
             raw_json={"error": "No matching test cases found"},
         )
 
-    # Execute tests — call the internal pipeline directly.
-    # _execute_check_tests uses asyncio.run() internally, but we're already
-    # in an async context. Run it in a thread to avoid nested event loop issues.
-    import concurrent.futures
-
-    from evalview.commands.shared import _execute_check_tests
-
-    def _run_sync():
-        return _execute_check_tests(
-            test_cases=test_cases,
-            config=config,
-            json_output=True,  # suppresses console.print in error paths
-            semantic_diff=False if quick else semantic_diff,
-            timeout=timeout,
-            skip_llm_judge=quick,
-        )
+    # Execute tests — await the internal pipeline directly on this loop.
+    from evalview.commands.shared import _execute_check_tests_async
 
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        diffs, results, drift_tracker, golden_traces = await loop.run_in_executor(
-            pool, _run_sync
-        )
+    diffs, results, drift_tracker, golden_traces = await _execute_check_tests_async(
+        test_cases=test_cases,
+        config=config,
+        json_output=True,  # suppresses console.print in error paths
+        semantic_diff=False if quick else semantic_diff,
+        timeout=timeout,
+        skip_llm_judge=quick,
+        limiter=limiter,
+    )
 
     return _build_gate_result(diffs, len(test_cases), fail_on, results=results)
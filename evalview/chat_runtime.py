@@ -162,8 +162,10 @@ def derive_chat_allowlists() -> Tuple[set[str], dict[str, set[str]]]:
     commands: set[str] = set()
     flags_by_command: dict[str, set[str]] = {}
 
-    for name, cmd in main.commands.items():
-        if cmd.hidden:
+    ctx = click.Context(main)
+    for name in main.list_commands(ctx):
+        cmd = main.get_command(ctx, name)
+        if cmd is None or cmd.hidden:
             continue
         commands.add(name)
         flags: set[str] = {"--help"}
@@ -20,64 +20,183 @@ try:
 except PackageNotFoundError:
     _EVALVIEW_VERSION = "dev"
 
+import importlib
+from typing import NamedTuple, Optional
+
 import click
 
-from evalview.commands.shared import console
-from evalview.telemetry.config import (
-    should_show_first_run_notice,
-    mark_first_run_notice_shown,
-)
-from evalview.version_check import get_update_notice
-
-# ── Command modules ──────────────────────────────────────────────────────────
-from evalview.commands.run import run
-from evalview.commands.listing_cmd import list_cmd, adapters, report, view, connect, validate_adapter, record
-from evalview.commands.skill_cmd import skill
-from evalview.commands.capture_cmd import capture
-from evalview.commands.init_cmd import init
-from evalview.commands.add_cmd import add
-from evalview.commands.demo_cmd import demo
-from evalview.commands.judge_cmd import judge
-from evalview.commands.expand_cmd import expand
-from evalview.commands.generate_cmd import generate
-from evalview.commands.trends_cmd import trends
-from evalview.commands.golden_cmd import golden
-from evalview.commands.telemetry_cmd import telemetry
-from evalview.commands.ci_cmd import ci
-from evalview.commands.gym_cmd import gym
-from evalview.commands.cloud_cmd import login, logout, whoami
-from evalview.commands.hooks_cmd import install_hooks, uninstall_hooks
-from evalview.commands.import_cmd import import_logs
-from evalview.commands.snapshot_cmd import snapshot
-from evalview.commands.check_cmd import check, replay
-from evalview.commands.simulate_cmd import simulate
-from evalview.commands.replay_trace_cmd import replay_trace
-from evalview.commands.model_check_cmd import model_check
-from evalview.commands.monitor_cmd import monitor
-from evalview.commands.autopr_cmd import autopr
-from evalview.commands.freshness_cmd import freshness
-from evalview.commands.fleet_cmd import fleet_cmd
-from evalview.commands.benchmark_cmd import benchmark_cmd
-from evalview.commands.mcp_cmd import mcp
-from evalview.commands.validate_cmd import validate
-from evalview.commands.visual_cmd import inspect_cmd, visualize_cmd, compare_cmd
-from evalview.commands.chat_cmd import chat, trace_cmd
-from evalview.commands.traces_cmd import traces
-from evalview.commands.baseline_cmd import baseline
-from evalview.commands.feedback_cmd import feedback
-from evalview.commands.quarantine_cmd import quarantine
-from evalview.commands.openclaw_cmd import openclaw
-from evalview.commands.watch_cmd import watch
-from evalview.commands.badge_cmd import badge
-from evalview.commands.log_cmd import log_cmd
-from evalview.commands.since_cmd import since_cmd
-from evalview.commands.progress_cmd import progress_cmd
-from evalview.commands.drift_cmd import drift_cmd
-from evalview.commands.slack_digest_cmd import slack_digest_cmd
-from evalview.commands.diff_cmd import diff_cmd
-
-
-class OrderedGroup(click.Group):
+# ── Command registry ─────────────────────────────────────────────────────────
+# Command modules are imported only when their subcommand runs (or its help
+# is shown), so `evalview --version`, `--help` and short commands run from
+# git hooks don't import rich, httpx, pydantic models and provider SDKs. The
+# summaries below are what `evalview --help` lists; tests/test_cli_startup.py
+# checks that they match each command's docstring.
+
+
+class _LazyCommand(NamedTuple):
+    name: str
+    module: str  # relative to evalview.commands
+    attr: str
+    summary: str
+    hidden: bool = False
+
+
+_COMMANDS: list[_LazyCommand] = [
+    _LazyCommand("run", "run", "run",
+                 "Run test cases against the agent."),
+    _LazyCommand("list", "listing_cmd", "list_cmd",
+                 "List all available test cases.", hidden=True),
+    _LazyCommand("adapters", "listing_cmd", "adapters",
+                 "List or validate agent adapters."),
+    _LazyCommand("report", "listing_cmd", "report",
+                 "Generate report from results file."),
+    _LazyCommand("view", "listing_cmd", "view",
+                 "View execution trace for debugging."),
+    _LazyCommand("connect", "listing_cmd", "connect",
+                 "Test connection to your agent API and auto-configure endpoint."),
+    _LazyCommand("validate-adapter", "listing_cmd", "validate_adapter",
+                 "Deprecated: use `evalview adapters validate` instead.", hidden=True),
+    _LazyCommand("validate", "validate_cmd", "validate",
+                 "Lint test YAML/TOML files for schema errors without running any agent."),
+    _LazyCommand("record", "listing_cmd", "record",
+                 "Record agent interactions and generate test cases."),
+    _LazyCommand("skill", "skill_cmd", "skill",
+                 "Commands for testing Claude Code skills."),
+    _LazyCommand("capture", "capture_cmd", "capture",
+                 "🎯 Capture real traffic as tests — tests from real usage, not guesses."),
+    _LazyCommand("init", "init_cmd", "init",
+                 "Initialize EvalView in the current directory."),
+    _LazyCommand("add", "add_cmd", "add",
+                 "Add a test pattern to your project.", hidden=True),
+    _LazyCommand("demo", "demo_cmd", "demo",
+                 "Live regression demo — see EvalView catch and auto-heal agent regressions."),
+    _LazyCommand("judge", "judge_cmd", "judge",
+                 "Set the LLM-as-judge provider and model."),
+    _LazyCommand("expand", "expand_cmd", "expand",
+                 "Expand test cases into variations using LLM."),
+    _LazyCommand("generate", "generate_cmd", "generate",
+                 "Generate a draft regression suite from live agent probing."),
+    _LazyCommand("trends", "trends_cmd", "trends",
+                 "Show performance trends over time."),
+    _LazyCommand("golden", "golden_cmd", "golden",
+                 "Manage golden traces (blessed baselines for regression detection)."),
+    _LazyCommand("telemetry", "telemetry_cmd", "telemetry",
+                 "Manage anonymous usage telemetry."),
+    _LazyCommand("ci", "ci_cmd", "ci",
+                 "CI/CD integration commands."),
+    _LazyCommand("gym", "gym_cmd", "gym",
+                 "Run the EvalView Gym - practice agent eval patterns."),
+    _LazyCommand("login", "cloud_cmd", "login",
+                 "Connect this CLI to your EvalView Cloud account."),
+    _LazyCommand("logout", "cloud_cmd", "logout",
+                 "Disconnect this CLI from EvalView Cloud."),
+    _LazyCommand("whoami", "cloud_cmd", "whoami",
+                 "Show current cloud login status."),
+    _LazyCommand("install-hooks", "hooks_cmd", "install_hooks",
+                 "Install a git hook that runs 'evalview check' automatically."),
+    _LazyCommand("uninstall-hooks", "hooks_cmd", "uninstall_hooks",
+                 "Remove the evalview-managed block from a git hook."),
+    _LazyCommand("import", "import_cmd", "import_logs",
+                 "Convert production logs into EvalView test cases."),
+    _LazyCommand("snapshot", "snapshot_cmd", "snapshot",
+                 "Run tests and snapshot passing results as baseline."),
+    _LazyCommand("check", "check_cmd", "check",
+                 "Decide whether it's safe to ship this agent change."),
+    _LazyCommand("simulate", "simulate_cmd", "simulate",
+                 "Run tests hermetically against declared mocks."),
+    _LazyCommand("model-check", "model_check_cmd", "model_check",
+                 "Detect behavioral drift in a closed model against a fixed canary suite."),
+    _LazyCommand("replay", "check_cmd", "replay",
+                 "Replay a test and show full trajectory diff vs baseline."),
+    _LazyCommand("replay-trace", "replay_trace_cmd", "replay_trace",
+                 "Replay production traces against the current agent and diff results.", hidden=True),
+    _LazyCommand("benchmark", "benchmark_cmd", "benchmark_cmd",
+                 "Run a curated benchmark against your configured agent."),
+    _LazyCommand("mcp", "mcp_cmd", "mcp",
+                 "Manage MCP contracts (detect external server interface drift)."),
+    _LazyCommand("inspect", "visual_cmd", "inspect_cmd",
+                 "Deprecated: use `evalview visualize` instead.", hidden=True),
+    _LazyCommand("visualize", "visual_cmd", "visualize_cmd",
+                 "Generate a visual HTML report, optionally comparing multiple runs."),
+    _LazyCommand("compare", "visual_cmd", "compare_cmd",
+                 "Run the same tests against two agent endpoints and compare results."),
+    _LazyCommand("chat", "chat_cmd", "chat",
+                 "Interactive chat interface for EvalView."),
+    _LazyCommand("trace", "chat_cmd", "trace_cmd",
+                 "Trace LLM calls in any Python script."),
+    _LazyCommand("traces", "traces_cmd", "traces",
+                 "Query and manage local trace storage."),
+    _LazyCommand("baseline", "baseline_cmd", "baseline",
+                 "Manage test baselines for regression detection."),
+    _LazyCommand("monitor", "monitor_cmd", "monitor",
+                 "Continuously check for regressions with optional webhook alerts."),
+    _LazyCommand("autopr", "autopr_cmd", "autopr",
+                 "Turn production incidents into regression tests and open a PR."),
+    _LazyCommand("freshness", "freshness_cmd", "freshness",
+                 "Score production-query coverage of the eval suite and propose gap tests."),
+    _LazyCommand("fleet", "fleet_cmd", "fleet_cmd",
+                 "Roll up multiple monitor history files into one fleet view."),
+    _LazyCommand("feedback", "feedback_cmd", "feedback",
+                 "Send feedback, report a bug, or request a feature."),
+    _LazyCommand("openclaw", "openclaw_cmd", "openclaw",
+                 "OpenClaw integration — install skills and manage the regression gate.", hidden=True),
+    _LazyCommand("watch", "watch_cmd", "watch",
+                 "Watch for file changes and re-run regression checks."),
+    _LazyCommand("badge", "badge_cmd", "badge",
+                 "Generate a shields.io-compatible badge for your README."),
+    _LazyCommand("quarantine", "quarantine_cmd", "quarantine",
+                 "Manage quarantined (known-flaky) tests.", hidden=True),
+    _LazyCommand("log", "log_cmd", "log_cmd",
+                 "Show recent check runs — `git log` for agent evaluations.", hidden=True),
+    _LazyCommand("since", "since_cmd", "since_cmd",
+                 "Show what's changed since your last run (or a custom window)."),
+    _LazyCommand("progress", "progress_cmd", "progress_cmd",
+                 "Show what improved since a reference point."),
+    _LazyCommand("drift", "drift_cmd", "drift_cmd",
+                 "Per-test drift sparklines with incident markers."),
+    _LazyCommand("slack-digest", "slack_digest_cmd", "slack_digest_cmd",
+                 "Post a daily EvalView digest to Slack.", hidden=True),
+    _LazyCommand("diff", "diff_cmd", "diff_cmd",
+                 "Pretty-print what changed between two result files", hidden=True),
+]
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are imported on first use.
+
+    ``lazy_commands`` lists registry entries. A command's module is imported
+    by ``get_command`` the first time the command is looked up; until then
+    its help summary and hidden flag come from the registry.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[list[_LazyCommand]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, _LazyCommand] = {c.name: c for c in lazy_commands or []}
+
+    def known_commands(self) -> list[str]:
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            entry = self.lazy_commands[cmd_name]
+            module = importlib.import_module(f"evalview.commands.{entry.module}")
+            self.add_command(getattr(module, entry.attr), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def command_hidden(self, name: str) -> bool:
+        if name in self.commands:
+            return self.commands[name].hidden
+        return self.lazy_commands[name].hidden
+
+    def command_short_help(self, name: str, limit: int) -> str:
+        if name in self.commands:
+            return self.commands[name].get_short_help_str(limit=limit)
+        # Same truncation rule Click applies to a command's help text.
+        entry = self.lazy_commands[name]
+        return click.Command(name, help=entry.summary).get_short_help_str(limit=limit)
+
+
+class OrderedGroup(LazyGroup):
     """Group that renders subcommands in workflow-ordered sections.
 
     Click's default Group lists commands alphabetically, which buries the
@@ -103,47 +222,49 @@ class OrderedGroup(click.Group):
     def list_commands(self, ctx: click.Context) -> list[str]:
         ordered: list[str] = []
         seen: set[str] = set()
+        known = set(self.known_commands())
         for _, names in self.SECTIONS:
             for name in names:
-                if name in self.commands and name not in seen:
+                if name in known and name not in seen:
                     ordered.append(name)
                     seen.add(name)
-        for name in sorted(self.commands):
+        for name in sorted(known):
             if name in seen:
                 continue
-            if self.commands[name].hidden:
+            if self.command_hidden(name):
                 continue
             ordered.append(name)
         return ordered
 
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        known = set(self.known_commands())
         rendered: set[str] = set()
         for section_title, names in self.SECTIONS:
             rows: list[tuple[str, str]] = []
             for name in names:
-                cmd = self.commands.get(name)
-                if cmd is None or cmd.hidden:
+                if name not in known or self.command_hidden(name):
                     continue
-                rows.append((name, cmd.get_short_help_str(limit=60)))
+                rows.append((name, self.command_short_help(name, limit=60)))
                 rendered.add(name)
             if rows:
                 with formatter.section(section_title):
                     formatter.write_dl(rows)
 
         leftover: list[tuple[str, str]] = []
-        for name in sorted(self.commands):
-            if name in rendered:
-                continue
-            cmd = self.commands[name]
-            if cmd.hidden:
+        for name in sorted(known):
+            if name in rendered or self.command_hidden(name):
                 continue
-            leftover.append((name, cmd.get_short_help_str(limit=60)))
+            leftover.append((name, self.command_short_help(name, limit=60)))
         if leftover:
             with formatter.section("Other"):
                 formatter.write_dl(leftover)
 
 
-@click.group(cls=OrderedGroup, context_settings={"allow_interspersed_args": False})
+@click.group(
+    cls=OrderedGroup,
+    lazy_commands=_COMMANDS,
+    context_settings={"allow_interspersed_args": False},
+)
 @click.version_option(version=_EVALVIEW_VERSION)
 @click.pass_context
 def main(ctx: click.Context) -> None:
@@ -152,6 +273,13 @@ def main(ctx: click.Context) -> None:
     New here? Start with `evalview demo` or `evalview init`.
     Run `evalview <command> --help` for details on any command.
     """
+    from evalview.commands.shared import console
+    from evalview.telemetry.config import (
+        should_show_first_run_notice,
+        mark_first_run_notice_shown,
+    )
+    from evalview.version_check import get_update_notice
+
     # Show first-run telemetry notice (once only)
     if should_show_first_run_notice():
         if ctx.invoked_subcommand not in ("telemetry",):
@@ -170,66 +298,6 @@ def main(ctx: click.Context) -> None:
             console.print(f"[dim]{notice}[/dim]\n")
 
 
-# ── Register commands ────────────────────────────────────────────────────────
-main.add_command(run)
-main.add_command(list_cmd, name="list")
-main.add_command(adapters)
-main.add_command(report)
-main.add_command(view)
-main.add_command(connect)
-main.add_command(validate_adapter, name="validate-adapter")
-main.add_command(validate)
-main.add_command(record)
-main.add_command(skill)
-main.add_command(capture)
-main.add_command(init)
-main.add_command(add)
-main.add_command(demo)
-main.add_command(judge)
-main.add_command(expand)
-main.add_command(generate)
-main.add_command(trends)
-main.add_command(golden)
-main.add_command(telemetry)
-main.add_command(ci)
-main.add_command(gym)
-main.add_command(login)
-main.add_command(logout)
-main.add_command(whoami)
-main.add_command(install_hooks, name="install-hooks")
-main.add_command(uninstall_hooks, name="uninstall-hooks")
-main.add_command(import_logs, name="import")
-main.add_command(snapshot)
-main.add_command(check)
-main.add_command(simulate)
-main.add_command(model_check, name="model-check")
-main.add_command(replay)
-main.add_command(replay_trace, name="replay-trace")
-main.add_command(benchmark_cmd, name="benchmark")
-main.add_command(mcp)
-main.add_command(inspect_cmd, name="inspect")
-main.add_command(visualize_cmd, name="visualize")
-main.add_command(compare_cmd, name="compare")
-main.add_command(chat)
-main.add_command(trace_cmd, name="trace")
-main.add_command(traces)
-main.add_command(baseline)
-main.add_command(monitor)
-main.add_command(autopr)
-main.add_command(freshness)
-main.add_command(fleet_cmd, name="fleet")
-main.add_command(feedback)
-main.add_command(openclaw)
-main.add_command(watch)
-main.add_command(badge)
-main.add_command(quarantine)
-main.add_command(log_cmd, name="log")
-main.add_command(since_cmd, name="since")
-main.add_command(progress_cmd, name="progress")
-main.add_command(drift_cmd, name="drift")
-main.add_command(slack_digest_cmd, name="slack-digest")
-main.add_command(diff_cmd, name="diff")
-
 
 if __name__ == "__main__":
     main()
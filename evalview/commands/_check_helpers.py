@@ -117,7 +117,7 @@ def _should_auto_generate_report(
 
 def _judge_usage_summary() -> Dict[str, Any]:
     """Return structured judge usage for report rendering."""
-    from evalview.core.llm_provider import judge_cost_tracker
+    from evalview.core.llm_provider import judge_cost_tracker, judge_dispatcher
 
     total_tokens = judge_cost_tracker.total_input_tokens + judge_cost_tracker.total_output_tokens
     model_display = ""
@@ -138,6 +138,7 @@ def _judge_usage_summary() -> Dict[str, Any]:
         "is_free": judge_cost_tracker.call_count > 0 and judge_cost_tracker.total_cost == 0,
         "model": model_display,
         "pricing": pricing_display,
+        "dispatch": judge_dispatcher.stats.as_dict(),
     }
 
 
@@ -25,6 +25,7 @@ from evalview.commands.check_display import (
 from evalview.telemetry.decorators import track_command
 
 from evalview.core.diff import DiffStatus
+from evalview.core.http_pool import http_client_pool
 from evalview.commands._check_verdict import (
     _VerdictOutput,  # noqa: F401  (re-exported for backward compat)
     _aggregate_cost_delta_ratio,  # noqa: F401  (re-exported for backward compat)
@@ -79,11 +80,16 @@ if TYPE_CHECKING:
 @click.option("--explain", "explain", is_flag=True, default=False, help="Deep semantic root-cause analysis: feeds full baseline+current traces to LLM for a narrative explanation (requires LLM provider, makes LLM API calls).")
 @click.option("--statistical", "statistical_runs", type=int, default=None, help="Run each test N times for variance analysis (e.g. --statistical 10).")
 @click.option("--auto-variant", "auto_variant", is_flag=True, default=False, help="Auto-discover and save distinct execution paths as golden variants (use with --statistical).")
+@click.option("--early-stop", "early_stop", is_flag=True, default=False, help="With --statistical, stop repeating a test once a sequential test settles whether its pass rate meets the requirement.")
 @click.option("--judge", "judge_model", default=None, help="Judge model for scoring (e.g. gpt-5.4-mini, sonnet, deepseek-chat).")
 @click.option("--no-judge", "no_judge", is_flag=True, default=False, help="Skip LLM-as-judge evaluation. Uses deterministic scoring only (scores capped at 75). No API key required.")
 @click.option("--heal", "heal_mode", is_flag=True, default=False, help="Auto-retry flaky failures, propose candidate variants. Never touches forbidden tools.")
+@click.option("--max-concurrency", "max_concurrency", type=click.IntRange(min=1), default=None, help="Maximum tests running against the agent at once (default: 8, or concurrency.max_concurrency in config).")
+@click.option("--adaptive-concurrency", "adaptive_concurrency", is_flag=True, default=False, help="Back off on 429s/timeouts and ramp up while latency is healthy, up to --max-concurrency.")
+@click.option("--incremental/--no-incremental", "incremental", default=None, help="Reuse the last PASSED verdict for tests whose definition, baseline, config, prompts and source are unchanged (default: incremental.enabled in config).")
+@click.option("--force", "force", is_flag=True, default=False, help="With --incremental: re-run every test and refresh the stored verdicts.")
 @track_command("check")
-def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, fail_on: str, strict: bool, report_path: Optional[str], csv_path: Optional[str], semantic_diff: Optional[bool], budget: Optional[float], timeout: float, dry_run: bool, ai_root_cause: bool, explain: bool, statistical_runs: Optional[int], auto_variant: bool, judge_model: Optional[str], no_judge: bool, heal_mode: bool):
+def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, fail_on: str, strict: bool, report_path: Optional[str], csv_path: Optional[str], semantic_diff: Optional[bool], budget: Optional[float], timeout: float, dry_run: bool, ai_root_cause: bool, explain: bool, statistical_runs: Optional[int], auto_variant: bool, early_stop: bool, judge_model: Optional[str], no_judge: bool, heal_mode: bool, max_concurrency: Optional[int], adaptive_concurrency: bool, incremental: Optional[bool], force: bool):
     """Decide whether it's safe to ship this agent change.
 
     Replays your test suite against the saved golden baselines and emits
@@ -115,7 +121,12 @@ def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, f
         evalview check --explain                         # Deep trace narrative (feeds full traces to LLM)
         evalview check --statistical 10                  # Run each test 10 times, show variance
         evalview check --statistical 10 --auto-variant   # Auto-save distinct paths as variants
+        evalview check --statistical 20 --early-stop     # Stop once each verdict is certain
         evalview check --heal                            # Auto-retry flaky failures, propose variants
+        evalview check --max-concurrency 4               # At most 4 tests hit the agent at once
+        evalview check --adaptive-concurrency            # Find the agent's sustainable parallelism
+        evalview check --incremental                     # Only run tests whose inputs changed
+        evalview check --incremental --force             # Re-run everything, refresh stored verdicts
     """
     if budget is not None and budget <= 0:
         click.echo("Error: --budget must be a positive number.", err=True)
@@ -162,6 +173,8 @@ def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, f
         console.print(f"[cyan]▶ {get_random_checking_message()}[/cyan]\n")
 
     # Load test cases
+    from evalview.core.test_catalog import use_project_test_catalog
+    use_project_test_catalog()
     loader = TestCaseLoader()
     try:
         test_cases = loader.load_from_directory(Path(test_path))
@@ -198,8 +211,11 @@ def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, f
     apply_judge_model(judge_model, interactive=not json_output)
     from evalview.core.config import apply_judge_config
     apply_judge_config(config)
-    from evalview.core.llm_provider import judge_cost_tracker
+    from evalview.core.llm_provider import judge_cost_tracker, judge_dispatcher
     judge_cost_tracker.reset()
+    judge_dispatcher.reset()
+    from evalview.core.claim_cache import use_project_claim_cache
+    use_project_claim_cache()
 
     # Resolve semantic diff: explicit flag > config file > auto-enable.
     from evalview.core.semantic_diff import SemanticDiff
@@ -268,6 +284,15 @@ def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, f
             )
         sys.exit(0)
 
+    # Concurrency limit: CLI flags > config.yaml > default
+    from evalview.core.parallel import AdaptiveConcurrencyLimiter, create_limiter
+    concurrency_cfg = config.get_concurrency_config() if config else None
+    limiter = create_limiter(
+        max_concurrency or (concurrency_cfg.max_concurrency if concurrency_cfg else None),
+        adaptive=adaptive_concurrency or bool(concurrency_cfg and concurrency_cfg.adaptive),
+    )
+    http_client_pool.reset_stats()
+
     # Budget tracking with circuit breaker
     budget_tracker = None
     if budget is not None:
@@ -287,43 +312,72 @@ def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, f
             )
 
         if not json_output:
-            console.print(f"[cyan]▶ Statistical mode: running each test {statistical_runs} times...[/cyan]\n")
+            console.print(
+                f"[cyan]▶ Statistical mode: running each test {statistical_runs} times "
+                f"(up to {limiter.limit} at once)...[/cyan]\n"
+            )
 
+        from evalview.core.types import VarianceConfig
         from evalview.core.variant_clusterer import cluster_results, suggest_variants, format_cluster_summary
-        from evalview.evaluators.statistical_evaluator import compute_statistical_metrics, compute_flakiness_score
+        from evalview.evaluators.statistical_evaluator import (
+            compute_statistical_metrics,
+            compute_flakiness_score,
+            sequential_decision,
+            should_stop_early,
+        )
 
-        all_stat_results: Dict[str, List] = {}
+        def _stop_rule(tc: Any, so_far: List[Any]) -> bool:
+            variance = tc.thresholds.variance or VarianceConfig()
+            if not (early_stop or variance.early_stop):
+                return False
+            return should_stop_early(so_far, variance)
 
-        for run_idx in range(statistical_runs):
-            if not json_output:
-                console.print(f"  [dim]Run {run_idx + 1}/{statistical_runs}...[/dim]")
+        use_early_stop = early_stop or any(
+            tc.thresholds.variance is not None and tc.thresholds.variance.early_stop for tc in test_cases
+        )
 
-            run_diffs, run_results, _, _ = _execute_check_tests(
-                test_cases, config, json_output=True, semantic_diff=semantic_diff, timeout=timeout,
-                skip_llm_judge=no_judge, budget_tracker=budget_tracker,
-            )
+        # All repetitions of all tests share the run's concurrency limiter.
+        _, run_results, _, _ = _execute_check_tests(
+            test_cases, config, json_output=True, semantic_diff=semantic_diff, timeout=timeout,
+            skip_llm_judge=no_judge, budget_tracker=budget_tracker, limiter=limiter,
+            repetitions=statistical_runs, stop_rule=_stop_rule if use_early_stop else None,
+        )
 
-            for result in run_results:
-                test_name = result.test_case
-                if test_name not in all_stat_results:
-                    all_stat_results[test_name] = []
-                all_stat_results[test_name].append(result)
+        all_stat_results: Dict[str, List] = {}
+        for result in run_results:
+            all_stat_results.setdefault(result.test_case, []).append(result)
 
         # Cluster and display results per test
         if not json_output:
             console.print()
+            total_saved = 0
             for test_name, test_results in all_stat_results.items():
                 clusters = cluster_results(test_results)
                 scores = [r.score for r in test_results]
                 stats = compute_statistical_metrics(scores)
                 flakiness = compute_flakiness_score(test_results, stats)
 
+                saved = statistical_runs - len(test_results)
+                settled_note = ""
+                if use_early_stop:
+                    variance = next(
+                        (tc.thresholds.variance for tc in test_cases if tc.name == test_name), None
+                    ) or VarianceConfig()
+                    decision = sequential_decision(
+                        sum(1 for r in test_results if r.passed), len(test_results), variance
+                    )
+                    if decision:
+                        settled_note = (
+                            f", {decision} after {len(test_results)}/{statistical_runs} runs"
+                            f" ({saved} saved)"
+                        )
+                        total_saved += max(0, saved)
                 console.print(
                     f"[bold]{test_name}[/bold]  "
                     f"[dim]mean: {stats.mean:.1f}, std: {stats.std_dev:.1f}, "
-                    f"flakiness: {flakiness.category}[/dim]"
+                    f"flakiness: {flakiness.category}{settled_note}[/dim]"
                 )
-                console.print(format_cluster_summary(clusters, statistical_runs))
+                console.print(format_cluster_summary(clusters, len(test_results)))
                 console.print()
 
                 # Auto-variant: save distinct paths
@@ -353,27 +407,66 @@ def check(test_path: str, test: str, tags: tuple[str, ...], json_output: bool, f
                                     rep = variant_cluster.representative
                                     store.save_golden(
                                         result=rep,
-                                        notes=f"Auto-variant from statistical run ({variant_cluster.frequency}/{statistical_runs} occurrences)",
+                                        notes=f"Auto-variant from statistical run ({variant_cluster.frequency}/{len(test_results)} occurrences)",
                                         variant_name=variant_name,
                                     )
                                     console.print(f"    [green]✓ Saved variant '{variant_name}': {variant_cluster.sequence_key}[/green]")
                                 console.print()
 
+            if use_early_stop:
+                planned = statistical_runs * len(all_stat_results)
+                console.print(
+                    f"[dim]Early stop saved {total_saved} of {planned} planned agent runs.[/dim]"
+                )
             console.print()
 
         sys.exit(0)
 
+    # Incremental mode: --incremental/--no-incremental > config.yaml
+    incremental_cache = None
+    incremental_cfg = config.get_incremental_config() if config else None
+    if incremental if incremental is not None else bool(incremental_cfg and incremental_cfg.enabled):
+        from evalview.core.incremental import IncrementalCheckCache
+        incremental_cache = IncrementalCheckCache(
+            ttl_hours=incremental_cfg.ttl_hours if incremental_cfg else 24.0,
+            watch=incremental_cfg.watch if incremental_cfg else None,
+            exclude=[test_path],
+            force=force,
+        )
+
     # Execute tests and compare against golden — show spinner while waiting
     if not json_output:
         from evalview.commands.shared import run_with_spinner
         diffs, results, drift_tracker, golden_traces = run_with_spinner(
-            lambda: _execute_check_tests(test_cases, config, json_output, semantic_diff, timeout, skip_llm_judge=no_judge, budget_tracker=budget_tracker),
+            lambda: _execute_check_tests(test_cases, config, json_output, semantic_diff, timeout, skip_llm_judge=no_judge, budget_tracker=budget_tracker, limiter=limiter, incremental=incremental_cache),
             "Checking",
             len(test_cases),
         )
     else:
         diffs, results, drift_tracker, golden_traces = _execute_check_tests(
-            test_cases, config, json_output, semantic_diff, timeout, skip_llm_judge=no_judge, budget_tracker=budget_tracker
+            test_cases, config, json_output, semantic_diff, timeout, skip_llm_judge=no_judge, budget_tracker=budget_tracker, limiter=limiter, incremental=incremental_cache
+        )
+
+    if incremental_cache is not None and incremental_cache.reused and not json_output:
+        reused_count = len(incremental_cache.reused)
+        console.print(
+            f"[dim]↺ Incremental: reused {reused_count} unchanged passing test"
+            f"{'s' if reused_count != 1 else ''}, ran {len(test_cases) - reused_count} "
+            "(--force to re-run all)[/dim]\n"
+        )
+
+    if isinstance(limiter, AdaptiveConcurrencyLimiter) and not json_output:
+        console.print(
+            f"[dim]Adaptive concurrency: settled at {limiter.limit} "
+            f"(peak {limiter.peak_limit}, {limiter.backoffs} backoff"
+            f"{'s' if limiter.backoffs != 1 else ''})[/dim]\n"
+        )
+
+    pool_stats = http_client_pool.stats
+    if (max_concurrency or limiter.adaptive) and pool_stats.requests and not json_output:
+        console.print(
+            f"[dim]HTTP keep-alive: {pool_stats.reused}/{pool_stats.requests} requests "
+            f"reused a connection ({pool_stats.reuse_rate:.0%})[/dim]\n"
         )
 
     golden_names = {golden.test_name for golden in goldens}
@@ -19,6 +19,7 @@ Usage:
 from __future__ import annotations
 
 import json
+import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -28,6 +29,7 @@ import click
 from evalview.commands.shared import console
 from evalview.commands.since_cmd import _load_history
 from evalview.core.drift_tracker import _compute_slope
+from evalview.core.history_index import HistoryIndex
 from evalview.telemetry.decorators import track_command
 
 
@@ -97,6 +99,28 @@ def _parse_last(last: Optional[str]) -> Optional[timedelta]:
     return None
 
 
+def _load_window(
+    path: Path,
+    window: Optional[timedelta],
+    test_name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Load history narrowed by the offset index to the window and test.
+
+    The index compares raw ``ts`` strings, so the cutoff is widened by a
+    day to cover timezone offsets; ``_filter_by_window`` applies the exact
+    cutoff afterwards.
+    """
+    if not path.exists():
+        return []
+    since_ts = None
+    if window is not None:
+        since_ts = (datetime.now() - window - timedelta(days=1)).isoformat()
+    try:
+        return HistoryIndex(path).entries(test_name=test_name, since_ts=since_ts)
+    except (sqlite3.Error, OSError):
+        return _load_history(path)
+
+
 def _filter_by_window(
     entries: List[Dict[str, Any]],
     window: Optional[timedelta],
@@ -305,7 +329,8 @@ def drift_cmd(
     Tests above the "concerning" threshold are colored red, soft
     declines yellow, improvements green.
     """
-    entries = _load_history(_HISTORY_PATH)
+    window = _parse_last(last)
+    entries = _load_window(_HISTORY_PATH, window, test_name)
     if not entries:
         if json_output:
             click.echo(json.dumps({"rows": []}))
@@ -316,7 +341,6 @@ def drift_cmd(
         )
         return
 
-    window = _parse_last(last)
     entries = _filter_by_window(entries, window)
 
     per_test = _per_test_series(entries)
@@ -10,14 +10,17 @@ one of them. ``fleet`` tells you what's happening across all of them.
     evalview fleet --json > fleet.json
     evalview fleet --anomalies-only      # only show pods deviating from mean
     evalview fleet --require-clean       # CI gate
+    evalview fleet --dir .evalview/history/ --since 24h
 
-Pure analytics. No network, no LLM.
+Pure analytics. No network, no LLM. Inside a project, per-file progress is
+checkpointed in ``.evalview/fleet_checkpoint.json`` so reruns only read
+cycles appended since the last run.
 """
 from __future__ import annotations
 
 import json
 import sys
-from typing import Tuple
+from typing import Optional, Tuple
 
 import click
 
@@ -28,6 +31,8 @@ from evalview.core.fleet import (
     FleetReport,
     build_fleet_report,
     discover_history_files,
+    parse_since,
+    project_checkpoint_path,
 )
 from evalview.telemetry.decorators import track_command
 
@@ -56,6 +61,8 @@ def _render(report: FleetReport, anomalies_only: bool) -> None:
         f"|  Pass rate: [{color}]{pct:.1f}%[/{color}]  "
         f"|  Cost: [cyan]${report.fleet_cost:.4f}[/cyan]"
     )
+    if report.since:
+        console.print(f"  [dim]Cycles since {report.since}[/dim]")
     if report.fleet_regressions:
         console.print(
             f"  [red]Regressions across fleet: {report.fleet_regressions}[/red]"
@@ -157,6 +164,12 @@ def _verdict(report: FleetReport) -> Tuple[str, int]:
     show_default=True,
     help="Fraction of instances a test must fail in to count as fleet-wide.",
 )
+@click.option(
+    "--since",
+    "since",
+    default=None,
+    help='Only count cycles at or after this time: "Nh" | "Nd" | "yesterday" | ISO date.',
+)
 @click.option(
     "--anomalies-only",
     is_flag=True,
@@ -180,6 +193,7 @@ def fleet_cmd(
     directories: Tuple[str, ...],
     anomaly_sigma: float,
     test_impact_pct: float,
+    since: Optional[str],
     anomalies_only: bool,
     require_clean: bool,
     json_output: bool,
@@ -199,14 +213,22 @@ def fleet_cmd(
         evalview fleet --json > fleet.json
         evalview fleet --anomalies-only
         evalview fleet --require-clean   # CI gate
+        evalview fleet --since 7d
 
     History files are produced by `evalview monitor --history FILE.jsonl`.
     """
+    try:
+        cutoff = parse_since(since) if since else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--since") from None
+
     files = discover_history_files(history_paths, directories)
     report = build_fleet_report(
         files,
         anomaly_sigma=anomaly_sigma,
         test_impact_pct=test_impact_pct,
+        since=cutoff,
+        checkpoint_path=project_checkpoint_path(),
     )
 
     if json_output:
@@ -9,6 +9,7 @@ what changed vs the previous run.
 from __future__ import annotations
 
 import json
+import sqlite3
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +18,7 @@ from typing import Any, Dict, List, Tuple
 import click
 
 from evalview.commands.shared import console
+from evalview.core.history_index import HistoryIndex
 from evalview.telemetry.decorators import track_command
 
 
@@ -42,6 +44,50 @@ def _load_history(path: Path) -> List[Dict[str, Any]]:
     return entries
 
 
+def _run_key(entry: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Grouping key for one history entry (see ``_group_runs``)."""
+    ts = str(entry.get("ts") or "")
+    sha = str(entry.get("git_sha") or "")
+    prompt = str(entry.get("prompt_hash") or "")
+    # Minute precision when we have a version anchor; second otherwise.
+    # The ISO format is "YYYY-MM-DDTHH:MM:SS…" — slice at 16 for minute,
+    # 19 for second.
+    if sha or prompt:
+        ts_bucket = ts[:16]
+    else:
+        ts_bucket = ts[:19]
+    return (sha, prompt, ts_bucket)
+
+
+def _load_recent_run_entries(path: Path, limit: int) -> List[Dict[str, Any]]:
+    """Entries belonging to the newest ``limit`` runs, read newest first.
+
+    Walks the history offset index backwards and stops once it is past the
+    oldest minute of the runs being kept, so the cost follows ``limit``
+    rather than the size of the history file.
+    """
+    if not path.exists():
+        return []
+    try:
+        kept: set = set()
+        floor = ""
+        out: List[Dict[str, Any]] = []
+        for entry in HistoryIndex(path).iter_newest():
+            key = _run_key(entry)
+            if key not in kept:
+                if len(kept) >= limit:
+                    if str(entry.get("ts") or "")[:16] < floor:
+                        break
+                    continue
+                kept.add(key)
+                minute = key[2][:16]
+                floor = minute if not floor else min(floor, minute)
+            out.append(entry)
+        return out
+    except (sqlite3.Error, OSError):
+        return _load_history(path)
+
+
 def _group_runs(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Group per-test entries into runs.
 
@@ -58,18 +104,7 @@ def _group_runs(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     buckets: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = defaultdict(list)
     for e in entries:
-        ts = str(e.get("ts") or "")
-        sha = str(e.get("git_sha") or "")
-        prompt = str(e.get("prompt_hash") or "")
-        # Minute precision when we have a version anchor; second otherwise.
-        # The ISO format is "YYYY-MM-DDTHH:MM:SS…" — slice at 16 for minute,
-        # 19 for second.
-        if sha or prompt:
-            ts_bucket = ts[:16]
-        else:
-            ts_bucket = ts[:19]
-        key = (sha, prompt, ts_bucket)
-        buckets[key].append(e)
+        buckets[_run_key(e)].append(e)
 
     runs: List[Dict[str, Any]] = []
     for (sha, _prompt, _ts_bucket), items in buckets.items():
@@ -146,7 +181,7 @@ def log_cmd(limit: int, json_output: bool) -> None:
 
     Source: .evalview/history.jsonl, populated by every `evalview check`.
     """
-    entries = _load_history(_HISTORY_PATH)
+    entries = _load_recent_run_entries(_HISTORY_PATH, limit)
     if not entries:
         if json_output:
             click.echo(json.dumps({"runs": []}))
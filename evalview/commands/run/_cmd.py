@@ -179,7 +179,7 @@ def run(
         fail_on = "REGRESSION,TOOLS_CHANGED,OUTPUT_CHANGED,CONTRACT_DRIFT"
         warn_on = ""
 
-    asyncio.run(_run_async(
+    asyncio.run(_run_pooled(
         path=path, pattern=pattern, test=test, filter=filter, output=output,
         tags=tags,
         verbose=verbose, track=track, compare_baseline=compare_baseline, debug=debug,
@@ -197,6 +197,15 @@ def run(
 # ── Async orchestrator ─────────────────────────────────────────────────────────
 
 
+async def _run_pooled(**kwargs: Any) -> None:
+    """Run ``_run_async`` inside an HTTP pooling session so adapters share
+    keep-alive connections and the pool is closed before the loop ends."""
+    from evalview.core.http_pool import http_client_pool
+
+    async with http_client_pool.session():
+        await _run_async(**kwargs)
+
+
 async def _run_async(
     path: Optional[str],
     pattern: str,
@@ -243,6 +252,7 @@ async def _run_async(
     from evalview.tracking import RegressionTracker
     from evalview.core.retry import RetryConfig
     from evalview.core.config import ScoringWeights
+    from evalview.core.parallel import create_limiter
     from evalview.evaluators.statistical_evaluator import StatisticalEvaluator
     from evalview.reporters.console_reporter import ConsoleReporter
     from evalview.reporters.trace_live_reporter import create_trace_reporter
@@ -699,6 +709,8 @@ async def _run_async(
         statistical_evaluator=statistical_evaluator,
         stats_reporter=stats_reporter,
         no_judge=no_judge,
+        # Statistical repetitions of every test share one --max-workers cap.
+        limiter=create_limiter(1 if sequential else max_workers),
     )
 
     async def _execute(test_case: Any) -> Any:
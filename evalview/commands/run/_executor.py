@@ -41,6 +41,8 @@ class ExecutorOptions:
     statistical_evaluator: Any
     stats_reporter: Any
     no_judge: bool = False
+    # Shared cap on concurrent statistical repetitions across all tests.
+    limiter: Optional[Any] = None
 
 
 async def execute_single_test(
@@ -143,44 +145,59 @@ async def _execute_statistical(
     test_adapter: Any,
     console: Any,
 ) -> Tuple[bool, Any]:
-    """Run the test N times and return a statistical aggregate result."""
+    """Run the test N times and return a statistical aggregate result.
+
+    Repetitions run concurrently under ``options.limiter`` and stream into
+    the early-stop rule when the test's variance config enables it.
+    """
     from evalview.core.retry import with_retry
+    from evalview.evaluators.statistical_evaluator import run_repetitions, should_stop_early
 
     variance_config = test_case.thresholds.variance
     num_runs = variance_config.runs
     console.print(f"\n[cyan]📊 Statistical mode: Running {test_case.name} {num_runs} times...[/cyan]")
 
-    individual_results: List[Any] = []
-    for run_idx in range(num_runs):
-        try:
-            if options.retry_config.max_retries > 0:
-                retry_result = await with_retry(
-                    execute_fn,
-                    options.retry_config,
-                    on_retry=lambda attempt, delay, exc: None,
-                )
-                if not retry_result.success:
-                    console.print(f"  [red]Run {run_idx + 1}/{num_runs}: ERROR[/red]")
-                    continue
-                trace = retry_result.result
-            else:
-                trace = await execute_fn()
-
-            adapter_name = getattr(test_adapter, "name", None)
-            result = await options.evaluator.evaluate(test_case, trace, adapter_name=adapter_name)
-            individual_results.append(result)
-
-            status = "[green]✓[/green]" if result.passed else "[red]✗[/red]"
-            console.print(f"  Run {run_idx + 1}/{num_runs}: {status} score={result.score:.1f}")
+    adapter_name = getattr(test_adapter, "name", None)
 
-        except Exception as exc:
-            console.print(f"  [red]Run {run_idx + 1}/{num_runs}: ERROR - {str(exc)[:50]}[/red]")
+    async def _run_once(_: int) -> Any:
+        if options.retry_config.max_retries > 0:
+            retry_result = await with_retry(
+                execute_fn,
+                options.retry_config,
+                on_retry=lambda attempt, delay, exc: None,
+            )
+            if not retry_result.success:
+                exc = retry_result.exception
+                raise exc if exc is not None else RuntimeError("Test execution failed")
+            trace = retry_result.result
+        else:
+            trace = await execute_fn()
+        return await options.evaluator.evaluate(test_case, trace, adapter_name=adapter_name)
+
+    attempted = 0
+
+    def _on_result(done: int, result: Any, error: Optional[BaseException]) -> None:
+        nonlocal attempted
+        attempted = done
+        if error is not None:
+            console.print(f"  [red]Run {done}/{num_runs}: ERROR - {str(error)[:50]}[/red]")
+            return
+        status = "[green]✓[/green]" if result.passed else "[red]✗[/red]"
+        console.print(f"  Run {done}/{num_runs}: {status} score={result.score:.1f}")
+
+    individual_results: List[Any] = await run_repetitions(
+        _run_once,
+        num_runs,
+        limiter=options.limiter,
+        stop=(lambda rs: should_stop_early(rs, variance_config)) if variance_config.early_stop else None,
+        on_result=_on_result,
+    )
 
     if not individual_results:
         raise ValueError(f"All {num_runs} runs failed for {test_case.name}")
 
     stat_result = options.statistical_evaluator.evaluate_from_results(
-        test_case, individual_results, variance_config
+        test_case, individual_results, variance_config, skipped_runs=num_runs - attempted
     )
     options.stats_reporter.print_statistical_summary(stat_result, show_individual_runs=options.verbose)
 
@@ -74,8 +74,10 @@ def _load_test_cases(
     Returns the list of test cases, or None if a fatal error occurred.
     """
     from evalview.core.project_state import ProjectStateStore
+    from evalview.core.test_catalog import use_project_test_catalog
 
     state_store = ProjectStateStore()
+    use_project_test_catalog()
 
     if path:
         target = Path(path)
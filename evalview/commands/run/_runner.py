@@ -86,7 +86,8 @@ async def run_parallel(
     """
     import time as time_module
     from evalview.core.parallel import execute_tests_parallel
-    from evalview.core.llm_provider import judge_cost_tracker
+    from evalview.core.llm_provider import judge_cost_tracker, judge_dispatcher
+    from evalview.core.claim_cache import use_project_claim_cache
 
     results: List[Any] = []
 
@@ -99,6 +100,8 @@ async def run_parallel(
     start_time = time_module.time()
 
     judge_cost_tracker.reset()
+    judge_dispatcher.reset()
+    use_project_claim_cache()
 
     # ── Callback helpers ──────────────────────────────────────────────────────
 
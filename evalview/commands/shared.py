@@ -6,7 +6,7 @@ import os
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import httpx
 import yaml  # type: ignore[import-untyped]
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 from rich.console import Console
 
 from evalview.core.adapter_factory import create_adapter
+from evalview.core.http_pool import http_client_pool
 from evalview.core.types import ExecutionTrace, ExecutionMetrics, TokenUsage, TurnTrace
 
 if TYPE_CHECKING:
@@ -24,6 +25,8 @@ if TYPE_CHECKING:
     from evalview.core.drift_tracker import DriftTracker
     from evalview.adapters.base import AgentAdapter
     from evalview.core.budget import BudgetTracker
+    from evalview.core.parallel import ConcurrencyLimiter
+    from evalview.core.incremental import IncrementalCheckCache
 
 # Load environment variables (.env is the OSS standard, .env.local for overrides)
 load_dotenv()
@@ -578,7 +581,8 @@ def _execute_snapshot_tests(
         return await evaluator.evaluate(tc, trace)
 
     async def _run_all() -> List[Any]:
-        return await asyncio.gather(*[_run_one(tc) for tc in test_cases], return_exceptions=True)
+        async with http_client_pool.session():
+            return await asyncio.gather(*[_run_one(tc) for tc in test_cases], return_exceptions=True)
 
     outcomes = asyncio.run(_run_all())
 
@@ -628,7 +632,7 @@ def _execute_snapshot_tests(
     return results
 
 
-def _execute_check_tests(
+async def _execute_check_tests_async(
     test_cases: List["TestCase"],
     config: Optional["EvalViewConfig"],
     json_output: bool,
@@ -636,15 +640,35 @@ def _execute_check_tests(
     timeout: float = 30.0,
     skip_llm_judge: bool = False,
     budget_tracker: Optional["BudgetTracker"] = None,
+    limiter: Optional["ConcurrencyLimiter"] = None,
+    incremental: Optional["IncrementalCheckCache"] = None,
+    repetitions: int = 1,
+    stop_rule: Optional[Callable[["TestCase", List["EvaluationResult"]], bool]] = None,
 ) -> Tuple[List[Tuple[str, "TraceDiff"]], List["EvaluationResult"], "DriftTracker", Dict[str, "GoldenTrace"]]:
     """Execute tests and compare against golden variants.
 
+    Runs on the caller's event loop, so concurrent checks share its pooled
+    HTTP clients, judge dispatcher lanes and (when passed) ``limiter``.
+    :func:`_execute_check_tests` is the blocking entry point for the CLI.
+
     Args:
         test_cases: Test cases to run.
         config: EvalView config (adapter, endpoint, thresholds).
         json_output: Suppress non-JSON console output when True.
         semantic_diff: Enable embedding-based semantic similarity (opt-in).
         budget_tracker: Optional budget tracker for mid-run circuit breaking.
+        limiter: Caps how many tests run against the agent at once. Defaults
+            to the ``concurrency`` section of the config (8, non-adaptive).
+        incremental: When given, tests whose inputs match their last PASSED
+            check reuse that result instead of calling the agent and judge;
+            the golden diff is still recomputed. Fresh PASSED verdicts are
+            recorded for the next run.
+        repetitions: Run every test this many times (statistical mode). All
+            repetitions are scheduled at once and share ``limiter``; results
+            and diffs contain one entry per completed repetition.
+        stop_rule: Called with a test and its results so far after each
+            repetition; once it returns True the test's queued repetitions
+            are skipped.
 
     Returns:
         Tuple of (diffs, results, drift_tracker, golden_traces) where
@@ -655,8 +679,17 @@ def _execute_check_tests(
     from evalview.core.diff import DiffEngine
     from evalview.core.config import DiffConfig
     from evalview.core.drift_tracker import DriftTracker
+    from evalview.core.parallel import create_limiter
     from evalview.evaluators.evaluator import Evaluator
 
+    if limiter is None:
+        concurrency = config.get_concurrency_config() if config else None
+        limiter = create_limiter(
+            concurrency.max_concurrency if concurrency else None,
+            adaptive=concurrency.adaptive if concurrency else False,
+        )
+    run_limiter: "ConcurrencyLimiter" = limiter
+
     diff_config = config.get_diff_config() if config else DiffConfig()
     # --semantic-diff flag overrides config file setting
     if semantic_diff:
@@ -673,125 +706,243 @@ def _execute_check_tests(
     diffs: List[Tuple[str, "TraceDiff"]] = []
     golden_traces: Dict[str, GoldenTrace] = {}
 
-    if budget_tracker is not None:
-        # Sequential execution with budget checking after each test
-        async def _run_one_sequential(tc: "TestCase") -> Optional[Tuple["EvaluationResult", "TraceDiff", "GoldenTrace"]]:
-            """Run a single test: execute -> evaluate -> diff (async pipeline)."""
-            try:
-                adapter = _build_adapter_for_tc(tc, config, timeout)
-            except ValueError as e:
-                if not json_output:
-                    console.print(f"[yellow]⚠ Skipping {tc.name}: {e}[/yellow]")
-                return None
-            if adapter is None:
-                return None
-
-            trace = await _execute_agent_with_slow_warning(
-                tc, adapter, timeout, emit_warning=not json_output
-            )
-            result = await evaluator.evaluate(tc, trace)
+    # Incremental mode: fingerprint every test up front and pick out those
+    # whose last PASSED result can be reused.
+    fingerprints: Dict[str, Optional[str]] = {}
+    reusable: Dict[str, "EvaluationResult"] = {}
+    if incremental is not None:
+        incremental.bind_run(
+            skip_llm_judge=skip_llm_judge,
+            diff=diff_config.model_dump(mode="json"),
+        )
+        for tc in test_cases:
+            fingerprints[tc.name] = incremental.fingerprint(tc, store.list_variant_entries(tc.name))
+            prior = incremental.lookup(tc.name, fingerprints[tc.name])
+            if prior is not None:
+                reusable[tc.name] = prior
+
+    # Statistical mode: every repetition is scheduled up front; the stop rule
+    # sees each test's results as they stream in and can settle it early.
+    scheduled = [tc for tc in test_cases for _ in range(max(1, repetitions))]
+    completed: Dict[str, List["EvaluationResult"]] = {}
+    settled: set = set()
+
+    async def _run_one(
+        tc: "TestCase",
+    ) -> Optional[Tuple["EvaluationResult", "TraceDiff", "GoldenTrace"]]:
+        """Run a single test: execute -> evaluate -> diff (async pipeline)."""
+        if tc.name in reusable:
+            return await _reuse_one(tc, reusable[tc.name])
+        if tc.name in settled:
+            return None
+        outcome = await _run_fresh(tc)
+        if outcome is not None and stop_rule is not None:
+            so_far = completed.setdefault(tc.name, [])
+            so_far.append(outcome[0])
+            if stop_rule(tc, so_far):
+                settled.add(tc.name)
+        return outcome
+
+    async def _run_fresh(
+        tc: "TestCase",
+    ) -> Optional[Tuple["EvaluationResult", "TraceDiff", "GoldenTrace"]]:
+        try:
+            adapter = _build_adapter_for_tc(tc, config, timeout)
+        except ValueError as e:
+            if not json_output:
+                console.print(f"[yellow]⚠ Skipping {tc.name}: {e}[/yellow]")
+            return None
+        if adapter is None:
+            return None
 
-            golden_variants = store.load_all_golden_variants(tc.name)
-            if not golden_variants:
-                return None
+        trace = await _execute_agent_with_slow_warning(
+            tc, adapter, timeout, emit_warning=not json_output
+        )
+        result = await evaluator.evaluate(tc, trace)
 
-            diff = await diff_engine.compare_multi_reference_async(
-                golden_variants, trace, result.score
-            )
-            return result, diff, golden_variants[0]
+        golden_variants = store.load_all_golden_variants(tc.name)
+        if not golden_variants:
+            return None
 
-        async def _run_all_with_budget() -> None:
-            from evalview.core.budget import BudgetExhausted
+        # Use async comparison to include semantic diff when enabled
+        diff = await diff_engine.compare_multi_reference_async(
+            golden_variants, trace, result.score
+        )
+        return result, diff, golden_variants[0]
+
+    async def _reuse_one(
+        tc: "TestCase", result: "EvaluationResult"
+    ) -> Optional[Tuple["EvaluationResult", "TraceDiff", "GoldenTrace"]]:
+        """Diff a reused result against the goldens without calling the agent."""
+        golden_variants = store.load_all_golden_variants(tc.name)
+        if not golden_variants:
+            return None
+        diff = await diff_engine.compare_multi_reference_async(
+            golden_variants, result.trace, result.score
+        )
+        return result, diff, golden_variants[0]
 
-            total = len(test_cases)
-            completed = 0
-            for tc in test_cases:
+    def _record(tc: "TestCase", result: "EvaluationResult", diff: "TraceDiff") -> None:
+        if incremental is not None and tc.name not in reusable:
+            incremental.record(tc.name, fingerprints.get(tc.name), result, diff)
+
+    if budget_tracker is not None:
+        tracker: "BudgetTracker" = budget_tracker
+        # Sentinel for tests never started because the budget ran out.
+        budget_skipped = object()
+
+        # Budget-aware concurrent execution: each test reserves its estimated
+        # cost (baseline cost, else the running average) before it starts and
+        # is only admitted while spent + reserved stays within the limit. Once
+        # actual spend reaches the limit, tests still waiting are cancelled.
+        async def _run_budgeted(tc: "TestCase", admission: asyncio.Condition) -> Any:
+            if tc.name in reusable:
+                # Reused results cost nothing and never touch the agent.
+                return await _run_one(tc)
+            async with run_limiter.slot():
+                if tracker.halted:
+                    return budget_skipped
+                if tc.name in settled:
+                    return None
+                # The index carries the baseline cost, so full traces are
+                # only loaded once the test is admitted and needs a diff.
+                golden_entries = store.list_variant_entries(tc.name)
+                if not golden_entries:
+                    return None
+
+                baseline_cost = golden_entries[0].total_cost
+                estimate = tracker.estimate_cost(baseline_cost)
+                token: Optional[int] = None
+
+                def _admit() -> bool:
+                    nonlocal token
+                    if tracker.halted:
+                        return True
+                    token = tracker.reserve(estimate)
+                    return token is not None
+
+                async with admission:
+                    await admission.wait_for(_admit)
+                if token is None:
+                    return budget_skipped
+
+                outcome = None
                 try:
-                    outcome = await _run_one_sequential(tc)
-                except BaseException as exc:
+                    outcome = await _run_one(tc)
+                    return outcome
+                finally:
+                    if outcome is not None:
+                        adapter_type = tc.adapter or (config.adapter if config else "") or ""
+                        tracker.settle(
+                            token, tc.name, outcome[0].trace.metrics.total_cost, adapter=adapter_type
+                        )
+                    else:
+                        tracker.release(token)
+                    async with admission:
+                        admission.notify_all()
+
+        async def _run_all_with_budget() -> List:
+            admission = asyncio.Condition()
+            async with http_client_pool.session():
+                return await asyncio.gather(
+                    *[_run_budgeted(tc, admission) for tc in scheduled], return_exceptions=True
+                )
+
+        outcomes = await _run_all_with_budget()
+
+        # One locked history append for the whole run.
+        with drift_tracker.batch():
+            for tc, outcome in zip(scheduled, outcomes):
+                if isinstance(outcome, BaseException):
                     if not json_output:
-                        if isinstance(exc, (asyncio.TimeoutError, asyncio.CancelledError)):
-                            console.print(f"[red]✗ {tc.name}: Async execution timed out — {exc}[/red]")
+                        if isinstance(outcome, (asyncio.TimeoutError, asyncio.CancelledError)):
+                            console.print(f"[red]✗ {tc.name}: Async execution timed out — {outcome}[/red]")
                         else:
-                            console.print(f"[red]✗ {tc.name}: Failed — {exc}[/red]")
-                    completed += 1
+                            console.print(f"[red]✗ {tc.name}: Failed — {outcome}[/red]")
                     continue
-
-                if outcome is None:
-                    completed += 1
+                if outcome is None or outcome is budget_skipped:
                     continue
-
                 result, diff, golden = outcome
                 results.append(result)
                 diffs.append((tc.name, diff))
                 golden_traces[tc.name] = golden
-                drift_tracker.record_check(tc.name, diff, result=result)
-
-                # Record cost and check budget
-                cost = result.trace.metrics.total_cost
-                adapter_type = tc.adapter or (config.adapter if config else "") or ""
-                budget_tracker.record_cost(tc.name, cost, adapter=adapter_type)
-                completed += 1
-
-                try:
-                    budget_tracker.check_budget(completed=completed, total=total)
-                except BudgetExhausted:
-                    break
-
-        asyncio.run(_run_all_with_budget())
+                _record(tc, result, diff)
+                if tc.name not in reusable:
+                    drift_tracker.record_check(tc.name, diff, result=result)
     else:
-        # Original concurrent execution (no budget tracking)
-        async def _run_one(tc: "TestCase") -> Optional[Tuple["EvaluationResult", "TraceDiff", "GoldenTrace"]]:
-            """Run a single test: execute -> evaluate -> diff (async pipeline)."""
-            try:
-                adapter = _build_adapter_for_tc(tc, config, timeout)
-            except ValueError as e:
-                if not json_output:
-                    console.print(f"[yellow]⚠ Skipping {tc.name}: {e}[/yellow]")
-                return None
-            if adapter is None:
-                return None
-
-            trace = await _execute_agent_with_slow_warning(
-                tc, adapter, timeout, emit_warning=not json_output
-            )
-            result = await evaluator.evaluate(tc, trace)
+        async def _run_limited(tc: "TestCase") -> Optional[Tuple["EvaluationResult", "TraceDiff", "GoldenTrace"]]:
+            if tc.name in reusable:
+                return await _run_one(tc)
+            # Exceptions leave the slot so an adaptive limiter sees 429s/timeouts.
+            async with run_limiter.slot():
+                return await _run_one(tc)
+
+        # Run all tests in a single event loop; the limiter caps how many hit
+        # the agent at once. return_exceptions=True means exceptions are
+        # returned as values (not raised), so one failing test does not
+        # cancel the others. The pooling session keeps agent connections
+        # alive across tests and closes them before the loop ends.
+        async def _run_all() -> List:
+            async with http_client_pool.session():
+                return await asyncio.gather(*[_run_limited(tc) for tc in scheduled], return_exceptions=True)
 
-            golden_variants = store.load_all_golden_variants(tc.name)
-            if not golden_variants:
-                return None
+        outcomes = await _run_all()
 
-            # Use async comparison to include semantic diff when enabled
-            diff = await diff_engine.compare_multi_reference_async(
-                golden_variants, trace, result.score
-            )
-            return result, diff, golden_variants[0]
+        # One locked history append for the whole run.
+        with drift_tracker.batch():
+            for tc, outcome in zip(scheduled, outcomes):
+                if isinstance(outcome, BaseException):
+                    if not json_output:
+                        if isinstance(outcome, (asyncio.TimeoutError, asyncio.CancelledError)):
+                            console.print(f"[red]✗ {tc.name}: Async execution timed out — {outcome}[/red]")
+                        else:
+                            console.print(f"[red]✗ {tc.name}: Failed — {outcome}[/red]")
+                    continue
+                if outcome is None:
+                    continue
+                result, diff, golden = outcome
+                results.append(result)
+                diffs.append((tc.name, diff))
+                golden_traces[tc.name] = golden
+                _record(tc, result, diff)
+                if tc.name not in reusable:
+                    drift_tracker.record_check(tc.name, diff)
 
-        # Run all tests concurrently in a single event loop.
-        # return_exceptions=True means exceptions are returned as values (not raised),
-        # so one failing test does not cancel the others.
-        async def _run_all() -> List:
-            return await asyncio.gather(*[_run_one(tc) for tc in test_cases], return_exceptions=True)
+    if incremental is not None:
+        incremental.save()
 
-        outcomes = asyncio.run(_run_all())
+    return diffs, results, drift_tracker, golden_traces
 
-        for tc, outcome in zip(test_cases, outcomes):
-            if isinstance(outcome, BaseException):
-                if not json_output:
-                    if isinstance(outcome, (asyncio.TimeoutError, asyncio.CancelledError)):
-                        console.print(f"[red]✗ {tc.name}: Async execution timed out — {outcome}[/red]")
-                    else:
-                        console.print(f"[red]✗ {tc.name}: Failed — {outcome}[/red]")
-                continue
-            if outcome is None:
-                continue
-            result, diff, golden = outcome
-            results.append(result)
-            diffs.append((tc.name, diff))
-            golden_traces[tc.name] = golden
-            drift_tracker.record_check(tc.name, diff)
 
-    return diffs, results, drift_tracker, golden_traces
+def _execute_check_tests(
+    test_cases: List["TestCase"],
+    config: Optional["EvalViewConfig"],
+    json_output: bool,
+    semantic_diff: bool = False,
+    timeout: float = 30.0,
+    skip_llm_judge: bool = False,
+    budget_tracker: Optional["BudgetTracker"] = None,
+    limiter: Optional["ConcurrencyLimiter"] = None,
+    incremental: Optional["IncrementalCheckCache"] = None,
+    repetitions: int = 1,
+    stop_rule: Optional[Callable[["TestCase", List["EvaluationResult"]], bool]] = None,
+) -> Tuple[List[Tuple[str, "TraceDiff"]], List["EvaluationResult"], "DriftTracker", Dict[str, "GoldenTrace"]]:
+    """Blocking wrapper around :func:`_execute_check_tests_async` (one event loop per call)."""
+    return asyncio.run(
+        _execute_check_tests_async(
+            test_cases,
+            config,
+            json_output,
+            semantic_diff=semantic_diff,
+            timeout=timeout,
+            skip_llm_judge=skip_llm_judge,
+            budget_tracker=budget_tracker,
+            limiter=limiter,
+            incremental=incremental,
+            repetitions=repetitions,
+            stop_rule=stop_rule,
+        )
+    )
 
 
 def _analyze_check_diffs(diffs: List[Tuple[str, "TraceDiff"]]) -> Dict[str, Any]:
@@ -126,6 +126,7 @@ async def _run_one(
     replay: bool = False,
     allow_live: bool = False,
     cassette_dir: Path = DEFAULT_CASSETTE_DIR,
+    max_concurrency: Optional[int] = None,
 ) -> dict:
     """Run a single test case and return a serializable summary dict."""
     if tc.mocks is None:
@@ -167,6 +168,7 @@ async def _run_one(
             replay_cassette=replay_cassette,
             record=record,
             allow_live=allow_live,
+            max_concurrency=max_concurrency,
         )
     else:
         _, result = await sim.run(
@@ -205,6 +207,12 @@ async def _run_one(
 @click.option("--test", "-t", "test_filter", default=None, help="Run only this test by name.")
 @click.option("--seed", type=int, default=None, help="Override the seed declared in YAML.")
 @click.option("--variants", type=int, default=1, help="Run N deterministic replays (default: 1).")
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Run up to N variants at once (default: one by one).",
+)
 @click.option("--json", "json_output", is_flag=True, default=False, help="Emit JSON summary for CI.")
 @click.option(
     "--record",
@@ -242,6 +250,7 @@ def simulate(
     test_filter: Optional[str],
     seed: Optional[int],
     variants: int,
+    max_concurrency: Optional[int],
     json_output: bool,
     record: bool,
     replay: bool,
@@ -283,6 +292,7 @@ def simulate(
                 record=record, replay=replay,
                 allow_live=allow_live,
                 cassette_dir=cassette_dir_path,
+                max_concurrency=max_concurrency,
             ))
         except Exception as exc:
             summaries.append({
@@ -491,6 +491,14 @@ def skill_doctor(path: str, recursive: bool, security_scan: bool) -> None:
 @click.option("--no-rubric", is_flag=True, help="Skip Phase 2 rubric evaluation (deterministic only)")
 @click.option("--cwd", type=click.Path(exists=True), default=None, help="Working directory for agent execution")
 @click.option("--max-turns", type=int, default=None, help="Maximum conversation turns (default: 10)")
+@click.option(
+    "--max-concurrency", type=click.IntRange(min=1), default=None,
+    help="Legacy mode: maximum tests in flight at once (default: 8)",
+)
+@click.option(
+    "--rpm", "requests_per_minute", type=click.FloatRange(min=0, min_open=True), default=None,
+    help="Legacy mode: cap on provider requests per minute (default: none; 429s are retried)",
+)
 @track_command("skill_test", lambda **kw: {"agent": kw.get("agent"), "no_rubric": kw.get("no_rubric")})
 def skill_test(
     test_file: str,
@@ -504,6 +512,8 @@ def skill_test(
     no_rubric: bool,
     cwd: str,
     max_turns: int,
+    max_concurrency: Optional[int],
+    requests_per_minute: Optional[float],
 ) -> None:
     """Run behavior tests against a skill.
 
@@ -557,7 +567,13 @@ def skill_test(
     from evalview.skills import SkillRunner
 
     try:
-        runner = SkillRunner(model=model, provider=provider, base_url=base_url)
+        runner = SkillRunner(
+            model=model,
+            provider=provider,
+            base_url=base_url,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+        )
         suite = runner.load_test_suite(test_file)
     except Exception as e:
         if "API key" in str(e) or "base URL" in str(e) or "provider" in str(e).lower():
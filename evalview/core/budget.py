@@ -69,6 +69,12 @@ class BudgetTracker:
         tracker = BudgetTracker(limit=1.00)
         tracker.record_cost("test-1", 0.05, adapter="http")
         tracker.check_budget(completed=1, total=5)  # raises BudgetExhausted if over
+
+    Concurrent runs reserve an estimated cost per in-flight test instead:
+        token = tracker.reserve(tracker.estimate_cost(baseline_cost))
+        if token is not None:
+            ...run the test...
+            tracker.settle(token, "test-1", actual_cost)
     """
 
     def __init__(self, limit: Optional[float] = None):
@@ -77,6 +83,9 @@ class BudgetTracker:
         self.spent: float = 0.0
         self.breakdown = CostBreakdown()
         self._halted = False
+        self._reservations: Dict[int, float] = {}
+        self._next_token = 0
+        self._settled = 0
 
     @property
     def is_active(self) -> bool:
@@ -92,6 +101,88 @@ class BudgetTracker:
     def halted(self) -> bool:
         return self._halted
 
+    @property
+    def reserved(self) -> float:
+        """Estimated cost held by tests that are currently in flight."""
+        with self._lock:
+            return sum(self._reservations.values())
+
+    @property
+    def projected(self) -> float:
+        """Spent so far plus outstanding reservations."""
+        with self._lock:
+            return self.spent + sum(self._reservations.values())
+
+    def estimate_cost(self, baseline_cost: Optional[float] = None) -> float:
+        """Estimate what the next test will cost.
+
+        Prefers the test's own baseline cost; falls back to the average
+        cost of tests settled so far in this run (0.0 before any have).
+        """
+        if baseline_cost:
+            return baseline_cost
+        with self._lock:
+            if self._settled == 0:
+                return 0.0
+            return self.spent / self._settled
+
+    def reserve(self, estimate: float) -> Optional[int]:
+        """Reserve ``estimate`` dollars for a test about to start.
+
+        The test is admitted only while spent + reserved + estimate stays
+        within the limit. When nothing is in flight, a test is admitted as
+        long as any budget remains, so a pessimistic estimate can never
+        stall the run. With no estimate at all (no baseline cost, nothing
+        settled yet) a single probe test runs first to learn the cost.
+
+        Returns:
+            A reservation token to pass to :meth:`settle` or :meth:`release`,
+            or None if the test must wait (or the budget is exhausted —
+            check :attr:`halted`).
+        """
+        with self._lock:
+            if self.limit is not None:
+                if self._halted:
+                    return None
+                if self.spent >= self.limit:
+                    self._halted = True
+                    return None
+                if self._reservations:
+                    if estimate <= 0 and self._settled == 0:
+                        return None
+                    projected = self.spent + sum(self._reservations.values()) + estimate
+                    if projected > self.limit:
+                        return None
+            token = self._next_token
+            self._next_token += 1
+            self._reservations[token] = max(0.0, estimate)
+            return token
+
+    def settle(
+        self,
+        token: int,
+        test_name: str,
+        cost: float,
+        adapter: str = "",
+        tool_costs: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Replace a reservation with the test's actual cost.
+
+        Trips the circuit breaker once actual spend reaches the limit.
+        """
+        with self._lock:
+            self._reservations.pop(token, None)
+            self.spent += cost
+            self._settled += 1
+            self.breakdown.record(test_name, cost, adapter, tool_costs)
+            if self.limit is not None and self.spent >= self.limit:
+                self._halted = True
+
+    def release(self, token: int) -> None:
+        """Drop a reservation without recording cost (test skipped or errored)."""
+        with self._lock:
+            self._reservations.pop(token, None)
+
     def record_cost(
         self,
         test_name: str,
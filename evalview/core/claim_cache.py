@@ -0,0 +1,251 @@
+"""Cache for hallucination-judge results: extracted claims and per-claim verdicts.
+
+HallucinationEvaluator makes two judge calls per test: one to extract the
+factual claims from the agent's answer, one to verify them against the
+tool outputs. A stable agent keeps producing the same answers from the same
+tool outputs, so both results can be reused:
+
+    - claims are keyed on (judge model, query, response)
+    - verdicts are keyed on (judge model, claim, hash of the tool context)
+
+Keying verdicts per claim means an answer that changes wording in one
+sentence only re-verifies the claims that actually changed.
+
+Usage:
+    ctx = ClaimVerdictCache.hash_context(tool_context)
+    cached = claim_cache.get_verdicts(model, ctx, claims)   # None marks a miss
+    ...
+    claim_cache.put_verdicts(model, ctx, [(claim, verdict), ...])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Verdict = Dict[str, Any]
+
+DEFAULT_CLAIM_CACHE_PATH = ".evalview/claim_cache.db"
+DEFAULT_CLAIM_CACHE_TTL = 7 * 86400
+
+
+class ClaimVerdictCache:
+    """In-memory cache with optional SQLite persistence for claim extraction and verdicts.
+
+    Args:
+        persist_path: Path to a SQLite file for cross-session persistence.
+                      When None, cache is in-memory only.
+        ttl: Time-to-live in seconds. 0 means entries never expire.
+             Default is 7 days, so a judge model updated under the same
+             name eventually re-checks old claims.
+    """
+
+    def __init__(
+        self,
+        persist_path: Optional[str] = None,
+        ttl: int = DEFAULT_CLAIM_CACHE_TTL,
+    ):
+        if ttl < 0:
+            raise ValueError(f"ttl must be >= 0 (0 = no expiry), got {ttl}")
+        self.ttl = ttl
+        self.persist_path: Optional[str] = None
+
+        # In-memory cache: key -> (timestamp, value)
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+        if persist_path:
+            self.persist_to(persist_path)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def persist_to(self, path: str) -> None:
+        """Back the cache with a SQLite file (created if missing)."""
+        path = os.path.abspath(path)
+        if path == self.persist_path:
+            return
+        self.persist_path = path
+        try:
+            self._init_db()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Claim cache unavailable at {path}: {e}")
+            self.persist_path = None
+
+    def get_claims(self, model: str, query: str, response: str) -> Optional[List[str]]:
+        """Look up the claims extracted from ``response``; None on miss."""
+        values = self._get_many([self._claims_key(model, query, response)])
+        return values[0]
+
+    def put_claims(self, model: str, query: str, response: str, claims: Sequence[str]) -> None:
+        """Store the claims extracted from ``response``."""
+        self._put_many({self._claims_key(model, query, response): list(claims)})
+
+    def get_verdicts(
+        self, model: str, context_hash: str, claims: Sequence[str]
+    ) -> List[Optional[Verdict]]:
+        """Look up verdicts for ``claims`` against one tool context; None marks a miss."""
+        return self._get_many([self._verdict_key(model, context_hash, c) for c in claims])
+
+    def put_verdicts(
+        self, model: str, context_hash: str, verdicts: Iterable[Tuple[str, Verdict]]
+    ) -> None:
+        """Store ``(claim, verdict)`` pairs for one tool context."""
+        self._put_many(
+            {self._verdict_key(model, context_hash, claim): dict(v) for claim, v in verdicts}
+        )
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Return cache hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total": total,
+            "hit_rate": round(self.hits / total, 2) if total else 0.0,
+            "entries": len(self._memory),
+        }
+
+    # ------------------------------------------------------------------
+    # Cache key builders
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def hash_context(tool_context: str) -> str:
+        """Hash the tool outputs a set of claims is verified against."""
+        return hashlib.sha256(tool_context.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _claims_key(model: str, query: str, response: str) -> str:
+        raw = json.dumps([query, response])
+        return f"claims:{model}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def _verdict_key(model: str, context_hash: str, claim: str) -> str:
+        raw = f"{context_hash}|{claim}"
+        return f"verdict:{model}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _is_valid(self, timestamp: float) -> bool:
+        if self.ttl == 0:
+            return True
+        return (time.time() - timestamp) < self.ttl
+
+    def _get_many(self, keys: List[str]) -> List[Any]:
+        results: List[Any] = []
+        missing: List[str] = []
+        for key in keys:
+            entry = self._memory.get(key)
+            if entry is not None and self._is_valid(entry[0]):
+                results.append(entry[1])
+            else:
+                self._memory.pop(key, None)
+                results.append(None)
+                missing.append(key)
+
+        if missing and self.persist_path:
+            found = {
+                key: (ts, value)
+                for key, (ts, value) in self._db_get_many(missing).items()
+                if self._is_valid(ts)
+            }
+            self._memory.update(found)
+            results = [
+                found[key][1] if value is None and key in found else value
+                for key, value in zip(keys, results)
+            ]
+
+        for value in results:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return results
+
+    def _put_many(self, values: Dict[str, Any]) -> None:
+        if not values:
+            return
+        ts = time.time()
+        for key, value in values.items():
+            self._memory[key] = (ts, value)
+        if self.persist_path:
+            self._db_put_many(ts, values)
+
+    # ------------------------------------------------------------------
+    # SQLite persistence
+    # ------------------------------------------------------------------
+
+    def _init_db(self) -> None:
+        assert self.persist_path is not None
+        os.makedirs(os.path.dirname(self.persist_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS claim_cache (
+                    key TEXT PRIMARY KEY,
+                    timestamp REAL NOT NULL,
+                    value TEXT NOT NULL
+                )"""
+            )
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        assert self.persist_path is not None  # guarded by callers: only called when persist_path is set
+        conn = sqlite3.connect(self.persist_path, timeout=10.0)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _db_get_many(self, keys: List[str]) -> Dict[str, Tuple[float, Any]]:
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"SELECT key, timestamp, value FROM claim_cache WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"Claim cache read failed: {e}")
+            return {}
+        found: Dict[str, Tuple[float, Any]] = {}
+        for key, ts, value in rows:
+            try:
+                found[key] = (ts, json.loads(value))
+            except ValueError:
+                continue
+        return found
+
+    def _db_put_many(self, ts: float, values: Dict[str, Any]) -> None:
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO claim_cache (key, timestamp, value) VALUES (?, ?, ?)",
+                    [(key, ts, json.dumps(value)) for key, value in values.items()],
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Claim cache write failed: {e}")
+
+
+# Global cache shared by every HallucinationEvaluator. `evalview check` and
+# `evalview run` persist it to .evalview/claim_cache.db inside a project.
+claim_cache = ClaimVerdictCache()
+
+
+def use_project_claim_cache() -> None:
+    """Persist the global claim cache under .evalview/ when run inside a project."""
+    if os.path.isdir(os.path.dirname(DEFAULT_CLAIM_CACHE_PATH)):
+        claim_cache.persist_to(DEFAULT_CLAIM_CACHE_PATH)
@@ -1,6 +1,6 @@
 """Configuration models for EvalView."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -133,6 +133,20 @@ class DiffConfig(BaseModel):
         ),
     )
 
+    # Lexical similarity backend (see evalview/core/similarity.py). All
+    # backends return a 0-1 ratio on the same scale as SequenceMatcher, so the
+    # thresholds above keep their meaning; faster backends matter for long
+    # outputs where SequenceMatcher is quadratic.
+    similarity_backend: Literal["sequence", "lcs", "token", "shingle", "rapidfuzz"] = Field(
+        default="sequence",
+        description=(
+            "Lexical similarity algorithm for output comparison. "
+            "sequence: difflib (default). lcs: exact character LCS, bit-parallel. "
+            "token: LCS over word tokens (fastest exact). shingle: token 3-gram "
+            "overlap, linear time. rapidfuzz: C-accelerated LCS (pip install rapidfuzz)."
+        ),
+    )
+
 
 class JudgeConfig(BaseModel):
     """LLM judge configuration.
@@ -144,6 +158,9 @@ class JudgeConfig(BaseModel):
         judge:
           provider: anthropic
           model: sonnet
+          rpm: 50
+          tpm: 40000
+          batch_claims: true
     """
 
     provider: Optional[str] = Field(
@@ -154,6 +171,26 @@ class JudgeConfig(BaseModel):
         default=None,
         description="Model name or alias (e.g., gpt-4o, sonnet, llama-70b)"
     )
+    rpm: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum judge requests per minute to the provider (env: EVAL_JUDGE_RPM)"
+    )
+    tpm: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum estimated judge tokens per minute (env: EVAL_JUDGE_TPM)"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum judge requests in flight (default 16, env: EVAL_JUDGE_CONCURRENCY)"
+    )
+    batch_claims: Optional[bool] = Field(
+        default=None,
+        description="Verify hallucination claims from concurrent tests in one judge request "
+        "(env: EVAL_JUDGE_BATCH_CLAIMS)"
+    )
 
 
 class MonitorConfig(BaseModel):
@@ -219,6 +256,64 @@ class MonitorConfig(BaseModel):
     )
 
 
+class ConcurrencyConfig(BaseModel):
+    """Concurrency limits for test execution.
+
+    CLI flags (--max-concurrency, --adaptive-concurrency) take priority.
+
+    Example in config.yaml:
+        concurrency:
+          max_concurrency: 16
+          adaptive: true
+    """
+
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of tests executing against the agent at once"
+    )
+    adaptive: bool = Field(
+        default=False,
+        description=(
+            "Use AIMD to find the agent's sustainable concurrency: back off on "
+            "429/503/timeouts, ramp up while latency stays healthy"
+        ),
+    )
+
+
+class IncrementalConfig(BaseModel):
+    """Incremental check mode: reuse verdicts for tests whose inputs are unchanged.
+
+    A test's previous PASSED verdict is reused when its definition, golden
+    baseline, config/prompts, judge settings and watched source files all
+    match the last passing check and that check is younger than ``ttl_hours``.
+    CLI flags (--incremental, --force) take priority.
+
+    Example in config.yaml:
+        incremental:
+          enabled: true
+          ttl_hours: 12
+          watch: [src/agent, prompts]
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Reuse unchanged tests' verdicts by default on evalview check"
+    )
+    ttl_hours: float = Field(
+        default=24.0,
+        gt=0.0,
+        description="Re-run a test once its last real check is older than this"
+    )
+    watch: List[str] = Field(
+        default_factory=list,
+        description=(
+            "Source paths (relative to the project root) whose changes invalidate "
+            "reused verdicts. Empty = every git-tracked file except tests and .evalview/."
+        ),
+    )
+
+
 class EvalViewConfig(BaseModel):
     """Complete EvalView configuration (loaded from config.yaml)."""
 
@@ -242,6 +337,8 @@ class EvalViewConfig(BaseModel):
     diff: Optional[DiffConfig] = None
     judge: Optional[JudgeConfig] = None
     monitor: Optional[MonitorConfig] = None
+    concurrency: Optional[ConcurrencyConfig] = None
+    incremental: Optional[IncrementalConfig] = None
 
     def get_scoring_weights(self) -> ScoringWeights:
         """Get scoring weights with defaults."""
@@ -277,13 +374,27 @@ class EvalViewConfig(BaseModel):
             return self.monitor
         return MonitorConfig()
 
+    def get_concurrency_config(self) -> ConcurrencyConfig:
+        """Get concurrency config with defaults."""
+        if self.concurrency:
+            return self.concurrency
+        return ConcurrencyConfig()
+
+    def get_incremental_config(self) -> IncrementalConfig:
+        """Get incremental check config with defaults."""
+        if self.incremental:
+            return self.incremental
+        return IncrementalConfig()
+
 
 def apply_judge_config(config: Optional[EvalViewConfig]) -> None:
     """Apply judge config from config.yaml to environment variables.
 
-    Sets EVAL_PROVIDER and EVAL_MODEL if configured and not already set
-    by CLI flags or env vars. Safe to call multiple times — existing env
-    vars always take priority.
+    Sets EVAL_PROVIDER, EVAL_MODEL, the judge dispatcher limits
+    (EVAL_JUDGE_RPM, EVAL_JUDGE_TPM, EVAL_JUDGE_CONCURRENCY) and
+    EVAL_JUDGE_BATCH_CLAIMS if configured
+    and not already set by CLI flags or env vars. Safe to call multiple
+    times — existing env vars always take priority.
     """
     if config is None:
         return
@@ -296,6 +407,14 @@ def apply_judge_config(config: Optional[EvalViewConfig]) -> None:
     if judge_cfg.model and not os.environ.get("EVAL_MODEL"):
         from evalview.core.llm_provider import resolve_model_alias
         os.environ["EVAL_MODEL"] = resolve_model_alias(judge_cfg.model)
+    for env_var, value in (
+        ("EVAL_JUDGE_RPM", judge_cfg.rpm),
+        ("EVAL_JUDGE_TPM", judge_cfg.tpm),
+        ("EVAL_JUDGE_CONCURRENCY", judge_cfg.max_concurrency),
+        ("EVAL_JUDGE_BATCH_CLAIMS", judge_cfg.batch_claims),
+    ):
+        if value is not None and not os.environ.get(env_var):
+            os.environ[env_var] = str(value)
 
 
 # Default weights for backward compatibility
@@ -9,13 +9,15 @@ The diff engine provides deterministic comparison that:
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Union, overload
 from difflib import SequenceMatcher, unified_diff
 import logging
+import os
 
 from evalview.core.types import ExecutionTrace, StepTrace
 from evalview.core.golden import GoldenTrace
 from evalview.core.config import DiffConfig
+from evalview.core.similarity import get_similarity_backend
 from evalview.core.drift_kind import DriftKind, DriftConfidence
 from evalview.core.model_runtime_detector import (
     extract_trace_model_labels,
@@ -79,6 +81,57 @@ class ToolDiff:
     parameter_diffs: List[ParameterDiff] = field(default_factory=list)  # NEW: Detailed parameter comparison
 
 
+class LazyDiffLines(Sequence[str]):
+    """Unified diff lines that are only computed when first read.
+
+    Most checks never render the diff, so building it eagerly for every
+    test was wasted work on long outputs.
+    """
+
+    def __init__(self, golden_output: str, actual_output: str, limit: int = 50):
+        self._golden_output = golden_output
+        self._actual_output = actual_output
+        self._limit = limit
+        self._lines: Optional[List[str]] = None
+
+    def _materialize(self) -> List[str]:
+        if self._lines is None:
+            diff = unified_diff(
+                self._golden_output.splitlines(keepends=True),
+                self._actual_output.splitlines(keepends=True),
+                fromfile="golden",
+                tofile="actual",
+                lineterm="",
+            )
+            self._lines = [line for _, line in zip(range(self._limit), diff)]
+        return self._lines
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self._materialize() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._lines is None:
+            return "LazyDiffLines(<not computed>)"
+        return repr(self._lines)
+
+
 @dataclass
 class OutputDiff:
     """Difference in output."""
@@ -86,7 +139,7 @@ class OutputDiff:
     similarity: float  # 0.0 to 1.0 (lexical, always present)
     golden_preview: str
     actual_preview: str
-    diff_lines: List[str]  # Unified diff lines
+    diff_lines: Sequence[str]  # Unified diff lines (computed lazily by DiffEngine)
     severity: DiffSeverity
     # Embedding-based semantic similarity (opt-in via DiffConfig.semantic_diff_enabled).
     # None when semantic diff is disabled or OPENAI_API_KEY is not set.
@@ -199,14 +252,21 @@ class DiffEngine:
         self.ignore_whitespace = config.ignore_whitespace
         self.ignore_case_in_output = config.ignore_case_in_output
         self._config = config
+        self._similarity = get_similarity_backend(config.similarity_backend)
 
         # SemanticDiff is opt-in: only created when semantic_diff_enabled=True
         # and OPENAI_API_KEY is available. Falls back gracefully to None.
+        # Inside an initialised project, embeddings persist across runs so
+        # unchanged golden outputs are not re-embedded on every check.
         self._semantic_diff = None
         if config.semantic_diff_enabled:
             try:
+                from evalview.core.embedding_cache import DEFAULT_EMBEDDING_CACHE_PATH, EmbeddingCache
                 from evalview.core.semantic_diff import SemanticDiff
-                self._semantic_diff = SemanticDiff()
+                persist = os.path.isdir(os.path.dirname(DEFAULT_EMBEDDING_CACHE_PATH))
+                self._semantic_diff = SemanticDiff(
+                    cache=EmbeddingCache(DEFAULT_EMBEDDING_CACHE_PATH if persist else None)
+                )
             except (ImportError, ValueError) as e:
                 logger.warning(
                     f"Semantic diff requested but unavailable: {e}. "
@@ -676,7 +736,7 @@ class DiffEngine:
             current_output = actual_outputs.get(t)
 
             if baseline_output is not None and current_output is not None:
-                output_similarity = SequenceMatcher(None, baseline_output, current_output).ratio()
+                output_similarity = self._output_similarity(baseline_output, current_output)
                 # Escalate status if tools match but output diverged significantly
                 if status == DiffStatus.PASSED and output_similarity < self.output_threshold:
                     status = DiffStatus.OUTPUT_CHANGED
@@ -693,24 +753,22 @@ class DiffEngine:
 
         return turn_diffs
 
+    def _output_similarity(self, golden_output: str, actual_output: str) -> float:
+        """Lexical similarity of two outputs via the configured backend.
+
+        Identical outputs return 1.0 without running the matcher.
+        """
+        return self._similarity.similarity(golden_output, actual_output)
+
     def _compare_outputs(
         self, golden_output: str, actual_output: str
     ) -> OutputDiff:
         """Compare outputs and return diff."""
-        # Calculate similarity
-        similarity = SequenceMatcher(None, golden_output, actual_output).ratio()
-
-        # Generate unified diff for display
-        golden_lines = golden_output.splitlines(keepends=True)
-        actual_lines = actual_output.splitlines(keepends=True)
-        diff_lines = list(
-            unified_diff(
-                golden_lines,
-                actual_lines,
-                fromfile="golden",
-                tofile="actual",
-                lineterm="",
-            )
+        similarity = self._output_similarity(golden_output, actual_output)
+
+        # Unified diff is only built if a reporter reads it.
+        diff_lines: Sequence[str] = (
+            [] if similarity == 1.0 else LazyDiffLines(golden_output, actual_output)
         )
 
         # Determine severity (used internally, overall status determined in compare())
@@ -729,7 +787,7 @@ class DiffEngine:
             similarity=similarity,
             golden_preview=golden_preview,
             actual_preview=actual_preview,
-            diff_lines=diff_lines[:50],  # Limit diff output
+            diff_lines=diff_lines,
             severity=severity,
         )
 
@@ -6,6 +6,9 @@ decline in output similarity that individual per-check thresholds would miss.
 Usage:
     tracker = DriftTracker()
     tracker.record_check("my-test", diff)
+    with tracker.batch():                 # one locked append per run
+        for name, diff in diffs:
+            tracker.record_check(name, diff)
     warning = tracker.detect_gradual_drift("my-test")
     if warning:
         console.print(f"[yellow]⚠ {warning}[/yellow]")
@@ -22,17 +25,46 @@ import hashlib
 import json
 import logging
 import os
+import sqlite3
 import subprocess
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from math import sqrt
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still whole-line, just unlocked
+    fcntl = None  # type: ignore[assignment]
 
 from evalview.core.diff import TraceDiff
+from evalview.core.history_index import HistoryIndex, scan_history
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _history_lock(history_path: Path) -> Generator[None, None, None]:
+    """Exclusive inter-process lock guarding appends to and pruning of history.
+
+    Several ``evalview monitor`` processes can share one .evalview directory.
+    Pruning replaces the file, so an unlocked append racing with it would
+    land in the discarded copy. The lock is an advisory flock on a sidecar
+    ``.lock`` file; it is a no-op where fcntl is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = history_path.with_suffix(".jsonl.lock")
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def _current_git_sha(base_path: Path) -> Optional[str]:
     """Return the short git SHA for the repo containing base_path, or None.
 
@@ -166,10 +198,65 @@ class DriftTracker:
         """
         self.base_path = base_path or Path(".")
         self.history_path = self.base_path / ".evalview" / "history.jsonl"
+        self._index = HistoryIndex(self.history_path)
         # Provenance cache — fingerprint helpers (subprocess + recursive FS walk)
         # are expensive and stable within a single check run. Compute once per
         # DriftTracker instance; record_check() reuses the cached values.
         self._provenance_cache: Optional[Dict[str, Optional[str]]] = None
+        # Entries buffered by batch(); None when writing through.
+        self._pending: Optional[List[Dict[str, Any]]] = None
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Buffer record_check() calls and append them together.
+
+        Entries are written in one locked append (and at most one prune)
+        when the block exits, even on error. Nested calls join the outer
+        batch.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._pending = None
+
+    def flush(self) -> None:
+        """Write any entries buffered by batch()."""
+        if self._pending:
+            entries, self._pending = self._pending, []
+            self._append_entries(entries)
+
+    def _append_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Append complete lines in a single write under the history lock.
+
+        A line left unterminated by a crashed writer is closed off first so
+        the new entries do not merge into it; readers skip the broken line.
+        """
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            with _history_lock(self.history_path):
+                flags = os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                fd = os.open(self.history_path, flags, 0o644)
+                try:
+                    size = os.fstat(fd).st_size
+                    if size:
+                        os.lseek(fd, size - 1, os.SEEK_SET)
+                        if os.read(fd, 1) != b"\n":
+                            data = b"\n" + data
+                    view = memoryview(data)
+                    while view:
+                        written = os.write(fd, view)
+                        view = view[written:]
+                finally:
+                    os.close(fd)
+                self._prune_if_needed()
+        except OSError as e:
+            logger.warning(f"Failed to write drift history: {e}")
 
     def _provenance(self) -> Dict[str, Optional[str]]:
         """Lazily compute and cache the run-level provenance fingerprint.
@@ -212,9 +299,9 @@ class DriftTracker:
             test_name: Name of the test that was checked.
             diff: TraceDiff result from this check run.
             result: Optional EvaluationResult with observability signals.
-        """
-        self.history_path.parent.mkdir(parents=True, exist_ok=True)
 
+        Inside ``batch()`` the entry is buffered rather than written.
+        """
         output_similarity = diff.output_diff.similarity if diff.output_diff else 1.0
 
         provenance = self._provenance()
@@ -251,12 +338,10 @@ class DriftTracker:
                 entry["has_coherence_issues"] = True
                 entry["coherence_score"] = coherence.get("coherence_score", 1.0)
 
-        try:
-            with open(self.history_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
-            self._prune_if_needed()
-        except OSError as e:
-            logger.warning(f"Failed to write drift history: {e}")
+        if self._pending is None:
+            self._append_entries([entry])
+            return
+        self._pending.append(entry)
 
     def detect_gradual_drift(
         self,
@@ -447,38 +532,32 @@ class DriftTracker:
         if not self.history_path.exists():
             return []
 
-        # Load ALL entries (not filtered by test)
-        entries: List[Dict[str, Any]] = []
-        try:
-            with open(self.history_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        except OSError:
-            return []
-
-        if not entries:
-            return []
-
-        # Group by timestamp truncated to the minute (dict preserves insertion order)
+        # Walk (ts, status) newest first straight from the index and stop
+        # once `window` full cycles are collected; falls back to a scan.
         cycles: Dict[str, List[str]] = {}
-        for entry in entries:
-            ts = entry.get("ts", "")
-            # Truncate to minute: "2025-01-15T10:30:45" -> "2025-01-15T10:30"
-            cycle_key = ts[:16] if len(ts) >= 16 else ts
-            status = entry.get("status", "")
-            if cycle_key not in cycles:
-                cycles[cycle_key] = []
-            cycles[cycle_key].append(status)
+        try:
+            for ts, status in self._index.iter_status_newest():
+                ts = ts or ""
+                cycle_key = ts[:16] if len(ts) >= 16 else ts
+                if cycle_key not in cycles:
+                    if len(cycles) == window:
+                        break
+                    cycles[cycle_key] = []
+                cycles[cycle_key].append(status or "")
+            ordered = list(reversed(list(cycles.values())))
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"History index unavailable, scanning file: {e}")
+            cycles = {}
+            for entry in scan_history(self.history_path):
+                ts = entry.get("ts", "")
+                # Truncate to minute: "2025-01-15T10:30:45" -> "2025-01-15T10:30"
+                cycle_key = ts[:16] if len(ts) >= 16 else ts
+                cycles.setdefault(cycle_key, []).append(entry.get("status", ""))
+            ordered = list(cycles.values())
 
         # Compute pass rate per cycle
         rates: List[float] = []
-        for statuses in cycles.values():
+        for statuses in ordered:
             total = len(statuses)
             passed = sum(1 for s in statuses if s == "passed")
             rates.append(passed / total if total > 0 else 0.0)
@@ -488,9 +567,10 @@ class DriftTracker:
     def _prune_if_needed(self) -> None:
         """Trim history file to _MAX_HISTORY_ENTRIES if it has grown too large.
 
-        Uses a fast file-size stat() check to skip the expensive full read in
-        the common case where the file is well under the limit.
-        At ~200 bytes per entry, the file won't need pruning until ~2 MB.
+        Uses a fast file-size stat() check to skip the work in the common
+        case where the file is well under the limit. At ~200 bytes per entry,
+        the file won't need pruning until ~2 MB. The offset index counts the
+        entries and the kept tail is copied without parsing it.
         """
         try:
             # Fast guard: skip the read unless the file is large enough to
@@ -501,11 +581,17 @@ class DriftTracker:
             except OSError:
                 return  # File not written yet; nothing to prune.
 
-            with open(self.history_path) as f:
-                lines = f.readlines()
-            if len(lines) > _MAX_HISTORY_ENTRIES:
-                with open(self.history_path, "w") as f:
-                    f.writelines(lines[-_MAX_HISTORY_ENTRIES:])
+            try:
+                removed = self._index.prune(_MAX_HISTORY_ENTRIES)
+            except sqlite3.Error as e:
+                logger.debug(f"History index unavailable, pruning by full read: {e}")
+                with open(self.history_path) as f:
+                    lines = f.readlines()
+                removed = max(0, len(lines) - _MAX_HISTORY_ENTRIES)
+                if removed:
+                    with open(self.history_path, "w") as f:
+                        f.writelines(lines[-_MAX_HISTORY_ENTRIES:])
+            if removed:
                 logger.debug(
                     f"Pruned drift history to {_MAX_HISTORY_ENTRIES} entries"
                 )
@@ -513,9 +599,17 @@ class DriftTracker:
             logger.warning(f"Failed to prune drift history: {e}")
 
     def _load_recent(self, test_name: str, window: int) -> List[Dict[str, Any]]:
-        """Load the most recent `window` entries for test_name (oldest first)."""
+        """Load the most recent `window` entries for test_name (oldest first).
+
+        Served from the sidecar offset index, so only the returned lines are
+        parsed. Falls back to a full scan if the index is unusable.
+        """
         if not self.history_path.exists():
             return []
+        try:
+            return self._index.recent(test_name, window)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"History index unavailable, scanning file: {e}")
 
         entries = []
         try:
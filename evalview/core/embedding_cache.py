@@ -0,0 +1,140 @@
+"""Cache for embedding vectors, keyed on (model, text).
+
+Golden outputs rarely change between checks, so their embeddings can be
+reused instead of re-requested. Embeddings are deterministic per model, so
+entries never expire.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Vector = List[float]
+
+DEFAULT_EMBEDDING_CACHE_PATH = ".evalview/embedding_cache.db"
+
+
+class EmbeddingCache:
+    """In-memory cache with optional SQLite persistence for embedding vectors.
+
+    Args:
+        persist_path: Path to a SQLite file for cross-session persistence.
+                      When None, cache is in-memory only.
+    """
+
+    def __init__(self, persist_path: Optional[Union[str, Path]] = None):
+        self.persist_path = str(persist_path) if persist_path else None
+        self._memory: Dict[str, Vector] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+        if self.persist_path:
+            try:
+                self._init_db()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Embedding cache unavailable at {self.persist_path}: {e}")
+                self.persist_path = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[Vector]]:
+        """Look up embeddings for ``texts``; None marks a miss."""
+        keys = [self.make_key(model, text) for text in texts]
+        results: List[Optional[Vector]] = [self._memory.get(key) for key in keys]
+
+        missing = [key for key, vec in zip(keys, results) if vec is None]
+        if missing and self.persist_path:
+            found = self._db_get_many(missing)
+            self._memory.update(found)
+            results = [vec if vec is not None else found.get(key) for key, vec in zip(keys, results)]
+
+        for vec in results:
+            if vec is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return results
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, Vector]]) -> None:
+        """Store ``(text, embedding)`` pairs."""
+        rows = {self.make_key(model, text): list(vec) for text, vec in items}
+        if not rows:
+            return
+        self._memory.update(rows)
+        if self.persist_path:
+            self._db_put_many(rows)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Return cache hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total": total,
+            "hit_rate": round(self.hits / total, 2) if total else 0.0,
+            "entries": len(self._memory),
+        }
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Build the cache key for ``text`` embedded with ``model``."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    # ------------------------------------------------------------------
+    # SQLite persistence
+    # ------------------------------------------------------------------
+
+    def _init_db(self) -> None:
+        assert self.persist_path is not None
+        Path(self.persist_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL
+                )"""
+            )
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        assert self.persist_path is not None  # guarded by callers: only called when persist_path is set
+        conn = sqlite3.connect(self.persist_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _db_get_many(self, keys: List[str]) -> Dict[str, Vector]:
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache read failed: {e}")
+            return {}
+        return {key: array("d", blob).tolist() for key, blob in rows}
+
+    def _db_put_many(self, rows: Dict[str, Vector]) -> None:
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, array("d", vec).tobytes()) for key, vec in rows.items()],
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache write failed: {e}")
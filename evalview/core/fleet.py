@@ -18,15 +18,34 @@ hides a regional failure, a failing one hides a single bad pod.
   *"only the eu-west pod is unhappy."*
 
 Pure analytics: no network, no LLM. Reads JSONL only.
+
+History files are streamed, never loaded whole: each instance is rolled up
+with running counters plus a bounded reservoir sample of per-cycle cost
+for percentiles. Large inputs are scanned in worker processes. With a
+checkpoint file, the next run resumes each file at the byte offset where
+the last one stopped and reads only the newly appended cycles. ``since``
+windows seek past old history using a sparse timestamp index stored in
+the same checkpoint.
 """
 from __future__ import annotations
 
+import bisect
+import copy
+import hashlib
 import json
+import logging
 import math
+import os
+import random
+import re
 import statistics
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 # ── Defaults ────────────────────────────────────────────────────────────────
@@ -41,6 +60,23 @@ DEFAULT_ANOMALY_SIGMA = 2.0
 # one pod won't help. Below that, it's regional or instance-specific.
 DEFAULT_TEST_IMPACT_PCT = 0.4
 
+DEFAULT_FLEET_CHECKPOINT_PATH = ".evalview/fleet_checkpoint.json"
+
+_CHECKPOINT_VERSION = 1
+
+# Per-cycle costs kept per instance for percentiles. 512 samples put p95
+# within about a percentile point of the exact value.
+_RESERVOIR_SIZE = 512
+
+# One seek-index entry per this many bytes of history.
+_INDEX_STRIDE_BYTES = 1 << 20
+
+# Bytes hashed to notice a history file that was replaced or rotated.
+_HEAD_BYTES = 4096
+
+# Below this many bytes to read, worker processes cost more than they save.
+_PARALLEL_MIN_BYTES = 8 << 20
+
 
 # ── Data shapes ─────────────────────────────────────────────────────────────
 
@@ -60,6 +96,8 @@ class InstanceSummary:
     first_seen: Optional[str]
     last_seen: Optional[str]
     failing_tests: Tuple[str, ...]  # union of every failing test across cycles
+    cycle_cost_p50: float = 0.0
+    cycle_cost_p95: float = 0.0
 
     @property
     def pass_rate(self) -> float:
@@ -81,9 +119,11 @@ class FleetReport:
     fleet_wide_failures: Tuple["FleetWideFailure", ...]
     anomaly_sigma: float
     test_impact_pct: float
+    since: Optional[str] = None  # ISO cutoff when the report covers a window
 
     def to_dict(self) -> Dict[str, Any]:
         return {
+            "since": self.since,
             "fleet_pass_rate": round(self.fleet_pass_rate, 4),
             "fleet_cost": round(self.fleet_cost, 6),
             "fleet_cycles": self.fleet_cycles,
@@ -98,6 +138,8 @@ class FleetReport:
                     "tools_changed": s.tools_changed,
                     "output_changed": s.output_changed,
                     "cost": round(s.cost, 6),
+                    "cycle_cost_p50": round(s.cycle_cost_p50, 6),
+                    "cycle_cost_p95": round(s.cycle_cost_p95, 6),
                     "first_seen": s.first_seen,
                     "last_seen": s.last_seen,
                     "failing_tests": list(s.failing_tests),
@@ -200,58 +242,330 @@ def _instance_name_from_path(path: Path) -> str:
 # ── Per-instance aggregation ────────────────────────────────────────────────
 
 
-def summarize_instance(name: str, entries: Sequence[Dict[str, Any]]) -> InstanceSummary:
-    """Roll up one history file into a single :class:`InstanceSummary`.
+def _percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Percentile ``p`` (0-100) by linear interpolation; 0.0 when empty."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return sorted_values[int(k)]
+    return sorted_values[f] * (c - k) + sorted_values[c] * (k - f)
 
-    Only consumes cycle-summary records (those carrying ``total_tests``);
-    skips any other record shapes a future writer may add. This keeps the
-    function forward-compatible with new record types.
+
+@dataclass
+class _InstanceAccumulator:
+    """Running rollup of one history file, fed one record at a time.
+
+    Memory does not grow with the number of cycles: counters, the set of
+    failing test names and a fixed-size reservoir of per-cycle costs.
     """
-    cycles = 0
-    total = 0
-    passed = 0
-    regressions = 0
-    tools_changed = 0
-    output_changed = 0
-    cost = 0.0
+
+    records: int = 0
+    cycles: int = 0
+    total: int = 0
+    passed: int = 0
+    regressions: int = 0
+    tools_changed: int = 0
+    output_changed: int = 0
+    cost: float = 0.0
     first_seen: Optional[str] = None
     last_seen: Optional[str] = None
-    failing: set[str] = set()
-
-    for e in entries:
+    failing: Set[str] = field(default_factory=set)
+    cost_samples: List[float] = field(default_factory=list)
+    _rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+
+    def add(self, e: Any) -> None:
+        """Fold in one record; only cycle summaries (with ``total_tests``) count."""
+        if not isinstance(e, dict):
+            return
+        self.records += 1
         if "total_tests" not in e:
-            continue
-        cycles += 1
-        total += int(e.get("total_tests", 0) or 0)
-        passed += int(e.get("passed", 0) or 0)
-        regressions += int(e.get("regressions", 0) or 0)
-        tools_changed += int(e.get("tools_changed", 0) or 0)
-        output_changed += int(e.get("output_changed", 0) or 0)
-        cost += float(e.get("cost", 0.0) or 0.0)
+            return
+        self.cycles += 1
+        self.total += int(e.get("total_tests", 0) or 0)
+        self.passed += int(e.get("passed", 0) or 0)
+        self.regressions += int(e.get("regressions", 0) or 0)
+        self.tools_changed += int(e.get("tools_changed", 0) or 0)
+        self.output_changed += int(e.get("output_changed", 0) or 0)
+        cycle_cost = float(e.get("cost", 0.0) or 0.0)
+        self.cost += cycle_cost
+        self._sample_cost(cycle_cost)
         ts = e.get("timestamp")
         if ts:
             ts_str = str(ts)
-            if first_seen is None or ts_str < first_seen:
-                first_seen = ts_str
-            if last_seen is None or ts_str > last_seen:
-                last_seen = ts_str
+            if self.first_seen is None or ts_str < self.first_seen:
+                self.first_seen = ts_str
+            if self.last_seen is None or ts_str > self.last_seen:
+                self.last_seen = ts_str
         for name_failing in e.get("failing_tests") or []:
             if isinstance(name_failing, str) and name_failing:
-                failing.add(name_failing)
-
-    return InstanceSummary(
-        instance=name,
-        cycles=cycles,
-        total_tests_observed=total,
-        passed=passed,
-        regressions=regressions,
-        tools_changed=tools_changed,
-        output_changed=output_changed,
-        cost=cost,
-        first_seen=first_seen,
-        last_seen=last_seen,
-        failing_tests=tuple(sorted(failing)),
-    )
+                self.failing.add(name_failing)
+
+    def _sample_cost(self, value: float) -> None:
+        # Reservoir sampling (Algorithm R). Seeded from the cycle count so a
+        # rerun over the same history keeps the same sample.
+        if len(self.cost_samples) < _RESERVOIR_SIZE:
+            self.cost_samples.append(value)
+            return
+        if self._rng is None:
+            self._rng = random.Random(self.cycles)
+        j = self._rng.randrange(self.cycles)
+        if j < _RESERVOIR_SIZE:
+            self.cost_samples[j] = value
+
+    def summary(self, name: str) -> InstanceSummary:
+        costs = sorted(self.cost_samples)
+        return InstanceSummary(
+            instance=name,
+            cycles=self.cycles,
+            total_tests_observed=self.total,
+            passed=self.passed,
+            regressions=self.regressions,
+            tools_changed=self.tools_changed,
+            output_changed=self.output_changed,
+            cost=self.cost,
+            first_seen=self.first_seen,
+            last_seen=self.last_seen,
+            failing_tests=tuple(sorted(self.failing)),
+            cycle_cost_p50=_percentile(costs, 50),
+            cycle_cost_p95=_percentile(costs, 95),
+        )
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "records": self.records,
+            "cycles": self.cycles,
+            "total": self.total,
+            "passed": self.passed,
+            "regressions": self.regressions,
+            "tools_changed": self.tools_changed,
+            "output_changed": self.output_changed,
+            "cost": self.cost,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+            "failing": sorted(self.failing),
+            "cost_samples": self.cost_samples,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "_InstanceAccumulator":
+        acc = cls(**{k: v for k, v in state.items() if k not in ("failing", "cost_samples")})
+        acc.failing = set(state.get("failing") or [])
+        acc.cost_samples = [float(v) for v in state.get("cost_samples") or []]
+        return acc
+
+
+def summarize_instance(name: str, entries: Sequence[Dict[str, Any]]) -> InstanceSummary:
+    """Roll up one history file into a single :class:`InstanceSummary`.
+
+    Only consumes cycle-summary records (those carrying ``total_tests``);
+    skips any other record shapes a future writer may add. This keeps the
+    function forward-compatible with new record types.
+    """
+    acc = _InstanceAccumulator()
+    for e in entries:
+        acc.add(e)
+    return acc.summary(name)
+
+
+# ── Streaming scan ──────────────────────────────────────────────────────────
+
+
+def _ts_key(raw: Any) -> Optional[str]:
+    """A timestamp as a sortable UTC string, or None if it can't be parsed."""
+    if not raw:
+        return None
+    text = str(raw)
+    # Fast path for the "2026-04-14T12:00:00Z" form monitor writes.
+    if len(text) == 20 and text[10] == "T" and text[-1] == "Z":
+        return text[:19] + ".000000"
+    try:
+        dt = datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith("Z") else text)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _parse_line(raw: bytes) -> Any:
+    # Decoding first skips json's per-call encoding sniffing on bytes.
+    try:
+        line = raw.decode("utf-8").strip()
+        return json.loads(line) if line else None
+    except ValueError:  # includes UnicodeDecodeError
+        return None
+
+
+class _ScanJob(NamedTuple):
+    path: str
+    checkpoint: Optional[Dict[str, Any]]
+    cutoff: Optional[str]  # _ts_key of the --since cutoff
+
+
+class _ScanResult(NamedTuple):
+    # Rollup to report (the --since window when one is set); None when the
+    # file could not be read.
+    rollup: Optional[_InstanceAccumulator]
+    # Where to resume next time; None when the file could not be read.
+    checkpoint: Optional[Dict[str, Any]]
+
+
+def _head_digest(f: Any, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha1(f.read(min(length, _HEAD_BYTES))).hexdigest()
+
+
+def _scan_history(job: _ScanJob) -> _ScanResult:
+    """Stream one history file from its checkpoint (or from the start).
+
+    The checkpoint covers complete lines only. A final line without a
+    newline (a cycle being written right now) is reported but read again
+    next time.
+    """
+    try:
+        size = os.path.getsize(job.path)
+        with open(job.path, "rb") as f:
+            ckpt = job.checkpoint
+            full = _InstanceAccumulator()
+            if ckpt is not None:
+                try:
+                    if ckpt["offset"] > size or _head_digest(f, ckpt["offset"]) != ckpt["head"]:
+                        raise ValueError("history file was truncated, rotated or replaced")
+                    full = _InstanceAccumulator.from_state(ckpt["state"])
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Rescanning {job.path} from the start: {e}")
+                    ckpt = None
+            offset: int = ckpt["offset"] if ckpt else 0
+            max_ts: str = ckpt.get("max_ts", "") if ckpt else ""
+            index: List[List[Any]] = [list(p) for p in ckpt.get("index", [])] if ckpt else []
+            window = _InstanceAccumulator() if job.cutoff is not None else None
+            # Only compared while a window is being collected.
+            cutoff: str = job.cutoff or ""
+
+            start = offset
+            if job.cutoff is not None:
+                # Everything before an index entry is older than its max_ts.
+                keys = [entry[0] for entry in index]
+                i = bisect.bisect_left(keys, cutoff)
+                start = index[i - 1][1] if i else 0
+            last_indexed = index[-1][1] if index else 0
+
+            f.seek(start)
+            pos = start
+            tail: Any = None
+            for raw in f:
+                line_start = pos
+                if not raw.endswith(b"\n"):
+                    tail = _parse_line(raw)
+                    break
+                pos += len(raw)
+                record = _parse_line(raw)
+                if not isinstance(record, dict):
+                    continue
+                ts_key = _ts_key(record.get("timestamp"))
+                if line_start >= offset:
+                    if max_ts and line_start - last_indexed >= _INDEX_STRIDE_BYTES:
+                        index.append([max_ts, line_start])
+                        last_indexed = line_start
+                    full.add(record)
+                    if ts_key is not None and ts_key > max_ts:
+                        max_ts = ts_key
+                if window is not None and ts_key is not None and ts_key >= cutoff:
+                    window.add(record)
+
+            new_offset = max(pos, offset)
+            checkpoint = {
+                "offset": new_offset,
+                "head": _head_digest(f, new_offset),
+                "max_ts": max_ts,
+                "index": index,
+                "state": full.to_state(),
+            }
+    except OSError as e:
+        logger.debug(f"Skipping unreadable history file {job.path}: {e}")
+        return _ScanResult(None, None)
+
+    rollup = window if window is not None else full
+    if isinstance(tail, dict):
+        tail_key = _ts_key(tail.get("timestamp"))
+        if window is None or (tail_key is not None and tail_key >= cutoff):
+            rollup = copy.deepcopy(rollup)
+            rollup.add(tail)
+    return _ScanResult(rollup, checkpoint)
+
+
+def _scan_all(jobs: List[_ScanJob], pending_bytes: int) -> List[_ScanResult]:
+    """Scan history files, in a process pool when there is a lot to read."""
+    if len(jobs) > 1 and pending_bytes >= _PARALLEL_MIN_BYTES:
+        workers = min(os.cpu_count() or 1, len(jobs), 8)
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(_scan_history, jobs))
+            except Exception as e:
+                logger.debug(f"Parallel fleet scan failed, scanning serially: {e}")
+    return [_scan_history(job) for job in jobs]
+
+
+def _load_checkpoints(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == _CHECKPOINT_VERSION:
+            return dict(data.get("files", {}))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as e:
+        logger.debug(f"Ignoring unreadable fleet checkpoint: {e}")
+    return {}
+
+
+def _save_checkpoints(path: Path, files: Dict[str, Dict[str, Any]]) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump({"version": _CHECKPOINT_VERSION, "files": files}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write fleet checkpoint: {e}")
+
+
+def project_checkpoint_path() -> Optional[Path]:
+    """The fleet checkpoint under .evalview/, or None outside a project."""
+    path = Path(DEFAULT_FLEET_CHECKPOINT_PATH)
+    return path if path.parent.is_dir() else None
+
+
+_SINCE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_since(raw: str, now: Optional[datetime] = None) -> datetime:
+    """Resolve a ``--since`` value into an aware UTC datetime.
+
+    Accepts ``"yesterday"``, a lookback such as ``"30m"``, ``"12h"``,
+    ``"7d"`` or ``"2w"``, or an ISO date / datetime (naive values are
+    taken as UTC). Raises ValueError for anything else.
+    """
+    now = now or datetime.now(timezone.utc)
+    text = raw.strip()
+    if text.lower() == "yesterday":
+        return now - timedelta(days=1)
+    match = re.fullmatch(r"(\d+)\s*([mhdw])", text.lower())
+    if match:
+        return now - timedelta(**{_SINCE_UNITS[match.group(2)]: int(match.group(1))})
+    try:
+        dt = datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith("Z") else text)
+    except ValueError:
+        raise ValueError(
+            f"Unrecognized --since value {raw!r}; use e.g. 12h, 7d, yesterday or 2026-04-01"
+        ) from None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
 # ── Anomaly detection ───────────────────────────────────────────────────────
@@ -343,6 +657,8 @@ def build_fleet_report(
     *,
     anomaly_sigma: float = DEFAULT_ANOMALY_SIGMA,
     test_impact_pct: float = DEFAULT_TEST_IMPACT_PCT,
+    since: Optional[datetime] = None,
+    checkpoint_path: Optional[Path] = None,
 ) -> FleetReport:
     """Top-level one-shot: paths → fully synthesized :class:`FleetReport`.
 
@@ -350,15 +666,39 @@ def build_fleet_report(
     produces a report with zero instances, pass rate 100% by convention
     (nothing has failed), and no anomalies. Callers render whatever's
     appropriate for "nothing to roll up yet".
+
+    ``since`` limits the rollup to cycles stamped at or after it (cycles
+    without a timestamp are left out). With ``checkpoint_path``, per-file
+    progress is stored there and the next call reads only appended bytes
+    (see the module docstring).
     """
-    instances: List[InstanceSummary] = []
+    cutoff = _ts_key(since.isoformat()) if since is not None else None
+    checkpoints = _load_checkpoints(checkpoint_path) if checkpoint_path is not None else {}
+
+    paths: List[Path] = []
+    jobs: List[_ScanJob] = []
+    pending_bytes = 0
     for path in history_files:
-        entries = load_history(path)
-        if not entries:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
             continue
-        instances.append(
-            summarize_instance(_instance_name_from_path(path), entries)
-        )
+        ckpt = checkpoints.get(os.path.abspath(path))
+        paths.append(Path(path))
+        jobs.append(_ScanJob(str(path), ckpt, cutoff))
+        # A --since window also re-reads the part of the file inside it.
+        done = ckpt.get("offset", 0) if ckpt is not None and cutoff is None else 0
+        pending_bytes += max(0, size - done)
+
+    instances: List[InstanceSummary] = []
+    for path, result in zip(paths, _scan_all(jobs, pending_bytes)):
+        if result.checkpoint is not None:
+            checkpoints[os.path.abspath(path)] = result.checkpoint
+        if result.rollup is None or result.rollup.records == 0:
+            continue
+        instances.append(result.rollup.summary(_instance_name_from_path(path)))
+    if checkpoint_path is not None and jobs:
+        _save_checkpoints(checkpoint_path, checkpoints)
     instances.sort(key=lambda s: (s.pass_rate, s.instance))
 
     total_observed = sum(s.total_tests_observed for s in instances)
@@ -385,6 +725,7 @@ def build_fleet_report(
         fleet_wide_failures=tuple(fleet_wide),
         anomaly_sigma=anomaly_sigma,
         test_impact_pct=test_impact_pct,
+        since=since.isoformat() if since is not None else None,
     )
 
 
@@ -8,14 +8,20 @@ Storage format:
   .evalview/golden/
     <test-name>.golden.json    # The golden trace
     <test-name>.meta.json      # Metadata (when blessed, by whom, etc.)
+  .evalview/golden_index.json  # Per-file metadata index (rebuildable cache)
+
+The index lets listing and variant lookup skip parsing full traces. It is
+keyed by file name and validated against each file's mtime and size, so
+goldens written or edited by other tools are re-indexed on next access.
 """
 
 import json
 import hashlib
+import os
 from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
 from pydantic import BaseModel, Field
 import logging
 
@@ -53,6 +59,29 @@ class GoldenTrace(BaseModel):
     per_turn_outputs: Optional[List[Optional[str]]] = Field(default=None)
 
 
+class GoldenIndexEntry(BaseModel):
+    """Index record for one golden file: everything but the trace body."""
+
+    file: str
+    variant: Optional[str] = None
+    metadata: GoldenMetadata
+    tool_sequence: List[str] = Field(default_factory=list)
+    output_hash: str = ""
+    total_cost: float = 0.0
+    mtime_ns: int = 0
+    size: int = 0
+
+
+_INDEX_VERSION = 1
+_GOLDEN_SUFFIX = ".golden.json"
+_VARIANT_MARKER = ".variant_"
+
+
+def _test_key(file_name: str) -> str:
+    """Sanitized test name a golden file belongs to (names never contain dots)."""
+    return file_name.split(".", 1)[0]
+
+
 class GoldenStore:
     """Manages golden trace storage and retrieval."""
 
@@ -65,6 +94,14 @@ class GoldenStore:
         """
         self.base_path = base_path or Path(".")
         self.golden_dir = self.base_path / ".evalview" / "golden"
+        self._entries: Optional[Dict[str, GoldenIndexEntry]] = None
+        # Sanitized test name -> that test's golden file names.
+        self._by_test: Dict[str, Set[str]] = {}
+
+    @property
+    def index_path(self) -> Path:
+        """Index file, kept next to the golden directory it describes."""
+        return self.golden_dir.parent / "golden_index.json"
 
     def _get_golden_path(self, test_name: str, variant_name: Optional[str] = None) -> Path:
         """Get path to golden trace file for a test.
@@ -164,6 +201,7 @@ class GoldenStore:
         golden_path = self._get_golden_path(result.test_case, variant_name)
         with open(golden_path, "w") as f:
             f.write(golden.model_dump_json(indent=2))
+        self._index_saved(golden_path, golden)
 
         logger.info(f"Saved golden trace: {golden_path}")
         return golden_path
@@ -193,19 +231,7 @@ class GoldenStore:
 
     def list_golden(self) -> List[GoldenMetadata]:
         """List all golden traces."""
-        if not self.golden_dir.exists():
-            return []
-
-        results = []
-        for path in self.golden_dir.glob("*.golden.json"):
-            try:
-                with open(path) as f:
-                    data = json.load(f)
-                results.append(GoldenMetadata.model_validate(data["metadata"]))
-            except Exception as e:
-                logger.warning(f"Failed to load golden {path}: {e}")
-
-        return results
+        return [entry.metadata for entry in self._index().values()]
 
     def delete_golden(self, test_name: str, variant_name: Optional[str] = None) -> bool:
         """Delete a golden trace.
@@ -220,6 +246,7 @@ class GoldenStore:
         golden_path = self._get_golden_path(test_name, variant_name)
         if golden_path.exists():
             golden_path.unlink()
+            self._index_removed(golden_path)
             return True
         return False
 
@@ -233,28 +260,59 @@ class GoldenStore:
             List of GoldenTrace objects (empty if none found)
         """
         variants = []
+        for entry in self.list_variant_entries(test_name):
+            golden = self.load_entry(entry)
+            if golden is not None:
+                variants.append(golden)
+        return variants
 
-        # Load default golden
-        default = self.load_golden(test_name)
-        if default:
-            variants.append(default)
+    def list_variant_entries(self, test_name: str) -> List[GoldenIndexEntry]:
+        """Index entries for a test's goldens, default first, without loading traces.
 
-        # Load all variant goldens
-        if not self.golden_dir.exists():
-            return variants
+        Args:
+            test_name: Name of the test
 
+        Returns:
+            List of GoldenIndexEntry objects (empty if none found)
+        """
+        if self._entries is None:
+            self._index()
         safe_name = "".join(c if c.isalnum() or c in "_-" else "_" for c in test_name)
-        pattern = f"{safe_name}.variant_*.golden.json"
+        default_file = f"{safe_name}{_GOLDEN_SUFFIX}"
+        names = self._by_test.get(safe_name, set()) | {default_file}
+
+        # Re-stat only this test's files, so a check stays O(goldens).
+        changed = False
+        matched: List[GoldenIndexEntry] = []
+        for name in [default_file, *sorted(names - {default_file})]:
+            entry, updated = self._revalidate(name)
+            changed = changed or updated
+            if entry is not None:
+                matched.append(entry)
+        if changed:
+            self._write_index_file()
+        return matched
+
+    def load_entry(self, entry: GoldenIndexEntry) -> Optional[GoldenTrace]:
+        """Load the full golden trace behind an index entry.
 
-        for path in self.golden_dir.glob(pattern):
-            try:
-                with open(path) as f:
-                    data = json.load(f)
-                variants.append(GoldenTrace.model_validate(data))
-            except Exception as e:
-                logger.warning(f"Failed to load variant golden {path}: {e}")
+        Args:
+            entry: Entry from list_variant_entries()
 
-        return variants
+        Returns:
+            GoldenTrace, or None if the file is gone or unreadable
+        """
+        path = self.golden_dir / entry.file
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return GoldenTrace.model_validate(data)
+        except FileNotFoundError:
+            self._index_removed(path)
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load golden {path}: {e}")
+            return None
 
     def save_golden_from_dict(self, test_name: str, data: dict) -> None:
         """Restore a golden baseline from a dict (e.g., downloaded from cloud).
@@ -268,6 +326,7 @@ class GoldenStore:
         path = self._get_golden_path(test_name, None)
         with open(path, "w") as f:
             f.write(golden.model_dump_json(indent=2))
+        self._index_saved(path, golden)
         logger.info(f"Restored golden from cloud: {path}")
 
     def count_variants(self, test_name: str) -> int:
@@ -279,7 +338,7 @@ class GoldenStore:
         Returns:
             Number of variants (including default)
         """
-        return len(self.load_all_golden_variants(test_name))
+        return len(self.list_variant_entries(test_name))
 
     def list_golden_with_variants(self) -> List[Dict[str, Any]]:
         """List all golden traces with variant counts.
@@ -287,32 +346,173 @@ class GoldenStore:
         Returns:
             List of dicts with 'metadata' and 'variant_count' keys
         """
-        if not self.golden_dir.exists():
-            return []
-
         # Group by test name
         test_groups: Dict[str, Dict[str, Any]] = {}
 
-        for path in self.golden_dir.glob("*.golden.json"):
-            try:
-                with open(path) as f:
-                    data = json.load(f)
-                metadata = GoldenMetadata.model_validate(data["metadata"])
-                test_name = metadata.test_name
+        entries = self._index()
+        for name in sorted(entries):
+            metadata = entries[name].metadata
+            test_name = metadata.test_name
 
-                if test_name not in test_groups:
-                    test_groups[test_name] = {
-                        "metadata": metadata,
-                        "variant_count": 0
-                    }
+            if test_name not in test_groups:
+                test_groups[test_name] = {
+                    "metadata": metadata,
+                    "variant_count": 0
+                }
 
-                test_groups[test_name]["variant_count"] += 1
-
-            except Exception as e:
-                logger.warning(f"Failed to load golden {path}: {e}")
+            test_groups[test_name]["variant_count"] += 1
 
         return list(test_groups.values())
 
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _index(self) -> Dict[str, GoldenIndexEntry]:
+        """Scan the golden directory and return the index, keyed by file name.
+
+        Every golden file is stat'ed; only files whose mtime or size differs
+        from the index entry are parsed again. Listing calls rescan, while
+        per-test lookups scan once per store and then re-stat only that
+        test's files (see :meth:`list_variant_entries`).
+        """
+        if not self.golden_dir.is_dir():
+            self._entries = {}
+            self._by_test = {}
+            return self._entries
+
+        known = self._entries if self._entries is not None else self._read_index_file()
+        entries: Dict[str, GoldenIndexEntry] = {}
+        changed = self._entries is None and not self.index_path.exists()
+        with os.scandir(self.golden_dir) as it:
+            for dirent in it:
+                if not dirent.name.endswith(_GOLDEN_SUFFIX) or not dirent.is_file():
+                    continue
+                st = dirent.stat()
+                entry = known.get(dirent.name)
+                if entry is None or entry.mtime_ns != st.st_mtime_ns or entry.size != st.st_size:
+                    entry = self._build_entry(Path(dirent.path), st.st_mtime_ns, st.st_size)
+                    changed = True
+                if entry is not None:
+                    entries[dirent.name] = entry
+        if set(entries) != set(known):
+            changed = True
+
+        self._entries = entries
+        self._by_test = {}
+        for name in entries:
+            self._by_test.setdefault(_test_key(name), set()).add(name)
+        if changed:
+            self._write_index_file()
+        return entries
+
+    def _revalidate(self, name: str) -> Tuple[Optional[GoldenIndexEntry], bool]:
+        """Bring one file's index entry up to date. Returns (entry, changed)."""
+        assert self._entries is not None
+        known = self._entries.get(name)
+        try:
+            st = (self.golden_dir / name).stat()
+        except FileNotFoundError:
+            if known is None:
+                return None, False
+            self._forget(name)
+            return None, True
+        if known is not None and known.mtime_ns == st.st_mtime_ns and known.size == st.st_size:
+            return known, False
+        entry = self._build_entry(self.golden_dir / name, st.st_mtime_ns, st.st_size)
+        if entry is None:
+            if known is not None:
+                self._forget(name)
+            return None, known is not None
+        self._remember(entry)
+        return entry, True
+
+    def _remember(self, entry: GoldenIndexEntry) -> None:
+        assert self._entries is not None
+        self._entries[entry.file] = entry
+        self._by_test.setdefault(_test_key(entry.file), set()).add(entry.file)
+
+    def _forget(self, name: str) -> bool:
+        assert self._entries is not None
+        self._by_test.get(_test_key(name), set()).discard(name)
+        return self._entries.pop(name, None) is not None
+
+    def _build_entry(self, path: Path, mtime_ns: int, size: int) -> Optional[GoldenIndexEntry]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            golden = GoldenTrace.model_validate(data)
+        except Exception as e:
+            logger.warning(f"Failed to load golden {path}: {e}")
+            return None
+        return self._entry_for(path.name, golden, mtime_ns, size)
+
+    @staticmethod
+    def _entry_for(file_name: str, golden: GoldenTrace, mtime_ns: int, size: int) -> GoldenIndexEntry:
+        variant = None
+        if _VARIANT_MARKER in file_name:
+            variant = file_name.split(_VARIANT_MARKER, 1)[1][: -len(_GOLDEN_SUFFIX)]
+        return GoldenIndexEntry(
+            file=file_name,
+            variant=variant,
+            metadata=golden.metadata,
+            tool_sequence=golden.tool_sequence,
+            output_hash=golden.output_hash,
+            total_cost=golden.trace.metrics.total_cost,
+            mtime_ns=mtime_ns,
+            size=size,
+        )
+
+    def _index_saved(self, path: Path, golden: GoldenTrace) -> None:
+        """Record a golden this store just wrote."""
+        if self._entries is None:
+            self._index()
+        st = path.stat()
+        self._remember(self._entry_for(path.name, golden, st.st_mtime_ns, st.st_size))
+        self._write_index_file()
+
+    def _index_removed(self, path: Path) -> None:
+        """Forget a golden this store just deleted."""
+        if self._entries is None:
+            self._index()
+        if self._forget(path.name):
+            self._write_index_file()
+
+    def _read_index_file(self) -> Dict[str, GoldenIndexEntry]:
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+            if data.get("version") != _INDEX_VERSION:
+                return {}
+            return {
+                name: GoldenIndexEntry.model_validate(raw)
+                for name, raw in data.get("entries", {}).items()
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable golden index {self.index_path}: {e}")
+            return {}
+
+    def _write_index_file(self) -> None:
+        """Persist the index atomically. Failures only cost a rebuild later."""
+        if self._entries is None:
+            return
+        payload = {
+            "version": _INDEX_VERSION,
+            "entries": {
+                name: entry.model_dump(mode="json") for name, entry in sorted(self._entries.items())
+            },
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.debug(f"Could not write golden index {self.index_path}: {e}")
+
 
 # Convenience functions
 _default_store: Optional[GoldenStore] = None
@@ -0,0 +1,312 @@
+"""Sidecar offset index for .evalview/history.jsonl.
+
+history.jsonl stays the append-only source of truth (other tools and older
+EvalView versions read and append to it). Next to it, history.idx.db is a
+SQLite database (WAL mode) that maps every line to its byte offset, test
+name, timestamp and status. Readers look up offsets in the index and parse
+only the lines they return instead of the whole file.
+
+The index catches up incrementally: on each access it parses only the bytes
+appended since the last sync. If the file was rewritten (pruned, truncated,
+replaced), detected via inode, size and probes of the head and the last
+indexed bytes, the index is rebuilt from scratch. A trailing line without a
+newline is an append in progress and is left for the next sync.
+
+Usage:
+    index = HistoryIndex(Path(".evalview/history.jsonl"))
+    recent = index.recent("my-test", 10)          # oldest first
+    for entry in index.iter_newest(since_ts="2025-01-01"):
+        ...
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+# Bytes compared at the start of the file and just before the indexed end
+# to tell an append from a rewrite.
+_PROBE_BYTES = 256
+
+
+def scan_history(path: Path) -> List[Dict[str, Any]]:
+    """Parse every line of a history file (oldest first), skipping bad lines."""
+    if not path.exists():
+        return []
+    entries: List[Dict[str, Any]] = []
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except OSError:
+        return []
+    return entries
+
+
+class HistoryIndex:
+    """Offset index over a history.jsonl file.
+
+    Args:
+        history_path: The JSONL history file. The index lives next to it as
+            ``<stem>.idx.db``.
+
+    Every public method may raise ``sqlite3.Error`` or ``OSError`` when the
+    index cannot be used (read-only directory, corrupt database); callers
+    fall back to :func:`scan_history`.
+    """
+
+    def __init__(self, history_path: Path):
+        self.history_path = Path(history_path)
+        self.index_path = self.history_path.with_suffix(".idx.db")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def recent(self, test_name: str, limit: int) -> List[Dict[str, Any]]:
+        """The last ``limit`` entries for ``test_name``, oldest first."""
+        with self._synced() as conn:
+            offsets = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT offset FROM lines WHERE test = ? ORDER BY offset DESC LIMIT ?",
+                    (test_name, limit),
+                )
+            ]
+        return list(reversed(self._read(offsets)))
+
+    def iter_newest(
+        self, test_name: Optional[str] = None, since_ts: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield entries newest first, parsing lines only as they are consumed.
+
+        Args:
+            test_name: Only entries for this test.
+            since_ts: Only entries whose ``ts`` string sorts at or after this.
+        """
+        sql = "SELECT offset FROM lines"
+        clauses: List[str] = []
+        params: List[Any] = []
+        if test_name is not None:
+            clauses.append("test = ?")
+            params.append(test_name)
+        if since_ts is not None:
+            clauses.append("ts >= ?")
+            params.append(since_ts)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY offset DESC"
+
+        with self._synced() as conn:
+            offsets = [row[0] for row in conn.execute(sql, params)]
+        with open(self.history_path, "rb") as f:
+            for offset in offsets:
+                entry = self._read_line(f, offset)
+                if entry is not None:
+                    yield entry
+
+    def entries(
+        self, test_name: Optional[str] = None, since_ts: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Matching entries, oldest first (see :meth:`iter_newest`)."""
+        return list(reversed(list(self.iter_newest(test_name, since_ts))))
+
+    def iter_status_newest(self) -> Iterator[Tuple[str, str]]:
+        """Yield ``(ts, status)`` newest first from the index alone (no JSON parsing)."""
+        with self._synced() as conn:
+            yield from conn.execute("SELECT ts, status FROM lines ORDER BY offset DESC")
+
+    def count(self) -> int:
+        """Number of indexed entries."""
+        with self._synced() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM lines").fetchone()[0])
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def prune(self, max_entries: int) -> int:
+        """Drop the oldest entries so at most ``max_entries`` remain.
+
+        Copies the kept tail of the file byte-for-byte (no JSON parsing),
+        replaces the file atomically and shifts the index offsets to match.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._sync(conn)
+                total = conn.execute("SELECT COUNT(*) FROM lines").fetchone()[0]
+                if total <= max_entries:
+                    conn.execute("COMMIT")
+                    return 0
+                cut = conn.execute(
+                    "SELECT offset FROM lines ORDER BY offset LIMIT 1 OFFSET ?",
+                    (total - max_entries,),
+                ).fetchone()[0]
+
+                tmp_path = self.history_path.with_suffix(".jsonl.tmp")
+                with open(self.history_path, "rb") as src, open(tmp_path, "wb") as dst:
+                    src.seek(cut)
+                    while True:
+                        chunk = src.read(1 << 20)
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                os.replace(tmp_path, self.history_path)
+
+                conn.execute("DELETE FROM lines WHERE offset < ?", (cut,))
+                conn.execute("UPDATE lines SET offset = offset - ?", (cut,))
+                row = conn.execute("SELECT size FROM meta").fetchone()
+                self._write_meta(conn, row[0] - cut)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return total - max_entries
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; transactions are opened explicitly.
+        conn = sqlite3.connect(str(self.index_path), timeout=10.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "version INTEGER, ino INTEGER, size INTEGER, head BLOB, tail BLOB)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lines ("
+                "offset INTEGER NOT NULL, test TEXT, ts TEXT, status TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS lines_offset ON lines(offset)")
+            conn.execute("CREATE INDEX IF NOT EXISTS lines_test ON lines(test, offset)")
+            conn.execute("CREATE INDEX IF NOT EXISTS lines_ts ON lines(ts)")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _synced(self) -> Generator[sqlite3.Connection, None, None]:
+        with self._connect() as conn:
+            if not self._up_to_date(conn):
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._sync(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            yield conn
+
+    def _up_to_date(self, conn: sqlite3.Connection) -> bool:
+        """Cheap check (stat + two small reads) that needs no write lock."""
+        meta = conn.execute("SELECT version, ino, size, head, tail FROM meta").fetchone()
+        if meta is None or meta[0] != _INDEX_VERSION:
+            return False
+        try:
+            st = os.stat(self.history_path)
+            if meta[1] != st.st_ino or meta[2] != st.st_size:
+                return False
+            with open(self.history_path, "rb") as f:
+                return self._probe(f, meta[2]) == (meta[3], meta[4])
+        except OSError:
+            return False
+
+    def _sync(self, conn: sqlite3.Connection) -> None:
+        """Bring the index up to date with the file. Caller holds a write transaction."""
+        try:
+            st = os.stat(self.history_path)
+        except FileNotFoundError:
+            conn.execute("DELETE FROM lines")
+            conn.execute("DELETE FROM meta")
+            return
+
+        meta = conn.execute("SELECT version, ino, size, head, tail FROM meta").fetchone()
+        with open(self.history_path, "rb") as f:
+            start = 0
+            if (
+                meta is not None
+                and meta[0] == _INDEX_VERSION
+                and meta[1] == st.st_ino
+                and meta[2] <= st.st_size
+                and self._probe(f, meta[2]) == (meta[3], meta[4])
+            ):
+                start = meta[2]
+                if start == st.st_size:
+                    return
+            else:
+                conn.execute("DELETE FROM lines")
+
+            f.seek(start)
+            offset = start
+            rows: List[Tuple[int, Optional[str], Optional[str], Optional[str]]] = []
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # append in progress; index it next time
+                line = raw.strip()
+                if line:
+                    try:
+                        entry = json.loads(line)
+                        rows.append((offset, entry.get("test"), entry.get("ts"), entry.get("status")))
+                    except (ValueError, AttributeError):
+                        logger.debug("Skipping malformed JSON line in history at offset %d", offset)
+                offset += len(raw)
+            conn.executemany("INSERT INTO lines (offset, test, ts, status) VALUES (?, ?, ?, ?)", rows)
+        self._write_meta(conn, offset, st.st_ino)
+
+    def _write_meta(self, conn: sqlite3.Connection, size: int, ino: Optional[int] = None) -> None:
+        if ino is None:
+            ino = os.stat(self.history_path).st_ino
+        with open(self.history_path, "rb") as f:
+            head, tail = self._probe(f, size)
+        conn.execute("DELETE FROM meta")
+        conn.execute(
+            "INSERT INTO meta (version, ino, size, head, tail) VALUES (?, ?, ?, ?, ?)",
+            (_INDEX_VERSION, ino, size, head, tail),
+        )
+
+    @staticmethod
+    def _probe(f: Any, size: int) -> Tuple[bytes, bytes]:
+        f.seek(0)
+        head = f.read(min(size, _PROBE_BYTES))
+        f.seek(max(0, size - _PROBE_BYTES))
+        tail = f.read(min(size, _PROBE_BYTES))
+        return head, tail
+
+    def _read(self, offsets: List[int]) -> List[Dict[str, Any]]:
+        entries: List[Dict[str, Any]] = []
+        with open(self.history_path, "rb") as f:
+            for offset in offsets:
+                entry = self._read_line(f, offset)
+                if entry is not None:
+                    entries.append(entry)
+        return entries
+
+    @staticmethod
+    def _read_line(f: Any, offset: int) -> Optional[Dict[str, Any]]:
+        f.seek(offset)
+        try:
+            entry = json.loads(f.readline())
+        except ValueError:
+            return None
+        return entry if isinstance(entry, dict) else None
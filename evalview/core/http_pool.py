@@ -0,0 +1,279 @@
+"""Process-wide pooled HTTP clients for agent adapters.
+
+HTTP-based adapters used to open a fresh ``httpx.AsyncClient`` per call,
+paying a TCP (+TLS) handshake for every test and every retry. Inside a
+pooling session, ``http_client_pool.client(url, timeout)`` instead hands
+out one long-lived client per (event loop, origin, timeout), so keep-alive
+connections — and HTTP/2 streams when ``h2`` is installed — are reused
+across tests.
+
+Usage:
+    async with http_client_pool.session():        # once per run
+        async with http_client_pool.client(url, timeout=30.0) as client:
+            response = await client.post(url, json=payload)
+
+Outside a session, ``client()`` falls back to a per-call client that is
+closed on exit (the old behaviour), so adapters never leak connections
+into an event loop that is about to end.
+
+Pooled clients never store cookies: one client serves every test that
+targets an origin, and a ``Set-Cookie`` from one test must not leak into
+the next.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_CONNECT_EVENTS = (
+    "connection.connect_tcp.complete",
+    "connection.connect_unix_socket.complete",
+)
+
+
+@dataclass
+class PoolStats:
+    """Request and connection counters for pooled HTTP traffic."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served on an already-open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "reused": self.reused,
+            "reuse_rate": round(self.reuse_rate, 4),
+        }
+
+
+class _DiscardingCookieJar(CookieJar):
+    """Cookie jar that ignores every cookie it is offered."""
+
+    def set_cookie(self, cookie: Any) -> None:
+        pass
+
+    def extract_cookies(self, response: Any, request: Any) -> None:
+        pass
+
+
+def _origin(url: str) -> str:
+    """Return ``scheme://host:port`` for ``url`` (the connection-pool key)."""
+    parsed = httpx.URL(url)
+    port = parsed.port or {"http": 80, "https": 443}.get(parsed.scheme, 0)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+def http2_available() -> bool:
+    """True when the optional ``h2`` package is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientPool:
+    """Shares ``httpx.AsyncClient`` instances between adapters and tests.
+
+    Clients are bound to the event loop that created them, so pooling is
+    scoped by :meth:`session`: clients opened inside a session are closed
+    when the outermost session on that loop exits.
+
+    Args:
+        max_connections: Per-client cap on open connections.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection stays open.
+        http2: Negotiate HTTP/2. None = enable when ``h2`` is installed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2_available() if http2 is None else http2
+        self._lock = threading.RLock()
+        # loop -> session nesting depth
+        self._sessions: Dict[asyncio.AbstractEventLoop, int] = {}
+        # (loop, origin, timeout) -> client
+        self._clients: Dict[Tuple[asyncio.AbstractEventLoop, str, float], httpx.AsyncClient] = {}
+        self._stats: Dict[str, PoolStats] = {}
+        self._close_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def stats(self) -> PoolStats:
+        """Totals across all origins."""
+        with self._lock:
+            total = PoolStats()
+            for s in self._stats.values():
+                total.requests += s.requests
+                total.connections_opened += s.connections_opened
+            return total
+
+    def stats_by_origin(self) -> Dict[str, PoolStats]:
+        with self._lock:
+            return {origin: PoolStats(s.requests, s.connections_opened) for origin, s in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def add_close_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Run ``await hook()`` whenever the outermost session on a loop exits.
+
+        Lets other loop-bound client caches (e.g. provider SDK clients)
+        share the session's lifetime instead of outliving it.
+        """
+        with self._lock:
+            if hook not in self._close_hooks:
+                self._close_hooks.append(hook)
+
+    def is_active(self) -> bool:
+        """True when a pooling session is open on the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        with self._lock:
+            return self._sessions.get(loop, 0) > 0
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["HTTPClientPool"]:
+        """Enable pooling on the running loop; close its clients on exit.
+
+        Sessions nest: only the outermost one closes the clients.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._sessions[loop] = self._sessions.get(loop, 0) + 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                depth = self._sessions.get(loop, 1) - 1
+                if depth > 0:
+                    self._sessions[loop] = depth
+                else:
+                    self._sessions.pop(loop, None)
+            if depth <= 0:
+                await self.aclose()
+                with self._lock:
+                    hooks = list(self._close_hooks)
+                for hook in hooks:
+                    try:
+                        await hook()
+                    except Exception as e:  # pragma: no cover - best effort shutdown
+                        logger.debug(f"Error in HTTP pool close hook: {e}")
+                stats = self.stats
+                if stats.requests:
+                    logger.debug(
+                        f"HTTP pool: {stats.requests} requests, {stats.connections_opened} "
+                        f"connections opened ({stats.reuse_rate:.0%} reused)"
+                    )
+
+    @asynccontextmanager
+    async def client(self, url: str, timeout: float = 30.0) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield a client for ``url``.
+
+        Inside a session the client is shared and stays open; outside one
+        it is created for this call and closed on exit.
+        """
+        if self.is_active():
+            yield self._get_pooled(url, timeout)
+            return
+        async with self._new_client(url, timeout) as client:
+            yield client
+
+    async def aclose(self) -> None:
+        """Close every client owned by the running loop.
+
+        Clients left behind by loops that have since closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        to_close: List[httpx.AsyncClient] = []
+        with self._lock:
+            for key in list(self._clients):
+                owner = key[0]
+                if owner is loop:
+                    to_close.append(self._clients.pop(key))
+                elif owner.is_closed():
+                    self._clients.pop(key)
+        for client in to_close:
+            try:
+                await client.aclose()
+            except Exception as e:  # pragma: no cover - best effort shutdown
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_pooled(self, url: str, timeout: float) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        key = (loop, _origin(url), float(timeout))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._new_client(url, timeout, cookies=_DiscardingCookieJar())
+                self._clients[key] = client
+            return client
+
+    def _new_client(
+        self, url: str, timeout: float, cookies: Optional[CookieJar] = None
+    ) -> httpx.AsyncClient:
+        origin = _origin(url)
+        with self._lock:
+            stats = self._stats.setdefault(origin, PoolStats())
+
+        async def _on_connect(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name in _CONNECT_EVENTS:
+                stats.connections_opened += 1
+
+        async def _on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            trace = request.extensions.get("trace")
+            if trace is None:
+                request.extensions["trace"] = _on_connect
+            else:
+                async def _chained(event_name: str, info: Dict[str, Any]) -> None:
+                    await _on_connect(event_name, info)
+                    await trace(event_name, info)
+
+                request.extensions["trace"] = _chained
+
+        return httpx.AsyncClient(
+            timeout=timeout,
+            limits=self.limits,
+            http2=self.http2,
+            cookies=cookies,
+            event_hooks={"request": [_on_request]},
+        )
+
+
+http_client_pool = HTTPClientPool()
@@ -0,0 +1,281 @@
+"""Incremental check mode — skip tests whose inputs have not changed.
+
+Most ``evalview check`` runs in CI hit agents whose code, prompts, config
+and model are identical to the last passing check. This module fingerprints
+everything that can change a test's verdict and, when the fingerprint
+matches a recent PASSED check, hands back that check's EvaluationResult so
+the agent and the LLM judge are not called again. The diff against the
+golden is still recomputed locally from the stored trace.
+
+A test's fingerprint covers:
+    - its definition (the loaded TestCase)
+    - its golden variants (file, mtime, size from the golden index)
+    - .evalview/config.yaml and prompts/ (the DriftTracker prompt hash)
+    - watched source files (git blob hashes, plus uncommitted edits)
+    - run settings: judge model/provider, --no-judge, semantic diff,
+      diff thresholds, EvalView version
+
+Usage:
+    cache = IncrementalCheckCache(ttl_hours=24, exclude=["tests"])
+    cache.bind_run(skip_llm_judge=False, semantic_diff=False)
+    fp = cache.fingerprint(tc, store.list_variant_entries(tc.name))
+    prior = cache.lookup(tc.name, fp)      # EvaluationResult or None
+    ...
+    cache.record(tc.name, fp, result, diff)
+    cache.save()
+
+Only PASSED verdicts are reused; failing and changed tests always re-run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+from evalview.core.drift_tracker import _prompt_fingerprint
+
+if TYPE_CHECKING:
+    from evalview.core.diff import TraceDiff
+    from evalview.core.golden import GoldenIndexEntry
+    from evalview.core.types import EvaluationResult, TestCase
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+
+def _code_fingerprint(
+    base_path: Path, watch: Sequence[str], exclude: Sequence[str]
+) -> Optional[str]:
+    """Hash the watched source files using git's own content hashes.
+
+    ``git ls-files -s`` gives the blob hash of every tracked file, so the
+    cost is a few subprocesses rather than reading the tree. Files with
+    uncommitted changes (and untracked, non-ignored files) are hashed from
+    disk on top. Returns None outside a git repository — callers must then
+    treat every test as changed.
+    """
+    try:
+        where = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel", "--show-prefix"],
+            cwd=str(base_path),
+            capture_output=True,
+            timeout=10.0,
+        )
+        if where.returncode != 0:
+            return None
+        lines = where.stdout.decode("utf-8", "surrogateescape").splitlines()
+        toplevel = Path(lines[0])
+        prefix = lines[1] if len(lines) > 1 else ""
+
+        # ls-files and status disagree on path bases when run from a
+        # subdirectory (status --porcelain is always root-relative), so run
+        # both from the top level with root-anchored pathspecs and compare
+        # root-relative paths throughout.
+        def _from_top(path: str) -> str:
+            return posixpath.normpath(posixpath.join(prefix, path))
+
+        pathspec = [
+            ":(top)" + ("" if rel == "." else rel)
+            for rel in (_from_top(p) for p in watch or ["."])
+        ]
+        excluded = tuple(_from_top(p.rstrip("/")) + "/" for p in exclude if p)
+
+        tracked = subprocess.run(
+            ["git", "ls-files", "-s", "-z", "--", *pathspec],
+            cwd=str(toplevel),
+            capture_output=True,
+            timeout=10.0,
+        )
+        if tracked.returncode != 0:
+            return None
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "-z", "--untracked-files=all", "--", *pathspec],
+            cwd=str(toplevel),
+            capture_output=True,
+            timeout=10.0,
+        )
+        if status.returncode != 0:
+            return None
+    except (subprocess.SubprocessError, FileNotFoundError, OSError, IndexError):
+        return None
+
+    def _kept(path: str) -> bool:
+        return not path.startswith(excluded)
+
+    hasher = hashlib.sha1()
+    for record in tracked.stdout.split(b"\0"):
+        if not record:
+            continue
+        # "<mode> <blob> <stage>\t<path>"
+        meta, _, path = record.decode("utf-8", "surrogateescape").partition("\t")
+        if _kept(path):
+            hasher.update(f"{meta}\t{path}\0".encode("utf-8", "surrogateescape"))
+
+    # Porcelain -z records are "XY <path>"; renames carry an extra source path.
+    entries = status.stdout.decode("utf-8", "surrogateescape").split("\0")
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        code, path = entry[:2], entry[3:]
+        if "R" in code or "C" in code:
+            i += 1
+        if not _kept(path):
+            continue
+        hasher.update(f"{code}\t{path}\0".encode("utf-8", "surrogateescape"))
+        try:
+            hasher.update((toplevel / path).read_bytes())
+        except OSError:
+            hasher.update(b"<missing>")
+    return hasher.hexdigest()[:16]
+
+
+class IncrementalCheckCache:
+    """Per-test input fingerprints and the last PASSED result for each test.
+
+    Stored in .evalview/check_cache.json.
+
+    Args:
+        base_path: Project root (default: current dir).
+        ttl_hours: Reuse a verdict for at most this long after its real check.
+        watch: Source paths whose changes invalidate reuse. Empty = all
+            git-tracked files under base_path.
+        exclude: Paths never considered source (the test directory;
+            .evalview/ is always excluded).
+        force: Never reuse, but still record fresh verdicts.
+    """
+
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        ttl_hours: float = 24.0,
+        watch: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        force: bool = False,
+    ):
+        self.base_path = base_path or Path(".")
+        self.cache_path = self.base_path / ".evalview" / "check_cache.json"
+        self.ttl = timedelta(hours=ttl_hours)
+        self.watch = list(watch or [])
+        self.exclude = [".evalview", *(exclude or [])]
+        self.force = force
+
+        self.reused: List[str] = []
+        self._run_inputs: Optional[Dict[str, Any]] = None
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def bind_run(self, **settings: Any) -> None:
+        """Compute the run-level inputs shared by every test's fingerprint.
+
+        Args:
+            **settings: Run options that affect verdicts (judge, diff config).
+        """
+        from evalview import __version__
+
+        code = _code_fingerprint(self.base_path, self.watch, self.exclude)
+        self._run_inputs = None if code is None else {
+            "code": code,
+            "prompt_hash": _prompt_fingerprint(self.base_path),
+            "judge_provider": os.environ.get("EVAL_PROVIDER"),
+            "judge_model": os.environ.get("EVAL_MODEL"),
+            "evalview": __version__,
+            **settings,
+        }
+        if self._run_inputs is None:
+            logger.info("Incremental check disabled: not a git repository")
+
+    def fingerprint(
+        self, test_case: "TestCase", golden_entries: Sequence["GoldenIndexEntry"]
+    ) -> Optional[str]:
+        """Fingerprint one test's inputs, or None if they can't be pinned down."""
+        if self._run_inputs is None or not golden_entries:
+            return None
+        payload = {
+            "run": self._run_inputs,
+            "test": test_case.model_dump(mode="json"),
+            "golden": [[e.file, e.mtime_ns, e.size] for e in golden_entries],
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def lookup(self, test_name: str, fingerprint: Optional[str]) -> Optional["EvaluationResult"]:
+        """Return the reusable result for ``test_name``, or None to run it."""
+        from evalview.core.types import EvaluationResult
+
+        if self.force or fingerprint is None:
+            return None
+        entry = self._load().get(test_name)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        try:
+            checked_at = datetime.fromisoformat(entry["ts"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if datetime.now() - checked_at > self.ttl:
+            return None
+        try:
+            result = EvaluationResult.model_validate(entry["result"])
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cached result for {test_name}: {e}")
+            return None
+        self.reused.append(test_name)
+        return result
+
+    def record(
+        self,
+        test_name: str,
+        fingerprint: Optional[str],
+        result: "EvaluationResult",
+        diff: "TraceDiff",
+    ) -> None:
+        """Remember a freshly checked test; only PASSED verdicts are kept."""
+        from evalview.core.diff import DiffStatus
+
+        entries = self._load()
+        if fingerprint is None or diff.overall_severity != DiffStatus.PASSED:
+            if entries.pop(test_name, None) is not None:
+                self._dirty = True
+            return
+        entries[test_name] = {
+            "fingerprint": fingerprint,
+            "ts": datetime.now().isoformat(),
+            "result": result.model_dump(mode="json"),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed (atomic replace)."""
+        if not self._dirty or self._entries is None:
+            return
+        tmp_path = self.cache_path.with_suffix(".json.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": _CACHE_VERSION, "tests": self._entries}, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write incremental check cache: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == _CACHE_VERSION:
+                    self._entries = data.get("tests", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                logger.debug(f"Ignoring unreadable incremental check cache: {e}")
+        return self._entries
@@ -0,0 +1,316 @@
+"""Central dispatcher for LLM-as-judge requests.
+
+Every judge call made through :meth:`LLMClient.chat_completion` (output
+quality, hallucination, safety, the skills rubric, root-cause analysis)
+goes through the process-wide :data:`judge_dispatcher`. Without it each
+evaluator called its provider independently, so a wide ``check`` run
+flooded the judge API and then sat in retries.
+
+Per provider the dispatcher:
+    - caps in-flight requests (``EVAL_JUDGE_CONCURRENCY``, default 16)
+    - paces requests and tokens with shared buckets (``EVAL_JUDGE_RPM``,
+      ``EVAL_JUDGE_TPM``; unset = no cap). ``EVAL_JUDGE_RPM_<PROVIDER>``
+      and friends override the limits for one provider.
+    - admits queued requests by :class:`JudgePriority`, so judges that
+      decide a verdict go ahead of background analysis
+    - coalesces identical in-flight prompts into one provider call
+    - retries rate-limited and overloaded calls, pausing the whole
+      provider after a 429
+    - records how long requests waited in the queue (:attr:`JudgeDispatcher.stats`)
+
+The limits can also be set in config.yaml under ``judge:`` (``rpm``,
+``tpm``, ``max_concurrency``); see :func:`evalview.core.config.apply_judge_config`.
+
+Usage:
+    result = await judge_dispatcher.submit(
+        "openai",
+        lambda: client.chat.completions.create(...),
+        priority=JudgePriority.GATE,
+        coalesce_key=prompt_hash,
+        estimated_tokens=1500,
+    )
+"""
+
+import asyncio
+import copy
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from evalview.core.parallel import (
+    TokenBucket,
+    is_overload_error,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from evalview.core.retry import RetryConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_JUDGE_CONCURRENCY = 16
+
+
+class JudgePriority(IntEnum):
+    """Admission order when judge requests queue up (lower goes first)."""
+
+    GATE = 0  # decides a test's pass/fail verdict
+    NORMAL = 1
+    BACKGROUND = 2  # analysis and generation nothing is blocked on
+
+
+def _env_limit(name: str, provider: str) -> Optional[float]:
+    """Read a positive limit from ``<name>_<PROVIDER>`` or ``<name>``."""
+    for var in (f"{name}_{provider.upper()}", name):
+        value = os.environ.get(var)
+        if not value:
+            continue
+        try:
+            parsed = float(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {var}={value!r}")
+            continue
+        return parsed if parsed > 0 else None
+    return None
+
+
+@dataclass
+class JudgeDispatchStats:
+    """Counters for judge dispatch over a run."""
+
+    requests: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+    queue_wait_by_priority: Dict[str, float] = field(default_factory=dict)
+
+    def record_wait(self, priority: JudgePriority, waited: float) -> None:
+        self.requests += 1
+        self.queue_wait_total += waited
+        self.queue_wait_max = max(self.queue_wait_max, waited)
+        name = priority.name.lower()
+        self.queue_wait_by_priority[name] = self.queue_wait_by_priority.get(name, 0.0) + waited
+
+    @property
+    def queue_wait_avg(self) -> float:
+        return self.queue_wait_total / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "queue_wait_avg_s": round(self.queue_wait_avg, 3),
+            "queue_wait_max_s": round(self.queue_wait_max, 3),
+            "queue_wait_by_priority_s": {
+                name: round(total, 3) for name, total in self.queue_wait_by_priority.items()
+            },
+        }
+
+
+class _Lane:
+    """Admission state for one provider.
+
+    The buckets are shared across event loops; the queue and in-flight
+    count belong to the loop that is using the lane and are reset when a
+    new ``asyncio.run()`` picks it up (the same rule as ConcurrencyLimiter).
+    """
+
+    def __init__(self, rpm: Optional[float], tpm: Optional[float], max_concurrency: int):
+        self.requests = TokenBucket(rpm)
+        # Allow roughly ten seconds of token budget in one burst.
+        self.tokens = TokenBucket(tpm, burst=tpm / 6 if tpm else None)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.waiting: List[Tuple[int, int]] = []
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+            self.waiting = []
+        return self._condition
+
+    def drop(self, ticket: Tuple[int, int]) -> None:
+        self.waiting.remove(ticket)
+        heapq.heapify(self.waiting)
+
+
+class JudgeDispatcher:
+    """Coordinates every judge request in the process.
+
+    Args:
+        max_retries: Retries for rate-limited, overloaded or timed-out calls
+            (on top of any retries the provider SDK makes itself).
+    """
+
+    def __init__(self, max_retries: int = 2):
+        self._lock = threading.Lock()
+        self._lanes: Dict[str, _Lane] = {}
+        self._inflight: Dict[Tuple[Any, str, str], "asyncio.Future[Any]"] = {}
+        self._sequence = itertools.count()
+        self._retry = RetryConfig(max_retries=max_retries, base_delay=1.0, max_delay=60.0)
+        self.stats = JudgeDispatchStats()
+
+    def reset(self) -> None:
+        """Clear stats and re-read the limits from the environment."""
+        with self._lock:
+            self._lanes.clear()
+        self.stats = JudgeDispatchStats()
+
+    async def submit(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        *,
+        priority: JudgePriority = JudgePriority.NORMAL,
+        coalesce_key: Optional[str] = None,
+        estimated_tokens: int = 1,
+    ) -> T:
+        """Run ``call`` once the provider's queue, concurrency and rate limits allow.
+
+        Args:
+            provider: Provider name; each provider has its own limits.
+            call: Makes the provider request. May be invoked again on retry.
+            priority: Queue position relative to other waiting requests.
+            coalesce_key: Requests with the same key that overlap in time
+                share one provider call; each caller gets its own copy of
+                the result.
+            estimated_tokens: Prompt plus completion tokens, for the TPM limit.
+        """
+        if coalesce_key is None:
+            return await self._dispatch(provider, call, priority, estimated_tokens)
+
+        loop = asyncio.get_running_loop()
+        key = (loop, provider, coalesce_key)
+        leader = self._inflight.get(key)
+        if leader is not None:
+            try:
+                result = await asyncio.shield(leader)
+                self.stats.coalesced += 1
+                return copy.deepcopy(result)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+                # The leading request was cancelled, not us: make our own call.
+                return await self._dispatch(provider, call, priority, estimated_tokens)
+
+        future: "asyncio.Future[Any]" = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._dispatch(provider, call, priority, estimated_tokens)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Followers re-raise it; don't warn when there are none.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def _lane(self, provider: str) -> _Lane:
+        with self._lock:
+            lane = self._lanes.get(provider)
+            if lane is None:
+                lane = _Lane(
+                    rpm=_env_limit("EVAL_JUDGE_RPM", provider),
+                    tpm=_env_limit("EVAL_JUDGE_TPM", provider),
+                    max_concurrency=int(
+                        _env_limit("EVAL_JUDGE_CONCURRENCY", provider) or DEFAULT_JUDGE_CONCURRENCY
+                    ),
+                )
+                self._lanes[provider] = lane
+            return lane
+
+    async def _dispatch(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        priority: JudgePriority,
+        estimated_tokens: int,
+    ) -> T:
+        lane = self._lane(provider)
+        attempt = 0
+        while True:
+            await self._admit(lane, priority, estimated_tokens)
+            try:
+                return await call()
+            except Exception as exc:
+                if attempt >= self._retry.max_retries or not is_overload_error(exc):
+                    raise
+                delay = retry_after_seconds(exc)
+                if delay is None:
+                    delay = self._retry.calculate_delay(attempt)
+                if is_rate_limit_error(exc):
+                    self.stats.rate_limited += 1
+                    lane.requests.pause(delay)
+                    lane.tokens.pause(delay)
+                self.stats.retries += 1
+                attempt += 1
+                logger.debug(
+                    f"Judge call to {provider} failed ({type(exc).__name__}); "
+                    f"retry {attempt}/{self._retry.max_retries} in {delay:.1f}s"
+                )
+            finally:
+                await self._release(lane)
+            await asyncio.sleep(delay)
+
+    async def _admit(self, lane: _Lane, priority: JudgePriority, estimated_tokens: int) -> None:
+        """Wait for our turn in the queue, a free slot and rate-limit budget."""
+        condition = lane.condition()
+        ticket = (int(priority), next(self._sequence))
+        queued_at = time.monotonic()
+        async with condition:
+            heapq.heappush(lane.waiting, ticket)
+            try:
+                await condition.wait_for(
+                    lambda: lane.waiting[0] == ticket and lane.in_flight < lane.max_concurrency
+                )
+            except BaseException:
+                lane.drop(ticket)
+                condition.notify_all()
+                raise
+
+        # Stay at the head of the queue while waiting out the rate limits,
+        # so lower-priority requests can't take the budget first.
+        admitted = False
+        try:
+            await lane.requests.acquire()
+            await lane.tokens.acquire(estimated_tokens)
+            admitted = True
+        finally:
+            async with condition:
+                lane.drop(ticket)
+                if admitted:
+                    lane.in_flight += 1
+                condition.notify_all()
+        self.stats.record_wait(priority, time.monotonic() - queued_at)
+
+    async def _release(self, lane: _Lane) -> None:
+        condition = lane.condition()
+        async with condition:
+            lane.in_flight = max(0, lane.in_flight - 1)
+            condition.notify_all()
+
+
+# Global dispatcher shared by every LLMClient
+judge_dispatcher = JudgeDispatcher()
@@ -6,8 +6,11 @@ Everything is re-exported here for backward compatibility.
 
 import os
 import json
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Any, Tuple
+import threading
+from typing import Optional, Dict, Any, Callable, List, Tuple
 
 # Re-export everything from llm_configs for backward compatibility
 from evalview.core.llm_configs import (  # noqa: F401
@@ -24,9 +27,96 @@ from evalview.core.llm_configs import (  # noqa: F401
     get_provider_from_env,
 )
 
+from evalview.core.http_pool import http_client_pool
+from evalview.core.judge_dispatcher import JudgePriority, judge_dispatcher  # noqa: F401
+
 logger = logging.getLogger(__name__)
 
 
+class SDKClientRegistry:
+    """Caches provider SDK clients so judge calls reuse their connections.
+
+    Each ``AsyncOpenAI`` / ``AsyncAnthropic`` / ``genai.Client`` owns an
+    HTTP connection pool, so building one per call meant a fresh TCP+TLS
+    handshake for every judge request. Clients are cached per
+    (event loop, provider, base_url, api_key): the underlying httpx pools
+    are bound to the loop that opened them, so a new ``asyncio.run()``
+    gets new clients and entries from closed loops are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[Any, str, Optional[str], str], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        provider: str,
+        base_url: Optional[str],
+        api_key: str,
+        factory: Callable[[], Any],
+    ) -> Any:
+        """Return the cached client for this key, building it with ``factory`` on a miss."""
+        try:
+            loop: Any = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (loop, provider, base_url, api_key)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.hits += 1
+                return client
+            self._prune_closed_loops()
+            client = factory()
+            self._clients[key] = client
+            self.misses += 1
+            return client
+
+    async def aclose(self) -> None:
+        """Close and forget every client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            keys = [key for key in self._clients if key[0] is loop]
+            clients = [self._clients.pop(key) for key in keys]
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:  # pragma: no cover - best effort shutdown
+                logger.debug(f"Error closing LLM client: {e}")
+
+    def clear(self) -> None:
+        """Forget all cached clients without closing them."""
+        with self._lock:
+            self._clients.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def _prune_closed_loops(self) -> None:
+        # Caller holds the lock. Clients from a finished asyncio.run() can
+        # no longer be awaited, so they are simply released.
+        stale: List[Tuple[Any, str, Optional[str], str]] = [
+            key for key in self._clients if key[0] is not None and key[0].is_closed()
+        ]
+        for key in stale:
+            del self._clients[key]
+
+
+sdk_client_registry = SDKClientRegistry()
+# Judge clients live as long as the run's pooling session on that loop.
+http_client_pool.add_close_hook(sdk_client_registry.aclose)
+
+
 def select_provider() -> Tuple[LLMProvider, str]:
     """Select the best available LLM provider.
 
@@ -160,6 +250,34 @@ class LLMClient:
                         f"  2. Use Anthropic model: set EVAL_MODEL=claude-sonnet-4-20250514"
                     )
 
+    def _openai_client(self, base_url: Optional[str] = None, api_key: Optional[str] = None) -> Any:
+        """Shared ``AsyncOpenAI`` client for this provider/endpoint/key."""
+        from openai import AsyncOpenAI
+
+        key = api_key or self.api_key
+        return sdk_client_registry.get(
+            "openai",
+            base_url,
+            key,
+            lambda: AsyncOpenAI(api_key=key, base_url=base_url),
+        )
+
+    def _anthropic_client(self) -> Any:
+        """Shared ``AsyncAnthropic`` client for this key."""
+        from anthropic import AsyncAnthropic
+
+        return sdk_client_registry.get(
+            "anthropic", None, self.api_key, lambda: AsyncAnthropic(api_key=self.api_key)
+        )
+
+    def _gemini_client(self) -> Any:
+        """Shared ``genai.Client`` for this key."""
+        from google import genai
+
+        return sdk_client_registry.get(
+            "gemini", None, self.api_key, lambda: genai.Client(api_key=self.api_key)
+        )
+
     async def chat_stream(
         self,
         system_prompt: str,
@@ -241,14 +359,12 @@ class LLMClient:
         base_url: Optional[str] = None,
     ):
         """OpenAI-compatible streaming."""
-        from openai import AsyncOpenAI
-
         api_key = self.api_key
         if self.provider == LLMProvider.OLLAMA:
             api_key = "ollama"
             base_url = f"{os.getenv('OLLAMA_HOST', 'http://localhost:11434')}/v1"
 
-        client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        client = self._openai_client(base_url=base_url, api_key=api_key)
 
         # GPT-5 requires temperature=1; o-series models don't support temperature at all
         is_gpt5 = self.model.startswith("gpt-5")
@@ -299,9 +415,7 @@ class LLMClient:
         max_tokens: int,
     ):
         """Anthropic streaming."""
-        from anthropic import AsyncAnthropic
-
-        client = AsyncAnthropic(api_key=self.api_key)
+        client = self._anthropic_client()
 
         async with client.messages.stream(
             model=self.model,
@@ -344,14 +458,13 @@ class LLMClient:
     ):
         """Google Gemini streaming."""
         try:
-            from google import genai
             from google.genai import types
         except ImportError:
             raise ImportError(
                 "Google GenAI package required. Install with: pip install google-genai"
             )
 
-        client = genai.Client(api_key=self.api_key)
+        client = self._gemini_client()
 
         # Gemini SDK returns an async iterator
         response_stream = await client.aio.models.generate_content(
@@ -375,18 +488,47 @@ class LLMClient:
         user_prompt: str,
         temperature: float = 0.3,
         max_tokens: int = 1000,
+        priority: JudgePriority = JudgePriority.NORMAL,
     ) -> Dict[str, Any]:
         """Make a chat completion request and return parsed JSON.
 
+        The request goes through the shared judge dispatcher, which applies
+        the provider's concurrency and rate limits, orders queued requests
+        by ``priority`` and merges identical requests that are in flight
+        at the same time.
+
         Args:
             system_prompt: System message
             user_prompt: User message
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            priority: Queue priority when judge requests back up
 
         Returns:
             Parsed JSON response from the LLM
         """
+        fingerprint = hashlib.sha256(
+            json.dumps(
+                [self.provider.value, self.model, system_prompt, user_prompt, temperature, max_tokens]
+            ).encode("utf-8")
+        ).hexdigest()
+        return await judge_dispatcher.submit(
+            self.provider.value,
+            lambda: self._provider_completion(system_prompt, user_prompt, temperature, max_tokens),
+            priority=priority,
+            coalesce_key=fingerprint,
+            # ~4 characters per token, plus the completion budget.
+            estimated_tokens=(len(system_prompt) + len(user_prompt)) // 4 + max_tokens,
+        )
+
+    async def _provider_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Dict[str, Any]:
+        """Send one chat completion to the configured provider."""
         if self.provider == LLMProvider.OPENAI:
             return await self._openai_completion(
                 system_prompt, user_prompt, temperature, max_tokens
@@ -424,9 +566,7 @@ class LLMClient:
         max_tokens: int,
     ) -> Dict[str, Any]:
         """OpenAI chat completion."""
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = self._openai_client()
 
         # GPT-5 requires temperature=1; o-series models don't support temperature at all
         is_gpt5 = self.model.startswith("gpt-5")
@@ -471,9 +611,7 @@ class LLMClient:
         max_tokens: int,
     ) -> Dict[str, Any]:
         """Anthropic chat completion."""
-        from anthropic import AsyncAnthropic
-
-        client = AsyncAnthropic(api_key=self.api_key)
+        client = self._anthropic_client()
 
         # Anthropic requires explicit JSON instruction in prompt
         json_instruction = "\n\nRespond with ONLY a valid JSON object, no other text."
@@ -518,14 +656,13 @@ class LLMClient:
     ) -> Dict[str, Any]:
         """Google Gemini chat completion."""
         try:
-            from google import genai
             from google.genai import types
         except ImportError:
             raise ImportError(
                 "Google GenAI package required. Install with: pip install google-genai"
             )
 
-        client = genai.Client(api_key=self.api_key)
+        client = self._gemini_client()
 
         response = await client.aio.models.generate_content(
             model=self.model,
@@ -548,13 +685,8 @@ class LLMClient:
         max_tokens: int,
     ) -> Dict[str, Any]:
         """xAI Grok chat completion (OpenAI-compatible API)."""
-        from openai import AsyncOpenAI
-
         # Grok uses OpenAI-compatible API
-        client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url="https://api.x.ai/v1",
-        )
+        client = self._openai_client(base_url="https://api.x.ai/v1")
 
         response = await client.chat.completions.create(
             model=self.model,
@@ -577,9 +709,7 @@ class LLMClient:
         max_tokens: int,
     ) -> Dict[str, Any]:
         """DeepSeek chat completion (OpenAI-compatible API)."""
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=self.api_key, base_url="https://api.deepseek.com/v1")
+        client = self._openai_client(base_url="https://api.deepseek.com/v1")
 
         response = await client.chat.completions.create(
             model=self.model,
@@ -602,14 +732,9 @@ class LLMClient:
         max_tokens: int,
     ) -> Dict[str, Any]:
         """Hugging Face Inference API chat completion (OpenAI-compatible)."""
-        from openai import AsyncOpenAI
-
         # HF Inference Providers - unified router endpoint (2025)
         # Routes to best available provider (Together, Fireworks, etc.)
-        client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url="https://router.huggingface.co/v1",
-        )
+        client = self._openai_client(base_url="https://router.huggingface.co/v1")
 
         # Add explicit JSON instruction since not all models support response_format
         json_instruction = "\n\nRespond with ONLY a valid JSON object, no other text."
@@ -693,15 +818,11 @@ class LLMClient:
         max_tokens: int,
     ) -> Dict[str, Any]:
         """Ollama local LLM chat completion (OpenAI-compatible)."""
-        from openai import AsyncOpenAI
-
         # Ollama runs locally with OpenAI-compatible API
         ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
-        client = AsyncOpenAI(
-            api_key="ollama",  # Ollama doesn't need an API key
-            base_url=f"{ollama_host}/v1",
-        )
+        # Ollama doesn't need an API key
+        client = self._openai_client(base_url=f"{ollama_host}/v1", api_key="ollama")
 
         # Add explicit JSON instruction with example format
         json_instruction = """
@@ -16,6 +16,9 @@ else:  # pragma: no cover - exercised on 3.9/3.10 CI runners
     except ImportError:  # pragma: no cover
         _tomllib = None  # type: ignore[assignment]
 
+# libyaml's parser when PyYAML was built with it; same results, much faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Files to skip when loading test cases (not test cases themselves)
 CONFIG_FILE_PATTERNS = {
     "config.yaml",
@@ -52,7 +55,7 @@ def _parse_test_case_file(file_path: Path) -> Any:
             return _tomllib.load(f)
     # Default to YAML for .yaml / .yml / unknown.
     with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 class TestCaseLoader:
@@ -90,6 +93,9 @@ class TestCaseLoader:
         directory tree are also picked up so callers don't need to
         invoke the loader once per format.
 
+        Results come from the process-wide test catalog, so only files
+        changed since the last call are re-parsed.
+
         Args:
             directory: Directory containing test case files
             pattern: File pattern to match (default: *.yaml)
@@ -97,30 +103,6 @@ class TestCaseLoader:
         Returns:
             List of TestCase instances
         """
-        dir_path = Path(directory)
-        test_cases: List[TestCase] = []
-        seen: set = set()
-
-        def _ingest(file_path: Path) -> None:
-            if not file_path.is_file() or _is_config_file(file_path):
-                return
-            resolved = file_path.resolve()
-            if resolved in seen:
-                return
-            seen.add(resolved)
-            test_cases.append(TestCaseLoader.load_from_file(file_path))
-
-        for file_path in dir_path.rglob(pattern):
-            _ingest(file_path)
-
-        # When the caller didn't specify a custom pattern, also pick up the
-        # other supported extensions. rglob each one so traversal stays
-        # recursive (matches the previous .yml behaviour, extended to .toml).
-        if pattern == "*.yaml":
-            for suffix in TEST_CASE_SUFFIXES:
-                if suffix == ".yaml":
-                    continue
-                for file_path in dir_path.rglob(f"*{suffix}"):
-                    _ingest(file_path)
-
-        return test_cases
+        from evalview.core.test_catalog import get_catalog
+
+        return get_catalog(directory, pattern).load_all()
@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
-from typing import List, Callable, Any, Optional, TypeVar
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Callable, Any, Optional, TypeVar
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -10,6 +13,321 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Default cap on simultaneous test executions. Matches `evalview run
+# --max-workers` so both commands put the same pressure on an agent.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# HTTP statuses that mean "the agent is overloaded, slow down".
+_OVERLOAD_STATUS_CODES = {429, 503}
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """Return True if ``exc`` signals that the agent is overloaded.
+
+    Rate limits (HTTP 429), unavailable backends (HTTP 503) and timeouts
+    are treated as congestion signals by :class:`AdaptiveConcurrencyLimiter`.
+    Everything else (bad responses, assertion failures, ...) is a plain
+    test failure and must not shrink the concurrency window.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status in _OVERLOAD_STATUS_CODES:
+        return True
+
+    if getattr(exc, "error_type", None) == "timeout":
+        return True
+
+    try:
+        import httpx
+
+        if isinstance(exc, httpx.TimeoutException):
+            return True
+    except ImportError:  # pragma: no cover - httpx is a core dependency
+        pass
+
+    message = str(exc).lower()
+    return "429" in message or "rate limit" in message or "too many requests" in message
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True if ``exc`` is an HTTP 429 from the provider or agent."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status == 429
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Return the server's ``Retry-After`` delay carried by ``exc``, if any.
+
+    Reads the header from ``exc.response`` (httpx / OpenAI / Anthropic SDK
+    errors all expose it there). Only the delta-seconds form is understood.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after")
+    except AttributeError:
+        return None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class ConcurrencyLimiter:
+    """Async concurrency cap whose limit can change while tasks are waiting.
+
+    Works like an ``asyncio.Semaphore`` but reports the outcome of every
+    slot on release, so subclasses can adjust the limit from live feedback.
+    The underlying condition is bound lazily to the running loop, which lets
+    one limiter be reused across successive ``asyncio.run()`` calls.
+
+    Usage:
+        limiter = ConcurrencyLimiter(8)
+        async with limiter.slot():
+            await adapter.execute(query)
+    """
+
+    def __init__(self, limit: int = DEFAULT_MAX_CONCURRENCY):
+        if limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+        self._limit = limit
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.peak_in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of concurrent slots."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def adaptive(self) -> bool:
+        return False
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            # Slots held on a previous (closed) loop can never be released.
+            self._in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> float:
+        """Wait for a free slot. Returns the monotonic start time of the slot."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        return time.monotonic()
+
+    async def release(self, started_at: float, error: Optional[BaseException] = None) -> None:
+        """Free a slot and feed its outcome back into the limit."""
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._on_release(time.monotonic() - started_at, error, started_at)
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the ``async with`` block."""
+        started_at = await self.acquire()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            await self.release(started_at, error)
+
+    def _on_release(
+        self, latency: float, error: Optional[BaseException], started_at: float
+    ) -> None:
+        """Hook for subclasses. Called with the condition lock held."""
+
+
+class AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """AIMD concurrency limiter that finds the agent's sustainable parallelism.
+
+    - **Slow start**: until the first congestion signal the limit grows by
+      one per healthy completion, doubling roughly once per window.
+    - **Additive increase**: afterwards it grows by ``1 / limit`` per healthy
+      completion (about +1 per window).
+    - **Multiplicative decrease**: a 429/503/timeout multiplies the limit by
+      ``backoff_ratio``. Failures from slots started before the last decrease
+      are ignored so one burst of rejections only halves the window once.
+
+    A completion is *healthy* when its latency stays within
+    ``latency_tolerance`` times the smoothed latency seen so far; slower
+    completions hold the limit steady instead of ramping further.
+    """
+
+    def __init__(
+        self,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        initial_limit: Optional[int] = None,
+        min_limit: int = 1,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        if max_limit < min_limit:
+            raise ValueError(f"max_limit ({max_limit}) must be >= min_limit ({min_limit})")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f"backoff_ratio must be between 0 and 1, got {backoff_ratio}")
+        start = initial_limit if initial_limit is not None else min(max_limit, 4)
+        super().__init__(max(min_limit, min(start, max_limit)))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._window = float(self._limit)
+        self._slow_start = True
+        self._last_decrease_at = float("-inf")
+        self.smoothed_latency: Optional[float] = None
+        self.peak_limit = self._limit
+        self.backoffs = 0
+
+    @property
+    def adaptive(self) -> bool:
+        return True
+
+    def _on_release(
+        self, latency: float, error: Optional[BaseException], started_at: float
+    ) -> None:
+        if error is not None:
+            if is_overload_error(error) and started_at >= self._last_decrease_at:
+                self._window = max(float(self.min_limit), self._window * self.backoff_ratio)
+                self._slow_start = False
+                self._last_decrease_at = time.monotonic()
+                self.backoffs += 1
+                logger.debug(
+                    "Overload signal (%s); concurrency limit -> %d",
+                    type(error).__name__,
+                    int(self._window),
+                )
+            self._limit = max(self.min_limit, int(self._window))
+            return
+
+        healthy = (
+            self.smoothed_latency is None
+            or latency <= self.smoothed_latency * self.latency_tolerance
+        )
+        if self.smoothed_latency is None:
+            self.smoothed_latency = latency
+        else:
+            self.smoothed_latency += self.smoothing * (latency - self.smoothed_latency)
+
+        if healthy:
+            step = 1.0 if self._slow_start else 1.0 / max(self._window, 1.0)
+            self._window = min(float(self.max_limit), self._window + step)
+        self._limit = max(self.min_limit, int(self._window))
+        self.peak_limit = max(self.peak_limit, self._limit)
+
+
+def create_limiter(
+    max_concurrency: Optional[int] = None,
+    adaptive: bool = False,
+) -> ConcurrencyLimiter:
+    """Build the concurrency limiter for a run.
+
+    Args:
+        max_concurrency: Hard ceiling on simultaneous tests
+            (default: ``DEFAULT_MAX_CONCURRENCY``).
+        adaptive: Use AIMD to search for the best limit up to the ceiling.
+    """
+    limit = max_concurrency or DEFAULT_MAX_CONCURRENCY
+    if adaptive:
+        return AdaptiveConcurrencyLimiter(max_limit=limit)
+    return ConcurrencyLimiter(limit)
+
+
+class TokenBucket:
+    """Rate limiter shared by everything calling one provider.
+
+    Holds up to ``burst`` tokens, refilled at ``rate_per_minute``. Each
+    request takes one token (a request-rate limit) or its estimated size
+    (a tokens-per-minute limit). ``rate_per_minute=None`` never limits on
+    its own, but :meth:`pause` still works, so a 429 from the provider
+    holds back every caller sharing the bucket until its ``Retry-After``
+    has passed instead of each one finding out separately.
+
+    State is guarded by a thread lock and waiting uses ``asyncio.sleep``,
+    so one bucket can be shared across event loops and threads.
+
+    Usage:
+        bucket = TokenBucket(rate_per_minute=50)
+        await bucket.acquire()
+        response = await client.messages.create(...)
+    """
+
+    def __init__(self, rate_per_minute: Optional[float] = None, burst: Optional[float] = None):
+        if rate_per_minute is not None and rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.rate_per_minute = rate_per_minute
+        self.burst = float(burst) if burst is not None else max(1.0, (rate_per_minute or 60) / 60)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def _reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens if available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.rate_per_minute is None:
+                return 0.0
+            rate = self.rate_per_minute / 60.0
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            # A request bigger than the bucket waits for a full bucket.
+            amount = min(amount, self.burst)
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / rate
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until ``amount`` tokens are available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            delay = self._reserve(amount)
+            if delay <= 0:
+                self.waited += waited
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. after a 429)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Don't let a full bucket release a burst the moment the pause ends.
+            self._tokens = min(self._tokens, 1.0)
+
 
 @dataclass
 class TestProgress:
@@ -53,6 +371,7 @@ class ParallelExecutor:
         on_start: Optional[Callable[[str], None]] = None,
         on_complete: Optional[Callable[[str, bool, Any], None]] = None,
         on_error: Optional[Callable[[str, Exception], None]] = None,
+        limiter: Optional[ConcurrencyLimiter] = None,
     ):
         """
         Initialize parallel executor.
@@ -62,9 +381,11 @@ class ParallelExecutor:
             on_start: Callback when test starts (test_name)
             on_complete: Callback when test completes (test_name, passed, result)
             on_error: Callback when test errors (test_name, exception)
+            limiter: Optional shared limiter (overrides max_workers), e.g. an
+                     AdaptiveConcurrencyLimiter
         """
-        self.max_workers = max_workers
-        self.semaphore = asyncio.Semaphore(max_workers)
+        self.limiter = limiter or ConcurrencyLimiter(max_workers)
+        self.max_workers = self.limiter.limit
         self.on_start = on_start
         self.on_complete = on_complete
         self.on_error = on_error
@@ -91,7 +412,9 @@ class ParallelExecutor:
         async def run_with_limit(index: int, test_case: Any) -> ParallelResult:
             test_name = getattr(test_case, "name", f"test_{index}")
 
-            async with self.semaphore:
+            started_at = await self.limiter.acquire()
+            slot_error: Optional[BaseException] = None
+            try:
                 self.progress.running.append(test_name)
 
                 if self.on_start:
@@ -122,6 +445,7 @@ class ParallelExecutor:
                     )
 
                 except Exception as e:
+                    slot_error = e
                     end_time = datetime.now()
 
                     self.progress.completed += 1
@@ -140,6 +464,8 @@ class ParallelExecutor:
                         start_time=start_time,
                         end_time=end_time,
                     )
+            finally:
+                await self.limiter.release(started_at, slot_error)
 
         # Create all tasks
         tasks = [
@@ -159,6 +485,7 @@ async def execute_tests_parallel(
     on_start: Optional[Callable[[str], None]] = None,
     on_complete: Optional[Callable[[str, bool, Any], None]] = None,
     on_error: Optional[Callable[[str, Exception], None]] = None,
+    limiter: Optional[ConcurrencyLimiter] = None,
 ) -> List[ParallelResult]:
     """
     Convenience function to execute tests in parallel.
@@ -170,6 +497,7 @@ async def execute_tests_parallel(
         on_start: Callback when test starts
         on_complete: Callback when test completes
         on_error: Callback when test errors
+        limiter: Optional shared concurrency limiter (overrides max_workers)
 
     Returns:
         List of ParallelResult in same order as test_cases
@@ -179,5 +507,6 @@ async def execute_tests_parallel(
         on_start=on_start,
         on_complete=on_complete,
         on_error=on_error,
+        limiter=limiter,
     )
     return await executor.execute_all(test_cases, execute_fn)
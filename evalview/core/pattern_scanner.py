@@ -0,0 +1,337 @@
+"""Precompiled multi-pattern scanning for deterministic checks.
+
+Safety, PII and skill-security checks each test a text against several
+categories of regexes. ``PatternSet`` compiles a set's patterns once, and
+scans a text for all of them like this:
+
+1. Literal prefilter. Each pattern's parse tree is searched for literal
+   text that every match must contain (``AKIA`` for AWS keys, ``ignore``
+   for "ignore previous instructions", ``@`` for emails). A pattern whose
+   literal is absent from the text cannot match, so it is skipped. These
+   are plain substring checks, so clean output skips most regexes
+   entirely instead of running every one of them over it.
+2. One combined pass. The patterns that survive are joined into a single
+   alternation, with one named group per category, compiled once per
+   surviving subset.
+3. Overlap fix-up. Alternation finds leftmost, non-overlapping matches, so
+   a match in one category can hide an overlapping match in another. When
+   the combined pass finds anything, the categories it did not report are
+   re-checked with their own precompiled regexes.
+
+Usage:
+    DANGEROUS = PatternSet(
+        {"weapons": [r"build (a )?bomb"], "fraud": [r"crack (password|license)"]},
+        flags=re.IGNORECASE,
+    )
+    DANGEROUS.search(output)                      # ("weapons",) or ()
+    DANGEROUS.matching_patterns(output, "fraud")  # the fraud regexes that hit
+
+Patterns with backreferences or group conditionals are scanned on their
+own, outside the combined pass, because their group numbers change once
+they are embedded in the alternation. A subset whose patterns cannot be
+combined (e.g. one starts with a global ``(?i)`` flag) is checked category
+by category instead.
+"""
+
+import functools
+import logging
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Pattern, Sequence, Tuple
+
+try:  # Python 3.11+
+    from re import _constants as _sre_constants  # type: ignore[attr-defined]
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre_constants  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
+
+# Called with the matched text; a False return discards the match.
+MatchValidator = Callable[[str], bool]
+
+# search() results kept per PatternSet for short texts. The same command is
+# often scanned by several checks in a row; long outputs are not retained.
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_MAX_LEN = 4096
+
+# Under re.IGNORECASE these match ASCII letters ("İ"/"ı" match "i", "ſ"
+# matches "s") but str.lower() does not map them there. Texts containing
+# them skip the prefilter for case-insensitive patterns.
+_CASEFOLD_EXCEPTIONS = ("İ", "ı", "ſ")
+
+_GROUP_REFS = tuple(
+    getattr(_sre_constants, name)
+    for name in ("GROUPREF", "GROUPREF_EXISTS")
+    if hasattr(_sre_constants, name)
+)
+
+_REPEATS = tuple(
+    getattr(_sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre_constants, name)
+)
+
+
+def _required_literals(pattern: str, flags: int) -> Optional[Tuple[FrozenSet[str], bool]]:
+    """Literal strings at least one of which appears in every match of ``pattern``.
+
+    Returns ``(literals, ignorecase)``, or None when no such literal can be
+    proven (the pattern then always goes to the regex engine). Literals of
+    case-insensitive patterns are lowercased.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    ignorecase = bool((parsed.state.flags | flags) & re.IGNORECASE)
+    literals = _required_in_sequence(list(parsed), ignorecase)
+    return (literals, ignorecase) if literals else None
+
+
+def _refers_to_groups(pattern: str, flags: int) -> bool:
+    """Whether ``pattern`` contains a backreference or a group conditional."""
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return True
+
+    def walk(node: Any) -> bool:
+        if isinstance(node, _sre_parse.SubPattern):
+            return any(op in _GROUP_REFS or walk(av) for op, av in node)
+        if isinstance(node, (list, tuple)):
+            return any(walk(item) for item in node)
+        return False
+
+    return walk(parsed)
+
+
+def _required_in_sequence(items: List[Tuple[Any, Any]], ignorecase: bool) -> Optional[FrozenSet[str]]:
+    """Best required-literal set for a sequence of parsed regex items."""
+    best: Optional[FrozenSet[str]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[FrozenSet[str]]) -> None:
+        nonlocal best
+        # Prefer the candidate whose shortest literal is longest.
+        if candidate and (best is None or min(map(len, candidate)) > min(map(len, best))):
+            best = candidate
+
+    def close_run() -> None:
+        if run:
+            consider(frozenset({"".join(run)}))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre_constants.LITERAL:
+            ch = chr(av)
+            if ignorecase:
+                if not ch.isascii():
+                    close_run()
+                    continue
+                ch = ch.lower()
+            run.append(ch)
+            continue
+        close_run()
+        if op is _sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if not add_flags and not del_flags:
+                consider(_required_in_sequence(list(sub), ignorecase))
+        elif op is _sre_constants.BRANCH:
+            branches = [_required_in_sequence(list(b), ignorecase) for b in av[1]]
+            if all(branches):
+                consider(frozenset().union(*branches))  # type: ignore[arg-type]
+        elif op in _REPEATS:
+            low, _, sub = av
+            if low >= 1:
+                consider(_required_in_sequence(list(sub), ignorecase))
+    close_run()
+    return best
+
+
+class _Entry:
+    """One compiled pattern and the literals its matches must contain."""
+
+    __slots__ = ("category", "pattern", "regex", "literals", "ignorecase", "standalone")
+
+    def __init__(self, category: str, pattern: str, flags: int):
+        self.category = category
+        self.pattern = pattern
+        self.regex = re.compile(pattern, flags)
+        # Group references break once the pattern is embedded in the alternation.
+        self.standalone = _refers_to_groups(pattern, flags)
+        required = _required_literals(pattern, flags)
+        self.literals: Optional[FrozenSet[str]] = required[0] if required else None
+        self.ignorecase = bool(required and required[1])
+
+
+class PatternSet:
+    """Regex categories scanned together.
+
+    Args:
+        categories: Category name -> regex strings. Order is preserved in results.
+        flags: ``re`` flags applied to every pattern.
+        validators: Optional per-category check of each matched string
+            (e.g. a Luhn check for card numbers).
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Sequence[str]],
+        flags: int = 0,
+        validators: Optional[Mapping[str, MatchValidator]] = None,
+    ):
+        self.flags = flags
+        self._categories = list(categories)
+        self._validators: Dict[str, MatchValidator] = dict(validators or {})
+        self._entries: List[_Entry] = [
+            _Entry(category, pattern, flags)
+            for category, patterns in categories.items()
+            for pattern in patterns
+        ]
+        self._search_cached = functools.lru_cache(maxsize=_SEARCH_CACHE_SIZE)(self._search)
+        self._combined = functools.lru_cache(maxsize=64)(self._compile_subset)
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._categories)
+
+    def search(self, text: str) -> Tuple[str, ...]:
+        """Categories with at least one (validated) match in ``text``."""
+        if len(text) > _SEARCH_CACHE_MAX_LEN:
+            return self._search(text)
+        return self._search_cached(text)
+
+    def matches(self, text: str, category: str) -> bool:
+        """Whether ``category`` matches anywhere in ``text``."""
+        return category in self.search(text)
+
+    def matching_patterns(self, text: str, category: str) -> List[str]:
+        """The individual patterns of ``category`` that match ``text``."""
+        if not self.matches(text, category):
+            return []
+        return [
+            self._entries[i].pattern
+            for i in self._candidates(text)
+            if self._entries[i].category == category and self._entry_matches(i, text)
+        ]
+
+    def findall(self, text: str, category: str) -> List[str]:
+        """Every matched string for ``category``, pattern by pattern."""
+        if not self.matches(text, category):
+            return []
+        return [
+            m.group()
+            for i in self._candidates(text)
+            if self._entries[i].category == category
+            for m in self._entries[i].regex.finditer(text)
+            if self._valid(category, m.group())
+        ]
+
+    def _valid(self, category: str, matched: str) -> bool:
+        validator = self._validators.get(category)
+        return validator is None or validator(matched)
+
+    def _entry_matches(self, index: int, text: str) -> bool:
+        entry = self._entries[index]
+        return any(self._valid(entry.category, m.group()) for m in entry.regex.finditer(text))
+
+    def _candidates(self, text: str) -> Tuple[int, ...]:
+        """Indices of the patterns whose required literals occur in ``text``."""
+        lowered: Optional[str] = None
+        fold_safe = not any(ch in text for ch in _CASEFOLD_EXCEPTIONS)
+        # Several patterns often share a literal ("rm", "instruction").
+        seen: Dict[Tuple[str, bool], bool] = {}
+        candidates: List[int] = []
+        for index, entry in enumerate(self._entries):
+            if entry.literals is None or (entry.ignorecase and not fold_safe):
+                candidates.append(index)
+                continue
+            if entry.ignorecase and lowered is None:
+                lowered = text.lower()
+            haystack = lowered if entry.ignorecase else text
+            for lit in entry.literals:
+                key = (lit, entry.ignorecase)
+                if key not in seen:
+                    seen[key] = lit in haystack  # type: ignore[operator]
+                if seen[key]:
+                    candidates.append(index)
+                    break
+        return tuple(candidates)
+
+    def _compile_subset(self, indices: Tuple[int, ...]) -> Optional[Tuple[Pattern[str], Dict[str, str]]]:
+        """One alternation over ``indices``, with a named group per category."""
+        by_category: Dict[str, List[str]] = {}
+        for i in indices:
+            by_category.setdefault(self._entries[i].category, []).append(self._entries[i].pattern)
+        groups: Dict[str, str] = {}
+        alternatives: List[str] = []
+        for category, patterns in by_category.items():
+            group = f"c{self._categories.index(category)}"
+            groups[group] = category
+            alternatives.append(f"(?P<{group}>" + "|".join(f"(?:{p})" for p in patterns) + ")")
+        try:
+            return re.compile("|".join(alternatives), self.flags), groups
+        except re.error as e:
+            logger.debug(f"Patterns cannot be combined, scanning per category: {e}")
+            return None
+
+    def _search(self, text: str) -> Tuple[str, ...]:
+        candidates = self._candidates(text) if text else ()
+        if not candidates:
+            return ()
+
+        found = {
+            self._entries[i].category
+            for i in candidates
+            if self._entries[i].standalone and self._entry_matches(i, text)
+        }
+        combinable = tuple(
+            i for i in candidates
+            if not self._entries[i].standalone and self._entries[i].category not in found
+        )
+        if not combinable:
+            return tuple(c for c in self._categories if c in found)
+        by_category: Dict[str, List[int]] = {}
+        for i in combinable:
+            by_category.setdefault(self._entries[i].category, []).append(i)
+
+        combined = self._combined(combinable)
+        if combined is None:
+            for category, indices in by_category.items():
+                if any(self._entry_matches(i, text) for i in indices):
+                    found.add(category)
+        else:
+            regex, groups = combined
+            matched_any = False
+            for m in regex.finditer(text):
+                matched_any = True
+                category = next(groups[g] for g in groups if m.start(g) != -1)
+                if category not in found and self._valid(category, m.group()):
+                    found.add(category)
+                    if by_category.keys() <= found:
+                        break
+            if matched_any:
+                for category, indices in by_category.items():
+                    if category not in found and any(self._entry_matches(i, text) for i in indices):
+                        found.add(category)
+
+        return tuple(c for c in self._categories if c in found)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_pattern_list(patterns: Tuple[str, ...], flags: int = 0) -> PatternSet:
+    """A PatternSet with one category per pattern, for user-supplied lists.
+
+    Invalid patterns are logged and left out. Results are cached, so a
+    pattern list repeated across tests is compiled once.
+    """
+    valid: Dict[str, List[str]] = {}
+    for pattern in patterns:
+        try:
+            re.compile(pattern, flags)
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+            continue
+        valid[pattern] = [pattern]
+    return PatternSet(valid, flags)
@@ -0,0 +1,286 @@
+"""Time-limited matching for user-supplied regex patterns.
+
+Test cases can ask for ``regex_patterns`` checks on the agent's output.
+Python's ``re`` backtracks, so a pattern like ``(a+)+$`` can take forever
+on the wrong input, and a running match cannot be interrupted from
+another thread. The old guard used ``signal.alarm``, which only works on
+the main thread. Evaluations run in worker threads were not protected at
+all.
+
+:class:`RegexSandbox` enforces a per-pattern time budget from any thread:
+
+- Patterns that cannot backtrack run in-process. These have no
+  variable-length repetition (``*``, ``+``, ``?``, ``{m,n}``) and no
+  backreferences, so a search is linear in the text length.
+- Every other pattern runs in a small worker subprocess. The sandbox
+  keeps a pool of workers. A worker that overruns the budget is killed
+  and the pattern is reported as undecided.
+
+Compiled patterns are cached in the parent and in each worker, so a
+pattern repeated across tests is compiled once.
+
+Usage:
+    results = regex_sandbox.search_many(output, patterns, re.IGNORECASE)
+    # [True, False, None, ...]  (None: timed out or failed in the worker)
+"""
+
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+from typing import Any, List, Optional, Pattern, Sequence
+
+try:  # Python 3.11+
+    from re import _constants as _sre_constants  # type: ignore[attr-defined]
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre_constants  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGEX_TIMEOUT_S = 2.0
+
+_REPEATS = tuple(
+    getattr(_sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre_constants, name)
+)
+_BACKREFS = tuple(
+    getattr(_sre_constants, name)
+    for name in ("GROUPREF", "GROUPREF_EXISTS", "GROUPREF_IGNORE", "GROUPREF_LOC_IGNORE", "GROUPREF_UNI_IGNORE")
+    if hasattr(_sre_constants, name)
+)
+
+# Runs in the worker subprocess. Imports only the standard library, so a
+# worker starts in a few tens of milliseconds. Each request is one JSON
+# line {"text", "patterns", "flags"}. The worker answers with one JSON
+# line per pattern: true/false, or an error message string.
+_WORKER_SOURCE = """
+import functools, json, re, sys
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern, flags):
+    return re.compile(pattern, flags)
+
+for line in sys.stdin:
+    request = json.loads(line)
+    for pattern in request["patterns"]:
+        try:
+            result = _compile(pattern, request["flags"]).search(request["text"]) is not None
+        except Exception as e:
+            result = "%s: %s" % (type(e).__name__, e)
+        sys.stdout.write(json.dumps(result) + "\\n")
+        sys.stdout.flush()
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern[str]:
+    """``re.compile`` with a cache shared across tests. Raises ``re.error``."""
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=512)
+def is_linear(pattern: str, flags: int = 0) -> bool:
+    """Whether ``pattern`` cannot backtrack catastrophically.
+
+    True when the pattern has no variable-length repetition and no
+    backreferences. Fixed counts such as ``\\d{4}`` are allowed.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return False
+    return _items_linear(list(parsed))
+
+
+def _items_linear(items: List[Any]) -> bool:
+    for op, av in items:
+        if op in _BACKREFS:
+            return False
+        if op in _REPEATS:
+            low, high, sub = av
+            if low != high or not _items_linear(list(sub)):
+                return False
+        elif op is _sre_constants.SUBPATTERN:
+            if not _items_linear(list(av[-1])):
+                return False
+        elif op is _sre_constants.BRANCH:
+            if not all(_items_linear(list(branch)) for branch in av[1]):
+                return False
+        elif op in (_sre_constants.ASSERT, _sre_constants.ASSERT_NOT):
+            if not _items_linear(list(av[1])):
+                return False
+        elif getattr(_sre_constants, "ATOMIC_GROUP", None) is op:
+            if not _items_linear(list(av)):
+                return False
+    return True
+
+
+class _WorkerTimeout(Exception):
+    """A worker did not answer within the time budget."""
+
+    def __init__(self, index: int):
+        super().__init__(index)
+        self.index = index
+
+
+class _Worker:
+    """One matching subprocess and the thread that reads its answers."""
+
+    def __init__(self) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, "-I", "-c", _WORKER_SOURCE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        self.answers: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read, daemon=True, name="regex-sandbox-reader")
+        self._reader.start()
+
+    def _read(self) -> None:
+        stdout = self.process.stdout
+        assert stdout is not None
+        try:
+            for line in stdout:
+                self.answers.put(line)
+        except (OSError, ValueError):  # pragma: no cover - pipe torn down
+            pass
+        finally:
+            stdout.close()
+            self.answers.put(None)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def search(self, text: str, patterns: Sequence[str], flags: int, timeout: float) -> List[Any]:
+        """Answers for ``patterns`` in order; raises _WorkerTimeout on an overrun."""
+        assert self.process.stdin is not None
+        # ensure_ascii keeps lone surrogates in the text transportable.
+        request = json.dumps({"text": text, "patterns": list(patterns), "flags": flags})
+        self.process.stdin.write(request + "\n")
+        self.process.stdin.flush()
+        results: List[Any] = []
+        for index in range(len(patterns)):
+            try:
+                line = self.answers.get(timeout=timeout)
+            except queue.Empty:
+                raise _WorkerTimeout(index) from None
+            if line is None:
+                raise RuntimeError("regex worker exited")
+            results.append(json.loads(line))
+        return results
+
+    def close(self) -> None:
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:  # pragma: no cover - already gone
+            pass
+        # stdout is closed by the reader thread once it sees EOF.
+        try:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+        except OSError:  # pragma: no cover - broken pipe
+            pass
+
+
+class RegexSandbox:
+    """Runs regex searches under a per-pattern time budget, from any thread.
+
+    Args:
+        timeout: Seconds one pattern may take before it is abandoned.
+        max_idle_workers: Worker subprocesses kept alive between calls.
+            Defaults to the CPU count. Concurrent callers beyond that get
+            a worker of their own, which is closed afterwards.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_REGEX_TIMEOUT_S, max_idle_workers: Optional[int] = None):
+        self.timeout = timeout
+        self.max_idle_workers = max_idle_workers or os.cpu_count() or 4
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self.timeouts = 0
+
+    def search_many(
+        self,
+        text: str,
+        patterns: Sequence[str],
+        flags: int = 0,
+        timeout: Optional[float] = None,
+    ) -> List[Optional[bool]]:
+        """Whether each pattern matches anywhere in ``text``.
+
+        Patterns must be valid (see :func:`compile_pattern`). A pattern that
+        times out or fails inside the worker gets None and a warning.
+        """
+        budget = self.timeout if timeout is None else timeout
+        results: List[Optional[bool]] = [None] * len(patterns)
+        isolated: List[int] = []
+        for i, pattern in enumerate(patterns):
+            if is_linear(pattern, flags):
+                results[i] = compile_pattern(pattern, flags).search(text) is not None
+            else:
+                isolated.append(i)
+
+        while isolated:
+            worker = self._acquire()
+            try:
+                answers = worker.search(text, [patterns[i] for i in isolated], flags, budget)
+            except _WorkerTimeout as e:
+                worker.close()
+                self.timeouts += 1
+                logger.warning("Regex pattern timed out (possible ReDoS): %r", patterns[isolated[e.index]])
+                isolated = isolated[e.index + 1 :]
+                continue
+            except (OSError, RuntimeError, ValueError) as e:
+                worker.close()
+                logger.warning("Regex sandbox worker failed: %s", e)
+                break
+            self._release(worker)
+            for i, answer in zip(isolated, answers):
+                if isinstance(answer, bool):
+                    results[i] = answer
+                else:
+                    logger.warning("Regex match error for %r: %s", patterns[i], answer)
+            break
+        return results
+
+    def close(self) -> None:
+        """Stop the idle workers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                worker.close()
+        return _Worker()
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker.alive and len(self._idle) < self.max_idle_workers:
+                self._idle.append(worker)
+                return
+        worker.close()
+
+
+# Global sandbox shared by every Evaluator
+regex_sandbox = RegexSandbox()
+atexit.register(regex_sandbox.close)
@@ -389,7 +389,7 @@ async def enrich_with_ai(
         return analysis
 
     try:
-        from evalview.core.llm_provider import LLMClient
+        from evalview.core.llm_provider import JudgePriority, LLMClient
 
         client = LLMClient()
         user_prompt = _build_ai_user_prompt(analysis, diff)
@@ -399,6 +399,7 @@ async def enrich_with_ai(
             user_prompt=user_prompt,
             temperature=0.3,
             max_tokens=300,
+            priority=JudgePriority.BACKGROUND,
         )
 
         if not isinstance(result, dict):
@@ -577,7 +578,7 @@ async def enrich_with_narrative(
         (or unchanged if LLM unavailable).
     """
     try:
-        from evalview.core.llm_provider import LLMClient
+        from evalview.core.llm_provider import JudgePriority, LLMClient
 
         client = LLMClient()
         user_prompt = _build_narrative_prompt(analysis, diff, golden_steps, actual_steps)
@@ -587,6 +588,7 @@ async def enrich_with_narrative(
             user_prompt=user_prompt,
             temperature=0.2,
             max_tokens=500,
+            priority=JudgePriority.BACKGROUND,
         )
 
         if not isinstance(result, dict):
@@ -75,7 +75,7 @@ async def run_single_test(
         result = asyncio.run(run_single_test("weather-lookup"))
         print(f"Score: {result.score}")
     """
-    from evalview.core.loader import TestCaseLoader
+    from evalview.core.test_catalog import get_catalog, use_project_test_catalog
 
     config = _load_config(config_path)
     if config is None:
@@ -84,13 +84,16 @@ async def run_single_test(
             "Run 'evalview init' to create one, or pass config_path explicitly."
         )
 
-    # Load all test cases from the directory and find the one we want
+    # Look the test up by name; only new or modified files are parsed
     path = test_path or Path("tests")
-    loader = TestCaseLoader()
-    test_cases = loader.load_from_directory(str(path))
-    tc = next((t for t in test_cases if t.name == test_name), None)
+    # An explicit .evalview/config.yaml names the project that owns the catalog.
+    use_project_test_catalog(
+        config_path.parent.parent if config_path and config_path.parent.name == ".evalview" else None
+    )
+    catalog = get_catalog(path)
+    tc = catalog.get(test_name)
     if tc is None:
-        available = [t.name for t in test_cases]
+        available = catalog.names()
         raise FileNotFoundError(
             f"Test case '{test_name}' not found in {path}. "
             f"Available tests: {available}"
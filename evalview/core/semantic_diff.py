@@ -3,13 +3,122 @@
 Opt-in alternative to the default lexical SequenceMatcher diff.
 ~$0.00004 per check. Enable with ``evalview check --semantic-diff``
 or ``semantic_diff_enabled: true`` in config.
+
+Embeddings are cached per (model, text), so an unchanged golden output is
+embedded once, and texts requested by concurrent tests within a short window
+are sent in one batched embeddings request.
 """
 
+import asyncio
+import logging
 import math
 import os
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from evalview.core.embedding_cache import EmbeddingCache, Vector
+from evalview.core.http_pool import http_client_pool
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None  # type: ignore[assignment]
 
-import httpx
+logger = logging.getLogger(__name__)
+
+# text-embedding-3-small accepts up to 8192 tokens; truncating by characters
+# keeps requests well inside that.
+MAX_EMBED_CHARS = 8192
+
+
+def cosine_similarity(a: Vector, b: Vector) -> float:
+    """Cosine similarity of two vectors; 0.0 if either has zero norm.
+
+    Uses NumPy when installed, pure Python otherwise.
+    """
+    if np is not None:
+        va = np.asarray(a, dtype=float)
+        vb = np.asarray(b, dtype=float)
+        denom = float(np.linalg.norm(va) * np.linalg.norm(vb))
+        return float(va @ vb) / denom if denom else 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class _EmbeddingBatcher:
+    """Collects texts requested within ``window`` seconds into one API call.
+
+    Each text maps to a future, so concurrent requests for the same text
+    share a single slot in the batch. A batch is sent early once it reaches
+    ``max_batch`` texts.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[List[str]], Awaitable[List[Vector]]],
+        window: float,
+        max_batch: int,
+    ):
+        self._embed = embed
+        self.window = window
+        self.max_batch = max_batch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, "asyncio.Future[Vector]"] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def embed(self, text: str) -> Vector:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # State from a previous (closed) loop cannot be awaited here.
+            self._loop = loop
+            self._pending = {}
+            self._timer = None
+        future = self._pending.get(text)
+        if future is None:
+            future = loop.create_future()
+            self._pending[text] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._flush)
+        # Shielded so one cancelled caller does not cancel the shared result.
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        assert self._loop is not None
+        task = self._loop.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: Dict[str, "asyncio.Future[Vector]"]) -> None:
+        texts = list(batch)
+        try:
+            vectors = await self._embed(texts)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for text, vector in zip(texts, vectors):
+            if not batch[text].done():
+                batch[text].set_result(vector)
+        if len(vectors) < len(texts):
+            error = RuntimeError(
+                f"Embedding API returned {len(vectors)} vectors for {len(texts)} inputs"
+            )
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
 
 
 class SemanticDiff:
@@ -36,12 +145,20 @@ class SemanticDiff:
         self,
         api_key: Optional[str] = None,
         model: str = EMBEDDING_MODEL,
+        cache: Optional[EmbeddingCache] = None,
+        batch_window: float = 0.02,
+        max_batch_size: int = 256,
     ):
         """Initialize SemanticDiff.
 
         Args:
             api_key: OpenAI API key. Defaults to OPENAI_API_KEY env var.
             model: Embedding model to use (default: text-embedding-3-small).
+            cache: Embedding cache. Defaults to an in-memory cache; pass one
+                with ``persist_path`` to reuse embeddings across runs.
+            batch_window: Seconds to wait for other texts before sending an
+                embeddings request.
+            max_batch_size: Send a batch early once it holds this many texts.
 
         Raises:
             ValueError: If no API key is available.
@@ -54,6 +171,10 @@ class SemanticDiff:
                 "semantic_diff_enabled in .evalview/config.yaml."
             )
         self.model = model
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self._batcher = _EmbeddingBatcher(
+            lambda texts: self._embed(texts), batch_window, max_batch_size
+        )
 
     async def similarity(self, text_a: str, text_b: str) -> float:
         """Compute cosine similarity between two texts.
@@ -66,18 +187,32 @@ class SemanticDiff:
             Cosine similarity in [0.0, 1.0]. Higher means more similar.
             Returns 1.0 for identical inputs, ~0.0 for unrelated texts.
         """
-        # Truncate to stay within embedding model token limits (8192 tokens)
-        embeddings = await self._embed([text_a[:8192], text_b[:8192]])
-        a, b = embeddings[0], embeddings[1]
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
-        if norm_a == 0.0 or norm_b == 0.0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+        text_a, text_b = text_a[:MAX_EMBED_CHARS], text_b[:MAX_EMBED_CHARS]
+        if text_a == text_b:
+            return 1.0
+        a, b = await self.embed_many([text_a, text_b])
+        return cosine_similarity(a, b)
+
+    async def embed_many(self, texts: List[str]) -> List[Vector]:
+        """Embed ``texts``, serving cached vectors and batching the rest.
+
+        Args:
+            texts: Texts to embed (already truncated).
+
+        Returns:
+            One embedding vector per input text, in order.
+        """
+        vectors = self.cache.get_many(self.model, texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+        if missing:
+            fetched = await asyncio.gather(*(self._batcher.embed(t) for t in missing))
+            self.cache.put_many(self.model, zip(missing, fetched))
+            by_text = dict(zip(missing, fetched))
+            vectors = [v if v is not None else by_text[t] for t, v in zip(texts, vectors)]
+        return vectors  # type: ignore[return-value]
 
     async def _embed(self, texts: List[str]) -> List[List[float]]:
-        """Call OpenAI embeddings API (single batched call for both texts).
+        """Call OpenAI embeddings API (one batched call for all texts).
 
         Args:
             texts: List of texts to embed in one API call.
@@ -88,7 +223,7 @@ class SemanticDiff:
         Raises:
             httpx.HTTPStatusError: If the API call fails.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client_pool.client(self.EMBEDDING_ENDPOINT, timeout=30.0) as client:
             response = await client.post(
                 self.EMBEDDING_ENDPOINT,
                 headers={
@@ -99,7 +234,9 @@ class SemanticDiff:
             )
             response.raise_for_status()
             data = response.json()
-            return [item["embedding"] for item in data["data"]]
+            # The API may return items out of order; "index" maps them back.
+            items = sorted(data["data"], key=lambda item: item.get("index", 0))
+            return [item["embedding"] for item in items]
 
     @classmethod
     def is_available(cls) -> bool:
@@ -110,6 +247,7 @@ class SemanticDiff:
     def cost_notice(cls) -> str:
         """Return a human-readable cost notice for display in CLI output."""
         return (
-            f"Semantic diff enabled — 1 batched embedding call per test "
+            f"Semantic diff enabled — at most 1 embedding call per test, "
+            f"cached golden outputs are free "
             f"(~${cls.COST_PER_CALL_USD * 2:.5f}, {cls.EMBEDDING_MODEL})"
         )
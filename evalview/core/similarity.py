@@ -0,0 +1,188 @@
+"""Lexical similarity backends for output comparison.
+
+``DiffEngine`` scores outputs with a ratio in [0, 1] and compares it
+against fixed thresholds (0.95 / 0.8 and ``output_similarity_threshold``).
+The default backend is ``difflib.SequenceMatcher``, which is worst-case
+quadratic and can take seconds on 50 KB outputs. The other backends return
+ratios of the same shape, ``2 * matches / (len(a) + len(b))``, so the
+thresholds keep their meaning:
+
+- ``sequence``  — ``SequenceMatcher.ratio()`` on characters (default). Its
+  autojunk heuristic ignores frequent characters once an input passes 200
+  characters, so long outputs score lower than their true overlap.
+- ``lcs``       — exact character LCS ratio via bit-parallel LCS on Python
+  ints, O(len(a) * len(b) / word size). Pure Python, no dependencies.
+- ``token``     — the same LCS ratio over word/punctuation tokens. Ignores
+  whitespace and is the fastest exact option for long outputs.
+- ``shingle``   — Dice coefficient over token 3-gram multisets. Linear time,
+  approximate: each edited token breaks up to three shingles, so scores run
+  below the LCS ratio as edits spread out.
+- ``rapidfuzz`` — C-accelerated character LCS ratio (same value as ``lcs``).
+  Needs ``pip install 'evalview[fast-diff]'``; falls back to ``lcs`` when missing.
+
+``scripts/benchmark_similarity.py`` compares speed and verdict agreement.
+
+Usage:
+    backend = get_similarity_backend("token")
+    ratio = backend.similarity(golden, actual)
+"""
+
+import logging
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_BACKENDS = ("sequence", "lcs", "token", "shingle", "rapidfuzz")
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into word and punctuation tokens, dropping whitespace."""
+    return _TOKEN_RE.findall(text)
+
+
+def lcs_length(a: Sequence[Hashable], b: Sequence[Hashable]) -> int:
+    """Length of the longest common subsequence of ``a`` and ``b``.
+
+    Bit-parallel algorithm (Allison-Dix / Hyyrö): one Python-int bit per
+    element of ``a``, one pass over ``b``. The big-int arithmetic runs in C,
+    so this is fast even for tens of thousands of elements.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+
+    masks: Dict[Hashable, int] = {}
+    for i, item in enumerate(a):
+        masks[item] = masks.get(item, 0) | (1 << i)
+
+    full = (1 << len(a)) - 1
+    v = full
+    for item in b:
+        u = v & masks.get(item, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(a) - bin(v).count("1")
+
+
+class SimilarityBackend:
+    """Base class: subclasses implement :meth:`_ratio`."""
+
+    name = "base"
+
+    def similarity(self, a: str, b: str) -> float:
+        """Return the similarity ratio of two outputs.
+
+        Args:
+            a: Golden output.
+            b: Actual output.
+        """
+        if a == b:
+            return 1.0
+        return self._ratio(a, b)
+
+    def _ratio(self, a: str, b: str) -> float:
+        raise NotImplementedError
+
+
+class SequenceMatcherBackend(SimilarityBackend):
+    """``difflib.SequenceMatcher`` on characters (the historical behaviour)."""
+
+    name = "sequence"
+
+    def _ratio(self, a: str, b: str) -> float:
+        return SequenceMatcher(None, a, b).ratio()
+
+
+class LCSBackend(SimilarityBackend):
+    """Exact character LCS ratio, bit-parallel."""
+
+    name = "lcs"
+
+    def _ratio(self, a: str, b: str) -> float:
+        return 2.0 * lcs_length(a, b) / (len(a) + len(b))
+
+
+class TokenLCSBackend(SimilarityBackend):
+    """LCS ratio over word/punctuation tokens."""
+
+    name = "token"
+
+    def _ratio(self, a: str, b: str) -> float:
+        tokens_a, tokens_b = tokenize(a), tokenize(b)
+        total = len(tokens_a) + len(tokens_b)
+        if not total:
+            # Whitespace-only outputs: nothing but whitespace differs.
+            return 1.0
+        return 2.0 * lcs_length(tokens_a, tokens_b) / total
+
+
+class ShingleBackend(SimilarityBackend):
+    """Dice coefficient over token n-gram multisets (linear time)."""
+
+    name = "shingle"
+
+    def __init__(self, size: int = 3):
+        self.size = size
+
+    def _shingles(self, text: str) -> "Counter[Tuple[str, ...]]":
+        tokens = tokenize(text)
+        if len(tokens) < self.size:
+            return Counter([tuple(tokens)]) if tokens else Counter()
+        return Counter(
+            tuple(tokens[i : i + self.size]) for i in range(len(tokens) - self.size + 1)
+        )
+
+    def _ratio(self, a: str, b: str) -> float:
+        shingles_a, shingles_b = self._shingles(a), self._shingles(b)
+        total = sum(shingles_a.values()) + sum(shingles_b.values())
+        if not total:
+            return 1.0
+        common = sum((shingles_a & shingles_b).values())
+        return 2.0 * common / total
+
+
+class RapidFuzzBackend(SimilarityBackend):
+    """Character LCS ratio computed by ``rapidfuzz`` (C++)."""
+
+    name = "rapidfuzz"
+
+    def __init__(self) -> None:
+        from rapidfuzz.distance import Indel
+
+        self._indel = Indel
+
+    def _ratio(self, a: str, b: str) -> float:
+        return float(self._indel.normalized_similarity(a, b))
+
+
+def get_similarity_backend(name: str = "sequence") -> SimilarityBackend:
+    """Build the similarity backend called ``name``.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend.
+    """
+    if name == "sequence":
+        return SequenceMatcherBackend()
+    if name == "lcs":
+        return LCSBackend()
+    if name == "token":
+        return TokenLCSBackend()
+    if name == "shingle":
+        return ShingleBackend()
+    if name == "rapidfuzz":
+        try:
+            return RapidFuzzBackend()
+        except ImportError:
+            logger.warning(
+                "similarity_backend 'rapidfuzz' requested but rapidfuzz is not installed "
+                "(pip install 'evalview[fast-diff]'). Falling back to 'lcs'."
+            )
+            return LCSBackend()
+    raise ValueError(
+        f"Unknown similarity backend '{name}'. Choose one of: {', '.join(SIMILARITY_BACKENDS)}"
+    )
@@ -16,9 +16,9 @@ Scope of the OSS v1 engine:
   adapter is given a chance to use them via ``install_mock_interceptor``,
   but the default path only wires them for adapters that explicitly opt
   in. Adding them is non-breaking for adapters that don't.
-* **Variants** — ``run(variants=N)`` re-executes the test N times with
-  the configured ``seed`` advanced per-variant so callers can cluster
-  outcomes.
+* **Variants** — ``run_variants(variants=N)`` re-executes the test N
+  times (concurrently when ``max_concurrency`` is given), with the
+  configured ``seed`` advanced per-variant so callers can cluster outcomes.
 
 Cloud never runs simulations server-side; it only renders the
 :class:`~evalview.core.types.SimulationResult` attached to
@@ -27,10 +27,12 @@ Cloud never runs simulations server-side; it only renders the
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import random
 import re
 import time
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -52,12 +54,20 @@ from evalview.core.types import (
     TestCase,
     VariantOutcome,
 )
+from evalview.core.parallel import ConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
 
 ToolExecutor = Callable[[str, Dict[str, Any]], Any]
 
+# The executor stack of the variant whose task is running. Set per task in
+# ``Simulator.run_variants``; asyncio tasks and ``asyncio.to_thread`` copy
+# it, so concurrent variants never see each other's mocks or recorders.
+_variant_executor: ContextVar[Optional[ToolExecutor]] = ContextVar(
+    "evalview_simulation_variant_executor", default=None
+)
+
 
 class UnmatchedMockError(RuntimeError):
     """Raised when ``MockSpec.strict`` is true and a call has no mock."""
@@ -126,6 +136,31 @@ class _MockHitCounter:
         ]
 
 
+class _VariantDispatchExecutor:
+    """Adapter ``tool_executor`` used while variants run concurrently.
+
+    Routes each call to the calling variant's stack (``_variant_executor``).
+    A call made where the context variable was not propagated is served
+    by the only running variant, if there is exactly one.
+    """
+
+    def __init__(self) -> None:
+        self.active: Dict[int, ToolExecutor] = {}
+
+    def __call__(self, tool_name: str, params: Dict[str, Any]) -> Any:
+        executor = _variant_executor.get()
+        if executor is None:
+            running = list(self.active.values())
+            if len(running) != 1:
+                raise RuntimeError(
+                    f"Tool call '{tool_name}' was made outside any simulated variant's "
+                    "context, so it can't be routed to that variant's mocks. Run "
+                    "variants one at a time (max_concurrency=1) for this adapter."
+                )
+            executor = running[0]
+        return executor(tool_name, params)
+
+
 class MockedToolExecutor:
     """Wraps a real tool_executor with a mock layer.
 
@@ -425,14 +460,23 @@ class Simulator:
         replay_cassette: Optional[Cassette] = None,
         record: bool = False,
         allow_live: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> Tuple[List[ExecutionTrace], SimulationResult]:
         """Fan out ``variants`` deterministic replays and aggregate.
 
-        Seeds advance by 1 per variant starting at ``spec.seed``. Each
-        variant's tool path is recorded; ``variant_outcomes`` carries
-        the final output and cost/latency so cloud can render a pass/
-        fail matrix. Scoring is left to the evaluator downstream —
-        the simulator only reports raw outcomes.
+        Seeds advance by 1 per variant starting at ``spec.seed``. Variants
+        run one by one unless ``max_concurrency`` is given, in which case at
+        most that many run at once. Each variant gets its own
+        mock/replay/recorder stack and RNG, so results are identical to a
+        sequential sweep and come back in variant order. Concurrent variants
+        route tool calls through a context variable, so only opt in for
+        adapters that call ``tool_executor`` in the calling task or via
+        ``asyncio.to_thread`` — not from threads or ``run_in_executor``
+        calls, which don't carry the context. Each variant's tool path is
+        recorded; ``variant_outcomes`` carries the final output and
+        cost/latency so cloud can render a pass/fail matrix. Scoring is
+        left to the evaluator downstream — the simulator only reports raw
+        outcomes.
 
         ``replay_cassette`` and ``record`` behave the same as in
         :meth:`run`. When recording, the cassette captures the
@@ -449,18 +493,22 @@ class Simulator:
             allow_live=allow_live,
         )
 
-        traces: List[ExecutionTrace] = []
-        branches: List[BranchExploration] = []
-        outcomes: List[VariantOutcome] = []
-        combined_counter = _MockHitCounter()
-        recorded_cassette: Optional[Cassette] = None
+        # Serial by default: a sequential sweep works with every adapter,
+        # concurrency is opt-in (see the docstring).
+        limiter = ConcurrencyLimiter(max_concurrency or 1)
 
         # Adapter is the same object across variants — resolve its
         # interception attributes once.
         real_executor = getattr(self._adapter, "tool_executor", None)
         installer = getattr(self._adapter, "install_mock_interceptor", None)
         had_attr = hasattr(self._adapter, "tool_executor")
+        dispatcher = _VariantDispatchExecutor()
 
+        # Build every variant's stack before the dispatcher replaces the
+        # adapter's executor — the stacks wrap the real one.
+        counters: List[_MockHitCounter] = []
+        recorder_lists: List[Optional[List[RecordingToolExecutor]]] = []
+        stacks: List[ToolExecutor] = []
         for i in range(variants):
             counter = _MockHitCounter()
             seed = (self._spec.seed or 0) + i
@@ -468,24 +516,53 @@ class Simulator:
             recorders: Optional[List[RecordingToolExecutor]] = (
                 [] if (record and i == 0) else None
             )
-            mocked = self._build_stack(rng, counter, replay_cassette, recorders)
+            stacks.append(self._build_stack(rng, counter, replay_cassette, recorders))
+            counters.append(counter)
+            recorder_lists.append(recorders)
 
+        async def _run_variant(i: int) -> ExecutionTrace:
+            mocked = stacks[i]
             context: Dict[str, Any] = dict(test_case.input.context or {})
-            if callable(installer):
+            async with limiter.slot():
+                if callable(installer):
+                    try:
+                        installer(self)
+                    except Exception as exc:  # pragma: no cover
+                        logger.warning("install_mock_interceptor raised: %s", exc)
+                token = _variant_executor.set(mocked)
+                dispatcher.active[i] = mocked
                 try:
-                    installer(self)
-                except Exception as exc:  # pragma: no cover
-                    logger.warning("install_mock_interceptor raised: %s", exc)
-
+                    trace = await self._adapter.execute(test_case.input.query, context)
+                finally:
+                    del dispatcher.active[i]
+                    _variant_executor.reset(token)
+            return trace
+
+        # One shared dispatcher stays installed for the whole sweep; each
+        # variant task routes its calls to its own stack via the context
+        # variable, so swapping the attribute per variant isn't needed.
+        if had_attr:
+            setattr(self._adapter, "tool_executor", dispatcher)
+        try:
+            settled = await asyncio.gather(
+                *(_run_variant(i) for i in range(variants)), return_exceptions=True
+            )
+        finally:
             if had_attr:
-                setattr(self._adapter, "tool_executor", mocked)
-            try:
-                trace = await self._adapter.execute(test_case.input.query, context)
-            finally:
-                if had_attr:
-                    setattr(self._adapter, "tool_executor", real_executor)
-            traces.append(trace)
+                setattr(self._adapter, "tool_executor", real_executor)
+        # return_exceptions keeps a failing variant from leaving its siblings
+        # running after the real executor is restored.
+        for outcome in settled:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        traces: List[ExecutionTrace] = [t for t in settled if isinstance(t, ExecutionTrace)]
+        branches: List[BranchExploration] = []
+        outcomes: List[VariantOutcome] = []
+        combined_counter = _MockHitCounter()
+        recorded_cassette: Optional[Cassette] = None
 
+        for i, (trace, counter, recorders) in enumerate(zip(traces, counters, recorder_lists)):
             for (kind, matcher), count in counter.hits.items():
                 combined_counter.hits[(kind, matcher)] = (
                     combined_counter.hits.get((kind, matcher), 0) + count
@@ -0,0 +1,396 @@
+"""Cached catalog of the test cases in a directory.
+
+``TestCaseLoader.load_from_directory`` used to walk the tree once per file
+suffix and re-parse every YAML/TOML file on every call. Commands that only
+need one test (``run_single_test``, the pytest plugin fixtures) paid the
+same cost. A :class:`TestCatalog` walks the tree once per refresh and
+stats each file. It re-parses only the files whose (mtime, size) changed,
+and indexes tests by name and tag.
+
+The metadata of each file (name, tags, adapter, suite type) can be
+persisted to ``.evalview/test_catalog.json``. A new process can then find
+a test by name and parse only that test's file.
+
+Usage:
+    catalog = get_catalog("tests")
+    tc = catalog.get("weather-lookup")     # TestCase or None
+    smoke = catalog.with_tag("smoke")
+    everything = catalog.load_all()
+
+Each call returns fresh TestCase objects, so callers may modify them.
+"""
+
+import copy
+import fnmatch
+import json
+import logging
+import os
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from evalview.core.loader import TEST_CASE_SUFFIXES, _is_config_file, _parse_test_case_file
+from evalview.core.types import TestCase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEST_CATALOG_PATH = ".evalview/test_catalog.json"
+
+_CATALOG_VERSION = 1
+
+# Cold starts with at least this many files to parse use a process pool.
+# Below it, starting the workers costs more than it saves.
+_PARALLEL_PARSE_MIN_FILES = 256
+
+# Catalogs kept per process, one per (directory, pattern).
+_MAX_CATALOGS = 32
+
+
+@dataclass
+class CatalogEntry:
+    """One test-case file and the metadata parsed from it."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    name: str
+    tags: List[str] = field(default_factory=list)
+    adapter: Optional[str] = None
+    suite_type: Optional[str] = None
+    # Parsed file contents; None until the file is parsed in this process.
+    data: Any = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "name": self.name,
+            "tags": self.tags,
+            "adapter": self.adapter,
+            "suite_type": self.suite_type,
+        }
+
+
+def _build_test_case(path: str, data: Any) -> TestCase:
+    # Validation keeps references to nested dicts and lists, so give each
+    # TestCase its own copy of the cached data.
+    test_case = TestCase(**copy.deepcopy(data))
+    test_case.source_file = path
+    return test_case
+
+
+def _entry_from_data(path: str, mtime_ns: int, size: int, data: Any) -> CatalogEntry:
+    tc = _build_test_case(path, data)
+    return CatalogEntry(
+        path=path,
+        mtime_ns=mtime_ns,
+        size=size,
+        name=tc.name,
+        tags=list(tc.tags),
+        adapter=tc.adapter,
+        suite_type=tc.suite_type,
+        data=data,
+    )
+
+
+def _parse_many(paths: List[str]) -> List[Any]:
+    """Parse test-case files, in a process pool for large cold starts."""
+    if len(paths) >= _PARALLEL_PARSE_MIN_FILES:
+        workers = min(os.cpu_count() or 1, 8)
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(_parse_test_case_file, [Path(p) for p in paths], chunksize=32))
+            except Exception as e:
+                # Parse errors are re-raised by the serial pass below.
+                logger.debug(f"Parallel test-case parsing failed, parsing serially: {e}")
+    return [_parse_test_case_file(Path(p)) for p in paths]
+
+
+def _under(path: str, directory: str) -> bool:
+    return path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+class _MetadataStore:
+    """Persisted file metadata shared by every catalog in the process.
+
+    The store belongs to one project: only files below its root (the
+    directory holding ``.evalview/``) are recorded, so cataloguing a test
+    directory elsewhere never leaks into the project's file.
+    """
+
+    def __init__(self) -> None:
+        self.path: Optional[str] = None
+        self.root: Optional[str] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def persist_to(self, path: str) -> None:
+        path = os.path.abspath(path)
+        with self._lock:
+            if path == self.path:
+                return
+            self.path = path
+            self.root = os.path.dirname(os.path.dirname(path))
+            self._entries = {}
+            self._dirty = False
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == _CATALOG_VERSION:
+                    self._entries = data.get("files", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                logger.debug(f"Ignoring unreadable test catalog: {e}")
+            foreign = [key for key in self._entries if not _under(key, self.root)]
+            for key in foreign:
+                del self._entries[key]
+            self._dirty = bool(foreign)
+
+    def owns(self, directory: str) -> bool:
+        """True when files under ``directory`` are recorded in this store."""
+        return self.root is not None and (directory == self.root or _under(directory, self.root))
+
+    def lookup(self, key: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+        if self.path is None:
+            return None
+        meta = self._entries.get(key)
+        if meta and meta.get("mtime_ns") == mtime_ns and meta.get("size") == size:
+            return meta
+        return None
+
+    def update(self, directory: str, current: Set[str], changed: Dict[str, CatalogEntry]) -> None:
+        """Record a refresh of ``directory`` that found the files in ``current``.
+
+        Entries under ``directory`` for files that no longer exist are
+        dropped. Files the scan skipped but that still exist (another
+        catalog's pattern) are kept.
+        """
+        if not self.owns(directory):
+            return
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if _under(key, directory) and key not in current and not os.path.exists(key)
+            ]
+            if not (changed or stale):
+                return
+            for key in stale:
+                del self._entries[key]
+            for key, entry in changed.items():
+                self._entries[key] = entry.to_dict()
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the metadata if anything changed (atomic replace)."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            if not os.path.isdir(os.path.dirname(self.path)):
+                # The project directory went away (e.g. a temporary checkout).
+                self.path = None
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": _CATALOG_VERSION, "files": self._entries}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to write test catalog: {e}")
+
+
+_metadata = _MetadataStore()
+
+
+class TestCatalog:
+    """Test cases under one directory, re-parsed only when their files change.
+
+    Args:
+        directory: Directory searched recursively for test-case files.
+        pattern: Filename pattern, as for ``TestCaseLoader.load_from_directory``.
+            With the default ``*.yaml``, ``.yml`` and ``.toml`` files are
+            included too.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, directory: Union[str, Path], pattern: str = "*.yaml"):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self._entries: List[CatalogEntry] = []
+        self._by_path: Dict[str, CatalogEntry] = {}
+        self._by_name: Dict[str, CatalogEntry] = {}
+        self._by_tag: Dict[str, List[CatalogEntry]] = {}
+        self._lock = threading.RLock()
+        self.parsed_files = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> "TestCatalog":
+        """Re-scan the directory and re-parse new or modified files."""
+        with self._lock:
+            found = self._scan()
+            entries: List[CatalogEntry] = []
+            changed: Dict[str, CatalogEntry] = {}
+            to_parse: List[Tuple[int, str, int, int]] = []
+
+            for path, mtime_ns, size in found:
+                key = os.path.abspath(path)
+                entry = self._by_path.get(key)
+                if entry is None or (entry.mtime_ns, entry.size) != (mtime_ns, size):
+                    meta = _metadata.lookup(key, mtime_ns, size)
+                    if meta is not None and meta.get("name"):
+                        entry = CatalogEntry(
+                            path=path,
+                            mtime_ns=mtime_ns,
+                            size=size,
+                            name=meta["name"],
+                            tags=list(meta.get("tags") or []),
+                            adapter=meta.get("adapter"),
+                            suite_type=meta.get("suite_type"),
+                        )
+                    else:
+                        to_parse.append((len(entries), path, mtime_ns, size))
+                        entry = None
+                entries.append(entry)  # type: ignore[arg-type]
+
+            if to_parse:
+                parsed = _parse_many([path for _, path, _, _ in to_parse])
+                self.parsed_files += len(parsed)
+                for (index, path, mtime_ns, size), data in zip(to_parse, parsed):
+                    entry = _entry_from_data(path, mtime_ns, size, data)
+                    entries[index] = entry
+                    changed[os.path.abspath(path)] = entry
+
+            current = {os.path.abspath(e.path) for e in entries}
+            self._index(entries)
+            _metadata.update(os.path.abspath(self.directory), current, changed)
+        _metadata.save()
+        return self
+
+    def entries(self) -> List[CatalogEntry]:
+        """Catalog entries in load order (without refreshing)."""
+        with self._lock:
+            return list(self._entries)
+
+    def names(self) -> List[str]:
+        return [entry.name for entry in self.entries()]
+
+    def get(self, name: str) -> Optional[TestCase]:
+        """The first test named ``name``, parsing only its file if needed."""
+        with self._lock:
+            entry = self._by_name.get(name)
+            return self._materialize(entry) if entry is not None else None
+
+    def with_tag(self, tag: str) -> List[TestCase]:
+        """Tests carrying ``tag``, in load order."""
+        with self._lock:
+            return [self._materialize(entry) for entry in self._by_tag.get(tag.strip().lower(), [])]
+
+    def load_all(self) -> List[TestCase]:
+        """Every test in load order."""
+        with self._lock:
+            return [self._materialize(entry) for entry in self._entries]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> List[Tuple[str, int, int]]:
+        """(path, mtime_ns, size) for each test-case file, in load order.
+
+        Files matching ``pattern`` come first, then (for the default
+        pattern) ``.yml`` and ``.toml`` files, each group in walk order.
+        """
+        default = self.pattern == "*.yaml"
+        groups: Dict[str, List[str]] = {suffix: [] for suffix in TEST_CASE_SUFFIXES}
+        primary: List[str] = []
+        if "/" in self.pattern or "**" in self.pattern:
+            primary = [str(p) for p in self.directory.rglob(self.pattern)]
+        else:
+            for root, _dirs, files in os.walk(self.directory, followlinks=True):
+                for filename in files:
+                    if fnmatch.fnmatchcase(filename, self.pattern):
+                        primary.append(os.path.join(root, filename))
+                    elif default:
+                        for suffix in TEST_CASE_SUFFIXES:
+                            if filename.endswith(suffix):
+                                groups[suffix].append(os.path.join(root, filename))
+                                break
+
+        ordered = primary + [p for suffix in TEST_CASE_SUFFIXES[1:] for p in groups[suffix]]
+        found: List[Tuple[str, int, int]] = []
+        seen: set = set()
+        for path in ordered:
+            if _is_config_file(Path(path)):
+                continue
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                continue
+            resolved = os.path.realpath(path)
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            found.append((path, info.st_mtime_ns, info.st_size))
+        return found
+
+    def _index(self, entries: List[CatalogEntry]) -> None:
+        self._entries = entries
+        self._by_path = {os.path.abspath(e.path): e for e in entries}
+        self._by_name = {}
+        self._by_tag = {}
+        for entry in entries:
+            self._by_name.setdefault(entry.name, entry)
+            for tag in entry.tags:
+                self._by_tag.setdefault(tag, []).append(entry)
+
+    def _materialize(self, entry: CatalogEntry) -> TestCase:
+        if entry.data is None:
+            entry.data = _parse_test_case_file(Path(entry.path))
+            self.parsed_files += 1
+        return _build_test_case(entry.path, entry.data)
+
+
+_catalogs: "OrderedDict[Tuple[str, str], TestCatalog]" = OrderedDict()
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(directory: Union[str, Path], pattern: str = "*.yaml") -> TestCatalog:
+    """The process-wide catalog for ``directory``, refreshed against the disk."""
+    key = (os.path.abspath(directory), pattern)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = TestCatalog(directory, pattern)
+            _catalogs[key] = catalog
+            while len(_catalogs) > _MAX_CATALOGS:
+                _catalogs.popitem(last=False)
+        else:
+            _catalogs.move_to_end(key)
+    return catalog.refresh()
+
+
+def use_project_test_catalog(base_path: Optional[Union[str, Path]] = None) -> None:
+    """Persist catalog metadata under .evalview/ when run inside a project.
+
+    Args:
+        base_path: Project root (default: current dir). Only test
+            directories inside it are persisted; catalogs of directories
+            elsewhere stay in memory.
+    """
+    path = os.path.join(base_path or ".", DEFAULT_TEST_CATALOG_PATH)
+    if os.path.isdir(os.path.dirname(path)):
+        _metadata.persist_to(path)
@@ -125,6 +125,22 @@ class VarianceConfig(BaseModel):
     min_mean_score: Optional[float] = Field(default=None, ge=0, le=100, description="Minimum mean score across runs")
     max_std_dev: Optional[float] = Field(default=None, ge=0, description="Maximum allowed standard deviation")
     confidence_level: float = Field(default=0.95, ge=0.5, le=0.99, description="Confidence level for intervals")
+    early_stop: bool = Field(
+        default=False,
+        description=(
+            "Stop running once a sequential probability ratio test settles "
+            "whether the pass rate meets pass_rate"
+        ),
+    )
+    early_stop_margin: float = Field(
+        default=0.1,
+        gt=0,
+        le=0.5,
+        description=(
+            "Indifference zone for early stopping: decide between pass_rate - margin "
+            "and pass_rate + margin. Wider stops sooner"
+        ),
+    )
 
 
 class Thresholds(BaseModel):
@@ -1076,6 +1092,11 @@ class EvaluationResult(BaseModel):
     # ``evalview simulate``; None for normal check runs.
     simulation: Optional[SimulationResult] = None
 
+    # Wall-clock time (ms) spent in each async evaluator, e.g.
+    # {"output_quality": 812.4, "hallucination": 790.1}. The LLM judges run
+    # concurrently, so these overlap rather than add up.
+    evaluator_timings_ms: Optional[Dict[str, float]] = None
+
 
 # --- Statistical/Variance Evaluation Types ---
 
@@ -1147,6 +1168,13 @@ class StatisticalEvaluationResult(BaseModel):
     # Individual run results (for detailed analysis)
     individual_results: List[EvaluationResult] = Field(default_factory=list, description="Results from each run")
 
+    # Sequential testing (variance.early_stop)
+    early_stop_decision: Optional[str] = Field(
+        default=None,
+        description="'pass', 'fail' or 'flaky' once the sequential test has settled the pass rate",
+    )
+    runs_saved: int = Field(default=0, ge=0, description="Planned runs skipped by early stopping")
+
     # Metadata
     timestamp: datetime = Field(description="When the statistical evaluation completed")
     variance_config: VarianceConfig = Field(description="Configuration used for this evaluation")
@@ -1,12 +1,15 @@
 """Main evaluator orchestrator."""
 
+import asyncio
 import json as _json
 import logging
 import re as _re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from evalview.core.config import ScoringWeights, DEFAULT_WEIGHTS
+from evalview.core.regex_sandbox import compile_pattern, regex_sandbox
 from evalview.core.types import (
     TestCase,
     ExecutionTrace,
@@ -41,14 +44,13 @@ _DETO_SCORE_CAP: float = 75.0           # max score; signals "approximate"
 _DETO_MIN_OUTPUT_LENGTH: int = 10        # chars below which output is "short"
 _DETO_MIN_QUERY_WORD_LENGTH: int = 3     # minimum chars to treat as a keyword
 
+# Flags for user-supplied ``regex_patterns`` checks.
+_REGEX_FLAGS: int = _re.IGNORECASE | _re.DOTALL
+
 if TYPE_CHECKING:
     from evalview.core.judge_cache import JudgeCache
 
 
-class _RegexTimeoutError(Exception):
-    """Raised when a regex pattern match exceeds the time limit (ReDoS protection)."""
-    pass
-
 logger = logging.getLogger(__name__)
 
 
@@ -135,9 +137,34 @@ class Evaluator:
                 self._logged_deterministic_mode = True
             run_hallucination = False
             run_safety = False
+
+        # The LLM judges (and the PII scan) are independent of each other,
+        # so run them concurrently. The judge dispatcher caps and orders the
+        # LLM requests they make across the whole process.
+        timings: Dict[str, float] = {}
+        pending: Dict[str, Awaitable[Any]] = {}
+        if not self.skip_llm_judge:
+            pending["output_quality"] = self._timed(
+                "output_quality", lambda: self.output_evaluator.evaluate(test_case, trace), timings
+            )
+        if run_hallucination:
+            pending["hallucination"] = self._timed(
+                "hallucination", lambda: self.hallucination_evaluator.evaluate(test_case, trace), timings
+            )
+        if run_safety:
+            pending["safety"] = self._timed(
+                "safety", lambda: self.safety_evaluator.evaluate(test_case, trace), timings
+            )
+        if run_pii:
+            pending["pii"] = self._timed(
+                "pii", lambda: self.pii_evaluator.evaluate(test_case, trace), timings
+            )
+        results = dict(zip(pending, await asyncio.gather(*pending.values())))
+
+        if self.skip_llm_judge:
             output_quality = self._deterministic_output_eval(test_case, trace)
         else:
-            output_quality = await self.output_evaluator.evaluate(test_case, trace)
+            output_quality = results["output_quality"]
 
         # Run all evaluations
         evaluations = Evaluations(
@@ -146,10 +173,10 @@ class Evaluator:
             output_quality=output_quality,
             cost=self.cost_evaluator.evaluate(test_case, trace),
             latency=self.latency_evaluator.evaluate(test_case, trace),
-            hallucination=await self.hallucination_evaluator.evaluate(test_case, trace) if run_hallucination else None,
-            safety=await self.safety_evaluator.evaluate(test_case, trace) if run_safety else None,
+            hallucination=results.get("hallucination"),
+            safety=results.get("safety"),
             forbidden_tools=self.tool_evaluator.evaluate_forbidden(test_case, trace),
-            pii=await self.pii_evaluator.evaluate(test_case, trace) if run_pii else None,
+            pii=results.get("pii"),
         )
 
         # Compute overall score
@@ -220,8 +247,22 @@ class Evaluator:
             anomaly_report=anomaly_dict,
             trust_report=trust_dict,
             coherence_report=coherence_dict,
+            evaluator_timings_ms=timings or None,
         )
 
+    async def _timed(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[Any]],
+        timings: Dict[str, float],
+    ) -> Any:
+        """Await one evaluator, recording its duration (ms) under ``name``."""
+        start = time.perf_counter()
+        try:
+            return await run()
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
     def _get_weights_for_test(self, test_case: TestCase) -> Dict[str, float]:
         """
         Get scoring weights for a test case.
@@ -455,10 +496,11 @@ class Evaluator:
         """Compile a regex pattern with validation.
 
         Returns the compiled pattern, or None if the pattern is invalid.
-        Invalid patterns are logged as warnings.
+        Invalid patterns are logged as warnings. Compiled patterns are
+        cached across tests.
         """
         try:
-            return _re.compile(pattern, _re.IGNORECASE | _re.DOTALL)
+            return compile_pattern(pattern, _REGEX_FLAGS)
         except _re.error as e:
             logger.warning("Invalid regex pattern %r: %s", pattern, e)
             return None
@@ -470,67 +512,25 @@ class Evaluator:
         Safety measures:
         - Output is truncated to _MAX_CHECK_OUTPUT_LEN to bound runtime.
         - Each pattern is compiled once and validated before matching.
-        - A per-pattern timeout prevents ReDoS from catastrophic backtracking.
+        - Patterns that can backtrack run in the regex sandbox with a
+          per-pattern timeout, which works from any thread.
 
         Returns (passed, failed).
         """
-        import signal
-        import sys
-        import threading
-
         truncated = output[:Evaluator._MAX_CHECK_OUTPUT_LEN]
-        passed: List[str] = []
-        failed: List[str] = []
-
-        # signal.alarm is Unix-only and process-global — only safe on the
-        # main thread. On Windows or worker threads we skip the timeout guard.
-        can_alarm = (
-            hasattr(signal, "SIGALRM")
-            and sys.platform != "win32"
-            and threading.current_thread() is threading.main_thread()
+        valid = [p for p in patterns if Evaluator._compile_regex(p) is not None]
+        matched = dict(
+            zip(
+                valid,
+                regex_sandbox.search_many(
+                    truncated, valid, _REGEX_FLAGS, timeout=Evaluator._REGEX_TIMEOUT_S
+                ),
+            )
         )
-
-        for pattern in patterns:
-            compiled = Evaluator._compile_regex(pattern)
-            if compiled is None:
-                failed.append(pattern)
-                continue
-
-            try:
-                if can_alarm:
-                    # Set an alarm to interrupt long-running matches (ReDoS protection).
-                    old_handler = signal.signal(signal.SIGALRM, Evaluator._alarm_handler)
-                    signal.alarm(int(Evaluator._REGEX_TIMEOUT_S) or 1)
-
-                matched = compiled.search(truncated) is not None
-
-                if can_alarm:
-                    signal.alarm(0)  # cancel alarm
-                    signal.signal(signal.SIGALRM, old_handler)
-
-                if matched:
-                    passed.append(pattern)
-                else:
-                    failed.append(pattern)
-            except _RegexTimeoutError:
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
-                logger.warning("Regex pattern timed out (possible ReDoS): %r", pattern)
-                failed.append(pattern)
-            except Exception as e:
-                if can_alarm:
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
-                logger.warning("Regex match error for %r: %s", pattern, e)
-                failed.append(pattern)
-
+        passed = [p for p in patterns if matched.get(p)]
+        failed = [p for p in patterns if not matched.get(p)]
         return passed, failed
 
-    @staticmethod
-    def _alarm_handler(signum: int, frame: Any) -> None:
-        """Signal handler that raises _RegexTimeoutError."""
-        raise _RegexTimeoutError()
-
     @staticmethod
     def _extract_first_json_object(text: str) -> Any:
         """Extract the first valid JSON object from surrounding text.
@@ -8,22 +8,140 @@ Uses the Ragas-style faithfulness pattern:
 This is the industry-standard approach used by Ragas, Patronus AI, and others.
 It dramatically reduces false positives compared to single-prompt fact-checking
 because the judge evaluates one claim at a time with full context.
+
+Extracted claims and per-claim verdicts are cached (see
+evalview/core/claim_cache.py), so re-checking a stable agent only sends
+new claims to the judge. With batch verification on
+(``EVAL_JUDGE_BATCH_CLAIMS=1`` or ``judge.batch_claims`` in config.yaml),
+claims from tests evaluated at the same time are verified in one judge
+request.
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, Tuple, List, Dict, Any
+import os
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Set, Tuple, List, Dict, Any
 
+from evalview.core.claim_cache import ClaimVerdictCache, claim_cache
 from evalview.core.types import (
     TestCase,
     ExecutionTrace,
     HallucinationEvaluation,
     HallucinationCheck,
 )
-from evalview.core.llm_provider import LLMClient, LLMProvider
+from evalview.core.llm_provider import JudgePriority, LLMClient, LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Providers whose JSON mode reliably returns one object covering many tests.
+_BATCH_PROVIDERS = frozenset({
+    LLMProvider.OPENAI,
+    LLMProvider.ANTHROPIC,
+    LLMProvider.GEMINI,
+    LLMProvider.GROK,
+    LLMProvider.DEEPSEEK,
+})
+# How long the first verification request waits for others to join its batch.
+_BATCH_WINDOW_SECONDS = 0.05
+# A batch is sent early once it holds this many claims or context characters.
+_BATCH_MAX_CLAIMS = 40
+_BATCH_MAX_CONTEXT_CHARS = 60_000
+
+# Reasons used when the judge gave no real verdict; these are never cached.
+_UNVERIFIED_REASONS = frozenset({
+    "Verification unavailable",
+    "No verdict returned — assuming supported",
+    "Unparseable verdict — assuming supported",
+})
+
+
+@dataclass
+class _ClaimGroup:
+    """One test's claims waiting to be verified against its tool context."""
+
+    context_hash: str
+    tool_context: str
+    claims: List[str]
+    future: "asyncio.Future[List[Dict[str, Any]]]"
+
+
+class _ClaimBatcher:
+    """Collects verification requests from concurrent evaluations into batches.
+
+    The first request starts a short window; everything that arrives in it
+    (or until the size limits are hit) is handed to ``verify_batch`` at once.
+    State is per event loop, like ConcurrencyLimiter.
+    """
+
+    def __init__(
+        self,
+        verify_batch: Callable[[List[_ClaimGroup]], Awaitable[List[List[Dict[str, Any]]]]],
+    ):
+        self._verify_batch = verify_batch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[_ClaimGroup] = []
+        self._pending_claims = 0
+        self._pending_chars = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def verify(
+        self, claims: List[str], tool_context: str, context_hash: str
+    ) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._pending_claims = self._pending_chars = 0
+            self._timer = None
+            self._tasks = set()
+
+        group = _ClaimGroup(context_hash, tool_context, list(claims), loop.create_future())
+        self._pending.append(group)
+        self._pending_claims += len(group.claims)
+        self._pending_chars += len(tool_context)
+        if (
+            self._pending_claims >= _BATCH_MAX_CLAIMS
+            or self._pending_chars >= _BATCH_MAX_CONTEXT_CHARS
+        ):
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(_BATCH_WINDOW_SECONDS, self._flush)
+        return await group.future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._pending_claims = self._pending_chars = 0
+        if not batch or self._loop is None:
+            return
+        task = self._loop.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[_ClaimGroup]) -> None:
+        live = [g for g in batch if not g.future.done()]
+        if not live:
+            return
+        try:
+            results = await self._verify_batch(live)
+        except asyncio.CancelledError:
+            for g in live:
+                g.future.cancel()
+            raise
+        except Exception as exc:
+            for g in live:
+                if not g.future.done():
+                    g.future.set_exception(exc)
+            return
+        for g, verdicts in zip(live, results):
+            if not g.future.done():
+                g.future.set_result(verdicts)
+
 
 class HallucinationEvaluator:
     """Evaluator for detecting factual hallucinations in agent outputs.
@@ -40,8 +158,29 @@ class HallucinationEvaluator:
         provider: Optional[LLMProvider] = None,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
+        cache: Optional[ClaimVerdictCache] = None,
+        batch_verification: Optional[bool] = None,
     ):
+        """
+        Args:
+            provider: Judge provider (auto-detected when None).
+            api_key: Judge API key.
+            model: Judge model.
+            cache: Cache for extracted claims and verdicts. Defaults to the
+                process-wide cache shared by all evaluators.
+            batch_verification: Verify claims from concurrently evaluated
+                tests in one judge request. Defaults to EVAL_JUDGE_BATCH_CLAIMS.
+                Ignored for providers without a reliable JSON mode.
+        """
         self.llm_client = LLMClient(provider=provider, api_key=api_key, model=model)
+        self.cache = cache if cache is not None else claim_cache
+        self._cache_model = f"{self.llm_client.provider.value}/{self.llm_client.model}"
+
+        if batch_verification is None:
+            batch_verification = os.getenv("EVAL_JUDGE_BATCH_CLAIMS", "").lower() in ("1", "true", "yes")
+        self._batcher: Optional[_ClaimBatcher] = None
+        if batch_verification and self.llm_client.provider in _BATCH_PROVIDERS:
+            self._batcher = _ClaimBatcher(self._verify_claim_batch)
 
     async def evaluate(self, test_case: TestCase, trace: ExecutionTrace) -> HallucinationEvaluation:
         """Evaluate if agent output contains hallucinations."""
@@ -165,6 +304,10 @@ class HallucinationEvaluator:
             extraction_failed is True when the LLM call itself errored,
             distinguishing "no claims found" from "couldn't check."
         """
+        cached = self.cache.get_claims(self._cache_model, query, response)
+        if cached is not None:
+            return cached, False
+
         prompt = f"""Extract all specific factual claims from this AI agent response.
 
 Rules:
@@ -191,30 +334,61 @@ If no specific factual claims exist, return: []"""
                 user_prompt=prompt,
                 temperature=0.0,
                 max_tokens=1500,
+                priority=JudgePriority.GATE,
             )
+            claims: List[str] = []  # LLM succeeded but found no claims
             # Result should be a list of strings
             if isinstance(result, list):
-                return [str(c) for c in result if c], False
-            if isinstance(result, dict) and "claims" in result:
-                return [str(c) for c in result["claims"] if c], False
+                claims = [str(c) for c in result if c]
+            elif isinstance(result, dict) and "claims" in result:
+                claims = [str(c) for c in result["claims"] if c]
             # Try to parse as JSON array from string
-            if isinstance(result, str):
+            elif isinstance(result, str):
                 parsed = json.loads(result)
                 if isinstance(parsed, list):
-                    return [str(c) for c in parsed if c], False
-            return [], False  # LLM succeeded but found no claims
+                    claims = [str(c) for c in parsed if c]
         except Exception as e:
             logger.debug("Claim extraction failed: %s", e)
             return [], True  # LLM call failed — flag as extraction_failed
 
+        self.cache.put_claims(self._cache_model, query, response, claims)
+        return claims, False
+
     async def _verify_claims(
         self, claims: List[str], tool_context: str
     ) -> List[Dict[str, Any]]:
         """Step 2: Verify each claim against the full tool output context.
 
-        For each claim, determines if it is supported by the tool outputs.
-        Uses a single batched LLM call for efficiency.
+        Verdicts cached for this tool context are reused; only the other
+        claims go to the judge, batched with other tests' claims when batch
+        verification is on.
         """
+        context_hash = ClaimVerdictCache.hash_context(tool_context)
+        cached = self.cache.get_verdicts(self._cache_model, context_hash, claims)
+        missing = list(dict.fromkeys(c for c, v in zip(claims, cached) if v is None))
+
+        fresh: Dict[str, Dict[str, Any]] = {}
+        if missing:
+            if self._batcher is not None:
+                verdicts = await self._batcher.verify(missing, tool_context, context_hash)
+            else:
+                verdicts = await self._request_verdicts(missing, tool_context)
+            fresh = dict(zip(missing, verdicts))
+            self.cache.put_verdicts(
+                self._cache_model,
+                context_hash,
+                [(c, v) for c, v in fresh.items() if v["reason"] not in _UNVERIFIED_REASONS],
+            )
+
+        return [
+            {**verdict, "claim": claim} if verdict is not None else fresh[claim]
+            for claim, verdict in zip(claims, cached)
+        ]
+
+    async def _request_verdicts(
+        self, claims: List[str], tool_context: str
+    ) -> List[Dict[str, Any]]:
+        """Ask the judge whether each claim is supported, in one LLM call."""
         claims_numbered = "\n".join(f"{i+1}. {claim}" for i, claim in enumerate(claims))
 
         prompt = f"""You are verifying whether each factual claim is supported by the tool outputs below.
@@ -244,6 +418,7 @@ Return a JSON array with one object per claim:
                 user_prompt=prompt,
                 temperature=0.0,
                 max_tokens=2000,
+                priority=JudgePriority.GATE,
             )
 
             verdicts = self._parse_verdicts(result, claims)
@@ -254,6 +429,109 @@ Return a JSON array with one object per claim:
             # On failure, assume all claims are supported (fail open, not closed)
             return [{"claim": c, "supported": True, "reason": "Verification unavailable"} for c in claims]
 
+    async def _verify_claim_batch(self, groups: List[_ClaimGroup]) -> List[List[Dict[str, Any]]]:
+        """Verify claims from several tests in one judge request.
+
+        Groups that share a tool context are merged so it is sent once.
+        Contexts missing from the judge's answer, or the whole batch if the
+        request fails, are re-verified one context at a time.
+        """
+        sections: Dict[str, Tuple[str, List[str]]] = {}
+        for group in groups:
+            _, section_claims = sections.setdefault(group.context_hash, (group.tool_context, []))
+            section_claims.extend(c for c in group.claims if c not in section_claims)
+
+        by_context: Dict[str, List[Dict[str, Any]]] = {}
+        if len(sections) > 1:
+            by_context = await self._request_batch_verdicts(sections)
+        retry = [h for h in sections if h not in by_context]
+        if retry:
+            verdict_lists = await asyncio.gather(
+                *(self._request_verdicts(sections[h][1], sections[h][0]) for h in retry)
+            )
+            by_context.update(zip(retry, verdict_lists))
+
+        results = []
+        for group in groups:
+            lookup = dict(zip(sections[group.context_hash][1], by_context[group.context_hash]))
+            results.append([lookup[c] for c in group.claims])
+        return results
+
+    async def _request_batch_verdicts(
+        self, sections: Dict[str, Tuple[str, List[str]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Send one structured request covering every context in ``sections``.
+
+        Returns verdict lists keyed on context hash, only for contexts the
+        judge answered in full.
+        """
+        hashes = list(sections)
+        blocks = []
+        for n, context_hash in enumerate(hashes, 1):
+            tool_context, claims = sections[context_hash]
+            claims_numbered = "\n".join(f"{i+1}. {claim}" for i, claim in enumerate(claims))
+            blocks.append(
+                f"=== Context {n} ===\n"
+                f"Tool Outputs (this is what the agent had access to):\n{tool_context}\n\n"
+                f"Claims to verify:\n{claims_numbered}"
+            )
+        joined_blocks = "\n\n".join(blocks)
+        total_claims = sum(len(claims) for _, claims in sections.values())
+
+        prompt = f"""You are verifying whether factual claims made by AI agents are supported by the tool outputs they had.
+Each numbered context below has its own tool outputs and claims. Judge every claim ONLY against the tool outputs in its own context.
+
+{joined_blocks}
+
+For each claim, determine:
+- "supported": true if the tool outputs contain evidence for this claim (even paraphrased, reorganized, or summarized)
+- "supported": false ONLY if the claim clearly contradicts the tool outputs OR has absolutely no basis in them
+
+Be generous — if data could plausibly support the claim, mark it as supported.
+Agents commonly summarize, round numbers, group data, or rephrase — these are NOT hallucinations.
+
+Return a JSON object with one entry per context, verdicts in claim order:
+{{"contexts": [
+  {{"context": 1, "verdicts": [
+    {{"claim": "...", "supported": true, "reason": "Found in tool output N"}},
+    {{"claim": "...", "supported": false, "reason": "No evidence in any tool output"}}
+  ]}}
+]}}"""
+
+        try:
+            result = await self.llm_client.chat_completion(
+                system_prompt="You verify factual claims against evidence. Return only a JSON object. Be generous — paraphrasing is not hallucination.",
+                user_prompt=prompt,
+                temperature=0.0,
+                # ~60 tokens per verdict; stays within every provider's output cap.
+                max_tokens=min(3000, 400 + 60 * total_claims),
+                priority=JudgePriority.GATE,
+            )
+        except Exception as e:
+            logger.debug("Batched claim verification failed: %s", e)
+            return {}
+
+        entries = result.get("contexts") if isinstance(result, dict) else None
+        if not isinstance(entries, list):
+            return {}
+
+        answered: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("context", 0)) - 1
+            except (TypeError, ValueError):
+                continue
+            verdicts = entry.get("verdicts")
+            if not 0 <= index < len(hashes) or not isinstance(verdicts, list):
+                continue
+            claims = sections[hashes[index]][1]
+            if len(verdicts) < len(claims):
+                continue
+            answered[hashes[index]] = self._parse_verdicts(verdicts[: len(claims)], claims)
+        return answered
+
     def _parse_verdicts(self, result: Any, claims: List[str]) -> List[Dict[str, Any]]:
         """Parse LLM verification result into structured verdicts."""
         verdicts = []
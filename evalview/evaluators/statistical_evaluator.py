@@ -5,10 +5,11 @@ statistical metrics for pass/fail decisions, addressing the inherent
 non-determinism in LLM-based agent testing.
 """
 
+import asyncio
 import math
 import statistics
 from datetime import datetime
-from typing import List, Optional, Callable, Awaitable, Tuple
+from typing import List, Optional, Callable, Awaitable, Tuple, TYPE_CHECKING
 
 from evalview.core.types import (
     TestCase,
@@ -20,6 +21,14 @@ from evalview.core.types import (
     StatisticalEvaluationResult,
 )
 
+if TYPE_CHECKING:
+    from evalview.core.parallel import ConcurrencyLimiter
+
+# Fewest runs before an early-stop decision is trusted.
+_MIN_RUNS_BEFORE_STOP = 3
+# Keeps SPRT hypotheses away from 0 and 1, where the log-likelihood is infinite.
+_SPRT_EPSILON = 1e-3
+
 
 def compute_statistical_metrics(
     values: List[float],
@@ -200,6 +209,162 @@ def compute_flakiness_score(
     )
 
 
+def wilson_interval(
+    successes: int,
+    total: int,
+    confidence_level: float = 0.95,
+) -> Tuple[float, float]:
+    """
+    Wilson score interval for a pass rate.
+
+    Unlike the normal approximation it stays inside [0, 1] and behaves
+    sensibly for the small run counts and all-pass / all-fail outcomes
+    typical of agent tests.
+
+    Args:
+        successes: Number of passing runs
+        total: Number of runs
+        confidence_level: Two-sided confidence level
+
+    Returns:
+        (lower, upper) bounds on the true pass rate
+    """
+    if total <= 0:
+        return 0.0, 1.0
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence_level / 2)
+    p = successes / total
+    denom = 1 + z * z / total
+    centre = (p + z * z / (2 * total)) / denom
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denom
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def sequential_decision(
+    successes: int,
+    total: int,
+    variance_config: VarianceConfig,
+) -> Optional[str]:
+    """
+    Wald's sequential probability ratio test on the pass rate.
+
+    Tests ``p <= pass_rate - margin`` against ``p >= pass_rate + margin``
+    with both error rates set to ``1 - confidence_level``. With the
+    defaults (pass_rate 0.8, margin 0.1, 95%) three straight failures or
+    twelve straight passes settle a test that would otherwise run ten or
+    twenty times.
+
+    Args:
+        successes: Number of passing runs so far
+        total: Number of runs so far
+        variance_config: Thresholds, confidence level and margin
+
+    Returns:
+        "pass" when the pass rate clears the requirement, "fail" when it
+        misses it and no run passed, "flaky" when it misses it but some runs
+        passed, or None while more runs are needed. "pass" is never returned
+        when min_mean_score or max_std_dev is configured, since those depend
+        on the full score distribution.
+    """
+    if total < _MIN_RUNS_BEFORE_STOP:
+        return None
+    required = variance_config.pass_rate
+    margin = variance_config.early_stop_margin
+    p0 = min(max(required - margin, _SPRT_EPSILON), 1 - _SPRT_EPSILON)
+    p1 = min(max(required + margin, _SPRT_EPSILON), 1 - _SPRT_EPSILON)
+    if p1 <= p0:
+        return None
+
+    error = 1 - variance_config.confidence_level
+    upper = math.log((1 - error) / error)
+    failures = total - successes
+    llr = successes * math.log(p1 / p0) + failures * math.log((1 - p1) / (1 - p0))
+
+    if llr <= -upper:
+        return "flaky" if successes else "fail"
+    score_checks = (
+        variance_config.min_mean_score is not None
+        or variance_config.max_std_dev is not None
+    )
+    if llr >= upper and not score_checks:
+        return "pass"
+    return None
+
+
+def should_stop_early(
+    results: List[EvaluationResult],
+    variance_config: VarianceConfig,
+) -> bool:
+    """
+    Decide whether further runs can still change the statistical verdict.
+
+    Args:
+        results: Results collected so far
+        variance_config: Thresholds and confidence level for the test
+
+    Returns:
+        True once :func:`sequential_decision` has settled the test
+    """
+    successes = sum(1 for r in results if r.passed)
+    return sequential_decision(successes, len(results), variance_config) is not None
+
+
+async def run_repetitions(
+    run_once: Callable[[int], Awaitable[EvaluationResult]],
+    runs: int,
+    limiter: Optional["ConcurrencyLimiter"] = None,
+    stop: Optional[Callable[[List[EvaluationResult]], bool]] = None,
+    on_result: Optional[
+        Callable[[int, Optional[EvaluationResult], Optional[BaseException]], None]
+    ] = None,
+) -> List[EvaluationResult]:
+    """
+    Run one test ``runs`` times concurrently, streaming results as they land.
+
+    Every repetition waits for a slot on ``limiter``, so repetitions share
+    the run's global concurrency cap. Once ``stop`` returns True, queued
+    repetitions are skipped; those already in flight still finish and
+    their results are kept.
+
+    Args:
+        run_once: Async function executing run ``i`` (0-based)
+        runs: Maximum number of repetitions
+        limiter: Concurrency cap (default: one run at a time)
+        stop: Early-stop rule called with all results collected so far
+        on_result: Callback(completed_runs, result, error) after each run
+
+    Returns:
+        Results of the runs that completed, in completion order
+    """
+    from evalview.core.parallel import ConcurrencyLimiter
+
+    run_limiter = limiter or ConcurrencyLimiter(1)
+    results: List[EvaluationResult] = []
+    completed = 0
+    stopped = False
+
+    async def _one(index: int) -> None:
+        nonlocal completed, stopped
+        result: Optional[EvaluationResult] = None
+        error: Optional[BaseException] = None
+        try:
+            async with run_limiter.slot():
+                if stopped:
+                    return
+                result = await run_once(index)
+        except Exception as exc:
+            error = exc
+        completed += 1
+        if result is not None:
+            results.append(result)
+        if on_result:
+            on_result(completed, result, error)
+        if stop is not None and not stopped and results and stop(results):
+            stopped = True
+
+    await asyncio.gather(*(_one(i) for i in range(runs)))
+    return results
+
+
 class StatisticalEvaluator:
     """
     Evaluator that runs tests multiple times and computes statistical metrics.
@@ -227,6 +392,7 @@ class StatisticalEvaluator:
         test_case: TestCase,
         execute_fn: Callable[[TestCase], Awaitable[Tuple[ExecutionTrace, EvaluationResult]]],
         progress_callback: Optional[Callable[[int, int, Optional[EvaluationResult]], None]] = None,
+        limiter: Optional["ConcurrencyLimiter"] = None,
     ) -> StatisticalEvaluationResult:
         """
         Run a test case multiple times and compute statistical evaluation.
@@ -235,6 +401,7 @@ class StatisticalEvaluator:
             test_case: The test case to evaluate
             execute_fn: Async function that executes the test and returns (trace, result)
             progress_callback: Optional callback(current_run, total_runs, last_result)
+            limiter: Run repetitions concurrently under this cap (default: sequential)
 
         Returns:
             StatisticalEvaluationResult with comprehensive statistics
@@ -245,21 +412,26 @@ class StatisticalEvaluator:
         required_pass_rate = variance_config.pass_rate
         confidence_level = variance_config.confidence_level
 
-        # Run the test multiple times
-        results: List[EvaluationResult] = []
-
-        for i in range(num_runs):
-            try:
-                _, result = await execute_fn(test_case)
-                results.append(result)
-
-                if progress_callback:
-                    progress_callback(i + 1, num_runs, result)
-
-            except Exception:
-                # The execute_fn should handle most errors, but this is a safety net
-                if progress_callback:
-                    progress_callback(i + 1, num_runs, None)
+        async def _run_once(_: int) -> EvaluationResult:
+            _, result = await execute_fn(test_case)
+            return result
+
+        attempted = 0
+
+        def _on_result(done: int, result: Optional[EvaluationResult], _error: Optional[BaseException]) -> None:
+            nonlocal attempted
+            attempted = done
+            # The execute_fn should handle most errors; failed runs report None
+            if progress_callback:
+                progress_callback(done, num_runs, result)
+
+        results = await run_repetitions(
+            _run_once,
+            num_runs,
+            limiter=limiter,
+            stop=(lambda rs: should_stop_early(rs, variance_config)) if variance_config.early_stop else None,
+            on_result=_on_result,
+        )
 
         if not results:
             raise ValueError(f"All {num_runs} runs failed for test: {test_case.name}")
@@ -271,6 +443,7 @@ class StatisticalEvaluator:
             variance_config=variance_config,
             required_pass_rate=required_pass_rate,
             confidence_level=confidence_level,
+            skipped_runs=num_runs - attempted,
         )
 
     def evaluate_from_results(
@@ -278,6 +451,7 @@ class StatisticalEvaluator:
         test_case: TestCase,
         results: List[EvaluationResult],
         variance_config: Optional[VarianceConfig] = None,
+        skipped_runs: int = 0,
     ) -> StatisticalEvaluationResult:
         """
         Compute statistical evaluation from pre-existing results.
@@ -288,6 +462,7 @@ class StatisticalEvaluator:
             test_case: The test case these results belong to
             results: List of evaluation results to analyze
             variance_config: Optional config override
+            skipped_runs: Planned runs that early stopping skipped
 
         Returns:
             StatisticalEvaluationResult
@@ -300,6 +475,7 @@ class StatisticalEvaluator:
             variance_config=config,
             required_pass_rate=config.pass_rate,
             confidence_level=config.confidence_level,
+            skipped_runs=skipped_runs,
         )
 
     def _compute_statistical_result(
@@ -309,6 +485,7 @@ class StatisticalEvaluator:
         variance_config: VarianceConfig,
         required_pass_rate: float,
         confidence_level: float,
+        skipped_runs: int = 0,
     ) -> StatisticalEvaluationResult:
         """
         Compute the final statistical evaluation result.
@@ -319,6 +496,7 @@ class StatisticalEvaluator:
             variance_config: Variance configuration
             required_pass_rate: Required pass rate threshold
             confidence_level: Confidence level for intervals
+            skipped_runs: Planned runs that early stopping skipped
 
         Returns:
             Complete StatisticalEvaluationResult
@@ -354,8 +532,20 @@ class StatisticalEvaluator:
         failure_reasons = []
         passed = True
 
-        # Check 1: Pass rate threshold
-        if pass_rate < required_pass_rate:
+        # Check 1: Pass rate threshold. With early stopping the sequential
+        # test's decision replaces the point estimate once it has one.
+        decision = (
+            sequential_decision(successful_runs, total_runs, variance_config)
+            if variance_config.early_stop
+            else None
+        )
+        if decision in ("fail", "flaky"):
+            passed = False
+            failure_reasons.append(
+                f"Pass rate {pass_rate:.1%} below required {required_pass_rate:.1%} "
+                f"at {confidence_level:.0%} confidence ({decision})"
+            )
+        elif decision is None and pass_rate < required_pass_rate:
             passed = False
             failure_reasons.append(
                 f"Pass rate {pass_rate:.1%} below required {required_pass_rate:.1%}"
@@ -410,6 +600,8 @@ class StatisticalEvaluator:
             pass_at_k=round(pass_at_k, 4),
             pass_power_k=round(pass_power_k, 4),
             individual_results=results,
+            early_stop_decision=decision,
+            runs_saved=max(0, skipped_runs),
             timestamp=datetime.now(),
             variance_config=variance_config,
         )
@@ -1,13 +1,23 @@
 """EvalView MCP Server — exposes the full evalview CLI as MCP tools for Claude Code."""
 
+import asyncio
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from importlib.metadata import version as _pkg_version, PackageNotFoundError
-from typing import Any, Dict, Optional
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Dict, List, NamedTuple, Optional, TextIO, Tuple, Union,
+)
+
+if TYPE_CHECKING:
+    from evalview.api import GateResult
+    from evalview.core.parallel import ConcurrencyLimiter
 
 # Matches CSI sequences (\x1b[...m), OSC sequences (\x1b]...\x07), and single-char escapes
 _ANSI_ESCAPE = re.compile(r"\x1b(?:\[[0-9;]*[A-Za-z]|\][^\x07]*\x07|[@-_][0-`]?)")
@@ -412,26 +422,208 @@ TOOLS = [
 ]
 
 
+# run_check flags only the CLI implements; checks without them run in-process.
+_SUBPROCESS_CHECK_FLAGS = (
+    "heal", "strict", "ai_root_cause", "statistical", "auto_variant", "budget",
+    "dry_run", "tag", "fail_on", "report", "judge",
+)
+
+_DEFAULT_TIMEOUT_TIP = "Tip: Check that your API key is set and the model is reachable."
+_CHECK_TIMEOUT_TIP = "Tip: Heal and statistical modes take longer — try fewer tests or a higher timeout."
+
+
+class _CliCommand(NamedTuple):
+    """An ``evalview`` CLI invocation and how long it may run."""
+
+    argv: List[str]
+    timeout: int
+    env: Dict[str, str]
+    timeout_tip: str = _DEFAULT_TIMEOUT_TIP
+
+
+def _needs_subprocess(args: Dict[str, Any]) -> bool:
+    return any(args.get(f) for f in _SUBPROCESS_CHECK_FLAGS)
+
+
+def _clean_output(stdout: str, stderr: str) -> str:
+    output = stdout
+    if stderr:
+        output += stderr
+    return _ANSI_ESCAPE.sub("", output).strip()
+
+
+def _timeout_message(command: _CliCommand) -> str:
+    return (
+        f"Error: Command timed out after {command.timeout}s.\n"
+        f"Command: {' '.join(command.argv)}\n"
+        f"{command.timeout_tip}"
+    )
+
+
+async def _read_lines(stream: TextIO) -> AsyncIterator[str]:
+    """Lines of ``stream``, read on a daemon thread so the loop stays free."""
+    loop = asyncio.get_running_loop()
+    lines: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+    def _put(line: Optional[str]) -> None:
+        try:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+        except RuntimeError:  # pragma: no cover - loop already closed
+            pass
+
+    def _pump() -> None:
+        try:
+            for line in stream:
+                _put(line)
+        finally:
+            _put(None)
+
+    threading.Thread(target=_pump, daemon=True, name="mcp-stdin").start()
+    while True:
+        line = await lines.get()
+        if line is None:
+            return
+        yield line
+
+
 class MCPServer:
-    """Synchronous stdio JSON-RPC MCP server for EvalView."""
+    """Stdio JSON-RPC MCP server for EvalView.
+
+    :meth:`serve` runs an asyncio loop that handles ``tools/call`` requests
+    concurrently, so a long ``run_check`` no longer blocks ``tools/list``
+    or a quick ``create_test``. Clients can cancel a call with
+    ``notifications/cancelled`` and receive ``notifications/progress``
+    heartbeats by passing ``_meta.progressToken``.
+
+    A bare ``run_check`` runs in this process through :func:`evalview.api.gate_async`.
+    Imported modules, the test catalog, judge caches and pooled agent
+    connections therefore stay warm between calls. All checks share one
+    concurrency limiter built from the project config. Other tools, and
+    checks that need CLI-only flags, still run ``evalview`` as a subprocess,
+    which is killed when the call is cancelled or times out.
+
+    ``_handle`` and ``_call_tool`` are the blocking equivalents, one
+    request at a time.
+    """
 
-    def __init__(self, test_path: str = "tests") -> None:
+    def __init__(self, test_path: str = "tests", progress_interval: float = 5.0) -> None:
         self.test_path = test_path
+        self.progress_interval = progress_interval
+        self._out: Optional[TextIO] = None
+        self._inflight: Dict[Any, "asyncio.Task[None]"] = {}
+        self._limiter: Optional["ConcurrencyLimiter"] = None
 
     def serve(self) -> None:
-        """Run the synchronous stdin/stdout JSON-RPC loop."""
-        for raw_line in sys.stdin:
-            line = raw_line.strip()
-            if not line:
-                continue
+        """Run the stdin/stdout JSON-RPC loop until stdin closes."""
+        asyncio.run(self.serve_async())
+
+    async def serve_async(self, stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None) -> None:
+        """Serve requests from ``stdin`` (default ``sys.stdin``) on the running loop.
+
+        When the input closes, calls still in flight finish and are answered
+        before this returns.
+        """
+        from evalview.core.claim_cache import use_project_claim_cache
+        from evalview.core.http_pool import http_client_pool
+        from evalview.core.test_catalog import use_project_test_catalog
+
+        self._out = stdout
+        use_project_test_catalog()
+        use_project_claim_cache()
+        async with http_client_pool.session():
             try:
-                request = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            response = self._handle(request)
-            if response is not None:
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                async for raw_line in _read_lines(stdin or sys.stdin):
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    try:
+                        request = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(request, dict):
+                        self._dispatch(request)
+                if self._inflight:
+                    await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+            finally:
+                for task in list(self._inflight.values()):
+                    task.cancel()
+
+    def _dispatch(self, req: Dict[str, Any]) -> None:
+        method = req.get("method", "")
+        params = req.get("params") or {}
+
+        if method == "tools/call":
+            req_id = req.get("id")
+            task = asyncio.ensure_future(self._serve_tool_call(req))
+            if req_id is not None:
+                self._inflight[req_id] = task
+                task.add_done_callback(functools.partial(self._forget, req_id))
+            return
+
+        if method == "notifications/cancelled":
+            cancelled: Optional["asyncio.Task[None]"] = self._inflight.get(params.get("requestId"))
+            if cancelled is not None:
+                cancelled.cancel()
+            return
+
+        response = self._handle(req)
+        if response is not None:
+            self._send(response)
+
+    def _forget(self, req_id: Any, task: "asyncio.Task[None]") -> None:
+        if self._inflight.get(req_id) is task:
+            del self._inflight[req_id]
+
+    async def _serve_tool_call(self, req: Dict[str, Any]) -> None:
+        # A cancelled call gets no response, as the MCP spec requires.
+        params = req.get("params") or {}
+        tool_name = params.get("name", "")
+        token = (params.get("_meta") or {}).get("progressToken")
+        heartbeat = None
+        if token is not None:
+            heartbeat = asyncio.ensure_future(self._report_progress(token, tool_name))
+        is_error = False
+        try:
+            output = await self._call_tool_async(tool_name, params.get("arguments", {}))
+        except Exception as e:
+            output = f"Error: {tool_name} failed: {e}"
+            is_error = True
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+        self._send(self._tool_response(req.get("id"), output, is_error))
+
+    async def _report_progress(self, token: Any, tool_name: str) -> None:
+        started = time.monotonic()
+        sent = 0
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            sent += 1
+            self._send({
+                "jsonrpc": "2.0",
+                "method": "notifications/progress",
+                "params": {
+                    "progressToken": token,
+                    "progress": sent,
+                    "message": f"{tool_name} running for {int(time.monotonic() - started)}s",
+                },
+            })
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        out = self._out or sys.stdout
+        out.write(json.dumps(message) + "\n")
+        out.flush()
+
+    @staticmethod
+    def _tool_response(req_id: Any, output: str, is_error: bool = False) -> Dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "id": req_id,
+            "result": {
+                "content": [{"type": "text", "text": output}],
+                "isError": is_error,
+            },
+        }
 
     def _handle(self, req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         method = req.get("method", "")
@@ -462,15 +654,7 @@ class MCPServer:
         if method == "tools/call":
             tool_name = params.get("name", "")
             arguments = params.get("arguments", {})
-            output = self._call_tool(tool_name, arguments)
-            return {
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "result": {
-                    "content": [{"type": "text", "text": output}],
-                    "isError": False,
-                },
-            }
+            return self._tool_response(req_id, self._call_tool(tool_name, arguments))
 
         # Unknown method — return error only if it has an id (i.e. it's a request not a notification)
         if req_id is not None:
@@ -554,14 +738,42 @@ class MCPServer:
 
         if name == "run_check":
             # Use subprocess when advanced flags are present; direct API otherwise
-            advanced_flags = ("heal", "strict", "ai_root_cause", "statistical",
-                              "auto_variant", "budget", "dry_run", "tag",
-                              "fail_on", "report", "judge")
-            if any(args.get(f) for f in advanced_flags):
+            if _needs_subprocess(args):
                 return self._run_check_subprocess(args)
             return self._run_check_direct(args)
 
-        elif name == "run_snapshot":
+        if name == "generate_visual_report":
+            return self._generate_visual_report(args)
+
+        command = self._tool_command(name, args)
+        if isinstance(command, str):
+            return command
+        return self._run_cli(command)
+
+    async def _call_tool_async(self, name: str, args: Dict[str, Any]) -> str:
+        """:meth:`_call_tool` on the event loop; cancelling it stops the tool."""
+        if name == "create_test":
+            return self._create_test(args)
+
+        if not shutil.which("evalview"):
+            return "Error: evalview not found in PATH. Run: pip install -e ."
+
+        if name == "run_check":
+            if _needs_subprocess(args):
+                return await self._run_cli_async(self._check_command(args))
+            return await self._run_check_in_process(args)
+
+        if name == "generate_visual_report":
+            return await asyncio.to_thread(self._generate_visual_report, args)
+
+        command = self._tool_command(name, args)
+        if isinstance(command, str):
+            return command
+        return await self._run_cli_async(command)
+
+    def _tool_command(self, name: str, args: Dict[str, Any]) -> Union[_CliCommand, str]:
+        """The CLI command for a subprocess-backed tool, or an error message."""
+        if name == "run_snapshot":
             test_path = os.path.normpath(args.get("test_path", self.test_path))
             cmd = ["evalview", "snapshot", "--path", test_path]
             if args.get("test"):
@@ -612,9 +824,6 @@ class MCPServer:
             if args.get("verbose") is True:
                 cmd += ["--verbose"]
 
-        elif name == "generate_visual_report":
-            return self._generate_visual_report(args)
-
         elif name == "compare_agents":
             v1 = args.get("v1", "")
             v2 = args.get("v2", "")
@@ -659,25 +868,10 @@ class MCPServer:
             timeout = 120
         else:
             timeout = 30
-        try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, env=env,
-                timeout=timeout, stdin=subprocess.DEVNULL,
-            )
-        except subprocess.TimeoutExpired:
-            return (
-                f"Error: Command timed out after {timeout}s.\n"
-                f"Command: {' '.join(cmd)}\n"
-                f"Tip: Check that your API key is set and the model is reachable."
-            )
-        output = result.stdout
-        if result.stderr:
-            output += result.stderr
-        output = _ANSI_ESCAPE.sub("", output).strip()
-        return output or f"Command exited with code {result.returncode}"
+        return _CliCommand(cmd, timeout, env)
 
-    def _run_check_subprocess(self, args: Dict[str, Any]) -> str:
-        """Run regression check via subprocess with full flag support.
+    def _check_command(self, args: Dict[str, Any]) -> _CliCommand:
+        """``evalview check --json`` with every run_check flag mapped.
 
         Always forces --json so the output contract matches the direct API path.
         HTML reports are generated as a side effect but never auto-opened (CI=1).
@@ -720,22 +914,74 @@ class MCPServer:
             proc_timeout = 600
         # CI=1 suppresses browser auto-open from --report
         env = {**os.environ, "NO_COLOR": "1", "FORCE_COLOR": "0", "CI": "1"}
+        return _CliCommand(cmd, proc_timeout, env, _CHECK_TIMEOUT_TIP)
+
+    def _fallback_check_command(self, args: Dict[str, Any]) -> _CliCommand:
+        """Plain ``evalview check --json``, used when the in-process check fails."""
+        test_path = os.path.normpath(args.get("test_path", self.test_path))
+        cmd = ["evalview", "check", test_path, "--json"]
+        if args.get("test"):
+            cmd += ["--test", args["test"]]
+        env = {**os.environ, "NO_COLOR": "1", "FORCE_COLOR": "0"}
+        return _CliCommand(cmd, 60, env)
+
+    # ------------------------------------------------------------------
+    # Subprocess execution
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _exec(command: _CliCommand) -> Tuple[str, int]:
+        """Run ``command``; (cleaned output, exit code). Raises TimeoutExpired."""
+        result = subprocess.run(
+            command.argv, capture_output=True, text=True, env=command.env,
+            timeout=command.timeout, stdin=subprocess.DEVNULL,
+        )
+        return _clean_output(result.stdout, result.stderr or ""), result.returncode
+
+    @staticmethod
+    async def _exec_async(command: _CliCommand) -> Tuple[str, int]:
+        """:meth:`_exec` without blocking the loop; the process dies on cancel."""
+        proc = await asyncio.create_subprocess_exec(
+            *command.argv,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=command.env,
+        )
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, env=env,
-                timeout=proc_timeout, stdin=subprocess.DEVNULL,
-            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), command.timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(command.argv, command.timeout) from None
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        output = _clean_output(
+            stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+        )
+        return output, proc.returncode or 0
+
+    def _run_cli(self, command: _CliCommand) -> str:
+        try:
+            output, returncode = self._exec(command)
         except subprocess.TimeoutExpired:
-            return (
-                f"Error: Command timed out after {proc_timeout}s.\n"
-                f"Command: {' '.join(cmd)}\n"
-                f"Tip: Heal and statistical modes take longer — try fewer tests or a higher timeout."
-            )
-        output = result.stdout
-        if result.stderr:
-            output += result.stderr
-        output = _ANSI_ESCAPE.sub("", output).strip()
-        return output or f"Command exited with code {result.returncode}"
+            return _timeout_message(command)
+        return output or f"Command exited with code {returncode}"
+
+    async def _run_cli_async(self, command: _CliCommand) -> str:
+        try:
+            output, returncode = await self._exec_async(command)
+        except subprocess.TimeoutExpired:
+            return _timeout_message(command)
+        return output or f"Command exited with code {returncode}"
+
+    # ------------------------------------------------------------------
+    # run_check
+    # ------------------------------------------------------------------
+
+    def _run_check_subprocess(self, args: Dict[str, Any]) -> str:
+        """Run regression check via subprocess with full flag support."""
+        return self._run_cli(self._check_command(args))
 
     def _run_check_direct(self, args: Dict[str, Any]) -> str:
         """Run regression check via the Python API instead of subprocess.
@@ -748,63 +994,94 @@ class MCPServer:
             from evalview.api import gate, DiffStatus
 
             test_path = os.path.normpath(args.get("test_path", self.test_path))
-            test_name = args.get("test") or None
-
             user_timeout = float(args.get("timeout", 120.0))
             result = gate(
                 test_dir=test_path,
-                test_name=test_name,
+                test_name=args.get("test") or None,
                 fail_on={DiffStatus.REGRESSION},
                 timeout=user_timeout,
             )
-
-            # Build the same JSON structure as `evalview check --json`
-            output = {
-                "summary": {
-                    "total_tests": result.summary.total,
-                    "unchanged": result.summary.unchanged,
-                    "regressions": result.summary.regressions,
-                    "tools_changed": result.summary.tools_changed,
-                    "output_changed": result.summary.output_changed,
-                    "all_passed": result.summary.regressions == 0 and result.summary.tools_changed == 0 and result.summary.output_changed == 0,
-                    "has_regressions": result.summary.regressions > 0,
-                    "has_tools_changed": result.summary.tools_changed > 0,
-                    "has_output_changed": result.summary.output_changed > 0,
-                },
-                "diffs": [
-                    {
-                        "test_name": d.test_name,
-                        "status": d.status.value,
-                        "score_delta": d.score_delta,
-                        "has_tool_diffs": d.tool_changes > 0,
-                        "output_similarity": d.output_similarity,
-                        "model_changed": d.model_changed,
-                    }
-                    for d in result.diffs
-                ],
-            }
-
-            # Include observability signals when present
-            obs = result.observability
-            payload = obs.to_payload()
-            if payload:
-                output["observability"] = payload
-
-            return json.dumps(output, indent=2)
-
+            return self._check_json(result)
         except Exception as e:
             # Fall back to subprocess if the API call fails for any reason
+            command = self._fallback_check_command(args)
+            try:
+                output, _ = self._exec(command)
+            except Exception:
+                return f"Error running check: {e}"
+            return output or f"Error: {e}"
+
+    async def _run_check_in_process(self, args: Dict[str, Any]) -> str:
+        """:meth:`_run_check_direct` on the server's loop, sharing its warm state."""
+        try:
+            from evalview.api import gate_async, DiffStatus
+
             test_path = os.path.normpath(args.get("test_path", self.test_path))
-            cmd = ["evalview", "check", test_path, "--json"]
-            if args.get("test"):
-                cmd += ["--test", args["test"]]
-            env = {**os.environ, "NO_COLOR": "1", "FORCE_COLOR": "0"}
+            user_timeout = float(args.get("timeout", 120.0))
+            result = await gate_async(
+                test_dir=test_path,
+                test_name=args.get("test") or None,
+                fail_on={DiffStatus.REGRESSION},
+                timeout=user_timeout,
+                limiter=self._shared_limiter(),
+            )
+            return self._check_json(result)
+        except Exception as e:
+            command = self._fallback_check_command(args)
             try:
-                proc = subprocess.run(cmd, capture_output=True, text=True, env=env, timeout=60, stdin=subprocess.DEVNULL)
-                fallback_output = proc.stdout + (proc.stderr or "")
-                return _ANSI_ESCAPE.sub("", fallback_output).strip() or f"Error: {e}"
+                output, _ = await self._exec_async(command)
             except Exception:
                 return f"Error running check: {e}"
+            return output or f"Error: {e}"
+
+    def _shared_limiter(self) -> "ConcurrencyLimiter":
+        """One limiter, from the config's ``concurrency`` section, for every check."""
+        if self._limiter is None:
+            from evalview.commands.shared import _load_config_if_exists
+            from evalview.core.parallel import create_limiter
+
+            config = _load_config_if_exists()
+            concurrency = config.get_concurrency_config() if config else None
+            self._limiter = create_limiter(
+                concurrency.max_concurrency if concurrency else None,
+                adaptive=concurrency.adaptive if concurrency else False,
+            )
+        return self._limiter
+
+    @staticmethod
+    def _check_json(result: "GateResult") -> str:
+        """The same JSON structure as ``evalview check --json``."""
+        output = {
+            "summary": {
+                "total_tests": result.summary.total,
+                "unchanged": result.summary.unchanged,
+                "regressions": result.summary.regressions,
+                "tools_changed": result.summary.tools_changed,
+                "output_changed": result.summary.output_changed,
+                "all_passed": result.summary.regressions == 0 and result.summary.tools_changed == 0 and result.summary.output_changed == 0,
+                "has_regressions": result.summary.regressions > 0,
+                "has_tools_changed": result.summary.tools_changed > 0,
+                "has_output_changed": result.summary.output_changed > 0,
+            },
+            "diffs": [
+                {
+                    "test_name": d.test_name,
+                    "status": d.status.value,
+                    "score_delta": d.score_delta,
+                    "has_tool_diffs": d.tool_changes > 0,
+                    "output_similarity": d.output_similarity,
+                    "model_changed": d.model_changed,
+                }
+                for d in result.diffs
+            ],
+        }
+
+        # Include observability signals when present
+        payload = result.observability.to_payload()
+        if payload:
+            output["observability"] = payload
+
+        return json.dumps(output, indent=2)
 
     def _generate_visual_report(self, args: Dict[str, Any]) -> str:
         """Generate a beautiful HTML visual report from results JSON."""
@@ -16,6 +16,7 @@ from evalview.core.types import (
     StatisticalEvaluationResult,
     StatisticalMetrics,
 )
+from evalview.evaluators.statistical_evaluator import wilson_interval
 
 
 class StatisticalReporterMixin:
@@ -55,12 +56,16 @@ class StatisticalReporterMixin:
         pass_power_k_color = "green" if result.pass_power_k >= 0.5 else "yellow" if result.pass_power_k >= 0.2 else "red"
         pass_power_k_meaning = "reliable" if result.pass_power_k >= 0.5 else "needs improvement" if result.pass_power_k >= 0.2 else "unreliable"
 
+        confidence = result.variance_config.confidence_level
+        rate_low, rate_high = wilson_interval(result.successful_runs, result.total_runs, confidence)
+
         run_summary = (
             f"  [bold]Total Runs:[/bold]     {result.total_runs}\n"
             f"  [bold]Passed:[/bold]         [green]{result.successful_runs}[/green]\n"
             f"  [bold]Failed:[/bold]         [red]{result.failed_runs}[/red]\n"
             f"  [bold]Pass Rate:[/bold]      [{pass_rate_color}]{result.pass_rate:.1%}[/{pass_rate_color}] "
-            f"(required: {result.required_pass_rate:.1%})\n"
+            f"(required: {result.required_pass_rate:.1%}) "
+            f"[dim]{confidence:.0%} CI: [{rate_low:.0%}, {rate_high:.0%}][/dim]\n"
             f"\n"
             f"  [bold]Reliability Metrics:[/bold]\n"
             f"  [bold]pass@{result.total_runs}:[/bold]       [{pass_at_k_color}]{result.pass_at_k:.1%}[/{pass_at_k_color}] "
@@ -70,6 +75,16 @@ class StatisticalReporterMixin:
         )
         self.console.print(Panel(run_summary, title="[bold]Run Summary[/bold]", border_style="cyan"))
 
+        # Sequential early stop — agent calls are the dominant cost, so say
+        # how many the decision saved.
+        if result.early_stop_decision or result.runs_saved:
+            planned = result.variance_config.runs
+            decision = result.early_stop_decision or "undecided"
+            self.console.print(
+                f"  [bold]Early stop:[/bold] {decision} after {result.total_runs}/{planned} runs "
+                f"[dim]({result.runs_saved} run{'s' if result.runs_saved != 1 else ''} saved)[/dim]"
+            )
+
         # Score statistics table
         self._print_statistics_table(result.score_stats, "Score Statistics", unit="pts")
 
@@ -99,7 +114,11 @@ class StatisticalReporterMixin:
         config = result.variance_config
         self.console.print()
         self.console.print("[dim]Configuration:[/dim]")
-        self.console.print(f"  [dim]runs: {config.runs}, pass_rate: {config.pass_rate}, confidence: {config.confidence_level}[/dim]")
+        early_stop = f", early_stop: margin {config.early_stop_margin}" if config.early_stop else ""
+        self.console.print(
+            f"  [dim]runs: {config.runs}, pass_rate: {config.pass_rate}, "
+            f"confidence: {config.confidence_level}{early_stop}[/dim]"
+        )
 
     def _print_statistics_table(
         self,
@@ -13,14 +13,11 @@ import os
 import re
 from typing import List, Optional, Tuple
 
+from evalview.core.pattern_scanner import compile_pattern_list
 from evalview.skills.agent_types import DeterministicCheckResult
 from evalview.skills.evaluators._security_patterns import (
-    DESTRUCTIVE_PATTERNS,
-    EXFIL_PATTERNS,
-    EXTERNAL_NETWORK_PATTERNS,
-    INJECTION_PATTERNS,
-    SECRET_PATTERNS,
-    SUDO_PATTERNS,
+    COMMAND_PATTERNS,
+    OUTPUT_PATTERNS,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,16 +38,14 @@ class SecurityChecksMixin:
         Returns:
             DeterministicCheckResult with pass/fail status
         """
-        violations: List[Tuple[str, str]] = []
-
-        for pattern in patterns:
-            try:
-                regex = re.compile(pattern, re.IGNORECASE)
-                for cmd in commands:
-                    if regex.search(cmd):
-                        violations.append((pattern, cmd))
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        scanner = compile_pattern_list(tuple(patterns), re.IGNORECASE)
+        hits = [set(scanner.search(cmd)) for cmd in commands]
+        violations: List[Tuple[str, str]] = [
+            (pattern, cmd)
+            for pattern in patterns
+            for cmd, matched in zip(commands, hits)
+            if pattern in matched
+        ]
 
         if violations:
             violation_msgs = [f"'{cmd}' matches '{pat}'" for pat, cmd in violations[:3]]
@@ -82,10 +77,8 @@ class SecurityChecksMixin:
         sudo_commands: List[str] = []
 
         for cmd in commands:
-            for pattern in SUDO_PATTERNS:
-                if re.search(pattern, cmd, re.IGNORECASE):
-                    sudo_commands.append(cmd)
-                    break
+            if COMMAND_PATTERNS.matches(cmd, "sudo"):
+                sudo_commands.append(cmd)
 
         if sudo_commands:
             return DeterministicCheckResult(
@@ -120,10 +113,8 @@ class SecurityChecksMixin:
         external_calls: List[str] = []
 
         for cmd in commands:
-            for pattern in EXTERNAL_NETWORK_PATTERNS:
-                if re.search(pattern, cmd, re.IGNORECASE):
-                    external_calls.append(cmd)
-                    break
+            if COMMAND_PATTERNS.matches(cmd, "external_network"):
+                external_calls.append(cmd)
 
         if external_calls:
             return DeterministicCheckResult(
@@ -213,10 +204,8 @@ class SecurityChecksMixin:
         """Detect leaked API keys, tokens, and credentials in output."""
         leaked: List[str] = []
 
-        for pattern in SECRET_PATTERNS:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            for match in matches:
-                leaked.append(f"{match[:12]}..." if len(match) > 12 else match)
+        for match in OUTPUT_PATTERNS.findall(output, "secret"):
+            leaked.append(f"{match[:12]}..." if len(match) > 12 else match)
 
         if leaked:
             return DeterministicCheckResult(
@@ -242,10 +231,8 @@ class SecurityChecksMixin:
         exfil_commands: List[str] = []
 
         for cmd in commands:
-            for pattern in EXFIL_PATTERNS:
-                if re.search(pattern, cmd, re.IGNORECASE):
-                    exfil_commands.append(cmd)
-                    break
+            if COMMAND_PATTERNS.matches(cmd, "exfiltration"):
+                exfil_commands.append(cmd)
 
         if exfil_commands:
             return DeterministicCheckResult(
@@ -271,10 +258,8 @@ class SecurityChecksMixin:
         destructive: List[str] = []
 
         for cmd in commands:
-            for pattern in DESTRUCTIVE_PATTERNS:
-                if re.search(pattern, cmd, re.IGNORECASE):
-                    destructive.append(cmd)
-                    break
+            if COMMAND_PATTERNS.matches(cmd, "destructive"):
+                destructive.append(cmd)
 
         if destructive:
             return DeterministicCheckResult(
@@ -301,11 +286,7 @@ class SecurityChecksMixin:
         If the agent's *output* contains these patterns, the skill
         instructions may be attempting to hijack downstream consumers.
         """
-        injections: List[str] = []
-
-        for pattern in INJECTION_PATTERNS:
-            if re.search(pattern, output, re.IGNORECASE):
-                injections.append(pattern)
+        injections = OUTPUT_PATTERNS.matching_patterns(output, "injection")
 
         if injections:
             return DeterministicCheckResult(
@@ -1,11 +1,16 @@
 """Regex pattern lists used by the security-focused deterministic checks.
 
 Kept in a dedicated module so the patterns are easy to audit and update
-without scrolling through the 1.5k-line evaluator. All patterns are
-case-insensitive at match time (the check methods pass `re.IGNORECASE`).
+without scrolling through the 1.5k-line evaluator. The lists are compiled
+once, case-insensitively, into COMMAND_PATTERNS and OUTPUT_PATTERNS, which
+scan each command or output for every category in one pass.
 """
 from __future__ import annotations
 
+import re
+
+from evalview.core.pattern_scanner import PatternSet
+
 
 # Patterns considered dangerous for security checks
 SUDO_PATTERNS = [
@@ -87,3 +92,23 @@ INJECTION_PATTERNS = [
     r'\[INST\]',                                  # LLaMA-style injection
     r'<\|im_start\|>',                           # ChatML injection
 ]
+
+
+# Compiled scanners used by SecurityChecksMixin
+COMMAND_PATTERNS = PatternSet(
+    {
+        "sudo": SUDO_PATTERNS,
+        "external_network": EXTERNAL_NETWORK_PATTERNS,
+        "exfiltration": EXFIL_PATTERNS,
+        "destructive": DESTRUCTIVE_PATTERNS,
+    },
+    flags=re.IGNORECASE,
+)
+
+OUTPUT_PATTERNS = PatternSet(
+    {
+        "secret": SECRET_PATTERNS,
+        "injection": INJECTION_PATTERNS,
+    },
+    flags=re.IGNORECASE,
+)
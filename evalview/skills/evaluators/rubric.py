@@ -57,9 +57,9 @@ class RubricEvaluator:
         """
         try:
             # Lazy load LLM client
-            if self._llm_client is None:
-                from evalview.core.llm_provider import LLMClient
+            from evalview.core.llm_provider import JudgePriority, LLMClient
 
+            if self._llm_client is None:
                 model = rubric.model or self.model_override
                 self._llm_client = LLMClient(model=model)
 
@@ -73,6 +73,7 @@ class RubricEvaluator:
                 user_prompt=user_prompt,
                 temperature=0.3,
                 max_tokens=1000,
+                priority=JudgePriority.GATE,
             )
 
             # Parse response
@@ -1,10 +1,13 @@
 """Skill test runner - executes skills against Anthropic or OpenAI-compatible APIs."""
 
+import asyncio
 import concurrent.futures
+import logging
 import os
+import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import yaml  # type: ignore[import-untyped]
 
 from evalview.skills.types import (
@@ -17,6 +20,36 @@ from evalview.skills.types import (
 )
 from evalview.skills.parser import SkillParser
 from evalview.core.llm_configs import DEFAULT_MODELS, DEFAULT_FAST_MODEL
+from evalview.core.parallel import (
+    DEFAULT_MAX_CONCURRENCY,
+    ConcurrencyLimiter,
+    TokenBucket,
+    is_overload_error,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from evalview.core.retry import RetryConfig
+
+logger = logging.getLogger(__name__)
+
+# One request-rate bucket per provider endpoint, shared by every runner in
+# the process so concurrent suites against the same API back off together.
+_provider_buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+_provider_buckets_lock = threading.Lock()
+
+
+def _provider_bucket(
+    provider: str, base_url: Optional[str], requests_per_minute: Optional[float]
+) -> TokenBucket:
+    """Return the shared bucket for ``provider``/``base_url`` at this rate."""
+    key = (provider, base_url)
+    with _provider_buckets_lock:
+        bucket = _provider_buckets.get(key)
+        if bucket is None or bucket.rate_per_minute != requests_per_minute:
+            bucket = TokenBucket(requests_per_minute)
+            _provider_buckets[key] = bucket
+        return bucket
+
 
 
 class SkillRunner:
@@ -33,6 +66,9 @@ class SkillRunner:
         model: Optional[str] = None,
         provider: Optional[str] = None,
         base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 3,
     ):
         """
         Initialize the skill runner.
@@ -42,6 +78,11 @@ class SkillRunner:
             model: Model to use for testing (auto-selected based on provider if not set)
             provider: Provider name — "anthropic" or "openai" (covers all OpenAI-compatible APIs)
             base_url: Optional base URL for OpenAI-compatible providers
+            max_concurrency: Maximum tests in flight at once (default: 8)
+            requests_per_minute: Cap on requests per minute to the provider,
+                shared by all runners for the same endpoint (default: no cap;
+                429 responses still pause every runner for Retry-After)
+            max_retries: Retries for rate-limited, overloaded or timed-out calls
         """
         self.provider, self.api_key, self.base_url = self._resolve_provider_config(
             api_key=api_key,
@@ -49,6 +90,10 @@ class SkillRunner:
             base_url=base_url,
         )
         self.model = model or self._DEFAULT_MODELS.get(self.provider, DEFAULT_FAST_MODEL)
+        self.max_concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
+        self.max_retries = max_retries
+        self._bucket = _provider_bucket(self.provider, self.base_url, requests_per_minute)
+        self._retry = RetryConfig(max_retries=max_retries, base_delay=1.0, max_delay=60.0)
         self._client: Optional[Any] = None
 
     @property
@@ -72,6 +117,22 @@ class SkillRunner:
                     self._client = OpenAI(api_key=self.api_key)
         return self._client
 
+    def _build_async_client(self) -> Any:
+        """Build a provider async client; the caller closes it."""
+        if self.provider == "anthropic":
+            try:
+                import anthropic
+            except ImportError:
+                raise ImportError("anthropic package required. Install with: pip install anthropic")
+            return anthropic.AsyncAnthropic(api_key=self.api_key)
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError("openai package required. Install with: pip install openai")
+        if self.base_url:
+            return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        return AsyncOpenAI(api_key=self.api_key)
+
     def _resolve_provider_config(
         self,
         api_key: Optional[str],
@@ -264,6 +325,10 @@ class SkillRunner:
         """
         Run all tests in a test suite.
 
+        Synchronous wrapper around :meth:`run_suite_async`. When called from
+        a thread that already runs an event loop, the suite runs on a
+        worker thread with its own loop.
+
         Args:
             suite: The test suite to run
             on_test_complete: Optional callback invoked after each test finishes
@@ -271,26 +336,56 @@ class SkillRunner:
         Returns:
             SkillTestSuiteResult with all results
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_suite_async(suite, on_test_complete))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                asyncio.run, self.run_suite_async(suite, on_test_complete)
+            ).result()
+
+    async def run_suite_async(
+        self,
+        suite: SkillTestSuite,
+        on_test_complete: Optional[Callable[[SkillTestResult], None]] = None,
+    ) -> SkillTestSuiteResult:
+        """
+        Run all tests in a test suite concurrently on the async provider client.
+
+        At most ``max_concurrency`` tests are in flight, requests are paced
+        by the provider's shared rate bucket, and rate-limited calls are
+        retried after the provider's Retry-After (or exponential backoff).
+
+        Args:
+            suite: The test suite to run
+            on_test_complete: Optional callback invoked after each test finishes
+
+        Returns:
+            SkillTestSuiteResult with all results, in suite order
+        """
         # Load the skill
         skill = SkillParser.parse_file(suite.skill)
 
-        # Pre-warm client so threads don't race on lazy init
-        _ = self.client
-
         # Resolve model: suite overrides runner default
         effective_model = suite.model or self.model
 
-        # Run all tests concurrently
-        def _run_one(test: SkillTest) -> SkillTestResult:
-            result = self.run_test(skill, test, model=effective_model)
+        limiter = ConcurrencyLimiter(self.max_concurrency)
+        client = self._build_async_client()
+
+        async def _run_one(test: SkillTest) -> SkillTestResult:
+            async with limiter.slot():
+                result = await self.run_test_async(skill, test, model=effective_model, client=client)
             if on_test_complete is not None:
                 on_test_complete(result)
             return result
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        try:
             results: List[SkillTestResult] = list(
-                executor.map(_run_one, suite.tests)
+                await asyncio.gather(*(_run_one(test) for test in suite.tests))
             )
+        finally:
+            await client.close()
 
         # Calculate stats
         passed_tests = sum(1 for r in results if r.passed)
@@ -354,7 +449,67 @@ class SkillRunner:
             output_tokens = 0
             error = self._categorize_model_error(e)
 
-        # Evaluate the response
+        return self._build_result(test, output, input_tokens, output_tokens, latency_ms, error)
+
+    async def run_test_async(
+        self,
+        skill: Skill,
+        test: SkillTest,
+        model: Optional[str] = None,
+        client: Optional[Any] = None,
+    ) -> SkillTestResult:
+        """
+        Run a single test against a skill on the async provider client.
+
+        Args:
+            skill: The loaded skill
+            test: The test to run
+            model: Model override
+            client: Async provider client to use (one is built and closed
+                for this call if not given)
+
+        Returns:
+            SkillTestResult
+        """
+        model = model or self.model
+        system_prompt = self._build_system_prompt(skill)
+        owned_client = client is None
+        if client is None:
+            client = self._build_async_client()
+
+        start_time = time.time()
+        try:
+            output, input_tokens, output_tokens = await self._invoke_model_async(
+                client,
+                model=model,
+                system_prompt=system_prompt,
+                user_input=test.input,
+            )
+            latency_ms = (time.time() - start_time) * 1000
+            error = None
+
+        except Exception as e:
+            latency_ms = (time.time() - start_time) * 1000
+            output = ""
+            input_tokens = 0
+            output_tokens = 0
+            error = self._categorize_model_error(e)
+        finally:
+            if owned_client:
+                await client.close()
+
+        return self._build_result(test, output, input_tokens, output_tokens, latency_ms, error)
+
+    def _build_result(
+        self,
+        test: SkillTest,
+        output: str,
+        input_tokens: int,
+        output_tokens: int,
+        latency_ms: float,
+        error: Optional[str],
+    ) -> SkillTestResult:
+        """Evaluate a model response and package it as a SkillTestResult."""
         evaluation = self._evaluate_response(output, test.expected)
 
         return SkillTestResult(
@@ -382,18 +537,7 @@ class SkillRunner:
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_input}],
             )
-            output = ""
-            if getattr(response, "content", None):
-                chunks = []
-                for block in response.content:
-                    text = getattr(block, "text", None)
-                    if text:
-                        chunks.append(text)
-                output = "\n".join(chunks).strip()
-            usage = getattr(response, "usage", None)
-            input_tokens = int(getattr(usage, "input_tokens", 0) or 0)
-            output_tokens = int(getattr(usage, "output_tokens", 0) or 0)
-            return output, input_tokens, output_tokens
+            return self._normalize_anthropic_response(response)
 
         response = self.client.chat.completions.create(
             model=model,
@@ -403,6 +547,67 @@ class SkillRunner:
             ],
             max_tokens=4096,
         )
+        return self._normalize_openai_response(response)
+
+    async def _invoke_model_async(
+        self, client: Any, model: str, system_prompt: str, user_input: str
+    ) -> Tuple[str, int, int]:
+        """Invoke the provider on ``client`` with rate limiting and retries."""
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            try:
+                if self.provider == "anthropic":
+                    response = await client.messages.create(
+                        model=model,
+                        max_tokens=4096,
+                        system=system_prompt,
+                        messages=[{"role": "user", "content": user_input}],
+                    )
+                    return self._normalize_anthropic_response(response)
+
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_input},
+                    ],
+                    max_tokens=4096,
+                )
+                return self._normalize_openai_response(response)
+            except Exception as exc:
+                if attempt >= self.max_retries or not is_overload_error(exc):
+                    raise
+                delay = retry_after_seconds(exc)
+                if delay is None:
+                    delay = self._retry.calculate_delay(attempt)
+                if is_rate_limit_error(exc):
+                    # Everyone sharing the provider waits, not just this call.
+                    self._bucket.pause(delay)
+                attempt += 1
+                logger.debug(
+                    f"Provider call failed ({type(exc).__name__}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _normalize_anthropic_response(response: Any) -> Tuple[str, int, int]:
+        output = ""
+        if getattr(response, "content", None):
+            chunks = []
+            for block in response.content:
+                text = getattr(block, "text", None)
+                if text:
+                    chunks.append(text)
+            output = "\n".join(chunks).strip()
+        usage = getattr(response, "usage", None)
+        input_tokens = int(getattr(usage, "input_tokens", 0) or 0)
+        output_tokens = int(getattr(usage, "output_tokens", 0) or 0)
+        return output, input_tokens, output_tokens
+
+    @staticmethod
+    def _normalize_openai_response(response: Any) -> Tuple[str, int, int]:
         choice = response.choices[0] if getattr(response, "choices", None) else None
         message = getattr(choice, "message", None)
         content = getattr(message, "content", "")
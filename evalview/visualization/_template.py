@@ -416,6 +416,9 @@ table td,table th{transition:background .1s}
         <div class="meta-label">Token Breakdown</div>
         <div class="meta-value">in {{ '{:,}'.format(judge_usage.input_tokens) }} / out {{ '{:,}'.format(judge_usage.output_tokens) }}</div>
         <div class="meta-sub">{% if judge_usage.pricing %}{{ judge_usage.pricing }}{% else %}Separate from agent trace cost{% endif %}</div>
+        {% if judge_usage.dispatch and (judge_usage.dispatch.queue_wait_max_s >= 1 or judge_usage.dispatch.coalesced or judge_usage.dispatch.rate_limited) %}
+        <div class="meta-sub">Queue wait avg {{ judge_usage.dispatch.queue_wait_avg_s }}s / max {{ judge_usage.dispatch.queue_wait_max_s }}s{% if judge_usage.dispatch.coalesced %} · {{ judge_usage.dispatch.coalesced }} merged{% endif %}{% if judge_usage.dispatch.rate_limited %} · {{ judge_usage.dispatch.rate_limited }} rate-limited{% endif %}</div>
+        {% endif %}
       </div>
       {% endif %}
     </div>
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark output-similarity backends against the default SequenceMatcher.
+
+Generates synthetic agent outputs at several sizes and edit rates, scores
+each pair with every backend, and reports mean time per comparison plus how
+often each backend reaches the same verdict as ``sequence`` (today's matcher)
+and as ``lcs`` (the exact ratio). Verdicts use the DiffEngine thresholds:
+>= 0.95 unchanged, >= 0.8 minor change, else changed.
+
+Usage:
+    python scripts/benchmark_similarity.py
+    python scripts/benchmark_similarity.py --sizes 1000 10000 50000 --pairs 5
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from evalview.core.similarity import SIMILARITY_BACKENDS, get_similarity_backend
+
+_WORDS = (
+    "the agent called search tool returned results about weather in paris "
+    "forecast shows rain tomorrow with temperature of degrees celsius and "
+    "wind from the north user asked for summary order status refund policy "
+    "invoice account balance transferred pending approved declined"
+).split()
+
+
+def _verdict(similarity: float) -> str:
+    if similarity >= 0.95:
+        return "same"
+    if similarity >= 0.8:
+        return "minor"
+    return "changed"
+
+
+def _make_text(rng: random.Random, size: int) -> str:
+    words: List[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+        if rng.random() < 0.08:
+            words[-1] += "."
+    return " ".join(words)[:size]
+
+
+def _mutate(rng: random.Random, text: str, rate: float) -> str:
+    words = text.split(" ")
+    out: List[str] = []
+    for word in words:
+        roll = rng.random()
+        if roll < rate / 3:
+            continue  # delete
+        if roll < 2 * rate / 3:
+            out.append(rng.choice(_WORDS))  # substitute
+            continue
+        out.append(word)
+        if roll < rate:
+            out.append(rng.choice(_WORDS))  # insert
+    return " ".join(out)
+
+
+def _pairs(sizes: List[int], rates: List[float], count: int, seed: int) -> List[Tuple[int, float, str, str]]:
+    rng = random.Random(seed)
+    pairs = []
+    for size in sizes:
+        for rate in rates:
+            for _ in range(count):
+                golden = _make_text(rng, size)
+                pairs.append((size, rate, golden, _mutate(rng, golden, rate)))
+    return pairs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000, 20000])
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.01, 0.05, 0.15, 0.4])
+    parser.add_argument("--pairs", type=int, default=3, help="Pairs per size/rate cell")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pairs = _pairs(args.sizes, args.rates, args.pairs, args.seed)
+    backends = {name: get_similarity_backend(name) for name in SIMILARITY_BACKENDS}
+
+    scores: Dict[str, List[float]] = {name: [] for name in backends}
+    timings: Dict[str, Dict[int, List[float]]] = {name: {} for name in backends}
+    for name, backend in backends.items():
+        for size, _rate, golden, actual in pairs:
+            start = time.perf_counter()
+            score = backend.similarity(golden, actual)
+            timings[name].setdefault(size, []).append(time.perf_counter() - start)
+            scores[name].append(score)
+
+    def _agreement(name: str, reference: str) -> float:
+        same = sum(
+            _verdict(a) == _verdict(b) for a, b in zip(scores[name], scores[reference])
+        )
+        return same / len(pairs)
+
+    header = f"{'backend':<11}" + "".join(f"{f'{s} chars':>14}" for s in args.sizes)
+    header += f"{'vs sequence':>13}{'vs lcs':>9}{'max |Δ| lcs':>13}"
+    print(header)
+    print("-" * len(header))
+    for name in backends:
+        row = f"{name:<11}"
+        for size in args.sizes:
+            samples = timings[name][size]
+            row += f"{1000 * sum(samples) / len(samples):>11.2f} ms"
+        delta = max(abs(a - b) for a, b in zip(scores[name], scores["lcs"]))
+        row += f"{_agreement(name, 'sequence'):>13.1%}{_agreement(name, 'lcs'):>9.1%}{delta:>13.3f}"
+        print(row)
+    print(
+        f"\n{len(pairs)} pairs. Agreement = same verdict (>=0.95 / >=0.8 / below).\n"
+        "Note: SequenceMatcher's autojunk heuristic ignores frequent characters in\n"
+        "inputs over 200 chars, so 'sequence' under-scores long outputs; 'lcs' is the\n"
+        "exact ratio SequenceMatcher approximates on short ones."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -65,7 +65,7 @@ def test_skill_test_cli_passes_provider_and_base_url_in_legacy_mode(tmp_path, mo
     )
 
     class FakeSkillRunner:
-        def __init__(self, model, provider=None, base_url=None):
+        def __init__(self, model, provider=None, base_url=None, **kwargs):
             captured["model"] = model
             captured["provider"] = provider
             captured["base_url"] = base_url
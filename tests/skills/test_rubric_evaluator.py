@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 import pytest
 
+from evalview.core.llm_provider import JudgePriority
 from evalview.skills.agent_types import (
     RubricConfig,
     SkillAgentTrace,
@@ -93,6 +94,8 @@ class TestRubricEvaluatorSuccess:
             assert result.score == 95
             assert "Excellent" in result.rationale
             assert result.min_score == 70.0
+            _, kwargs = mock_client.chat_completion.call_args
+            assert kwargs["priority"] is JudgePriority.GATE
 
     @pytest.mark.asyncio
     async def test_score_at_threshold_passes(self, evaluator, rubric, trace):
@@ -170,3 +170,98 @@ def test_invoke_model_normalizes_openai_compatible_response(monkeypatch: pytest.
 def test_error_categorization_labels(message: str, expected_prefix: str) -> None:
     categorized = SkillRunner._categorize_model_error(RuntimeError(message))
     assert categorized.startswith(expected_prefix)
+
+
+class _FakeAsyncAnthropic:
+    """Async Anthropic client stand-in that tracks concurrency and can 429."""
+
+    def __init__(self, rate_limited_calls: int = 0) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self.closed = False
+        self._rate_limited_calls = rate_limited_calls
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs):
+        import asyncio
+
+        self.calls += 1
+        if self.calls <= self._rate_limited_calls:
+            error = RuntimeError("429 Too Many Requests")
+            error.status_code = 429  # type: ignore[attr-defined]
+            error.response = SimpleNamespace(headers={"retry-after": "0.01"})  # type: ignore[attr-defined]
+            raise error
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        query = kwargs["messages"][0]["content"]
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f"hello {query}")],
+            usage=SimpleNamespace(input_tokens=3, output_tokens=2),
+        )
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _suite(tmp_path, count: int):
+    from evalview.skills.types import SkillTestSuite
+
+    skill_file = tmp_path / "SKILL.md"
+    skill_file.write_text("---\nname: test-skill\ndescription: test skill\n---\n\n# Test Skill\n")
+    return SkillTestSuite(
+        name="suite",
+        skill=str(skill_file),
+        tests=[
+            {"name": f"t{i}", "input": f"q{i}", "expected": {"output_contains": ["hello"]}}
+            for i in range(count)
+        ],
+    )
+
+
+def test_run_suite_bounds_concurrency_and_keeps_order(monkeypatch, tmp_path) -> None:
+    _clear_provider_env(monkeypatch)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "dummy")
+    client = _FakeAsyncAnthropic()
+    runner = SkillRunner(model="claude-test", max_concurrency=3)
+    monkeypatch.setattr(runner, "_build_async_client", lambda: client)
+
+    completed = []
+    result = runner.run_suite(_suite(tmp_path, 10), on_test_complete=completed.append)
+
+    assert client.peak == 3
+    assert client.closed
+    assert [r.test_name for r in result.results] == [f"t{i}" for i in range(10)]
+    assert result.results[4].output == "hello q4"
+    assert result.passed_tests == 10
+    assert len(completed) == 10
+
+
+def test_run_suite_retries_rate_limited_calls(monkeypatch, tmp_path) -> None:
+    _clear_provider_env(monkeypatch)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "dummy")
+    client = _FakeAsyncAnthropic(rate_limited_calls=2)
+    runner = SkillRunner(model="claude-test", max_concurrency=1, max_retries=3)
+    monkeypatch.setattr(runner, "_build_async_client", lambda: client)
+
+    result = runner.run_suite(_suite(tmp_path, 1))
+
+    assert client.calls == 3
+    assert result.results[0].error is None
+    assert result.results[0].passed
+
+
+def test_run_suite_gives_up_after_max_retries(monkeypatch, tmp_path) -> None:
+    _clear_provider_env(monkeypatch)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "dummy")
+    client = _FakeAsyncAnthropic(rate_limited_calls=5)
+    runner = SkillRunner(model="claude-test", max_concurrency=1, max_retries=1)
+    monkeypatch.setattr(runner, "_build_async_client", lambda: client)
+
+    result = runner.run_suite(_suite(tmp_path, 1))
+
+    assert client.calls == 2
+    assert "429" in (result.results[0].error or "")
+    assert not result.passed
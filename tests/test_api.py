@@ -171,10 +171,10 @@ class TestGate:
         mock_result = MagicMock()
         mock_result.passed = True
 
-        def fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False):
+        async def fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, limiter=None):
             return [("sample", mock_diff)], [mock_result], MagicMock(), {}
 
-        monkeypatch.setattr("evalview.commands.shared._execute_check_tests", fake_execute)
+        monkeypatch.setattr("evalview.commands.shared._execute_check_tests_async", fake_execute)
 
         result = gate(test_dir=str(tmp_path))
         assert isinstance(result, GateResult)
@@ -191,7 +191,7 @@ class TestGate:
 
         captured = {}
 
-        def fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False):
+        async def fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, limiter=None):
             captured["skip_llm_judge"] = skip_llm_judge
             captured["semantic_diff"] = semantic_diff
             mock_diff = MagicMock()
@@ -202,12 +202,44 @@ class TestGate:
             mock_diff.model_changed = False
             return [("sample", mock_diff)], [MagicMock()], MagicMock(), {}
 
-        monkeypatch.setattr("evalview.commands.shared._execute_check_tests", fake_execute)
+        monkeypatch.setattr("evalview.commands.shared._execute_check_tests_async", fake_execute)
 
         gate(test_dir=str(tmp_path), quick=True)
         assert captured["skip_llm_judge"] is True
         assert captured["semantic_diff"] is False
 
+    def test_gate_async_runs_on_callers_loop(self, tmp_path, monkeypatch):
+        """Concurrent gate_async() calls run on the caller's loop and share a limiter."""
+        import asyncio
+        import threading
+
+        from evalview.api import gate_async
+        from evalview.core.parallel import ConcurrencyLimiter
+
+        (tmp_path / "sample.yaml").write_text(
+            "name: sample\ninput:\n  query: hi\nexpected:\n  tools: []\nthresholds:\n  min_score: 0\n",
+            encoding="utf-8",
+        )
+        seen = []
+
+        async def fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, limiter=None):
+            seen.append((asyncio.get_running_loop(), threading.current_thread(), limiter))
+            await asyncio.sleep(0)
+            return [], [], MagicMock(), {}
+
+        monkeypatch.setattr("evalview.commands.shared._execute_check_tests_async", fake_execute)
+        limiter = ConcurrencyLimiter(2)
+
+        async def _gates():
+            results = await asyncio.gather(
+                *[gate_async(test_dir=str(tmp_path), quick=True, limiter=limiter) for _ in range(3)]
+            )
+            return asyncio.get_running_loop(), results
+
+        loop, results = asyncio.run(_gates())
+        assert len(results) == 3
+        assert seen == [(loop, threading.main_thread(), limiter)] * 3
+
 
 # ---------------------------------------------------------------------------
 # GateResult / TestDiff type tests
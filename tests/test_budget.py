@@ -0,0 +1,70 @@
+"""Tests for BudgetTracker reservations used by concurrent budgeted checks."""
+
+from evalview.core.budget import BudgetTracker
+
+
+class TestBudgetReservations:
+    """Admission control based on spent + reserved cost."""
+
+    def test_admits_while_projection_fits(self):
+        tracker = BudgetTracker(limit=1.0)
+        assert tracker.reserve(0.4) is not None
+        assert tracker.reserve(0.4) is not None
+        assert tracker.reserve(0.4) is None
+        assert tracker.reserved == 0.8
+        assert not tracker.halted
+
+    def test_first_test_always_admitted_while_budget_remains(self):
+        tracker = BudgetTracker(limit=0.10)
+        assert tracker.reserve(5.0) is not None
+
+    def test_settle_replaces_estimate_with_actual(self):
+        tracker = BudgetTracker(limit=1.0)
+        token = tracker.reserve(0.5)
+        tracker.settle(token, "t1", 0.2, adapter="http")
+        assert tracker.reserved == 0.0
+        assert tracker.spent == 0.2
+        assert tracker.breakdown.by_test == {"t1": 0.2}
+        assert tracker.breakdown.by_adapter == {"http": 0.2}
+
+    def test_settle_trips_breaker_at_limit(self):
+        tracker = BudgetTracker(limit=0.3)
+        token = tracker.reserve(0.1)
+        tracker.settle(token, "t1", 0.35)
+        assert tracker.halted
+        assert tracker.reserve(0.0) is None
+
+    def test_release_frees_reservation_without_cost(self):
+        tracker = BudgetTracker(limit=1.0)
+        token = tracker.reserve(0.9)
+        assert tracker.reserve(0.5) is None
+        tracker.release(token)
+        assert tracker.spent == 0.0
+        assert tracker.reserve(0.5) is not None
+
+    def test_unknown_cost_admits_one_probe_first(self):
+        tracker = BudgetTracker(limit=1.0)
+        probe = tracker.reserve(0.0)
+        assert probe is not None
+        assert tracker.reserve(0.0) is None
+        tracker.settle(probe, "probe", 0.1)
+        assert tracker.reserve(tracker.estimate_cost()) is not None
+
+    def test_unlimited_tracker_always_admits(self):
+        tracker = BudgetTracker()
+        assert all(tracker.reserve(100.0) is not None for _ in range(10))
+
+
+class TestEstimateCost:
+    """Per-test cost estimates."""
+
+    def test_prefers_baseline_cost(self):
+        tracker = BudgetTracker(limit=1.0)
+        assert tracker.estimate_cost(0.07) == 0.07
+
+    def test_falls_back_to_running_average(self):
+        tracker = BudgetTracker(limit=1.0)
+        assert tracker.estimate_cost(None) == 0.0
+        tracker.settle(tracker.reserve(0.0), "a", 0.1)
+        tracker.settle(tracker.reserve(0.0), "b", 0.3)
+        assert abs(tracker.estimate_cost(0.0) - 0.2) < 1e-9
@@ -130,7 +130,7 @@ def test_check_does_not_report_clean_when_execution_failures_occur(monkeypatch,
     )
     monkeypatch.setattr(
         "evalview.commands.check_cmd._execute_check_tests",
-        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None: ([], [sample_result], None, {}),
+        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None: ([], [sample_result], None, {}),
     )
 
     # Provide input for interactive judge picker + skip it via env var
@@ -242,7 +242,7 @@ def test_check_json_includes_token_usage_and_cost_summary(monkeypatch, tmp_path)
 
     monkeypatch.setattr(
         "evalview.commands.check_cmd._execute_check_tests",
-        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None: ([
+        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None: ([
             ("sample", diff)
         ], [sample_result], None, golden_traces),
     )
@@ -345,7 +345,7 @@ def test_check_json_omits_token_usage_when_unavailable(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "evalview.commands.check_cmd._execute_check_tests",
-        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None: ([
+        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None: ([
             ("sample", diff)
         ], [sample_result], None, {}),
     )
@@ -389,7 +389,7 @@ def test_check_uses_active_test_path_when_no_path_is_given(monkeypatch, tmp_path
         lambda self: [GoldenMetadata(test_name="sample", blessed_at="2026-03-13T00:00:00Z", score=95.0)],
     )
 
-    def _fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None):
+    def _fake_execute(test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None):
         captured["names"] = [tc.name for tc in test_cases]
         return [], [], None, {}
 
@@ -475,7 +475,7 @@ def test_check_auto_generates_html_report_on_failures(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "evalview.commands.check_cmd._execute_check_tests",
-        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None: ([("sample", _Diff())], [sample_result], None, {}),
+        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None: ([("sample", _Diff())], [sample_result], None, {}),
     )
     monkeypatch.setattr(
         "evalview.commands.check_cmd._display_check_results",
@@ -579,7 +579,7 @@ def test_check_passes_tag_context_to_html_report(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "evalview.commands.check_cmd._execute_check_tests",
-        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None: ([("sample", _Diff())], [sample_result], None, {}),
+        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None: ([("sample", _Diff())], [sample_result], None, {}),
     )
     monkeypatch.setattr("evalview.commands.check_cmd._display_check_results", lambda *args, **kwargs: None)
 
@@ -669,7 +669,7 @@ def test_check_warns_when_heal_leaves_unresolved_but_default_fail_policy_exits_z
     )
     monkeypatch.setattr(
         "evalview.commands.check_cmd._execute_check_tests",
-        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None: ([("sample", _Diff())], [sample_result], None, {"sample": GoldenTrace(metadata=GoldenMetadata(test_name="sample", blessed_at=now, score=95.0, model_id="gpt-4o-mini"), trace=sample_result.trace, tool_sequence=[], output_hash="abc")}),
+        lambda test_cases, config, json_output, semantic_diff=False, timeout=30.0, skip_llm_judge=False, budget_tracker=None, limiter=None, incremental=None: ([("sample", _Diff())], [sample_result], None, {"sample": GoldenTrace(metadata=GoldenMetadata(test_name="sample", blessed_at=now, score=95.0, model_id="gpt-4o-mini"), trace=sample_result.trace, tool_sequence=[], output_hash="abc")}),
     )
     monkeypatch.setattr("evalview.commands.check_cmd._display_check_results", lambda *args, **kwargs: None)
     monkeypatch.setattr("evalview.commands.check_cmd._should_auto_generate_report", lambda **kwargs: False)
@@ -224,6 +224,168 @@ class TestConcurrentExecution:
         diff_names = [name for name, _ in diffs]
         assert "test-b" in diff_names, "test-b should still complete even though test-a failed"
 
+    def test_limiter_caps_concurrent_agent_calls(self, tmp_path, monkeypatch):
+        """No more than max_concurrency tests may be in flight at once."""
+        import asyncio as _asyncio
+        from evalview.commands.shared import _execute_check_tests
+        from evalview.core.config import EvalViewConfig
+        from evalview.core.loader import TestCaseLoader
+        from evalview.core.parallel import ConcurrencyLimiter
+
+        _write_config(tmp_path)
+        for i in range(6):
+            _write_test_yaml(tmp_path / "tests", f"test-{i}")
+            _write_golden(tmp_path, f"test-{i}")
+        monkeypatch.chdir(tmp_path)
+
+        fake_trace = _make_fake_trace()
+        in_flight = {"now": 0, "peak": 0}
+
+        async def _execute(query, context):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await _asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return fake_trace
+
+        mock_adapter = MagicMock()
+        mock_adapter.execute = _execute
+        mock_evaluator = MagicMock()
+        mock_evaluator.evaluate = AsyncMock(return_value=_make_fake_result("test-0"))
+
+        test_cases = TestCaseLoader().load_from_directory(str(tmp_path / "tests"))
+        config = EvalViewConfig(adapter="http", endpoint="http://example.com")
+
+        with (
+            patch("evalview.commands.shared._create_adapter", return_value=mock_adapter),
+            patch("evalview.evaluators.evaluator.Evaluator", return_value=mock_evaluator),
+        ):
+            diffs, _, _, _ = _execute_check_tests(
+                test_cases, config, json_output=True, limiter=ConcurrencyLimiter(2)
+            )
+
+        assert len(diffs) == 6
+        assert in_flight["peak"] == 2
+
+    def test_budgeted_run_is_concurrent_and_stops_at_limit(self, tmp_path, monkeypatch):
+        """--budget runs tests concurrently and skips pending ones once spent."""
+        import asyncio as _asyncio
+        from evalview.commands.shared import _execute_check_tests
+        from evalview.core.budget import BudgetTracker
+        from evalview.core.config import EvalViewConfig
+        from evalview.core.loader import TestCaseLoader
+        from evalview.core.parallel import ConcurrencyLimiter
+        from evalview.core.types import ExecutionTrace, ExecutionMetrics
+
+        costly_trace = ExecutionTrace(
+            session_id="s1",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            steps=[],
+            final_output="The answer is 42.",
+            metrics=ExecutionMetrics(total_cost=0.25, total_latency=100.0),
+        )
+
+        _write_config(tmp_path)
+        for i in range(8):
+            _write_test_yaml(tmp_path / "tests", f"test-{i}")
+            _write_golden(tmp_path, f"test-{i}", trace=costly_trace)
+        monkeypatch.chdir(tmp_path)
+        in_flight = {"now": 0, "peak": 0, "calls": 0}
+
+        async def _execute(query, context):
+            in_flight["now"] += 1
+            in_flight["calls"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await _asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return costly_trace
+
+        result = _make_fake_result("test-0")
+        result.trace = costly_trace
+        mock_adapter = MagicMock()
+        mock_adapter.execute = _execute
+        mock_evaluator = MagicMock()
+        mock_evaluator.evaluate = AsyncMock(return_value=result)
+
+        test_cases = TestCaseLoader().load_from_directory(str(tmp_path / "tests"))
+        config = EvalViewConfig(adapter="http", endpoint="http://example.com")
+        tracker = BudgetTracker(limit=1.0)
+
+        with (
+            patch("evalview.commands.shared._create_adapter", return_value=mock_adapter),
+            patch("evalview.evaluators.evaluator.Evaluator", return_value=mock_evaluator),
+        ):
+            diffs, _, _, _ = _execute_check_tests(
+                test_cases, config, json_output=True,
+                budget_tracker=tracker, limiter=ConcurrencyLimiter(8),
+            )
+
+        # Each baseline costs $0.25, so exactly four fit in the $1 budget:
+        # they run together, and the other four are never started.
+        assert in_flight["peak"] == 4
+        assert in_flight["calls"] == 4
+        assert len(diffs) == 4
+        assert tracker.halted
+        assert tracker.reserved == 0.0
+
+
+class TestStatisticalRepetitions:
+    """--statistical schedules every repetition at once under the limiter."""
+
+    def _run(self, tmp_path, monkeypatch, stop_rule=None, limit=4):
+        import asyncio as _asyncio
+        from evalview.commands.shared import _execute_check_tests
+        from evalview.core.config import EvalViewConfig
+        from evalview.core.loader import TestCaseLoader
+        from evalview.core.parallel import ConcurrencyLimiter
+
+        _write_config(tmp_path)
+        for name in ("test-a", "test-b"):
+            _write_test_yaml(tmp_path / "tests", name)
+            _write_golden(tmp_path, name)
+        monkeypatch.chdir(tmp_path)
+
+        fake_trace = _make_fake_trace()
+        in_flight = {"now": 0, "peak": 0, "calls": 0}
+
+        async def _execute(query, context):
+            in_flight["now"] += 1
+            in_flight["calls"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await _asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return fake_trace
+
+        mock_adapter = MagicMock()
+        mock_adapter.execute = _execute
+        mock_evaluator = MagicMock()
+        mock_evaluator.evaluate = AsyncMock(side_effect=lambda tc, trace: _make_fake_result(tc.name))
+
+        test_cases = TestCaseLoader().load_from_directory(str(tmp_path / "tests"))
+        config = EvalViewConfig(adapter="http", endpoint="http://example.com")
+        with (
+            patch("evalview.commands.shared._create_adapter", return_value=mock_adapter),
+            patch("evalview.evaluators.evaluator.Evaluator", return_value=mock_evaluator),
+        ):
+            _, results, _, _ = _execute_check_tests(
+                test_cases, config, json_output=True, limiter=ConcurrencyLimiter(limit),
+                repetitions=5, stop_rule=stop_rule,
+            )
+        return results, in_flight
+
+    def test_repetitions_run_concurrently(self, tmp_path, monkeypatch):
+        results, in_flight = self._run(tmp_path, monkeypatch)
+        assert sorted(r.test_case for r in results) == ["test-a"] * 5 + ["test-b"] * 5
+        assert in_flight["peak"] == 4
+
+    def test_stop_rule_skips_queued_repetitions(self, tmp_path, monkeypatch):
+        results, in_flight = self._run(
+            tmp_path, monkeypatch, stop_rule=lambda tc, so_far: len(so_far) >= 2, limit=1
+        )
+        assert sorted(r.test_case for r in results) == ["test-a"] * 2 + ["test-b"] * 2
+        assert in_flight["calls"] == 4
+
 
 class TestSlowAgentWarning:
     """Slow-agent warning fires once at 50% of timeout, respects --json mode."""
@@ -0,0 +1,232 @@
+"""Tests for the claim verdict cache and batched hallucination verification."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from evalview.core.claim_cache import ClaimVerdictCache
+from evalview.core.llm_provider import LLMProvider
+from evalview.core.types import (
+    ExecutionMetrics,
+    ExecutionTrace,
+    ExpectedBehavior,
+    StepMetrics,
+    StepTrace,
+    TestCase,
+    TestInput,
+    Thresholds,
+)
+from evalview.evaluators.hallucination_evaluator import HallucinationEvaluator
+
+
+def _case(query: str = "What is the weather?") -> TestCase:
+    return TestCase(
+        name="weather",
+        input=TestInput(query=query),
+        expected=ExpectedBehavior(),
+        thresholds=Thresholds(min_score=50.0),
+    )
+
+
+def _trace(output: str, tool_output: str = "Paris: 22C, sunny") -> ExecutionTrace:
+    return ExecutionTrace(
+        session_id="s1",
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+        steps=[
+            StepTrace(
+                step_id="1",
+                step_name="weather",
+                tool_name="get_weather",
+                parameters={"city": "Paris"},
+                output=tool_output,
+                success=True,
+                metrics=StepMetrics(latency=1.0, cost=0.0),
+            )
+        ],
+        final_output=output,
+        metrics=ExecutionMetrics(total_cost=0.0, total_latency=1.0),
+    )
+
+
+class _FakeJudge:
+    """Stands in for LLMClient.chat_completion; answers extraction and verification prompts."""
+
+    def __init__(self, claims_by_output):
+        self.claims_by_output = claims_by_output
+        self.extractions = 0
+        self.verifications = 0
+        self.batches = 0
+
+    async def __call__(self, system_prompt, user_prompt, **kwargs):
+        await asyncio.sleep(0)
+        if "extract factual claims" in system_prompt:
+            self.extractions += 1
+            for output, claims in self.claims_by_output.items():
+                if output in user_prompt:
+                    return {"claims": claims}
+            return {"claims": []}
+        if "=== Context" in user_prompt:
+            self.batches += 1
+            contexts = []
+            n = 1
+            while f"=== Context {n} ===" in user_prompt:
+                block = user_prompt.split(f"=== Context {n} ===")[1].split("=== Context")[0]
+                claims = [
+                    line.split(". ", 1)[1]
+                    for line in block.split("Claims to verify:")[1].strip().splitlines()
+                    if ". " in line and line[0].isdigit()
+                ]
+                contexts.append({"context": n, "verdicts": [self._verdict(c) for c in claims]})
+                n += 1
+            return {"contexts": contexts}
+        self.verifications += 1
+        claims = [
+            line.split(". ", 1)[1]
+            for line in user_prompt.split("Claims to verify:")[1].split("For each claim")[0].strip().splitlines()
+        ]
+        return {"verdicts": [self._verdict(c) for c in claims]}
+
+    @staticmethod
+    def _verdict(claim):
+        supported = "Tokyo" not in claim
+        return {"claim": claim, "supported": supported, "reason": "checked"}
+
+
+@pytest.fixture
+def openai_judge():
+    with patch("evalview.core.llm_provider.select_provider", return_value=(LLMProvider.OPENAI, "sk-test")):
+        yield
+
+
+class TestClaimVerdictCache:
+    def test_verdicts_keyed_on_claim_and_context(self):
+        cache = ClaimVerdictCache()
+        ctx = ClaimVerdictCache.hash_context("tool output")
+        cache.put_verdicts("m", ctx, [("Paris is sunny", {"supported": True, "reason": "ok"})])
+
+        assert cache.get_verdicts("m", ctx, ["Paris is sunny", "other"]) == [
+            {"supported": True, "reason": "ok"},
+            None,
+        ]
+        other_ctx = ClaimVerdictCache.hash_context("different output")
+        assert cache.get_verdicts("m", other_ctx, ["Paris is sunny"]) == [None]
+        assert cache.get_verdicts("other-model", ctx, ["Paris is sunny"]) == [None]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "claims.db")
+        ClaimVerdictCache(path).put_claims("m", "q", "answer", ["claim a"])
+        assert ClaimVerdictCache(path).get_claims("m", "q", "answer") == ["claim a"]
+
+    def test_expired_entries_miss(self, tmp_path):
+        path = str(tmp_path / "claims.db")
+        ClaimVerdictCache(path).put_claims("m", "q", "answer", ["claim a"])
+        with patch("evalview.core.claim_cache.time.time", return_value=2e10):
+            assert ClaimVerdictCache(path, ttl=60).get_claims("m", "q", "answer") is None
+
+
+class TestCachedHallucinationChecks:
+    @pytest.mark.asyncio
+    async def test_repeat_check_makes_no_judge_calls(self, openai_judge):
+        output = "Paris is 22C and sunny."
+        judge = _FakeJudge({output: ["Paris is 22C", "Paris is sunny"]})
+        evaluator = HallucinationEvaluator(cache=ClaimVerdictCache(), batch_verification=False)
+
+        with patch.object(evaluator.llm_client, "chat_completion", side_effect=judge.__call__):
+            first = await evaluator.evaluate(_case(), _trace(output))
+            second = await evaluator.evaluate(_case(), _trace(output))
+
+        assert first.details == second.details
+        assert (judge.extractions, judge.verifications) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_only_new_claims_are_verified(self, openai_judge):
+        judge = _FakeJudge({
+            "Paris is 22C.": ["Paris is 22C"],
+            "Paris is 22C and it is Tokyo.": ["Paris is 22C", "Tokyo is mentioned"],
+        })
+        evaluator = HallucinationEvaluator(cache=ClaimVerdictCache(), batch_verification=False)
+        verified = []
+        original = evaluator._request_verdicts
+
+        async def _spy(claims, tool_context):
+            verified.append(list(claims))
+            return await original(claims, tool_context)
+
+        with (
+            patch.object(evaluator.llm_client, "chat_completion", side_effect=judge.__call__),
+            patch.object(evaluator, "_request_verdicts", side_effect=_spy),
+        ):
+            await evaluator.evaluate(_case(), _trace("Paris is 22C."))
+            result = await evaluator.evaluate(_case(), _trace("Paris is 22C and it is Tokyo."))
+
+        assert verified == [["Paris is 22C"], ["Tokyo is mentioned"]]
+        assert result.has_hallucination is True
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_is_not_cached(self, openai_judge):
+        output = "Paris is 22C."
+        judge = _FakeJudge({output: ["Paris is 22C"]})
+        evaluator = HallucinationEvaluator(cache=ClaimVerdictCache(), batch_verification=False)
+
+        async def _flaky(system_prompt, user_prompt, **kwargs):
+            if "verify factual claims" in system_prompt and judge.verifications == 0:
+                judge.verifications += 1
+                raise RuntimeError("judge down")
+            return await judge(system_prompt, user_prompt, **kwargs)
+
+        with patch.object(evaluator.llm_client, "chat_completion", side_effect=_flaky):
+            await evaluator.evaluate(_case(), _trace(output))
+            await evaluator.evaluate(_case(), _trace(output))
+
+        assert judge.verifications == 2
+
+
+class TestBatchedVerification:
+    @pytest.mark.asyncio
+    async def test_concurrent_tests_share_one_request(self, openai_judge):
+        outputs = {
+            "Paris is 22C.": (["Paris is 22C"], "Paris: 22C"),
+            "Rome is 25C.": (["Rome is 25C"], "Rome: 25C"),
+            "It is Tokyo.": (["Tokyo is sunny"], "Tokyo: rain"),
+        }
+        judge = _FakeJudge({o: claims for o, (claims, _) in outputs.items()})
+        evaluator = HallucinationEvaluator(cache=ClaimVerdictCache(), batch_verification=True)
+
+        with patch.object(evaluator.llm_client, "chat_completion", side_effect=judge.__call__):
+            results = await asyncio.gather(
+                *(evaluator.evaluate(_case(), _trace(o, tool)) for o, (_, tool) in outputs.items())
+            )
+
+        assert (judge.batches, judge.verifications) == (1, 0)
+        assert [r.has_hallucination for r in results] == [False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_unanswered_context_is_verified_on_its_own(self, openai_judge):
+        judge = _FakeJudge({"Paris is 22C.": ["Paris is 22C"], "Rome is 25C.": ["Rome is 25C"]})
+        evaluator = HallucinationEvaluator(cache=ClaimVerdictCache(), batch_verification=True)
+
+        async def _partial(system_prompt, user_prompt, **kwargs):
+            result = await judge(system_prompt, user_prompt, **kwargs)
+            if "contexts" in result:
+                result["contexts"] = result["contexts"][:1]
+            return result
+
+        with patch.object(evaluator.llm_client, "chat_completion", side_effect=_partial):
+            results = await asyncio.gather(
+                evaluator.evaluate(_case(), _trace("Paris is 22C.", "Paris: 22C")),
+                evaluator.evaluate(_case(), _trace("Rome is 25C.", "Rome: 25C")),
+            )
+
+        assert (judge.batches, judge.verifications) == (1, 1)
+        assert all("1/1 claims verified" in r.details for r in results)
+
+    def test_not_used_for_providers_without_json_mode(self):
+        with patch(
+            "evalview.core.llm_provider.select_provider",
+            return_value=(LLMProvider.OLLAMA, "ollama"),
+        ):
+            evaluator = HallucinationEvaluator(model="llama3.2", batch_verification=True)
+        assert evaluator._batcher is None
@@ -0,0 +1,74 @@
+"""CLI startup cost: lazy command registration and an import-time budget."""
+
+import importlib
+import re
+import subprocess
+import sys
+
+import click
+import pytest
+
+from evalview.cli import _COMMANDS, main
+
+# `import evalview.cli` took ~850ms when every command module was imported
+# eagerly; with lazy registration it is ~60ms. The budget leaves room for
+# slow CI machines while still catching a heavy import creeping back in.
+_IMPORT_BUDGET_MS = 250
+
+_HEAVY_MODULES = ("rich", "httpx", "pydantic", "yaml", "openai", "anthropic")
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, timeout=60
+    )
+
+
+@pytest.mark.parametrize("entry", _COMMANDS, ids=lambda e: e.name)
+def test_registry_matches_command(entry):
+    module = importlib.import_module(f"evalview.commands.{entry.module}")
+    command = getattr(module, entry.attr)
+    assert isinstance(command, click.Command)
+    assert entry.summary == command.get_short_help_str(limit=10_000)
+    assert entry.hidden == command.hidden
+
+
+def test_version_imports_no_command_modules():
+    proc = _run_python(
+        "import sys\n"
+        "from evalview.cli import main\n"
+        "try:\n"
+        "    main(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"heavy = {_HEAVY_MODULES!r}\n"
+        "print(sorted(m for m in sys.modules\n"
+        "             if m.split('.')[0] in heavy or m.startswith('evalview.commands')))\n"
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_cli_import_time_budget():
+    proc = _run_python("import evalview.cli", "-X", "importtime")
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| evalview\.cli$", proc.stderr, re.M)
+    assert match, proc.stderr[-2000:]
+    cumulative_ms = int(match.group(1)) / 1000
+    assert cumulative_ms < _IMPORT_BUDGET_MS, (
+        f"`import evalview.cli` took {cumulative_ms:.0f}ms (budget {_IMPORT_BUDGET_MS}ms); "
+        "run `python -X importtime -c 'import evalview.cli'` to find the new import"
+    )
+
+
+def test_subcommand_is_loaded_on_first_lookup():
+    ctx = click.Context(main)
+    assert "check" in main.list_commands(ctx)
+    command = main.get_command(ctx, "check")
+    assert command is not None and command.name == "check"
+    assert main.get_command(ctx, "no-such-command") is None
+
+
+def test_all_lists_every_lazy_export():
+    import evalview
+
+    assert sorted(evalview.__all__) == sorted(["__version__", *evalview._LAZY_EXPORTS])
@@ -576,3 +576,65 @@ class TestEdgeCases:
         # Should detect value change
         assert len(diffs) == 1
         assert diffs[0].diff_type == "value_changed"
+
+
+class TestOutputComparisonTiers:
+    """Tiered output comparison: exact match short-circuit, full matcher."""
+
+    @pytest.fixture
+    def diff_engine(self):
+        """Create a diff engine."""
+        return DiffEngine()
+
+    def test_identical_outputs_skip_matcher(self, diff_engine, monkeypatch):
+        """Byte-identical outputs never reach SequenceMatcher."""
+        monkeypatch.setattr(
+            "evalview.core.similarity.SequenceMatcher",
+            lambda *a, **k: pytest.fail("matcher should not run"),
+        )
+        od = diff_engine._compare_outputs("same output" * 100, "same output" * 100)
+
+        assert od.similarity == 1.0
+        assert list(od.diff_lines) == []
+
+    def test_divergent_outputs_report_exact_ratio(self, diff_engine):
+        """Regressed outputs carry the real ratio, not a cheap upper bound."""
+        from difflib import SequenceMatcher
+
+        golden = "short answer"
+        actual = "x" * 5000
+        od = diff_engine._compare_outputs(golden, actual)
+
+        assert od.similarity == SequenceMatcher(None, golden, actual).ratio()
+        assert od.severity == DiffStatus.REGRESSION
+
+    def test_close_outputs_use_exact_ratio(self, diff_engine):
+        """Near-identical outputs still get the exact SequenceMatcher ratio."""
+        from difflib import SequenceMatcher
+
+        golden = "The weather in Paris is sunny and 22 degrees."
+        actual = "The weather in Paris is sunny and 23 degrees."
+        od = diff_engine._compare_outputs(golden, actual)
+
+        assert od.similarity == SequenceMatcher(None, golden, actual).ratio()
+
+    def test_diff_lines_computed_lazily(self, diff_engine, monkeypatch):
+        """The unified diff is only built when a reporter reads it."""
+        calls = []
+        import evalview.core.diff as diff_module
+
+        real_unified_diff = diff_module.unified_diff
+
+        def _counting_unified_diff(*args, **kwargs):
+            calls.append(1)
+            return real_unified_diff(*args, **kwargs)
+
+        monkeypatch.setattr(diff_module, "unified_diff", _counting_unified_diff)
+        od = diff_engine._compare_outputs("line one\nline two\n", "line one\nline 2\n")
+        assert calls == []
+
+        lines = list(od.diff_lines)
+        assert "-line two\n" in lines
+        assert "+line 2\n" in lines
+        assert od.diff_lines[:1] == lines[:1]
+        assert len(calls) == 1
@@ -239,3 +239,64 @@ class TestPruning:
         with open(tracker.history_path) as f:
             lines = [line for line in f.readlines() if line.strip()]
         assert len(lines) == 10
+
+
+class TestBatchedWrites:
+    """Tests for DriftTracker.batch() run-scoped writes."""
+
+    @pytest.fixture
+    def tmp_dir(self):
+        d = tempfile.mkdtemp()
+        yield Path(d)
+        shutil.rmtree(d)
+
+    def test_batch_defers_writes_until_exit(self, tmp_dir):
+        from evalview.core.drift_tracker import DriftTracker
+        tracker = DriftTracker(base_path=tmp_dir)
+        with tracker.batch():
+            tracker.record_check("a", _make_diff(0.95))
+            tracker.record_check("b", _make_diff(0.93))
+            assert not tracker.history_path.exists()
+        assert len(tracker.history_path.read_text().splitlines()) == 2
+
+    def test_batch_flushes_on_error(self, tmp_dir):
+        from evalview.core.drift_tracker import DriftTracker
+        tracker = DriftTracker(base_path=tmp_dir)
+        with pytest.raises(RuntimeError):
+            with tracker.batch():
+                tracker.record_check("a", _make_diff(0.95))
+                raise RuntimeError("boom")
+        assert len(tracker.get_test_history("a")) == 1
+
+    def test_unterminated_line_is_not_merged(self, tmp_dir):
+        from evalview.core.drift_tracker import DriftTracker
+        tracker = DriftTracker(base_path=tmp_dir)
+        tracker.history_path.parent.mkdir(parents=True)
+        tracker.history_path.write_text('{"ts": "2026-01-01T00:00:00", "test": "a"')
+        with tracker.batch():
+            tracker.record_check("a", _make_diff(0.9))
+        history = tracker.get_test_history("a")
+        assert len(history) == 1
+        assert history[0]["output_similarity"] == 0.9
+
+    def test_concurrent_writers_do_not_lose_entries(self, tmp_dir):
+        import threading
+
+        from evalview.core.drift_tracker import DriftTracker
+
+        def _writer(name: str) -> None:
+            tracker = DriftTracker(base_path=tmp_dir)
+            for _ in range(5):
+                with tracker.batch():
+                    for _ in range(4):
+                        tracker.record_check(name, _make_diff(0.9))
+
+        threads = [threading.Thread(target=_writer, args=(f"t{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        tracker = DriftTracker(base_path=tmp_dir)
+        for i in range(4):
+            assert len(tracker.get_test_history(f"t{i}", limit=100)) == 20
@@ -0,0 +1,33 @@
+"""Tests for the embedding cache."""
+
+from evalview.core.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    def test_miss_then_hit(self):
+        cache = EmbeddingCache()
+        assert cache.get_many("m", ["hello"]) == [None]
+        cache.put_many("m", [("hello", [0.1, 0.2])])
+        assert cache.get_many("m", ["hello"]) == [[0.1, 0.2]]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_keyed_on_model(self):
+        cache = EmbeddingCache()
+        cache.put_many("model-a", [("hello", [1.0])])
+        assert cache.get_many("model-b", ["hello"]) == [None]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "nested" / "embeddings.db"
+        EmbeddingCache(path).put_many("m", [("golden", [0.25, -1.5, 3.0])])
+
+        fresh = EmbeddingCache(path)
+        assert fresh.get_many("m", ["golden", "other"]) == [[0.25, -1.5, 3.0], None]
+
+    def test_unwritable_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        cache = EmbeddingCache(blocker / "sub" / "embeddings.db")
+        assert cache.persist_path is None
+        cache.put_many("m", [("a", [1.0])])
+        assert cache.get_many("m", ["a"]) == [[1.0]]
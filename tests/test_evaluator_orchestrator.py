@@ -1,5 +1,7 @@
 """Tests for the Evaluator orchestrator (evalview.evaluators.evaluator)."""
 
+import asyncio
+
 import pytest
 from datetime import datetime
 from unittest.mock import patch
@@ -17,6 +19,8 @@ from evalview.core.types import (
     StepMetrics,
     ExpectedOutput,
     ChecksConfig,
+    HallucinationEvaluation,
+    SafetyEvaluation,
 )
 from evalview.core.config import ScoringWeights
 from evalview.evaluators.evaluator import Evaluator
@@ -265,6 +269,67 @@ class TestCheckGating:
         assert result.evaluations.pii is None
 
 
+class _SlowJudge:
+    """Fake LLM evaluator that records how many judges overlap."""
+
+    def __init__(self, result, tracker, delay: float = 0.05):
+        self.result = result
+        self.tracker = tracker
+        self.delay = delay
+
+    async def evaluate(self, test_case, trace):
+        self.tracker["active"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        await asyncio.sleep(self.delay)
+        self.tracker["active"] -= 1
+        return self.result
+
+
+def _judged_evaluator():
+    """Evaluator whose three LLM judges are slow fakes."""
+    ev = Evaluator(skip_llm_judge=True)
+    tracker = {"active": 0, "peak": 0}
+    tc = _make_test_case()
+    trace = _make_trace()
+    ev.skip_llm_judge = False
+    ev.output_evaluator = _SlowJudge(ev._deterministic_output_eval(tc, trace), tracker)
+    ev.hallucination_evaluator = _SlowJudge(
+        HallucinationEvaluation(has_hallucination=False, confidence=0.9, details="ok", passed=True),
+        tracker,
+    )
+    ev.safety_evaluator = _SlowJudge(
+        SafetyEvaluation(is_safe=True, severity="safe", details="ok", passed=True), tracker
+    )
+    return ev, tracker
+
+
+class TestConcurrentJudges:
+    """LLM judges fan out concurrently; the judge dispatcher caps requests."""
+
+    @pytest.mark.asyncio
+    async def test_judges_run_concurrently(self):
+        ev, tracker = _judged_evaluator()
+        result = await ev.evaluate(_make_test_case(), _make_trace())
+        assert tracker["peak"] == 3
+        assert result.evaluations.hallucination.passed is True
+        assert result.evaluations.safety.passed is True
+
+    @pytest.mark.asyncio
+    async def test_timing_breakdown_attached(self):
+        ev, _ = _judged_evaluator()
+        tc = _make_test_case(checks=ChecksConfig(pii=True))
+        result = await ev.evaluate(tc, _make_trace())
+        timings = result.evaluator_timings_ms
+        assert set(timings) == {"output_quality", "hallucination", "safety", "pii"}
+        assert timings["output_quality"] >= 40
+
+    @pytest.mark.asyncio
+    async def test_deterministic_mode_has_no_judge_timings(self):
+        ev = Evaluator(skip_llm_judge=True)
+        result = await ev.evaluate(_make_test_case(), _make_trace())
+        assert result.evaluator_timings_ms is None
+
+
 class TestRegexSafety:
     """Tests for regex ReDoS protection."""
 
@@ -3,17 +3,23 @@
 Two layers:
 
 1. ``evalview.core.fleet`` — pure rollup math (per-instance summarize,
-   anomaly detection, fleet-wide failure detection).
+   anomaly detection, fleet-wide failure detection) and the streaming,
+   checkpointed scan behind ``build_fleet_report``.
 2. ``evalview.commands.fleet_cmd`` — CLI wiring via ``CliRunner``.
 """
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List
+from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
+from evalview.core import fleet
+
 from evalview.commands.fleet_cmd import fleet_cmd
 from evalview.core.fleet import (
     DEFAULT_ANOMALY_SIGMA,
@@ -24,6 +30,7 @@ from evalview.core.fleet import (
     detect_fleet_wide_failures,
     discover_history_files,
     load_history,
+    parse_since,
     summarize_instance,
 )
 
@@ -330,6 +337,11 @@ class TestCoefficientOfVariation:
 
 
 class TestFleetCommand:
+    @pytest.fixture(autouse=True)
+    def _outside_project(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        # The command checkpoints into ./.evalview when it exists.
+        monkeypatch.chdir(tmp_path)
+
     def test_runs_against_directory(self, tmp_path: Path) -> None:
         for name in ("monitor-a", "monitor-b", "monitor-c"):
             _write_history(
@@ -397,3 +409,159 @@ class TestFleetCommand:
         assert result.exit_code == 0, result.output
         # No "Per-instance" table when --anomalies-only is set.
         assert "Per-instance" not in result.output
+
+    def test_since_limits_the_window(self, tmp_path: Path) -> None:
+        _write_history(
+            tmp_path / "monitor-a.jsonl",
+            [
+                _cycle_record(timestamp="2020-01-01T00:00:00Z", regressions=1, passed=9),
+                _cycle_record(timestamp="2999-01-01T00:00:00Z"),
+            ],
+        )
+        runner = CliRunner()
+        result = runner.invoke(
+            fleet_cmd, ["--dir", str(tmp_path), "--since", "7d", "--json"]
+        )
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.output[result.output.index("{") :])
+        assert payload["fleet_cycles"] == 1
+        assert payload["fleet_regressions"] == 0
+        assert payload["since"]
+
+    def test_bad_since_is_a_usage_error(self, tmp_path: Path) -> None:
+        runner = CliRunner()
+        result = runner.invoke(fleet_cmd, ["--dir", str(tmp_path), "--since", "soon"])
+        assert result.exit_code == 2
+        assert "--since" in result.output
+
+
+# ---------------------------------------------------------------------------
+# Streaming scan, checkpoints and --since
+# ---------------------------------------------------------------------------
+
+
+def _day(n: int) -> str:
+    return (datetime(2026, 4, 1, tzinfo=timezone.utc) + timedelta(days=n)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def _append(path: Path, records: List[Dict[str, Any]], *, newline: bool = True) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        for i, r in enumerate(records):
+            last = i == len(records) - 1
+            f.write(json.dumps(r) + ("\n" if newline or not last else ""))
+
+
+class TestStreamingScan:
+    def test_matches_in_memory_rollup(self, tmp_path: Path) -> None:
+        records = [
+            _cycle_record(cycle=i, passed=10 - i % 3, regressions=i % 3, cost=0.01 * i,
+                          timestamp=_day(i), failing_tests=[f"t{i % 4}"] if i % 3 else [])
+            for i in range(1, 40)
+        ]
+        path = tmp_path / "monitor-a.jsonl"
+        _write_history(path, records)
+        report = build_fleet_report([path])
+        expected = summarize_instance("a", records)
+        assert report.instances == (expected,)
+        assert expected.cycle_cost_p50 == pytest.approx(0.20)
+        assert 0.37 < expected.cycle_cost_p95 < 0.39
+
+    def test_reservoir_is_bounded(self) -> None:
+        records = [_cycle_record(cost=float(i % 100)) for i in range(5000)]
+        acc = fleet._InstanceAccumulator()
+        for r in records:
+            acc.add(r)
+        assert acc.cycles == 5000
+        assert len(acc.cost_samples) == fleet._RESERVOIR_SIZE
+        assert 40 <= acc.summary("a").cycle_cost_p50 <= 60
+
+    def test_rerun_reads_only_appended_cycles(self, tmp_path: Path) -> None:
+        path = tmp_path / "monitor-a.jsonl"
+        checkpoint = tmp_path / "ckpt.json"
+        _write_history(path, [_cycle_record(cycle=i) for i in range(1, 21)])
+        first = build_fleet_report([path], checkpoint_path=checkpoint)
+        assert first.fleet_cycles == 20
+
+        _append(path, [_cycle_record(cycle=21, regressions=1, passed=9, failing_tests=["x"])])
+        with patch.object(fleet, "_parse_line", wraps=fleet._parse_line) as parse:
+            second = build_fleet_report([path], checkpoint_path=checkpoint)
+        assert parse.call_count == 1
+        assert second.to_dict() == build_fleet_report([path]).to_dict()
+        assert second.instances[0].failing_tests == ("x",)
+
+    def test_partial_last_line_is_not_double_counted(self, tmp_path: Path) -> None:
+        path = tmp_path / "monitor-a.jsonl"
+        checkpoint = tmp_path / "ckpt.json"
+        _append(path, [_cycle_record(cycle=1), _cycle_record(cycle=2)], newline=False)
+        assert build_fleet_report([path], checkpoint_path=checkpoint).fleet_cycles == 2
+
+        with path.open("a", encoding="utf-8") as f:
+            f.write("\n")  # the writer finishes cycle 2
+        _append(path, [_cycle_record(cycle=3)])
+        assert build_fleet_report([path], checkpoint_path=checkpoint).fleet_cycles == 3
+
+    def test_rewritten_file_is_rescanned(self, tmp_path: Path) -> None:
+        path = tmp_path / "monitor-a.jsonl"
+        checkpoint = tmp_path / "ckpt.json"
+        _write_history(path, [_cycle_record(cycle=i) for i in range(1, 6)])
+        build_fleet_report([path], checkpoint_path=checkpoint)
+
+        _write_history(path, [_cycle_record(cycle=1, regressions=1, passed=9)])
+        report = build_fleet_report([path], checkpoint_path=checkpoint)
+        assert report.fleet_cycles == 1
+        assert report.fleet_regressions == 1
+
+    def test_since_window_with_seek_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(fleet, "_INDEX_STRIDE_BYTES", 256)
+        path = tmp_path / "monitor-a.jsonl"
+        checkpoint = tmp_path / "ckpt.json"
+        records = [
+            _cycle_record(cycle=i, timestamp=_day(i), regressions=int(i < 20), passed=10 - int(i < 20))
+            for i in range(40)
+        ]
+        _write_history(path, records)
+        build_fleet_report([path], checkpoint_path=checkpoint)  # builds the index
+        assert len(json.loads(checkpoint.read_text())["files"][str(path.resolve())]["index"]) > 5
+
+        since = datetime.fromisoformat(_day(25)[:-1] + "+00:00")
+        with patch.object(fleet, "_parse_line", wraps=fleet._parse_line) as parse:
+            report = build_fleet_report([path], since=since, checkpoint_path=checkpoint)
+        assert parse.call_count < 25
+        assert report.fleet_cycles == 15
+        assert report.fleet_regressions == 0
+        assert report.instances[0].first_seen == _day(25)
+        assert report.since == since.isoformat()
+
+    def test_parallel_scan_matches_serial(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ("a", "b", "c"):
+            _write_history(
+                tmp_path / f"monitor-{name}.jsonl",
+                [_cycle_record(cycle=i, passed=9, regressions=1, failing_tests=[name]) for i in range(50)],
+            )
+        files = sorted(tmp_path.glob("*.jsonl"))
+        serial = build_fleet_report(files)
+        monkeypatch.setattr(fleet, "_PARALLEL_MIN_BYTES", 0)
+        assert build_fleet_report(files).to_dict() == serial.to_dict()
+
+
+class TestParseSince:
+    NOW = datetime(2026, 4, 14, 12, 0, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("12h", datetime(2026, 4, 14, 0, 0, tzinfo=timezone.utc)),
+            ("7d", datetime(2026, 4, 7, 12, 0, tzinfo=timezone.utc)),
+            ("yesterday", datetime(2026, 4, 13, 12, 0, tzinfo=timezone.utc)),
+            ("2026-04-01", datetime(2026, 4, 1, tzinfo=timezone.utc)),
+            ("2026-04-01T06:30:00Z", datetime(2026, 4, 1, 6, 30, tzinfo=timezone.utc)),
+        ],
+    )
+    def test_accepted_forms(self, raw: str, expected: datetime) -> None:
+        assert parse_since(raw, now=self.NOW) == expected
+
+    def test_rejects_garbage(self) -> None:
+        with pytest.raises(ValueError):
+            parse_since("last tuesday", now=self.NOW)
@@ -1,5 +1,7 @@
 """Unit tests for golden trace storage and variant management."""
 
+import json
+import os
 import tempfile
 import shutil
 from pathlib import Path
@@ -525,3 +527,179 @@ class TestGoldenEdgeCases:
         golden = store.load_golden("test")
 
         assert golden.tool_sequence == ["search", "analyze"]
+
+
+class TestGoldenIndex:
+    """Test the on-disk metadata index behind listing and variant lookup."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        tmpdir = tempfile.mkdtemp()
+        yield Path(tmpdir)
+        shutil.rmtree(tmpdir)
+
+    @pytest.fixture
+    def sample_result(self):
+        """Create a sample evaluation result for testing."""
+        trace = ExecutionTrace(
+            session_id="test-session",
+            steps=[
+                StepTrace(
+                    step_id="step-1",
+                    step_name="search",
+                    tool_name="search",
+                    parameters={"query": "test"},
+                    output="result",
+                    success=True,
+                    start_time=datetime.now(),
+                    end_time=datetime.now(),
+                    metrics=StepMetrics(cost=0.01, latency=50)
+                )
+            ],
+            final_output="Final result",
+            metrics=ExecutionMetrics(total_cost=0.25, total_latency=100),
+            start_time=datetime.now(),
+            end_time=datetime.now()
+        )
+
+        return EvaluationResult(
+            test_case="test-indexed",
+            trace=trace,
+            score=85.0,
+            passed=True,
+            evaluations=create_sample_evaluations(),
+            timestamp=datetime.now()
+        )
+
+    def test_save_writes_index_entry(self, temp_dir, sample_result):
+        """Saving a golden records its metadata in the index file."""
+        store = GoldenStore(temp_dir)
+        store.save_golden(sample_result)
+        store.save_golden(sample_result, variant_name="alt")
+
+        assert store.index_path.exists()
+        entries = store.list_variant_entries("test-indexed")
+        assert [e.variant for e in entries] == [None, "alt"]
+        assert entries[0].tool_sequence == ["search"]
+        assert entries[0].total_cost == 0.25
+        assert entries[0].output_hash == store._hash_output("Final result")
+
+    def test_listing_does_not_parse_traces(self, temp_dir, sample_result, monkeypatch):
+        """A fresh store lists goldens from the index without loading any trace."""
+        GoldenStore(temp_dir).save_golden(sample_result)
+
+        store = GoldenStore(temp_dir)
+        monkeypatch.setattr(
+            GoldenStore, "_build_entry", lambda *a, **k: pytest.fail("golden re-parsed")
+        )
+        assert [g.test_name for g in store.list_golden()] == ["test-indexed"]
+        assert store.count_variants("test-indexed") == 1
+
+    def test_delete_removes_index_entry(self, temp_dir, sample_result):
+        """Deleting a golden drops it from the index."""
+        store = GoldenStore(temp_dir)
+        store.save_golden(sample_result)
+        store.delete_golden("test-indexed")
+
+        assert store.list_golden() == []
+        assert GoldenStore(temp_dir).list_golden() == []
+
+    def test_external_changes_are_reindexed(self, temp_dir, sample_result):
+        """Goldens added or removed outside the store are picked up."""
+        store = GoldenStore(temp_dir)
+        path = store.save_golden(sample_result)
+        copy = store.golden_dir / "copied.golden.json"
+        shutil.copy(path, copy)
+
+        fresh = GoldenStore(temp_dir)
+        assert len(fresh.list_golden()) == 2
+
+        copy.unlink()
+        assert len(GoldenStore(temp_dir).list_golden()) == 1
+
+    def test_stale_index_file_is_repaired(self, temp_dir, sample_result):
+        """An index pointing at a missing file doesn't surface phantom goldens."""
+        store = GoldenStore(temp_dir)
+        path = store.save_golden(sample_result)
+        path.unlink()
+
+        assert GoldenStore(temp_dir).list_golden() == []
+        assert GoldenStore(temp_dir).load_all_golden_variants("test-indexed") == []
+
+    def test_in_place_edits_are_reindexed_by_a_live_store(self, temp_dir, sample_result):
+        """Editing a golden in place is seen without a new store."""
+        store = GoldenStore(temp_dir)
+        path = store.save_golden(sample_result)
+        assert store.list_golden()[0].score == 85.0
+
+        data = json.loads(path.read_text())
+        data["metadata"]["score"] = 42.0
+        path.write_text(json.dumps(data, default=str))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert store.list_golden()[0].score == 42.0
+
+    def test_in_place_edit_seen_by_variant_lookup(self, temp_dir, sample_result):
+        """Per-test lookups re-stat that test's own files."""
+        store = GoldenStore(temp_dir)
+        path = store.save_golden(sample_result)
+        assert store.list_variant_entries("test-indexed")[0].metadata.score == 85.0
+
+        data = json.loads(path.read_text())
+        data["metadata"]["score"] = 42.0
+        path.write_text(json.dumps(data, default=str))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert store.list_variant_entries("test-indexed")[0].metadata.score == 42.0
+        path.unlink()
+        assert store.list_variant_entries("test-indexed") == []
+
+    def test_per_test_lookups_scan_the_directory_once(self, temp_dir, sample_result, monkeypatch):
+        """A check's per-test lookups cost O(that test's goldens), not O(all goldens)."""
+        import evalview.core.golden as golden_module
+
+        store = GoldenStore(temp_dir)
+        names = [f"test-{i}" for i in range(50)]
+        for name in names:
+            store.save_golden(sample_result.model_copy(update={"test_case": name}))
+        store.save_golden(
+            sample_result.model_copy(update={"test_case": "test-0"}), variant_name="alt"
+        )
+
+        scans = []
+        real_scandir = golden_module.os.scandir
+        monkeypatch.setattr(
+            golden_module.os, "scandir", lambda p: scans.append(p) or real_scandir(p)
+        )
+        stats = []
+        real_stat = Path.stat
+        monkeypatch.setattr(
+            Path, "stat", lambda self, **kw: stats.append(self) or real_stat(self, **kw)
+        )
+
+        fresh = GoldenStore(temp_dir)
+        counts = [len(fresh.list_variant_entries(name)) for name in names]
+
+        assert counts == [2] + [1] * 49
+        assert len(scans) == 1
+        # One stat per golden file, plus the directory and index checks.
+        assert len(stats) <= len(names) + 5
+
+    def test_index_follows_golden_dir(self, temp_dir):
+        """Pointing a store at another golden dir moves its index too."""
+        store = GoldenStore()
+        store.golden_dir = temp_dir / "golden"
+        assert store.index_path == temp_dir / "golden_index.json"
+
+    def test_load_entry_returns_full_trace(self, temp_dir, sample_result):
+        """Full traces load lazily from an index entry."""
+        store = GoldenStore(temp_dir)
+        store.save_golden(sample_result)
+
+        entry = store.list_variant_entries("test-indexed")[0]
+        golden = store.load_entry(entry)
+        assert golden is not None
+        assert golden.trace.final_output == "Final result"
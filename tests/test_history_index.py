@@ -0,0 +1,96 @@
+"""Tests for the drift history offset index (evalview/core/history_index.py)."""
+
+import json
+from pathlib import Path
+
+from evalview.core.drift_tracker import DriftTracker
+from evalview.core.history_index import HistoryIndex, scan_history
+
+
+def _entry(test: str, i: int, status: str = "passed") -> dict:
+    return {
+        "ts": f"2026-01-01T10:{i // 60:02d}:{i % 60:02d}",
+        "test": test,
+        "status": status,
+        "score_diff": float(i),
+    }
+
+
+def _append(path: Path, *entries: dict) -> None:
+    with open(path, "a") as f:
+        for e in entries:
+            f.write(json.dumps(e) + "\n")
+
+
+def test_recent_returns_newest_oldest_first(tmp_path):
+    path = tmp_path / "history.jsonl"
+    _append(path, *[_entry("a" if i % 2 else "b", i) for i in range(10)])
+
+    recent = HistoryIndex(path).recent("a", 3)
+    assert [e["score_diff"] for e in recent] == [5.0, 7.0, 9.0]
+
+
+def test_appends_are_indexed_incrementally(tmp_path):
+    path = tmp_path / "history.jsonl"
+    index = HistoryIndex(path)
+    _append(path, _entry("a", 0))
+    assert index.count() == 1
+
+    _append(path, _entry("a", 1), _entry("b", 2))
+    assert index.count() == 3
+    assert [e["score_diff"] for e in index.recent("a", 10)] == [0.0, 1.0]
+
+
+def test_partial_trailing_line_is_not_indexed(tmp_path):
+    path = tmp_path / "history.jsonl"
+    _append(path, _entry("a", 0))
+    with open(path, "a") as f:
+        f.write('{"ts": "2026-01-01T11:00:00", "test": "a"')
+    index = HistoryIndex(path)
+    assert index.count() == 1
+
+    with open(path, "a") as f:
+        f.write(', "status": "passed"}\n')
+    assert index.count() == 2
+
+
+def test_external_rewrite_triggers_rebuild(tmp_path):
+    path = tmp_path / "history.jsonl"
+    _append(path, *[_entry("a", i) for i in range(5)])
+    index = HistoryIndex(path)
+    assert index.count() == 5
+
+    path.write_text(json.dumps(_entry("z", 42)) + "\n")
+    assert index.count() == 1
+    assert index.recent("z", 5)[0]["score_diff"] == 42.0
+    assert index.recent("a", 5) == []
+
+
+def test_since_ts_filters_entries(tmp_path):
+    path = tmp_path / "history.jsonl"
+    _append(path, *[_entry("a", i) for i in range(5)])
+    got = HistoryIndex(path).entries(since_ts="2026-01-01T10:00:03")
+    assert [e["score_diff"] for e in got] == [3.0, 4.0]
+
+
+def test_prune_keeps_newest_and_shifts_offsets(tmp_path):
+    path = tmp_path / "history.jsonl"
+    _append(path, *[_entry("a", i) for i in range(10)])
+    index = HistoryIndex(path)
+
+    assert index.prune(4) == 6
+    assert [e["score_diff"] for e in scan_history(path)] == [6.0, 7.0, 8.0, 9.0]
+    assert [e["score_diff"] for e in index.recent("a", 2)] == [8.0, 9.0]
+
+    _append(path, _entry("a", 10))
+    assert [e["score_diff"] for e in index.recent("a", 2)] == [9.0, 10.0]
+
+
+def test_drift_tracker_reads_through_index(tmp_path):
+    path = tmp_path / ".evalview" / "history.jsonl"
+    path.parent.mkdir()
+    _append(path, *[_entry("a", i, "passed" if i < 5 else "regression") for i in range(8)])
+
+    tracker = DriftTracker(base_path=tmp_path)
+    assert [e["score_diff"] for e in tracker._load_recent("a", 3)] == [5.0, 6.0, 7.0]
+    assert (tmp_path / ".evalview" / "history.idx.db").exists()
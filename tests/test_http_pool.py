@@ -0,0 +1,166 @@
+"""Tests for the shared HTTP client pool used by agent adapters."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from evalview.core.http_pool import HTTPClientPool, PoolStats, _origin
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # noqa: N802 - http.server API
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps({"response": "ok", "cookie": self.headers.get("Cookie")}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def agent_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/execute"
+    server.shutdown()
+    server.server_close()
+
+
+def _pool() -> HTTPClientPool:
+    return HTTPClientPool(http2=False)
+
+
+class TestHTTPClientPool:
+    """Client sharing and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_session_shares_client_per_origin(self):
+        pool = _pool()
+        async with pool.session():
+            async with pool.client("http://agent.local:8000/a") as first:
+                pass
+            async with pool.client("http://agent.local:8000/b") as second:
+                pass
+            async with pool.client("http://other.local:8000/a") as other:
+                pass
+            assert first is second
+            assert first is not other
+            assert not first.is_closed
+        assert first.is_closed
+        assert other.is_closed
+
+    @pytest.mark.asyncio
+    async def test_outside_session_client_is_per_call(self):
+        pool = _pool()
+        async with pool.client("http://agent.local:8000") as first:
+            pass
+        async with pool.client("http://agent.local:8000") as second:
+            pass
+        assert first is not second
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_nested_sessions_close_on_outermost_exit(self):
+        pool = _pool()
+        async with pool.session():
+            async with pool.session():
+                async with pool.client("http://agent.local:8000") as client:
+                    pass
+            assert pool.is_active()
+            assert not client.is_closed
+        assert not pool.is_active()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_hooks_run_on_outermost_exit(self):
+        pool = _pool()
+        calls = []
+
+        async def _hook():
+            calls.append("closed")
+
+        pool.add_close_hook(_hook)
+        pool.add_close_hook(_hook)
+        async with pool.session():
+            async with pool.session():
+                pass
+            assert calls == []
+        assert calls == ["closed"]
+
+    def test_sessions_are_per_event_loop(self):
+        pool = _pool()
+
+        async def _use():
+            async with pool.session():
+                async with pool.client("http://agent.local:8000") as client:
+                    return client
+
+        first = asyncio.run(_use())
+        second = asyncio.run(_use())
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+
+class TestPoolStats:
+    """Connection reuse accounting against a real keep-alive server."""
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_connections(self, agent_url):
+        pool = _pool()
+        async with pool.session():
+            for _ in range(5):
+                async with pool.client(agent_url, timeout=5.0) as client:
+                    response = await client.post(agent_url, json={"query": "hi"})
+                    assert response.json()["response"] == "ok"
+
+        stats = pool.stats
+        assert stats.requests == 5
+        assert stats.connections_opened == 1
+        assert stats.reused == 4
+        assert pool.stats_by_origin()[_origin(agent_url)].requests == 5
+
+    @pytest.mark.asyncio
+    async def test_per_call_clients_open_a_connection_each(self, agent_url):
+        pool = _pool()
+        for _ in range(3):
+            async with pool.client(agent_url, timeout=5.0) as client:
+                await client.post(agent_url, json={})
+
+        assert pool.stats.connections_opened == 3
+        assert pool.stats.reuse_rate == 0.0
+
+    @pytest.mark.asyncio
+    async def test_pooled_clients_do_not_carry_cookies_between_tests(self, agent_url):
+        pool = _pool()
+        async with pool.session():
+            for _ in range(2):
+                async with pool.client(agent_url, timeout=5.0) as client:
+                    response = await client.post(agent_url, json={})
+                    assert response.json()["cookie"] is None
+                    assert not client.cookies
+
+    def test_reuse_rate_and_dict(self):
+        stats = PoolStats(requests=4, connections_opened=1)
+        assert stats.to_dict() == {
+            "requests": 4,
+            "connections_opened": 1,
+            "reused": 3,
+            "reuse_rate": 0.75,
+        }
+
+
+def test_origin_normalises_default_ports():
+    assert _origin("https://api.example.com/v1/run") == "https://api.example.com:443"
+    assert _origin("http://localhost:8000/execute") == "http://localhost:8000"
@@ -0,0 +1,195 @@
+"""Tests for incremental check mode (evalview/core/incremental.py)."""
+
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import yaml
+
+from evalview.core.config import EvalViewConfig
+from evalview.core.incremental import IncrementalCheckCache, _code_fingerprint
+from evalview.core.types import (
+    ContainsChecks,
+    CostEvaluation,
+    EvaluationResult,
+    Evaluations,
+    ExecutionMetrics,
+    ExecutionTrace,
+    LatencyEvaluation,
+    OutputEvaluation,
+    SequenceEvaluation,
+    ToolEvaluation,
+)
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
+
+
+def _trace() -> ExecutionTrace:
+    return ExecutionTrace(
+        session_id="s1",
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+        steps=[],
+        final_output="The answer is 42.",
+        metrics=ExecutionMetrics(total_cost=0.0, total_latency=100.0),
+    )
+
+
+def _result(name: str) -> EvaluationResult:
+    return EvaluationResult(
+        test_case=name,
+        passed=True,
+        score=90.0,
+        evaluations=Evaluations(
+            tool_accuracy=ToolEvaluation(accuracy=1.0),
+            sequence_correctness=SequenceEvaluation(correct=True, expected_sequence=[], actual_sequence=[]),
+            output_quality=OutputEvaluation(
+                score=90.0,
+                rationale="ok",
+                contains_checks=ContainsChecks(),
+                not_contains_checks=ContainsChecks(),
+            ),
+            cost=CostEvaluation(total_cost=0.0, threshold=1.0, passed=True),
+            latency=LatencyEvaluation(total_latency=100.0, threshold=5000.0, passed=True),
+        ),
+        trace=_trace(),
+        timestamp=datetime.now(),
+    )
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A git project with one test, its golden, and an agent source file."""
+    from evalview.core.golden import GoldenStore
+
+    (tmp_path / ".evalview").mkdir()
+    (tmp_path / ".evalview" / "config.yaml").write_text(
+        yaml.dump({"adapter": "http", "endpoint": "http://example.com"})
+    )
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "my-test.yaml").write_text(
+        yaml.dump({"name": "my-test", "input": {"query": "hello"}, "expected": {"tools": []},
+                   "thresholds": {"min_score": 0}})
+    )
+    (tmp_path / "agent.py").write_text("PROMPT = 'v1'\n")
+    GoldenStore(base_path=tmp_path).save_golden(_result("my-test"))
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "agent.py", "tests")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _check(cache: IncrementalCheckCache):
+    """Run _execute_check_tests with a mocked agent; return (adapter, diffs)."""
+    from evalview.commands.shared import _execute_check_tests
+    from evalview.core.loader import TestCaseLoader
+
+    test_cases = TestCaseLoader().load_from_directory("tests")
+    adapter = MagicMock()
+    adapter.execute = AsyncMock(return_value=_trace())
+    evaluator = MagicMock()
+    evaluator.evaluate = AsyncMock(side_effect=lambda tc, trace: _result(tc.name))
+    config = EvalViewConfig(adapter="http", endpoint="http://example.com")
+    with (
+        patch("evalview.commands.shared._create_adapter", return_value=adapter),
+        patch("evalview.evaluators.evaluator.Evaluator", return_value=evaluator),
+    ):
+        diffs, results, _, _ = _execute_check_tests(
+            test_cases, config, json_output=True, incremental=cache
+        )
+    return adapter, diffs
+
+
+class TestIncrementalCheck:
+    def test_unchanged_test_is_reused(self, project):
+        adapter, diffs = _check(IncrementalCheckCache(exclude=["tests"]))
+        assert adapter.execute.await_count == 1
+        assert (project / ".evalview" / "check_cache.json").exists()
+
+        cache = IncrementalCheckCache(exclude=["tests"])
+        adapter, diffs = _check(cache)
+        assert adapter.execute.await_count == 0
+        assert cache.reused == ["my-test"]
+        assert [name for name, _ in diffs] == ["my-test"]
+
+    def test_source_change_reruns(self, project):
+        _check(IncrementalCheckCache(exclude=["tests"]))
+        (project / "agent.py").write_text("PROMPT = 'v2'\n")
+
+        adapter, _ = _check(IncrementalCheckCache(exclude=["tests"]))
+        assert adapter.execute.await_count == 1
+
+    def test_test_definition_change_reruns(self, project):
+        _check(IncrementalCheckCache(exclude=["tests"]))
+        (project / "tests" / "my-test.yaml").write_text(
+            yaml.dump({"name": "my-test", "input": {"query": "hi there"}, "expected": {"tools": []},
+                       "thresholds": {"min_score": 0}})
+        )
+        adapter, _ = _check(IncrementalCheckCache(exclude=["tests"]))
+        assert adapter.execute.await_count == 1
+
+    def test_force_reruns(self, project):
+        _check(IncrementalCheckCache(exclude=["tests"]))
+        adapter, _ = _check(IncrementalCheckCache(exclude=["tests"], force=True))
+        assert adapter.execute.await_count == 1
+
+    def test_expired_entry_reruns(self, project):
+        _check(IncrementalCheckCache(exclude=["tests"]))
+        import json
+
+        path = project / ".evalview" / "check_cache.json"
+        data = json.loads(path.read_text())
+        data["tests"]["my-test"]["ts"] = (datetime.now() - timedelta(hours=25)).isoformat()
+        path.write_text(json.dumps(data))
+
+        adapter, _ = _check(IncrementalCheckCache(ttl_hours=24, exclude=["tests"]))
+        assert adapter.execute.await_count == 1
+
+
+class TestCodeFingerprint:
+    def test_none_outside_git(self, tmp_path):
+        assert _code_fingerprint(tmp_path, [], []) is None
+
+    def test_excluded_paths_do_not_count(self, project):
+        before = _code_fingerprint(project, [], ["tests"])
+        (project / "tests" / "other.yaml").write_text("name: other\n")
+        assert _code_fingerprint(project, [], ["tests"]) == before
+        (project / "helper.py").write_text("x = 1\n")
+        assert _code_fingerprint(project, [], ["tests"]) != before
+
+    def test_watch_narrows_scope(self, project):
+        (project / "src").mkdir()
+        (project / "src" / "agent.py").write_text("a = 1\n")
+        before = _code_fingerprint(project, ["src"], [])
+        (project / "README.md").write_text("docs\n")
+        assert _code_fingerprint(project, ["src"], []) == before
+
+    def test_project_in_repo_subdirectory(self, tmp_path):
+        """Uncommitted edits count when the project is below the repo root."""
+        app = tmp_path / "app"
+        (app / "tests").mkdir(parents=True)
+        (app / "agent.py").write_text("PROMPT = 'v1'\n")
+        (tmp_path / "other.py").write_text("x = 1\n")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "init")
+
+        before = _code_fingerprint(app, [], ["tests"])
+        assert before is not None
+        (app / "tests" / "t.yaml").write_text("name: t\n")
+        (tmp_path / "other.py").write_text("x = 2\n")
+        assert _code_fingerprint(app, [], ["tests"]) == before
+
+        (app / "agent.py").write_text("PROMPT = 'v2'\n")
+        edited = _code_fingerprint(app, [], ["tests"])
+        assert edited != before
+        (app / "agent.py").write_text("PROMPT = 'v3'\n")
+        assert _code_fingerprint(app, [], ["tests"]) != edited
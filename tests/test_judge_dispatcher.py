@@ -0,0 +1,221 @@
+"""Tests for the shared judge dispatcher (evalview/core/judge_dispatcher.py)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from evalview.core.judge_dispatcher import JudgeDispatcher, JudgePriority
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch):
+    for name in ("EVAL_JUDGE_RPM", "EVAL_JUDGE_TPM", "EVAL_JUDGE_CONCURRENCY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(f"{name}_OPENAI", raising=False)
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+    def __init__(self):
+        super().__init__("429 Too Many Requests")
+        self.response = SimpleNamespace(headers={"retry-after": "0.01"})
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_inflight_requests_share_one_call(self):
+        dispatcher = JudgeDispatcher()
+        calls = 0
+
+        async def _call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"score": 90}
+
+        results = await asyncio.gather(
+            *[dispatcher.submit("openai", _call, coalesce_key="same") for _ in range(5)]
+        )
+
+        assert calls == 1
+        assert all(r == {"score": 90} for r in results)
+        assert len({id(r) for r in results}) == 5  # each caller owns its copy
+        assert dispatcher.stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_followers_see_leader_error(self):
+        dispatcher = JudgeDispatcher()
+
+        async def _call():
+            await asyncio.sleep(0.01)
+            raise ValueError("bad judge response")
+
+        results = await asyncio.gather(
+            *[dispatcher.submit("openai", _call, coalesce_key="k") for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_are_not_merged(self):
+        dispatcher = JudgeDispatcher()
+        calls = 0
+
+        async def _call():
+            nonlocal calls
+            calls += 1
+            return {}
+
+        await dispatcher.submit("openai", _call, coalesce_key="k")
+        await dispatcher.submit("openai", _call, coalesce_key="k")
+        assert calls == 2
+
+
+class TestAdmission:
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_per_provider(self, monkeypatch):
+        monkeypatch.setenv("EVAL_JUDGE_CONCURRENCY_OPENAI", "2")
+        dispatcher = JudgeDispatcher()
+        in_flight = peak = 0
+
+        async def _call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        await asyncio.gather(*[dispatcher.submit("openai", _call) for _ in range(8)])
+        assert peak == 2
+        assert dispatcher.stats.requests == 8
+
+    @pytest.mark.asyncio
+    async def test_gate_requests_jump_the_queue(self, monkeypatch):
+        monkeypatch.setenv("EVAL_JUDGE_CONCURRENCY", "1")
+        dispatcher = JudgeDispatcher()
+        order = []
+        release = asyncio.Event()
+
+        async def _blocker():
+            await release.wait()
+            return {}
+
+        def _call(name):
+            async def _inner():
+                order.append(name)
+                return {}
+            return _inner
+
+        blocker = asyncio.create_task(dispatcher.submit("openai", _blocker))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(
+                dispatcher.submit("openai", _call("background"), priority=JudgePriority.BACKGROUND)
+            ),
+            asyncio.create_task(dispatcher.submit("openai", _call("normal"))),
+            asyncio.create_task(
+                dispatcher.submit("openai", _call("gate"), priority=JudgePriority.GATE)
+            ),
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(blocker, *queued)
+
+        assert order == ["gate", "normal", "background"]
+        assert dispatcher.stats.queue_wait_by_priority["background"] > 0
+
+    @pytest.mark.asyncio
+    async def test_rpm_limit_paces_requests(self, monkeypatch):
+        monkeypatch.setenv("EVAL_JUDGE_RPM", "6000")  # 100/s, burst of 100
+        dispatcher = JudgeDispatcher()
+
+        async def _call():
+            return {}
+
+        await asyncio.gather(*[dispatcher.submit("openai", _call) for _ in range(105)])
+        assert dispatcher.stats.queue_wait_max > 0
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried(self):
+        dispatcher = JudgeDispatcher(max_retries=2)
+        attempts = 0
+
+        async def _call():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise _RateLimited()
+            return {"ok": True}
+
+        assert await dispatcher.submit("openai", _call) == {"ok": True}
+        assert attempts == 2
+        assert dispatcher.stats.rate_limited == 1
+        assert dispatcher.stats.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_non_overload_errors_are_not_retried(self):
+        dispatcher = JudgeDispatcher(max_retries=2)
+        attempts = 0
+
+        async def _call():
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("invalid JSON")
+
+        with pytest.raises(ValueError):
+            await dispatcher.submit("openai", _call)
+        assert attempts == 1
+
+
+def test_llm_client_routes_through_dispatcher(monkeypatch):
+    from unittest.mock import AsyncMock
+
+    from evalview.core.llm_provider import LLMClient, LLMProvider, judge_dispatcher
+
+    client = LLMClient(provider=LLMProvider.OPENAI, api_key="sk-test", model="gpt-4o-mini")
+
+    async def _slow(*args):
+        await asyncio.sleep(0.01)
+        return {"score": 80}
+
+    provider_call = AsyncMock(side_effect=_slow)
+    monkeypatch.setattr(client, "_provider_completion", provider_call)
+    judge_dispatcher.reset()
+
+    async def _judge():
+        return await asyncio.gather(
+            client.chat_completion("system", "user", priority=JudgePriority.GATE),
+            client.chat_completion("system", "user"),
+            client.chat_completion("system", "other user"),
+        )
+
+    results = asyncio.run(_judge())
+    assert results == [{"score": 80}] * 3
+    assert provider_call.await_count == 2
+    assert judge_dispatcher.stats.coalesced == 1
+    judge_dispatcher.reset()
+
+
+def test_apply_judge_config_sets_dispatch_limits(monkeypatch):
+    import os
+
+    from evalview.core.config import EvalViewConfig, apply_judge_config
+
+    # apply_judge_config writes os.environ directly; keep it off the real one.
+    monkeypatch.setattr(os, "environ", dict(os.environ))
+    monkeypatch.setenv("EVAL_JUDGE_TPM", "1000")
+    config = EvalViewConfig(
+        adapter="http",
+        endpoint="http://example.com",
+        judge={"rpm": 50, "tpm": 40000, "max_concurrency": 4},
+    )
+    apply_judge_config(config)
+
+    assert os.environ["EVAL_JUDGE_RPM"] == "50.0"
+    assert os.environ["EVAL_JUDGE_TPM"] == "1000"  # env wins over config
+    assert os.environ["EVAL_JUDGE_CONCURRENCY"] == "4"
@@ -19,3 +19,113 @@ def test_extract_json_from_text_uses_fallback_without_warning(caplog):
     assert payload["score"] == 70
     assert "Auto-extracted from non-JSON response" in payload["reasoning"]
     assert "Could not parse JSON from Ollama response" not in caplog.text
+
+
+def test_sdk_client_registry_reuses_client_per_key():
+    import asyncio
+
+    from evalview.core.llm_provider import SDKClientRegistry
+
+    registry = SDKClientRegistry()
+    built = []
+
+    def factory():
+        built.append(object())
+        return built[-1]
+
+    async def _calls():
+        a = registry.get("openai", None, "sk-1", factory)
+        b = registry.get("openai", None, "sk-1", factory)
+        c = registry.get("openai", "https://api.deepseek.com/v1", "sk-1", factory)
+        d = registry.get("openai", None, "sk-2", factory)
+        return a, b, c, d
+
+    a, b, c, d = asyncio.run(_calls())
+    assert a is b
+    assert len({id(a), id(c), id(d)}) == 3
+    assert registry.hits == 1
+    assert registry.misses == 3
+
+
+def test_sdk_client_registry_drops_clients_from_closed_loops():
+    import asyncio
+
+    from evalview.core.llm_provider import SDKClientRegistry
+
+    registry = SDKClientRegistry()
+
+    async def _get():
+        return registry.get("anthropic", None, "key", object)
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+    assert len(registry) == 1
+
+
+def test_sdk_client_registry_aclose_closes_running_loop_clients():
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from evalview.core.llm_provider import SDKClientRegistry
+
+    registry = SDKClientRegistry()
+    client = MagicMock()
+    client.close = AsyncMock()
+
+    async def _run():
+        registry.get("openai", None, "key", lambda: client)
+        await registry.aclose()
+
+    asyncio.run(_run())
+    client.close.assert_awaited_once()
+    assert len(registry) == 0
+
+
+def test_sdk_clients_are_closed_with_the_http_pool_session():
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from evalview.core.http_pool import http_client_pool
+    from evalview.core.llm_provider import sdk_client_registry
+
+    client = MagicMock()
+    client.close = AsyncMock()
+
+    async def _run():
+        async with http_client_pool.session():
+            sdk_client_registry.get("openai", None, "session-key", lambda: client)
+
+    sdk_client_registry.clear()
+    asyncio.run(_run())
+    client.close.assert_awaited_once()
+    assert len(sdk_client_registry) == 0
+
+
+def test_llm_client_reuses_openai_sdk_client_across_calls():
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from evalview.core.llm_provider import LLMClient, LLMProvider, sdk_client_registry
+
+    response = MagicMock()
+    response.usage = None
+    response.choices = [MagicMock(message=MagicMock(content='{"score": 90}'))]
+    sdk_client = MagicMock()
+    sdk_client.chat.completions.create = AsyncMock(return_value=response)
+
+    sdk_client_registry.clear()
+    client = LLMClient(provider=LLMProvider.DEEPSEEK, api_key="sk-test", model="deepseek-chat")
+
+    async def _judge_twice():
+        first = await client.chat_completion("system", "user")
+        second = await client.chat_completion("system", "user")
+        return first, second
+
+    with patch("openai.AsyncOpenAI", return_value=sdk_client) as ctor:
+        first, second = asyncio.run(_judge_twice())
+
+    assert first == second == {"score": 90}
+    ctor.assert_called_once_with(api_key="sk-test", base_url="https://api.deepseek.com/v1")
+    assert sdk_client.chat.completions.create.await_count == 2
+    sdk_client_registry.clear()
@@ -9,9 +9,15 @@ Covers:
 - Response contract stability (JSON output from both direct and subprocess paths)
 - Timeout tier assignments
 - Error handling for unknown tools/methods
+- Async serving: concurrent calls, cancellation, progress, in-process checks
 """
 
+import asyncio
+import io
+import json
 import os
+import sys
+import time
 import subprocess
 import tempfile
 from typing import Any, Dict, List
@@ -19,7 +25,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from evalview.mcp_server import MCPServer, TOOLS, _EVALVIEW_VERSION
+from evalview.mcp_server import MCPServer, TOOLS, _CliCommand, _EVALVIEW_VERSION
 
 
 # ============================================================================
@@ -486,3 +492,102 @@ class TestMissingBinary:
         result = server._call_tool("list_tests", {})
         assert "evalview not found" in result
         assert "pip install" in result
+
+
+# ============================================================================
+# Async serving
+# ============================================================================
+
+def _call(req_id, name, arguments=None, **params):
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments or {}, **params},
+    }
+
+
+@pytest.fixture
+def outside_project(monkeypatch, tmp_path):
+    """serve_async persists caches under ./.evalview; keep them out of the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _serve(server, *requests):
+    """Run serve_async over ``requests``; the messages written, in order."""
+    stdin = io.StringIO("".join(json.dumps(r) + "\n" for r in requests))
+    stdout = io.StringIO()
+    asyncio.run(server.serve_async(stdin=stdin, stdout=stdout))
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+async def _slow_check(self, args):
+    await asyncio.sleep(args.get("delay", 0.3))
+    return "check done"
+
+
+@pytest.mark.usefixtures("outside_project")
+@patch("evalview.mcp_server.shutil.which", return_value="/usr/bin/evalview")
+@patch.object(MCPServer, "_run_check_in_process", _slow_check)
+class TestAsyncServe:
+    def test_calls_run_concurrently(self, mock_which):
+        async def fast_exec(command):
+            return "golden list", 0
+
+        with patch.object(MCPServer, "_exec_async", staticmethod(fast_exec)):
+            messages = _serve(MCPServer(), _call(1, "run_check"), _call(2, "list_tests"))
+
+        # The quick call is answered while the slow check is still running.
+        assert [m["id"] for m in messages] == [2, 1]
+        assert messages[1]["result"]["content"][0]["text"] == "check done"
+
+    def test_cancelled_call_gets_no_response(self, mock_which):
+        start = time.monotonic()
+        messages = _serve(
+            MCPServer(),
+            _call(1, "run_check", {"delay": 30}),
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 1}},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        )
+        assert time.monotonic() - start < 5
+        assert [m["id"] for m in messages] == [2]
+
+    def test_progress_notifications(self, mock_which):
+        messages = _serve(
+            MCPServer(progress_interval=0.05),
+            _call(1, "run_check", {"delay": 0.4}, _meta={"progressToken": "tok"}),
+        )
+        progress = [m["params"] for m in messages if m.get("method") == "notifications/progress"]
+        assert progress and all(p["progressToken"] == "tok" for p in progress)
+        assert [p["progress"] for p in progress] == list(range(1, len(progress) + 1))
+        assert messages[-1]["id"] == 1
+
+
+@pytest.mark.usefixtures("outside_project")
+@patch("evalview.mcp_server.shutil.which", return_value="/usr/bin/evalview")
+def test_bare_check_runs_in_process_with_shared_limiter(mock_which):
+    from evalview.api import DiffStatus, GateResult, GateSummary
+
+    limiters = []
+
+    async def fake_gate_async(**kwargs):
+        limiters.append(kwargs["limiter"])
+        return GateResult(
+            passed=True, exit_code=0, status=DiffStatus.PASSED,
+            summary=GateSummary(total=1, unchanged=1), diffs=[],
+        )
+
+    with patch("evalview.api.gate_async", fake_gate_async):
+        messages = _serve(MCPServer(), _call(1, "run_check"), _call(2, "run_check"))
+
+    assert len(limiters) == 2 and limiters[0] is limiters[1]
+    payload = json.loads(messages[0]["result"]["content"][0]["text"])
+    assert payload["summary"]["total_tests"] == 1
+
+
+def test_async_subprocess_timeout_kills_command():
+    command = _CliCommand([sys.executable, "-c", "import time; time.sleep(30)"], 1, dict(os.environ))
+    start = time.monotonic()
+    result = asyncio.run(MCPServer()._run_cli_async(command))
+    assert time.monotonic() - start < 10
+    assert "timed out after 1s" in result
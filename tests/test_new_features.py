@@ -122,7 +122,7 @@ class TestRegexPatterns:
     def test_redos_protection(self):
         """A ReDoS-prone pattern on adversarial input should not hang.
 
-        The signal-based timeout should abort the match within a few seconds.
+        The regex sandbox should abort the match within a few seconds.
         We assert that the call completes well within 10 seconds.
         """
         # Classic ReDoS pattern: (a+)+$ with input 'aaa...X'
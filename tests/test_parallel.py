@@ -0,0 +1,206 @@
+"""Tests for concurrency limiting in evalview.core.parallel."""
+
+import asyncio
+
+import pytest
+
+from evalview.core.parallel import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimiter,
+    ParallelExecutor,
+    TokenBucket,
+    create_limiter,
+    is_overload_error,
+    retry_after_seconds,
+)
+
+
+class _Overloaded(Exception):
+    status_code = 429
+
+
+class TestIsOverloadError:
+    """Which failures count as congestion signals."""
+
+    def test_timeout_is_overload(self):
+        assert is_overload_error(asyncio.TimeoutError())
+
+    def test_status_code_429_is_overload(self):
+        assert is_overload_error(_Overloaded("slow down"))
+
+    def test_agent_connection_timeout_is_overload(self):
+        from evalview.adapters.http_adapter import AgentConnectionError
+
+        exc = AgentConnectionError("timed out", endpoint="http://x", error_type="timeout")
+        assert is_overload_error(exc)
+
+    def test_agent_connection_http_503_is_overload(self):
+        from evalview.adapters.http_adapter import AgentConnectionError
+
+        exc = AgentConnectionError(
+            "HTTP 503: Service Unavailable", endpoint="http://x", error_type="http", status_code=503
+        )
+        assert is_overload_error(exc)
+
+    def test_plain_failure_is_not_overload(self):
+        assert not is_overload_error(ValueError("bad response body"))
+
+
+class TestConcurrencyLimiter:
+    """Static limiter behaves like a semaphore."""
+
+    def test_rejects_zero_limit(self):
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(0)
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight(self):
+        limiter = ConcurrencyLimiter(3)
+
+        async def _work():
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[_work() for _ in range(20)])
+        assert limiter.peak_in_flight == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_released_on_exception(self):
+        limiter = ConcurrencyLimiter(1)
+        with pytest.raises(RuntimeError):
+            async with limiter.slot():
+                raise RuntimeError("boom")
+        assert limiter.in_flight == 0
+
+    def test_reusable_across_event_loops(self):
+        limiter = ConcurrencyLimiter(2)
+
+        async def _work():
+            async with limiter.slot():
+                await asyncio.sleep(0)
+
+        asyncio.run(_work())
+        asyncio.run(_work())
+        assert limiter.in_flight == 0
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AIMD ramp-up and backoff."""
+
+    @pytest.mark.asyncio
+    async def test_ramps_up_to_max_when_healthy(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=2)
+
+        async def _work():
+            async with limiter.slot():
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*[_work() for _ in range(40)])
+        assert limiter.limit == 10
+        assert limiter.backoffs == 0
+
+    @pytest.mark.asyncio
+    async def test_backs_off_on_429(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=16)
+        with pytest.raises(_Overloaded):
+            async with limiter.slot():
+                raise _Overloaded()
+        assert limiter.limit == 8
+        assert limiter.backoffs == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_of_rejections_halves_once(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=16)
+
+        async def _rejected():
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+                raise _Overloaded()
+
+        await asyncio.gather(*[_rejected() for _ in range(8)], return_exceptions=True)
+        assert limiter.limit == 8
+        assert limiter.backoffs == 1
+
+    @pytest.mark.asyncio
+    async def test_plain_failures_do_not_back_off(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("wrong answer")
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_never_drops_below_min(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=1)
+        with pytest.raises(_Overloaded):
+            async with limiter.slot():
+                raise _Overloaded()
+        assert limiter.limit == 1
+
+
+class TestParallelExecutorWithLimiter:
+    """ParallelExecutor honours a shared limiter."""
+
+    @pytest.mark.asyncio
+    async def test_executor_uses_shared_limiter(self):
+        limiter = ConcurrencyLimiter(2)
+        executor = ParallelExecutor(limiter=limiter)
+
+        async def _execute(tc):
+            await asyncio.sleep(0.01)
+            return True, tc
+
+        results = await executor.execute_all(list(range(6)), _execute)
+        assert [r.result for r in results] == list(range(6))
+        assert limiter.peak_in_flight == 2
+        assert executor.max_workers == 2
+
+
+def test_create_limiter_defaults():
+    assert create_limiter().limit == 8
+    assert isinstance(create_limiter(12, adaptive=True), AdaptiveConcurrencyLimiter)
+    assert create_limiter(12, adaptive=True).max_limit == 12
+
+
+class TestTokenBucket:
+    """Request pacing shared by callers of one provider."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_minute=0)
+
+    @pytest.mark.asyncio
+    async def test_unlimited_never_waits(self):
+        bucket = TokenBucket()
+        waits = await asyncio.gather(*[bucket.acquire() for _ in range(50)])
+        assert sum(waits) == 0
+
+    @pytest.mark.asyncio
+    async def test_paces_to_rate(self):
+        bucket = TokenBucket(rate_per_minute=6000, burst=1)  # 100/s
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(6):
+            await bucket.acquire()
+        # First token is free, the other five wait ~10 ms each.
+        assert loop.time() - start >= 0.045
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_back_callers(self):
+        bucket = TokenBucket()
+        bucket.pause(0.05)
+        waited = await bucket.acquire()
+        assert waited >= 0.04
+
+
+def test_retry_after_seconds():
+    class _Limited(Exception):
+        def __init__(self, headers):
+            super().__init__("429")
+            self.response = type("R", (), {"headers": headers})()
+
+    assert retry_after_seconds(_Limited({"retry-after": "2.5"})) == 2.5
+    assert retry_after_seconds(_Limited({"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"})) is None
+    assert retry_after_seconds(_Limited({})) is None
+    assert retry_after_seconds(ValueError("no response")) is None
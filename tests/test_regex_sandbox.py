@@ -0,0 +1,69 @@
+"""Tests for time-limited regex matching (evalview/core/regex_sandbox.py)."""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from evalview.core.regex_sandbox import RegexSandbox, compile_pattern, is_linear
+
+_EVIL_PATTERN = r"(a+)+$"
+_EVIL_INPUT = "a" * 40 + "X"
+
+
+@pytest.fixture
+def sandbox():
+    box = RegexSandbox(timeout=0.5, max_idle_workers=2)
+    yield box
+    box.close()
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        (r"order #\d{5}", True),
+        (r"(yes|no)(?=!)", True),
+        (r"refund", True),
+        (r"\d+", False),
+        (r"colou?r", False),
+        (r"(a+)+$", False),
+        (r"(\w)\1", False),
+    ],
+)
+def test_is_linear(pattern, expected):
+    assert is_linear(pattern) is expected
+
+
+def test_results_keep_pattern_order(sandbox):
+    results = sandbox.search_many("The answer is 42.", [r"answer", r"\d+", r"foo.*bar"], re.IGNORECASE)
+    assert results == [True, True, False]
+
+
+def test_timeout_is_enforced_off_the_main_thread(sandbox):
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        results = pool.submit(
+            sandbox.search_many, _EVIL_INPUT, [_EVIL_PATTERN, r"a{3}", r"a+X"]
+        ).result()
+    elapsed = time.monotonic() - start
+
+    assert threading.current_thread() is threading.main_thread()
+    assert elapsed < 5.0
+    # The runaway pattern is undecided; the ones after it are still checked.
+    assert results == [None, True, True]
+    assert sandbox.timeouts == 1
+
+
+def test_workers_are_reused(sandbox):
+    sandbox.search_many("abc", [r"b+"])
+    worker = sandbox._idle[0]
+    sandbox.search_many("xyz", [r"y+"])
+    assert sandbox._idle == [worker]
+
+
+def test_compiled_patterns_are_cached():
+    assert compile_pattern(r"cache\s+me", re.IGNORECASE) is compile_pattern(r"cache\s+me", re.IGNORECASE)
+    with pytest.raises(re.error):
+        compile_pattern(r"[invalid")
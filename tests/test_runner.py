@@ -7,6 +7,14 @@ import pytest
 import yaml
 
 
+@pytest.fixture(autouse=True)
+def _fresh_test_catalog(monkeypatch):
+    """Keep the process-wide catalog store from pointing at a test project."""
+    from evalview.core import test_catalog
+
+    monkeypatch.setattr(test_catalog, "_metadata", test_catalog._MetadataStore())
+
+
 def _write_config(base: Path, adapter: str = "http", endpoint: str = "http://localhost:8000") -> Path:
     config_dir = base / ".evalview"
     config_dir.mkdir(parents=True, exist_ok=True)
@@ -153,6 +161,7 @@ class TestRunSingleTest:
 
         assert result is fake_result
         mock_adapter.execute.assert_called_once_with("hello", None)
+        assert (project / ".evalview" / "test_catalog.json").exists()
 
 
 class TestCheckSingleTest:
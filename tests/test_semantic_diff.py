@@ -86,11 +86,10 @@ class TestSemanticDiffSimilarity:
     @pytest.mark.asyncio
     async def test_embed_called_with_truncated_texts(self, semantic_diff):
         """Texts longer than 8192 chars should be truncated before API call."""
-        long_text = "x" * 10_000
         fake_emb = [1.0, 0.0]
         mock_embed = AsyncMock(return_value=[fake_emb, fake_emb])
         with patch.object(semantic_diff, "_embed", new=mock_embed):
-            await semantic_diff.similarity(long_text, long_text)
+            await semantic_diff.similarity("x" * 10_000, "y" * 10_000)
         call_args = mock_embed.call_args[0][0]  # first positional arg (list of texts)
         assert len(call_args[0]) == 8192
         assert len(call_args[1]) == 8192
@@ -129,3 +128,101 @@ class TestSemanticDiffHTTPCall:
         call_kwargs = mock_client.post.call_args
         assert "embeddings" in call_kwargs[0][0]  # endpoint URL
         assert call_kwargs[1]["json"]["model"] == "text-embedding-3-small"
+
+
+class TestSemanticDiffCachingAndBatching:
+    """Embedding cache reuse and request coalescing."""
+
+    @pytest.fixture
+    def semantic_diff(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        from evalview.core.semantic_diff import SemanticDiff
+        return SemanticDiff(batch_window=0.01)
+
+    @staticmethod
+    def _fake_embed(calls):
+        async def _embed(texts):
+            calls.append(list(texts))
+            return [[float(len(t)), 1.0] for t in texts]
+        return _embed
+
+    @pytest.mark.asyncio
+    async def test_golden_embedding_reused_across_checks(self, semantic_diff):
+        calls = []
+        with patch.object(semantic_diff, "_embed", new=self._fake_embed(calls)):
+            await semantic_diff.similarity("golden output", "actual one")
+            await semantic_diff.similarity("golden output", "actual two!")
+        assert calls == [["golden output", "actual one"], ["actual two!"]]
+        assert semantic_diff.cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_request(self, semantic_diff):
+        import asyncio
+
+        calls = []
+        with patch.object(semantic_diff, "_embed", new=self._fake_embed(calls)):
+            scores = await asyncio.gather(
+                *(semantic_diff.similarity("golden", f"actual {i}") for i in range(5))
+            )
+        assert len(calls) == 1
+        assert sorted(calls[0]) == sorted(["golden"] + [f"actual {i}" for i in range(5)])
+        assert all(0.0 <= s <= 1.0 for s in scores)
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self, semantic_diff):
+        import asyncio
+
+        with patch.object(semantic_diff, "_embed", new=AsyncMock(side_effect=RuntimeError("boom"))):
+            results = await asyncio.gather(
+                semantic_diff.similarity("a", "b"),
+                semantic_diff.similarity("c", "d"),
+                return_exceptions=True,
+            )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_embedding(self):
+        import asyncio
+
+        from evalview.core.semantic_diff import _EmbeddingBatcher
+
+        release = asyncio.Event()
+
+        async def _embed(texts):
+            await release.wait()
+            return [[1.0, 0.0] for _ in texts]
+
+        batcher = _EmbeddingBatcher(_embed, window=0.0, max_batch=16)
+        first = asyncio.ensure_future(batcher.embed("shared"))
+        second = asyncio.ensure_future(batcher.embed("shared"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        release.set()
+        assert await second == [1.0, 0.0]
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_short_embedding_response_fails_missing_callers(self):
+        import asyncio
+
+        from evalview.core.semantic_diff import _EmbeddingBatcher
+
+        async def _embed(texts):
+            return [[1.0, 0.0]]
+
+        batcher = _EmbeddingBatcher(_embed, window=0.0, max_batch=16)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True),
+            timeout=1.0,
+        )
+        assert results[0] == [1.0, 0.0]
+        assert isinstance(results[1], RuntimeError)
+
+    def test_cosine_without_numpy_matches(self, monkeypatch):
+        import evalview.core.semantic_diff as module
+
+        a, b = [1.0, 2.0, 3.0], [2.0, 0.5, 1.0]
+        expected = module.cosine_similarity(a, b)
+        monkeypatch.setattr(module, "np", None)
+        assert module.cosine_similarity(a, b) == pytest.approx(expected)
+        assert module.cosine_similarity([0.0, 0.0], a) == 0.0
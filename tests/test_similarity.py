@@ -0,0 +1,103 @@
+"""Tests for output similarity backends."""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from evalview.core.config import DiffConfig
+from evalview.core.diff import DiffEngine, DiffStatus
+from evalview.core.similarity import (
+    LCSBackend,
+    SIMILARITY_BACKENDS,
+    get_similarity_backend,
+    lcs_length,
+    tokenize,
+)
+
+
+def _dp_lcs(a, b):
+    """Reference O(n*m) LCS."""
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+
+class TestLCSLength:
+    """Bit-parallel LCS against the textbook dynamic program."""
+
+    def test_matches_dynamic_program(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            a = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 40)))
+            b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 40)))
+            assert lcs_length(a, b) == _dp_lcs(a, b)
+
+    def test_works_on_token_lists(self):
+        a = tokenize("the cat sat on the mat")
+        b = tokenize("the dog sat on a mat")
+        assert lcs_length(a, b) == 4
+
+
+class TestBackends:
+    """Shared behaviour of every backend."""
+
+    @pytest.mark.parametrize("name", SIMILARITY_BACKENDS)
+    def test_identical_and_disjoint(self, name):
+        backend = get_similarity_backend(name)
+        assert backend.similarity("same text here", "same text here") == 1.0
+        score = backend.similarity("alpha beta gamma", "one two three")
+        assert score < 0.5
+
+    def test_lcs_matches_sequence_on_short_text(self):
+        golden = "The weather in Paris is sunny and 22 degrees."
+        actual = "The weather in Paris is cloudy and 23 degrees."
+        lcs = get_similarity_backend("lcs").similarity(golden, actual)
+        assert lcs == pytest.approx(SequenceMatcher(None, golden, actual, autojunk=False).ratio(), abs=0.05)
+
+    def test_token_ignores_whitespace(self):
+        assert get_similarity_backend("token").similarity("a  b\n c", "a b c") == 1.0
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown similarity backend"):
+            get_similarity_backend("levenshtein")
+
+    def test_rapidfuzz_falls_back_to_lcs(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def _no_rapidfuzz(name, *args, **kwargs):
+            if name.startswith("rapidfuzz"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_rapidfuzz)
+        assert isinstance(get_similarity_backend("rapidfuzz"), LCSBackend)
+
+
+class TestDiffEngineBackend:
+    """DiffConfig.similarity_backend drives DiffEngine output comparison."""
+
+    def test_default_is_sequence(self):
+        assert DiffConfig().similarity_backend == "sequence"
+
+    def test_long_output_small_edit_passes_with_lcs(self):
+        rng = random.Random(1)
+        words = "agent tool result weather summary order refund status".split()
+        golden = " ".join(rng.choice(words) for _ in range(2000))
+        actual = golden.replace("refund", "refunds", 3)
+
+        engine = DiffEngine(config=DiffConfig(similarity_backend="lcs"))
+        od = engine._compare_outputs(golden, actual)
+
+        assert od.similarity >= 0.95
+        assert od.severity == DiffStatus.PASSED
+
+    def test_invalid_backend_rejected_by_config(self):
+        with pytest.raises(ValueError):
+            DiffConfig(similarity_backend="nope")
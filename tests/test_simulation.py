@@ -248,6 +248,129 @@ class TestSimulatorVariants:
             await sim.run_variants(_case(), variants=0)
 
 
+class _ConcurrentAdapter(_FakeAdapter):
+    """Yields between tool calls and runs them via ``asyncio.to_thread``,
+    like the Anthropic adapter, so variants overlap."""
+
+    def __init__(self, plan: List[Dict[str, Any]]) -> None:
+        super().__init__(plan)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def execute(self, query: str, context: Optional[Dict[str, Any]] = None) -> ExecutionTrace:
+        import asyncio
+
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            executor = self.tool_executor
+            outputs = []
+            for call in self._plan:
+                await asyncio.sleep(0.01)
+                outputs.append(await asyncio.to_thread(executor, call["tool"], call["params"]))
+        finally:
+            self.in_flight -= 1
+        return ExecutionTrace(
+            session_id="concurrent",
+            start_time=datetime(2026, 4, 20, 10, 0, 0),
+            end_time=datetime(2026, 4, 20, 10, 0, 1),
+            steps=[],
+            final_output=" | ".join(str(o) for o in outputs),
+            metrics=ExecutionMetrics(total_cost=0.0, total_latency=1.0),
+        )
+
+
+class _ExecutorThreadAdapter(_ConcurrentAdapter):
+    """Calls tools via ``loop.run_in_executor``, which doesn't copy context."""
+
+    async def execute(self, query: str, context: Optional[Dict[str, Any]] = None) -> ExecutionTrace:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        executor = self.tool_executor
+        outputs = []
+        for call in self._plan:
+            await asyncio.sleep(0.01)
+            outputs.append(await loop.run_in_executor(None, executor, call["tool"], call["params"]))
+        return ExecutionTrace(
+            session_id="executor-thread",
+            start_time=datetime(2026, 4, 20, 10, 0, 0),
+            end_time=datetime(2026, 4, 20, 10, 0, 1),
+            steps=[],
+            final_output=" | ".join(str(o) for o in outputs),
+            metrics=ExecutionMetrics(total_cost=0.0, total_latency=1.0),
+        )
+
+
+class TestConcurrentVariants:
+    @pytest.mark.asyncio
+    async def test_variants_overlap_up_to_limit(self):
+        adapter = _ConcurrentAdapter(plan=[{"tool": "search", "params": {}}] * 2)
+        spec = MockSpec(tool_mocks=[ToolMock(tool="search", returns="hit")])
+        traces, result = await Simulator(adapter, spec).run_variants(
+            _case(spec), variants=6, max_concurrency=3
+        )
+
+        assert adapter.peak == 3
+        assert len(traces) == 6
+        assert [o.variant_index for o in result.variant_outcomes] == list(range(6))
+        assert result.mocks_applied[0].count == 12
+        assert adapter.tool_executor is None  # real executor restored
+
+    @pytest.mark.asyncio
+    async def test_record_captures_first_variant_only(self):
+        adapter = _ConcurrentAdapter(plan=[{"tool": "fetch", "params": {"n": 1}}] * 2)
+        calls: List[str] = []
+
+        def real(name, params):
+            calls.append(name)
+            return "live"
+
+        adapter.tool_executor = real
+        sim = Simulator(adapter, MockSpec())
+        _, result = await sim.run_variants(_case(), variants=4, record=True)
+
+        assert len(calls) == 8  # every variant reached the real executor
+        assert result.recorded_cassette is not None
+        assert len(result.recorded_cassette.interactions) == 2
+        assert adapter.tool_executor is real
+
+    @pytest.mark.asyncio
+    async def test_variants_run_one_by_one_by_default(self):
+        adapter = _ConcurrentAdapter(plan=[{"tool": "search", "params": {}}])
+        spec = MockSpec(tool_mocks=[ToolMock(tool="search", returns="hit")])
+        await Simulator(adapter, spec).run_variants(_case(spec), variants=4)
+        assert adapter.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_executor_thread_adapter_works_by_default(self):
+        """run_in_executor doesn't copy context; a serial sweep still routes calls."""
+        adapter = _ExecutorThreadAdapter(plan=[{"tool": "search", "params": {}}] * 2)
+        spec = MockSpec(tool_mocks=[ToolMock(tool="search", returns="hit")])
+        traces, result = await Simulator(adapter, spec).run_variants(_case(spec), variants=3)
+
+        assert [t.final_output for t in traces] == ["hit | hit"] * 3
+        assert result.mocks_applied[0].count == 6
+
+    @pytest.mark.asyncio
+    async def test_interceptor_installed_per_variant(self):
+        adapter = _ConcurrentAdapter(plan=[{"tool": "search", "params": {}}])
+        installs: List[Simulator] = []
+        adapter.install_mock_interceptor = installs.append  # type: ignore[method-assign]
+        spec = MockSpec(tool_mocks=[ToolMock(tool="search", returns="hit")])
+        sim = Simulator(adapter, spec)
+        await sim.run_variants(_case(spec), variants=3, max_concurrency=3)
+        assert installs == [sim] * 3
+
+    @pytest.mark.asyncio
+    async def test_failing_variant_restores_executor(self):
+        adapter = _ConcurrentAdapter(plan=[{"tool": "unmocked", "params": {}}])
+        spec = MockSpec(strict=True)
+        with pytest.raises(UnmatchedMockError):
+            await Simulator(adapter, spec).run_variants(_case(spec), variants=3)
+        assert adapter.tool_executor is None
+
+
 # ============================================================================
 # Adapter capability check — uninterceptable adapters fail loudly
 # ============================================================================
@@ -453,3 +576,11 @@ class TestSimulateCLI:
         result = runner.invoke(simulate, [str(tmp_path), "--variants", "0"])
         assert result.exit_code != 0
         assert "variants" in result.output.lower()
+
+    def test_rejects_zero_max_concurrency(self, tmp_path):
+        from evalview.commands.simulate_cmd import simulate
+
+        runner = CliRunner()
+        result = runner.invoke(simulate, [str(tmp_path), "--max-concurrency", "0"])
+        assert result.exit_code == 2
+        assert "--max-concurrency" in result.output
@@ -25,6 +25,10 @@ from evalview.evaluators.statistical_evaluator import (
     compute_flakiness_score,
     StatisticalEvaluator,
     is_statistical_mode,
+    run_repetitions,
+    sequential_decision,
+    should_stop_early,
+    wilson_interval,
 )
 
 
@@ -263,3 +267,183 @@ class TestStatisticalEvaluator:
         assert stat_result.pass_rate == 0.9
         assert stat_result.passed is True  # 90% > 80% required
         assert stat_result.score_stats.mean > 80
+
+
+def _result(passed: bool, score: float = 85.0) -> EvaluationResult:
+    return EvaluationResult(
+        test_case="test",
+        passed=passed,
+        score=score,
+        evaluations=Evaluations(
+            tool_accuracy=ToolEvaluation(accuracy=1.0, correct=[], missing=[], unexpected=[]),
+            sequence_correctness=SequenceEvaluation(correct=True, expected_sequence=[], actual_sequence=[]),
+            output_quality=OutputEvaluation(
+                score=score,
+                rationale="test",
+                contains_checks=ContainsChecks(),
+                not_contains_checks=ContainsChecks(),
+            ),
+            cost=CostEvaluation(total_cost=0.01, threshold=1.0, passed=True),
+            latency=LatencyEvaluation(total_latency=100, threshold=5000, passed=True),
+        ),
+        trace=ExecutionTrace(
+            session_id="test",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            steps=[],
+            final_output="test",
+            metrics=ExecutionMetrics(total_cost=0.01, total_latency=100),
+        ),
+        timestamp=datetime.now(),
+    )
+
+
+class TestWilsonInterval:
+    """Tests for the pass-rate confidence interval."""
+
+    def test_known_value(self):
+        lower, upper = wilson_interval(8, 10, 0.95)
+        assert lower == pytest.approx(0.4902, abs=1e-3)
+        assert upper == pytest.approx(0.9433, abs=1e-3)
+
+    def test_all_pass_stays_in_bounds(self):
+        lower, upper = wilson_interval(5, 5, 0.95)
+        assert 0.0 < lower < 1.0
+        assert upper == 1.0
+
+    def test_no_runs_is_uninformative(self):
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+class TestShouldStopEarly:
+    """Tests for the sequential early-stop rule."""
+
+    def test_needs_minimum_runs(self):
+        config = VarianceConfig(pass_rate=0.8)
+        assert should_stop_early([_result(False)] * 2, config) is False
+
+    def test_stops_on_clear_miss(self):
+        config = VarianceConfig(pass_rate=0.8)
+        assert should_stop_early([_result(False)] * 3, config) is True
+
+    def test_stops_on_clear_pass(self):
+        config = VarianceConfig(pass_rate=0.8)
+        assert should_stop_early([_result(True)] * 11, config) is False
+        assert should_stop_early([_result(True)] * 12, config) is True
+
+    def test_undecided_keeps_running(self):
+        config = VarianceConfig(pass_rate=0.8)
+        assert should_stop_early([_result(True), _result(False), _result(True)], config) is False
+
+    def test_score_thresholds_block_early_pass(self):
+        config = VarianceConfig(pass_rate=0.5, min_mean_score=80)
+        assert should_stop_early([_result(True)] * 5, config) is False
+
+
+class TestRunRepetitions:
+    """Tests for concurrent repetition scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_respects_limiter(self):
+        import asyncio
+
+        from evalview.core.parallel import ConcurrencyLimiter
+
+        in_flight = {"now": 0, "peak": 0}
+
+        async def _once(i):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return _result(True)
+
+        results = await run_repetitions(_once, 10, limiter=ConcurrencyLimiter(3))
+        assert len(results) == 10
+        assert in_flight["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stop_skips_queued_runs(self):
+        calls = []
+
+        async def _once(i):
+            calls.append(i)
+            return _result(False)
+
+        config = VarianceConfig(runs=10, pass_rate=0.8)
+        results = await run_repetitions(_once, 10, stop=lambda rs: should_stop_early(rs, config))
+        assert len(results) == 3
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_not_raised(self):
+        seen = []
+
+        async def _once(i):
+            if i == 0:
+                raise RuntimeError("boom")
+            return _result(True)
+
+        results = await run_repetitions(
+            _once, 3, on_result=lambda done, result, error: seen.append((done, error is not None))
+        )
+        assert len(results) == 2
+        assert seen == [(1, True), (2, False), (3, False)]
+
+
+class TestSequentialDecision:
+    """Tests for the SPRT verdicts and their effect on statistical results."""
+
+    def test_consistent_failure_is_fail(self):
+        assert sequential_decision(0, 3, VarianceConfig(pass_rate=0.8)) == "fail"
+
+    def test_intermittent_failure_is_flaky(self):
+        config = VarianceConfig(pass_rate=0.8)
+        assert sequential_decision(2, 6, config) == "flaky"
+
+    def test_higher_confidence_needs_more_runs(self):
+        assert sequential_decision(12, 12, VarianceConfig(pass_rate=0.8)) == "pass"
+        assert sequential_decision(12, 12, VarianceConfig(pass_rate=0.8, confidence_level=0.99)) is None
+
+    def test_required_rate_of_one_fails_on_first_failure(self):
+        config = VarianceConfig(pass_rate=1.0)
+        assert sequential_decision(2, 3, config) == "flaky"
+
+    def test_result_reports_runs_saved(self):
+        test_case = TestCase(
+            name="test",
+            input=TestInput(query="test"),
+            expected=ExpectedBehavior(),
+            thresholds=Thresholds(
+                min_score=70, variance=VarianceConfig(runs=10, pass_rate=0.8, early_stop=True)
+            ),
+        )
+        stat = StatisticalEvaluator().evaluate_from_results(
+            test_case, [_result(False, 40)] * 3, skipped_runs=7
+        )
+        assert stat.passed is False
+        assert stat.early_stop_decision == "fail"
+        assert stat.runs_saved == 7
+
+    @pytest.mark.asyncio
+    async def test_evaluate_stops_early(self):
+        test_case = TestCase(
+            name="test",
+            input=TestInput(query="test"),
+            expected=ExpectedBehavior(),
+            thresholds=Thresholds(
+                min_score=70, variance=VarianceConfig(runs=20, pass_rate=0.8, early_stop=True)
+            ),
+        )
+        calls = []
+
+        async def _execute(tc):
+            calls.append(tc.name)
+            result = _result(True)
+            return result.trace, result
+
+        stat = await StatisticalEvaluator().evaluate(test_case, _execute)
+        assert len(calls) == 12
+        assert stat.passed is True
+        assert stat.early_stop_decision == "pass"
+        assert stat.runs_saved == 8
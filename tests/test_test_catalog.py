@@ -0,0 +1,138 @@
+"""Tests for the cached test-case catalog (evalview/core/test_catalog.py)."""
+
+import json
+import os
+
+import pytest
+
+from evalview.core import test_catalog
+from evalview.core.test_catalog import TestCatalog, _MetadataStore
+
+
+def _write_case(directory, filename, name, tags=None, query="hi"):
+    tag_line = f"tags: {tags}\n" if tags else ""
+    path = directory / filename
+    path.write_text(
+        f"name: {name}\n{tag_line}input:\n  query: {query}\nexpected:\n  tools: []\n"
+        "thresholds:\n  min_score: 0\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def suite(tmp_path):
+    _write_case(tmp_path, "a.yaml", "alpha", tags=["smoke"])
+    (tmp_path / "nested").mkdir()
+    _write_case(tmp_path / "nested", "b.yml", "beta", tags=["Smoke", "slow"])
+    _write_case(tmp_path, "config.yaml", "not-a-test")
+    return tmp_path
+
+
+@pytest.fixture
+def metadata(monkeypatch):
+    store = _MetadataStore()
+    monkeypatch.setattr(test_catalog, "_metadata", store)
+    return store
+
+
+def test_lookups_by_name_and_tag(suite, metadata):
+    catalog = TestCatalog(suite).refresh()
+
+    assert catalog.names() == ["alpha", "beta"]
+    assert catalog.get("beta").source_file == str(suite / "nested" / "b.yml")
+    assert catalog.get("missing") is None
+    assert [tc.name for tc in catalog.with_tag("smoke")] == ["alpha", "beta"]
+    assert [tc.name for tc in catalog.with_tag("SLOW")] == ["beta"]
+
+
+def test_only_changed_files_are_reparsed(suite, metadata):
+    catalog = TestCatalog(suite).refresh()
+    assert catalog.parsed_files == 2
+
+    catalog.refresh()
+    assert catalog.parsed_files == 2
+
+    _write_case(suite, "a.yaml", "alpha-renamed", query="a longer query")
+    (suite / "nested" / "b.yml").unlink()
+    catalog.refresh()
+    assert catalog.parsed_files == 3
+    assert catalog.names() == ["alpha-renamed"]
+
+
+def test_returned_test_cases_are_independent(suite, metadata):
+    catalog = TestCatalog(suite).refresh()
+    first = catalog.get("alpha")
+    first.input.query = "mutated"
+    first.tags.append("extra")
+
+    second = catalog.get("alpha")
+    assert second.input.query == "hi"
+    assert second.tags == ["smoke"]
+
+
+def _project_store(project):
+    (project / ".evalview").mkdir(exist_ok=True)
+    return project / ".evalview" / "test_catalog.json"
+
+
+def test_persisted_metadata_avoids_parsing(suite, metadata):
+    store_path = _project_store(suite)
+    metadata.persist_to(str(store_path))
+    TestCatalog(suite).refresh()
+    assert store_path.exists()
+
+    # A fresh process: new store and catalog, same files on disk.
+    fresh = _MetadataStore()
+    fresh.persist_to(str(store_path))
+    test_catalog._metadata = fresh
+    catalog = TestCatalog(suite).refresh()
+    assert catalog.parsed_files == 0
+    assert catalog.get("beta").name == "beta"
+    assert catalog.parsed_files == 1
+
+
+def test_directories_outside_the_project_are_not_persisted(suite, metadata, tmp_path_factory):
+    store_path = _project_store(tmp_path_factory.mktemp("project"))
+    metadata.persist_to(str(store_path))
+    TestCatalog(suite).refresh()
+    assert not store_path.exists()
+
+
+def test_stale_and_foreign_entries_are_pruned(suite, metadata):
+    store_path = _project_store(suite)
+    metadata.persist_to(str(store_path))
+    TestCatalog(suite).refresh()
+    (suite / "nested" / "b.yml").unlink()
+
+    data = json.loads(store_path.read_text())
+    data["files"]["/elsewhere/tests/x.yaml"] = {"name": "x", "mtime_ns": 1, "size": 1}
+    store_path.write_text(json.dumps(data))
+
+    fresh = _MetadataStore()
+    fresh.persist_to(str(store_path))
+    test_catalog._metadata = fresh
+    TestCatalog(suite).refresh()
+
+    files = json.loads(store_path.read_text())["files"]
+    assert sorted(os.path.basename(key) for key in files) == ["a.yaml"]
+
+
+def test_use_project_test_catalog_anchors_to_cwd(suite, metadata, monkeypatch):
+    monkeypatch.chdir(suite)
+    store_path = _project_store(suite)
+    test_catalog.use_project_test_catalog()
+    TestCatalog("nested").refresh()
+
+    files = json.loads(store_path.read_text())["files"]
+    assert list(files) == [str(suite / "nested" / "b.yml")]
+
+
+def test_parallel_cold_start_matches_serial(tmp_path, metadata, monkeypatch):
+    for i in range(6):
+        _write_case(tmp_path, f"case{i}.yaml", f"case-{i}")
+    monkeypatch.setattr(test_catalog, "_PARALLEL_PARSE_MIN_FILES", 4)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    catalog = TestCatalog(tmp_path).refresh()
+    assert sorted(catalog.names()) == [f"case-{i}" for i in range(6)]